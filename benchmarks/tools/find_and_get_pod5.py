@@ -30,9 +30,10 @@ def load_mapped_ids(select_read_ids_data):
     ]
 
 
-def do_batch_work(filename, batches, column, mode, result_q):
+def do_batch_work(file, batches, column, mode, result_q):
     """
-    Per process worker to do loading of data from a set of batches
+    Per process worker to do loading of data from a set of batches of a
+    (pickled) reader, which is reopened lazily in the worker
     """
 
     read_ids = []
@@ -40,7 +41,6 @@ def do_batch_work(filename, batches, column, mode, result_q):
     extracted_columns = {"read_id": read_ids, column: vals}
 
     if column == "samples":
-        file = p5.Reader(filename)
         for batch in file.read_batches(batch_selection=batches, preload={"samples"}):
             read_ids.extend(p5.format_read_ids(batch.read_id_column))
 
@@ -123,7 +123,7 @@ def run_multiprocess(files, output, select_read_ids=None, column=None, mode=None
                 select_batches = batches[start_index : start_index + approx_chunk_size]
                 p = mp.Process(
                     target=do_batch_work,
-                    args=(filename, select_batches, column, mode, result_queue),
+                    args=(file, select_batches, column, mode, result_queue),
                 )
                 p.start()
                 processes.append(p)
@@ -0,0 +1,229 @@
+#!/usr/bin/env python3
+"""
+Micro-benchmark of the per-read cost of the fields written by
+`pod5 inspect reads`, comparing ReadRecord views over the column values of each
+batch against building them from per-row arrow scalars.
+
+Example usage:
+```
+> ./benchmarks/tools/read_record_iteration_pod5.py --reads 20000
+```
+"""
+
+import argparse
+import tempfile
+import time
+import uuid
+from datetime import datetime
+from pathlib import Path
+
+import numpy
+
+import pod5 as p5
+from pod5.pod5_types import ShiftScalePair
+
+
+def write_reads(path, read_count, sample_count):
+    """Write a pod5 file of `read_count` reads of random signal"""
+    rng = numpy.random.default_rng(1)
+    run_info = p5.RunInfo(
+        acquisition_id="acquisition",
+        acquisition_start_time=datetime.now(),
+        adc_max=4095,
+        adc_min=-4096,
+        context_tags={},
+        experiment_name="",
+        flow_cell_id="",
+        flow_cell_product_code="",
+        protocol_name="",
+        protocol_run_id="",
+        protocol_start_time=datetime.now(),
+        sample_id="",
+        sample_rate=4000,
+        sequencing_kit="",
+        sequencer_position="",
+        sequencer_position_type="",
+        software="",
+        system_name="",
+        system_type="",
+        tracking_id={},
+    )
+    with p5.Writer(path) as writer:
+        writer.add_reads(
+            [
+                p5.Read(
+                    read_id=uuid.uuid4(),
+                    pore=p5.Pore(channel=idx % 512 + 1, well=1, pore_type="pore"),
+                    calibration=p5.Calibration(offset=1.0, scale=0.5),
+                    read_number=idx,
+                    start_sample=idx * sample_count,
+                    median_before=100.0,
+                    end_reason=p5.EndReason.from_reason_with_default_forced(
+                        p5.EndReasonEnum.SIGNAL_POSITIVE
+                    ),
+                    run_info=run_info,
+                    signal=rng.integers(-500, 500, sample_count, dtype=numpy.int16),
+                )
+                for idx in range(read_count)
+            ]
+        )
+
+
+class ArrowScalarRecord:
+    """
+    A read record building each property from per-row arrow scalars, as
+    ReadRecord did before viewing the column values of its batch
+    """
+
+    def __init__(self, reader, batch, row):
+        self._reader = reader
+        self._batch = batch
+        self._row = row
+
+    @property
+    def read_id(self):
+        return uuid.UUID(bytes=self._batch.columns.read_id[self._row].as_py())
+
+    @property
+    def read_number(self):
+        return self._batch.columns.read_number[self._row].as_py()
+
+    @property
+    def start_sample(self):
+        return self._batch.columns.start[self._row].as_py()
+
+    @property
+    def num_samples(self):
+        return self._batch.columns.num_samples[self._row].as_py()
+
+    @property
+    def median_before(self):
+        return self._batch.columns.median_before[self._row].as_py()
+
+    @property
+    def num_minknow_events(self):
+        return self._batch.columns.num_minknow_events[self._row].as_py()
+
+    @property
+    def tracked_scaling(self):
+        return ShiftScalePair(
+            self._batch.columns.tracked_scaling_shift[self._row].as_py(),
+            self._batch.columns.tracked_scaling_scale[self._row].as_py(),
+        )
+
+    @property
+    def predicted_scaling(self):
+        return ShiftScalePair(
+            self._batch.columns.predicted_scaling_shift[self._row].as_py(),
+            self._batch.columns.predicted_scaling_scale[self._row].as_py(),
+        )
+
+    @property
+    def num_reads_since_mux_change(self):
+        return self._batch.columns.num_reads_since_mux_change[self._row].as_py()
+
+    @property
+    def time_since_mux_change(self):
+        return self._batch.columns.time_since_mux_change[self._row].as_py()
+
+    @property
+    def pore(self):
+        return p5.Pore(
+            self._batch.columns.channel[self._row].as_py(),
+            self._batch.columns.well[self._row].as_py(),
+            self._batch.columns.pore_type[self._row].as_py(),
+        )
+
+    @property
+    def end_reason(self):
+        return p5.EndReason(
+            reason=p5.EndReasonEnum[
+                self._batch.columns.end_reason[self._row].as_py().upper()
+            ],
+            forced=self._batch.columns.end_reason_forced[self._row].as_py(),
+        )
+
+    @property
+    def byte_count(self):
+        byte_count = 0
+        for signal_row in self._batch.columns.signal[self._row]:
+            signal_batch, _, batch_row = self._batch.get_read(
+                self._row
+            )._find_signal_row_index(signal_row.as_py())
+            if self._reader.is_vbz_compressed:
+                byte_count += len(signal_batch.signal[batch_row].as_buffer())
+            else:
+                byte_count += signal_batch.samples[batch_row].as_py() * 2
+        return byte_count
+
+
+def read_record_fields(read):
+    """The inspect reads fields of a ReadRecord"""
+    return (
+        read.read_id,
+        read.pore.channel,
+        read.pore.well,
+        read.pore.pore_type,
+        read.read_number,
+        read.start_sample,
+        read.end_reason.name,
+        read.median_before,
+        read.num_samples,
+        read.byte_count,
+        read.num_minknow_events,
+        read.tracked_scaling,
+        read.predicted_scaling,
+        read.num_reads_since_mux_change,
+        read.time_since_mux_change,
+    )
+
+
+def time_fields(path, use_views, repeats):
+    """Time reading the inspect reads fields of every read in the file at path"""
+    best = None
+    for _ in range(repeats):
+        with p5.Reader(path) as reader:
+            start = time.perf_counter()
+            if use_views:
+                fields = [read_record_fields(read) for read in reader.reads()]
+            else:
+                fields = [
+                    read_record_fields(ArrowScalarRecord(reader, batch, row))
+                    for batch in reader.read_batches()
+                    for row in range(batch.num_reads)
+                ]
+            elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best, fields
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--reads", type=int, default=20_000)
+    parser.add_argument("--samples", type=int, default=100)
+    parser.add_argument("--repeats", type=int, default=3)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "reads.pod5"
+        write_reads(path, args.reads, args.samples)
+
+        scalar_secs, scalar_fields = time_fields(path, False, args.repeats)
+        view_secs, view_fields = time_fields(path, True, args.repeats)
+        # Compared by repr as unset scaling values are NaN
+        assert repr(scalar_fields) == repr(view_fields)
+
+    print(f"{args.reads} reads")
+    print(
+        f"arrow scalars: {scalar_secs:.4f} secs, "
+        f"{scalar_secs / args.reads * 1e6:.2f} us/read"
+    )
+    print(
+        f"record views:  {view_secs:.4f} secs, "
+        f"{view_secs / args.reads * 1e6:.2f} us/read"
+    )
+    print(f"speedup:       {scalar_secs / view_secs:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
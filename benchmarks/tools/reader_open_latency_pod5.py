@@ -0,0 +1,155 @@
+#!/usr/bin/env python3
+"""
+Micro-benchmark of the latency of opening many small pod5 files, comparing
+Reader, which maps each file once and opens the run info and signal tables on
+first use, against eagerly opening every table in its own mapping.
+
+Example usage:
+```
+> ./benchmarks/tools/reader_open_latency_pod5.py --files 100 1000 5000
+```
+"""
+
+import argparse
+import shutil
+import tempfile
+import time
+import uuid
+from datetime import datetime
+from pathlib import Path
+
+import lib_pod5 as p5b
+import numpy
+
+import pod5 as p5
+from pod5.reader import ArrowTableHandle
+
+
+def write_reads(path, read_count, sample_count):
+    """Write a pod5 file of `read_count` reads of random signal"""
+    rng = numpy.random.default_rng(1)
+    run_info = p5.RunInfo(
+        acquisition_id="acquisition",
+        acquisition_start_time=datetime.now(),
+        adc_max=4095,
+        adc_min=-4096,
+        context_tags={},
+        experiment_name="",
+        flow_cell_id="",
+        flow_cell_product_code="",
+        protocol_name="",
+        protocol_run_id="",
+        protocol_start_time=datetime.now(),
+        sample_id="",
+        sample_rate=4000,
+        sequencing_kit="",
+        sequencer_position="",
+        sequencer_position_type="",
+        software="",
+        system_name="",
+        system_type="",
+        tracking_id={},
+    )
+    with p5.Writer(path) as writer:
+        writer.add_reads(
+            [
+                p5.Read(
+                    read_id=uuid.uuid4(),
+                    pore=p5.Pore(channel=idx % 512 + 1, well=1, pore_type="pore"),
+                    calibration=p5.Calibration(offset=1.0, scale=0.5),
+                    read_number=idx,
+                    start_sample=idx * sample_count,
+                    median_before=100.0,
+                    end_reason=p5.EndReason.from_reason_with_default_forced(
+                        p5.EndReasonEnum.SIGNAL_POSITIVE
+                    ),
+                    run_info=run_info,
+                    signal=rng.integers(-500, 500, sample_count, dtype=numpy.int16),
+                )
+                for idx in range(read_count)
+            ]
+        )
+
+
+def open_eager(path):
+    """
+    Open every table of the file at path in its own file handle and mapping, as
+    Reader did before sharing one mapping and opening tables on first use
+    """
+    file_reader = p5b.open_file(str(path))
+    handles = [
+        ArrowTableHandle(file_reader.get_file_read_table_location()),
+        ArrowTableHandle(file_reader.get_file_run_info_table_location()),
+        ArrowTableHandle(file_reader.get_file_signal_table_location()),
+    ]
+    read_count = sum(
+        handles[0].reader.get_batch(idx).num_rows
+        for idx in range(handles[0].reader.num_record_batches)
+    )
+    for handle in handles:
+        handle.close()
+    file_reader.close()
+    return read_count
+
+
+def open_reader(path):
+    """Open the file at path with a Reader, reading the read table only"""
+    with p5.Reader(path) as reader:
+        return sum(
+            reader.read_table.get_batch(idx).num_rows
+            for idx in range(reader.batch_count)
+        )
+
+
+def time_opens(paths, open_func, repeats):
+    """Time opening every file in paths, returning the best total seconds"""
+    best = None
+    for _ in range(repeats):
+        start = time.perf_counter()
+        read_counts = [open_func(path) for path in paths]
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best, read_counts
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--files", type=int, nargs="+", default=[100, 1000, 5000])
+    parser.add_argument("--reads", type=int, default=10)
+    parser.add_argument("--samples", type=int, default=1000)
+    parser.add_argument("--repeats", type=int, default=3)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        source = Path(tmp) / "source.pod5"
+        write_reads(source, args.reads, args.samples)
+
+        paths = []
+        for file_count in sorted(args.files):
+            for idx in range(len(paths), file_count):
+                path = Path(tmp) / f"reads_{idx}.pod5"
+                shutil.copyfile(source, path)
+                paths.append(path)
+
+            eager_secs, eager_counts = time_opens(
+                paths[:file_count], open_eager, args.repeats
+            )
+            reader_secs, reader_counts = time_opens(
+                paths[:file_count], open_reader, args.repeats
+            )
+            assert eager_counts == reader_counts
+
+            print(f"{file_count} files")
+            print(
+                f"  eager tables:  {eager_secs:.4f} secs, "
+                f"{eager_secs / file_count * 1e3:.3f} ms/file"
+            )
+            print(
+                f"  lazy tables:   {reader_secs:.4f} secs, "
+                f"{reader_secs / file_count * 1e3:.3f} ms/file"
+            )
+            print(f"  speedup:       {eager_secs / reader_secs:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,171 @@
+#!/usr/bin/env python3
+"""
+Benchmark of passing compressed reads from producer processes to a single writing
+process, comparing pickling lists of CompressedRead through a multiprocessing queue
+against packing them into the shared memory slots of SharedReadBuffers.
+
+Example usage:
+```
+> ./benchmarks/tools/shared_reads_pod5.py --producers 4 --reads 20000
+```
+"""
+
+import argparse
+import multiprocessing as mp
+import tempfile
+import time
+import uuid
+from datetime import datetime
+from pathlib import Path
+
+import numpy
+
+import pod5 as p5
+
+BATCH_SIZE = 400
+
+
+def make_run_info():
+    """A run info shared by every read"""
+    return p5.RunInfo(
+        acquisition_id="acquisition",
+        acquisition_start_time=datetime.now(),
+        adc_max=4095,
+        adc_min=-4096,
+        context_tags={},
+        experiment_name="",
+        flow_cell_id="",
+        flow_cell_product_code="",
+        protocol_name="",
+        protocol_run_id="",
+        protocol_start_time=datetime.now(),
+        sample_id="",
+        sample_rate=4000,
+        sequencing_kit="",
+        sequencer_position="",
+        sequencer_position_type="",
+        software="",
+        system_name="",
+        system_type="",
+        tracking_id={},
+    )
+
+
+def make_reads(read_count, sample_count, chunk_size, seed):
+    """Compressed reads of random walk signal, as a conversion worker creates them"""
+    rng = numpy.random.default_rng(seed)
+    run_info = make_run_info()
+    signal = numpy.cumsum(
+        rng.integers(-5, 6, sample_count, dtype=numpy.int16), dtype=numpy.int16
+    )
+    chunks = [
+        p5.vbz_compress_signal(signal[start : start + chunk_size])
+        for start in range(0, sample_count, chunk_size)
+    ]
+    chunk_lengths = [
+        len(signal[start : start + chunk_size])
+        for start in range(0, sample_count, chunk_size)
+    ]
+    return [
+        p5.CompressedRead(
+            read_id=uuid.uuid4(),
+            pore=p5.Pore(channel=idx % 512 + 1, well=1, pore_type="pore"),
+            calibration=p5.Calibration(offset=1.0, scale=0.5),
+            read_number=idx,
+            start_sample=idx * sample_count,
+            median_before=100.0,
+            end_reason=p5.EndReason.from_reason_with_default_forced(
+                p5.EndReasonEnum.SIGNAL_POSITIVE
+            ),
+            run_info=run_info,
+            # Each read holds its own copy of the chunks, as if compressed itself
+            signal_chunks=[chunk.copy() for chunk in chunks],
+            signal_chunk_lengths=chunk_lengths,
+        )
+        for idx in range(read_count)
+    ]
+
+
+def produce(queue, buffers, read_count, sample_count, chunk_size, seed):
+    """Send batches of compressed reads to the writer, then None when done"""
+    reads = make_reads(read_count, sample_count, chunk_size, seed)
+    for start in range(0, read_count, BATCH_SIZE):
+        batch = reads[start : start + BATCH_SIZE]
+        queue.put(batch if buffers is None else buffers.pack(batch))
+    queue.put(None)
+
+
+def transfer(path, args, shared):
+    """
+    Write the reads of every producer to path, returning the seconds taken from
+    starting the producers to closing the file, excluding creating the reads
+    """
+    ctx = mp.get_context("spawn")
+    queue = ctx.Queue()
+    buffers = None
+    if shared:
+        buffers = p5.SharedReadBuffers(args.producers * 2, context=ctx)
+
+    processes = [
+        ctx.Process(
+            target=produce,
+            args=(queue, buffers, args.reads, args.samples, args.chunk_size, idx),
+        )
+        for idx in range(args.producers)
+    ]
+    for process in processes:
+        process.start()
+
+    start = None
+    finished = 0
+    with p5.Writer(path) as writer:
+        while finished < args.producers:
+            batch = queue.get()
+            start = start or time.perf_counter()
+            if batch is None:
+                finished += 1
+            elif buffers is None:
+                writer.add_reads(batch)
+            else:
+                buffers.write(batch, writer)
+    elapsed = time.perf_counter() - start
+
+    for process in processes:
+        process.join()
+    if buffers is not None:
+        buffers.close()
+    return elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--producers", type=int, default=4)
+    parser.add_argument("--reads", type=int, default=20_000, help="Per producer")
+    parser.add_argument("--samples", type=int, default=20_000)
+    parser.add_argument(
+        "--chunk-size", type=int, default=p5.signal_tools.DEFAULT_SIGNAL_CHUNK_SIZE
+    )
+    args = parser.parse_args()
+
+    read_count = args.producers * args.reads
+    with tempfile.TemporaryDirectory() as tmp:
+        results = {}
+        for name, shared in [("pickled queue", False), ("shared memory", True)]:
+            path = Path(tmp) / f"{name.replace(' ', '_')}.pod5"
+            results[name] = transfer(path, args, shared)
+            with p5.Reader(path) as reader:
+                assert reader.num_reads == read_count
+
+    print(f"{args.producers} producers of {args.reads} reads of {args.samples} samples")
+    for name, secs in results.items():
+        print(
+            f"{name + ':':15} {secs:.4f} secs, "
+            f"{secs / read_count * 1e6:.2f} us/read"
+        )
+    print(f"speedup:        {results['pickled queue'] / results['shared memory']:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
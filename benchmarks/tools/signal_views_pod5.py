@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""
+Micro-benchmark comparing signal access from memory-mapped uncompressed signal
+tables (zero-copy views) against VBZ compressed signal tables.
+
+Example usage:
+```
+> ./benchmarks/tools/signal_views_pod5.py --reads 2000 --samples 40000
+```
+"""
+
+import argparse
+import tempfile
+import time
+from pathlib import Path
+
+import numpy
+import pyarrow as pa
+
+import pod5 as p5
+from pod5.reader import _signal_row_view
+
+
+def write_signal_table(path, signals, compressed):
+    """Write an arrow file with a pod5 style signal and samples column"""
+    if compressed:
+        signal = pa.array(
+            [p5.vbz_compress_signal(s).tobytes() for s in signals], pa.large_binary()
+        )
+    else:
+        signal = pa.array(signals, pa.large_list(pa.int16()))
+    samples = pa.array([len(s) for s in signals], pa.uint32())
+
+    batch = pa.record_batch([signal, samples], names=["signal", "samples"])
+    with pa.OSFile(str(path), "wb") as sink:
+        with pa.ipc.new_file(sink, batch.schema) as writer:
+            writer.write_batch(batch)
+
+
+def time_access(path, compressed, repeats):
+    """Time reading every signal row of the memory-mapped table at path"""
+    batch = pa.ipc.open_file(pa.memory_map(str(path))).get_batch(0)
+    signal = batch.column("signal")
+    samples = batch.column("samples")
+
+    total = 0
+    start = time.perf_counter()
+    for _ in range(repeats):
+        for row in range(batch.num_rows):
+            if compressed:
+                data = p5.vbz_decompress_signal(
+                    memoryview(signal[row].as_buffer()), samples[row].as_py()
+                )
+            else:
+                data = _signal_row_view(signal, row)
+            total += int(data[-1])
+    return (time.perf_counter() - start) / repeats, total
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--reads", type=int, default=2000)
+    parser.add_argument("--samples", type=int, default=40_000)
+    parser.add_argument("--repeats", type=int, default=3)
+    args = parser.parse_args()
+
+    rng = numpy.random.default_rng(1)
+    signals = [
+        rng.integers(-500, 500, args.samples, dtype=numpy.int16)
+        for _ in range(args.reads)
+    ]
+
+    with tempfile.TemporaryDirectory() as tmp:
+        vbz_path = Path(tmp) / "vbz.arrow"
+        raw_path = Path(tmp) / "uncompressed.arrow"
+        write_signal_table(vbz_path, signals, compressed=True)
+        write_signal_table(raw_path, signals, compressed=False)
+
+        vbz_secs, vbz_total = time_access(vbz_path, True, args.repeats)
+        raw_secs, raw_total = time_access(raw_path, False, args.repeats)
+        assert vbz_total == raw_total
+
+    total_samples = args.reads * args.samples
+    print(f"{args.reads} reads, {total_samples} samples")
+    print(
+        f"vbz:          {vbz_secs:.4f} secs, {total_samples / vbz_secs:.3e} samples/s"
+    )
+    print(
+        f"uncompressed: {raw_secs:.4f} secs, {total_samples / raw_secs:.3e} samples/s"
+    )
+    print(f"speedup:      {vbz_secs / raw_secs:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
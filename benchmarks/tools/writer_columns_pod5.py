@@ -0,0 +1,175 @@
+#!/usr/bin/env python3
+"""
+Micro-benchmark of writing reads held as columns, comparing
+Writer.add_reads_columns against building a Read object per read to pass to
+Writer.add_reads.
+
+Example usage:
+```
+> ./benchmarks/tools/writer_columns_pod5.py --reads 100000
+```
+"""
+
+import argparse
+import tempfile
+import time
+import uuid
+from datetime import datetime
+from pathlib import Path
+
+import numpy
+
+import pod5 as p5
+
+BATCH_SIZE = 1000
+
+
+def make_run_info():
+    """A run info shared by every read"""
+    return p5.RunInfo(
+        acquisition_id="acquisition",
+        acquisition_start_time=datetime.now(),
+        adc_max=4095,
+        adc_min=-4096,
+        context_tags={},
+        experiment_name="",
+        flow_cell_id="",
+        flow_cell_product_code="",
+        protocol_name="",
+        protocol_run_id="",
+        protocol_start_time=datetime.now(),
+        sample_id="",
+        sample_rate=4000,
+        sequencing_kit="",
+        sequencer_position="",
+        sequencer_position_type="",
+        software="",
+        system_name="",
+        system_type="",
+        tracking_id={},
+    )
+
+
+def make_columns(read_count, sample_count):
+    """Columns of `read_count` reads of random signal, as an acquisition holds them"""
+    rng = numpy.random.default_rng(1)
+    end_reasons = numpy.array(["signal_positive", "mux_change", "unblock_mux_change"])
+    return {
+        "read_id": numpy.frombuffer(
+            b"".join(uuid.uuid4().bytes for _ in range(read_count)), dtype=numpy.uint8
+        ).reshape(-1, 16),
+        "read_number": numpy.arange(read_count, dtype=numpy.uint32),
+        "start": numpy.arange(read_count, dtype=numpy.uint64) * sample_count,
+        "channel": (numpy.arange(read_count) % 512 + 1).astype(numpy.uint16),
+        "well": numpy.ones(read_count, dtype=numpy.uint8),
+        "pore_type": numpy.full(read_count, "pore"),
+        "calibration_offset": numpy.ones(read_count, dtype=numpy.float32),
+        "calibration_scale": numpy.full(read_count, 0.5, dtype=numpy.float32),
+        "median_before": numpy.full(read_count, 100.0, dtype=numpy.float32),
+        "end_reason": end_reasons[rng.integers(0, 3, read_count)],
+        "run_info": numpy.full(read_count, "acquisition"),
+    }, rng.integers(-500, 500, read_count * sample_count, dtype=numpy.int16)
+
+
+def batch_slices(read_count):
+    """The slices of each batch of reads added at once"""
+    return [
+        slice(start, min(start + BATCH_SIZE, read_count))
+        for start in range(0, read_count, BATCH_SIZE)
+    ]
+
+
+def write_reads(path, columns, signal, sample_count, run_info):
+    """Write the reads building a Read object per read"""
+    with p5.Writer(path) as writer:
+        for rows in batch_slices(len(columns["read_id"])):
+            writer.add_reads(
+                [
+                    p5.Read(
+                        read_id=uuid.UUID(bytes=columns["read_id"][idx].tobytes()),
+                        pore=p5.Pore(
+                            channel=int(columns["channel"][idx]),
+                            well=int(columns["well"][idx]),
+                            pore_type=str(columns["pore_type"][idx]),
+                        ),
+                        calibration=p5.Calibration(
+                            offset=float(columns["calibration_offset"][idx]),
+                            scale=float(columns["calibration_scale"][idx]),
+                        ),
+                        read_number=int(columns["read_number"][idx]),
+                        start_sample=int(columns["start"][idx]),
+                        median_before=float(columns["median_before"][idx]),
+                        end_reason=p5.EndReason.from_reason_with_default_forced(
+                            p5.EndReasonEnum[columns["end_reason"][idx].upper()]
+                        ),
+                        run_info=run_info,
+                        signal=signal[idx * sample_count : (idx + 1) * sample_count],
+                    )
+                    for idx in range(rows.start, rows.stop)
+                ]
+            )
+
+
+def write_columns(path, columns, signal, sample_count, run_info):
+    """Write the reads with Writer.add_reads_columns"""
+    with p5.Writer(path) as writer:
+        writer.add(run_info)
+        for rows in batch_slices(len(columns["read_id"])):
+            offsets = numpy.arange(
+                0, (rows.stop - rows.start + 1) * sample_count, sample_count
+            ).astype(numpy.uint64)
+            writer.add_reads_columns(
+                {name: values[rows] for name, values in columns.items()},
+                signal=signal[rows.start * sample_count : rows.stop * sample_count],
+                signal_offsets=offsets,
+            )
+
+
+def time_write(write_func, path, repeats, *args):
+    """Time writing the reads to path, returning the best seconds"""
+    best = None
+    for _ in range(repeats):
+        path.unlink(missing_ok=True)
+        start = time.perf_counter()
+        write_func(path, *args)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--reads", type=int, default=100_000)
+    parser.add_argument("--samples", type=int, default=100)
+    parser.add_argument("--repeats", type=int, default=3)
+    args = parser.parse_args()
+
+    run_info = make_run_info()
+    columns, signal = make_columns(args.reads, args.samples)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        reads_path = Path(tmp) / "reads.pod5"
+        columns_path = Path(tmp) / "columns.pod5"
+        write_args = (columns, signal, args.samples, run_info)
+        reads_secs = time_write(write_reads, reads_path, args.repeats, *write_args)
+        columns_secs = time_write(
+            write_columns, columns_path, args.repeats, *write_args
+        )
+
+        with p5.Reader(reads_path) as reads, p5.Reader(columns_path) as written:
+            assert reads.num_reads == written.num_reads == args.reads
+
+    print(f"{args.reads} reads of {args.samples} samples")
+    print(
+        f"read objects: {reads_secs:.4f} secs, "
+        f"{reads_secs / args.reads * 1e6:.2f} us/read"
+    )
+    print(
+        f"columns:      {columns_secs:.4f} secs, "
+        f"{columns_secs / args.reads * 1e6:.2f} us/read"
+    )
+    print(f"speedup:      {reads_secs / columns_secs:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,181 @@
+#!/usr/bin/env python3
+"""
+Benchmark matrix of WriterOptions, reporting for each combination of signal chunk
+size, table batch sizes, signal type and writer threads the time to write a file,
+its size, and the time to read every read's signal or a random subset of reads.
+
+Example usage:
+```
+> ./benchmarks/tools/writer_options_pod5.py --reads 2000 \\
+    --chunk-sizes 20000 102400 --signal-batch-sizes 10 100 \\
+    --read-batch-sizes 100 1000 --signal-types vbz uncompressed
+```
+"""
+
+import argparse
+import itertools
+import tempfile
+import time
+import uuid
+from datetime import datetime
+from pathlib import Path
+
+import numpy
+
+import pod5 as p5
+
+
+def make_run_info():
+    """A run info shared by every read"""
+    return p5.RunInfo(
+        acquisition_id="acquisition",
+        acquisition_start_time=datetime.now(),
+        adc_max=4095,
+        adc_min=-4096,
+        context_tags={},
+        experiment_name="",
+        flow_cell_id="",
+        flow_cell_product_code="",
+        protocol_name="",
+        protocol_run_id="",
+        protocol_start_time=datetime.now(),
+        sample_id="",
+        sample_rate=4000,
+        sequencing_kit="",
+        sequencer_position="",
+        sequencer_position_type="",
+        software="",
+        system_name="",
+        system_type="",
+        tracking_id={},
+    )
+
+
+def make_reads(read_count, mean_samples):
+    """Columns of `read_count` reads of random walk signal of log-normal length"""
+    rng = numpy.random.default_rng(1)
+    lengths = numpy.maximum(
+        rng.lognormal(numpy.log(mean_samples), 0.8, read_count).astype(numpy.uint64), 1
+    )
+    offsets = numpy.zeros(read_count + 1, dtype=numpy.uint64)
+    numpy.cumsum(lengths, out=offsets[1:])
+    signal = numpy.cumsum(
+        rng.integers(-5, 6, int(offsets[-1]), dtype=numpy.int16), dtype=numpy.int16
+    )
+    columns = {
+        "read_id": numpy.frombuffer(
+            b"".join(uuid.uuid4().bytes for _ in range(read_count)), dtype=numpy.uint8
+        ).reshape(-1, 16),
+        "read_number": numpy.arange(read_count, dtype=numpy.uint32),
+        "start": offsets[:-1],
+        "channel": (numpy.arange(read_count) % 512 + 1).astype(numpy.uint16),
+        "well": numpy.ones(read_count, dtype=numpy.uint8),
+        "pore_type": numpy.full(read_count, "pore"),
+        "calibration_offset": numpy.ones(read_count, dtype=numpy.float32),
+        "calibration_scale": numpy.full(read_count, 0.5, dtype=numpy.float32),
+        "median_before": numpy.full(read_count, 100.0, dtype=numpy.float32),
+        "end_reason": numpy.full(read_count, "signal_positive"),
+        "run_info": numpy.full(read_count, "acquisition"),
+    }
+    return columns, signal, offsets
+
+
+def write_file(path, options, columns, signal, offsets, run_info):
+    """Write the reads to path with options, returning the seconds taken"""
+    start = time.perf_counter()
+    with p5.Writer(path, options=options) as writer:
+        writer.add(run_info)
+        writer.add_reads_columns(columns, signal=signal, signal_offsets=offsets)
+    return time.perf_counter() - start
+
+
+def read_all(path):
+    """Read the signal of every read, returning the seconds taken"""
+    start = time.perf_counter()
+    with p5.Reader(path) as reader:
+        sample_count = sum(len(read.signal) for read in reader.reads())
+    return time.perf_counter() - start, sample_count
+
+
+def read_subset(path, read_ids):
+    """Read the signal of a subset of reads, returning the seconds taken"""
+    start = time.perf_counter()
+    with p5.Reader(path) as reader:
+        sample_count = sum(
+            len(read.signal) for read in reader.reads(selection=read_ids)
+        )
+    return time.perf_counter() - start, sample_count
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--reads", type=int, default=2000)
+    parser.add_argument("--mean-samples", type=int, default=20_000)
+    parser.add_argument("--subset-fraction", type=float, default=0.01)
+    parser.add_argument("--chunk-sizes", type=int, nargs="+", default=[20_000, 102_400])
+    parser.add_argument("--signal-batch-sizes", type=int, nargs="+", default=[10, 100])
+    parser.add_argument("--read-batch-sizes", type=int, nargs="+", default=[100, 1000])
+    parser.add_argument(
+        "--signal-types",
+        nargs="+",
+        default=["vbz", "uncompressed"],
+        choices=[signal_type.value for signal_type in p5.SignalType],
+    )
+    parser.add_argument(
+        "--writer-threads",
+        type=int,
+        nargs="+",
+        default=[None],
+        help="Writer thread counts, by default the shared pool of one per core",
+    )
+    args = parser.parse_args()
+
+    run_info = make_run_info()
+    columns, signal, offsets = make_reads(args.reads, args.mean_samples)
+    rng = numpy.random.default_rng(2)
+    subset = [
+        str(uuid.UUID(bytes=columns["read_id"][idx].tobytes()))
+        for idx in rng.choice(
+            args.reads, max(1, int(args.reads * args.subset_fraction)), replace=False
+        )
+    ]
+
+    print(
+        "chunk_size,signal_batch,read_batch,signal_type,threads,"
+        "write_secs,file_mb,read_all_secs,read_subset_secs"
+    )
+    with tempfile.TemporaryDirectory() as tmp:
+        for idx, (chunk, signal_batch, read_batch, signal_type, threads) in enumerate(
+            itertools.product(
+                args.chunk_sizes,
+                args.signal_batch_sizes,
+                args.read_batch_sizes,
+                args.signal_types,
+                args.writer_threads,
+            )
+        ):
+            options = p5.WriterOptions(
+                max_signal_chunk_size=chunk,
+                signal_table_batch_size=signal_batch,
+                read_table_batch_size=read_batch,
+                signal_type=signal_type,
+                writer_threads=threads,
+            )
+            path = Path(tmp) / f"options_{idx}.pod5"
+            write_secs = write_file(path, options, columns, signal, offsets, run_info)
+            all_secs, all_samples = read_all(path)
+            subset_secs, _ = read_subset(path, subset)
+            assert all_samples == len(signal)
+
+            print(
+                f"{chunk},{signal_batch},{read_batch},{signal_type},"
+                f"{threads or 'default'},{write_secs:.4f},"
+                f"{path.stat().st_size / 1e6:.2f},{all_secs:.4f},{subset_secs:.4f}"
+            )
+            path.unlink()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,194 @@
+#!/usr/bin/env python3
+"""
+Micro-benchmark of writing pre-compressed reads, comparing Writer.add_reads with
+CompressedRead objects, Writer.add_reads_columns with a list of signal chunks,
+and Writer.add_reads_columns with every chunk in one contiguous buffer with
+offsets, which FileWriter.add_reads_pre_compressed_flat slices without walking a
+list of arrays.
+
+Example usage:
+```
+> ./benchmarks/tools/writer_pre_compressed_pod5.py --reads 50000
+```
+"""
+
+import argparse
+import tempfile
+import time
+import uuid
+from datetime import datetime
+from pathlib import Path
+
+import numpy
+
+import pod5 as p5
+
+BATCH_SIZE = 1000
+
+
+def make_run_info():
+    """A run info shared by every read"""
+    return p5.RunInfo(
+        acquisition_id="acquisition",
+        acquisition_start_time=datetime.now(),
+        adc_max=4095,
+        adc_min=-4096,
+        context_tags={},
+        experiment_name="",
+        flow_cell_id="",
+        flow_cell_product_code="",
+        protocol_name="",
+        protocol_run_id="",
+        protocol_start_time=datetime.now(),
+        sample_id="",
+        sample_rate=4000,
+        sequencing_kit="",
+        sequencer_position="",
+        sequencer_position_type="",
+        software="",
+        system_name="",
+        system_type="",
+        tracking_id={},
+    )
+
+
+def make_reads(read_count, sample_count, chunk_size):
+    """Compressed reads of random walk signal, and their columns"""
+    rng = numpy.random.default_rng(1)
+    run_info = make_run_info()
+    signal = numpy.cumsum(
+        rng.integers(-5, 6, sample_count, dtype=numpy.int16), dtype=numpy.int16
+    )
+    chunks, chunk_lengths = p5.signal_tools.vbz_compress_signal_chunked(
+        signal, chunk_size
+    )
+    reads = [
+        p5.CompressedRead(
+            read_id=uuid.uuid4(),
+            pore=p5.Pore(channel=idx % 512 + 1, well=1, pore_type="pore"),
+            calibration=p5.Calibration(offset=1.0, scale=0.5),
+            read_number=idx,
+            start_sample=idx * sample_count,
+            median_before=100.0,
+            end_reason=p5.EndReason.from_reason_with_default_forced(
+                p5.EndReasonEnum.SIGNAL_POSITIVE
+            ),
+            run_info=run_info,
+            signal_chunks=[chunk.copy() for chunk in chunks],
+            signal_chunk_lengths=chunk_lengths,
+        )
+        for idx in range(read_count)
+    ]
+    columns = {
+        "read_id": numpy.frombuffer(
+            b"".join(read.read_id.bytes for read in reads), dtype=numpy.uint8
+        ).reshape(-1, 16),
+        "read_number": numpy.arange(read_count, dtype=numpy.uint32),
+        "start": numpy.arange(read_count, dtype=numpy.uint64) * sample_count,
+        "channel": (numpy.arange(read_count) % 512 + 1).astype(numpy.uint16),
+        "well": numpy.ones(read_count, dtype=numpy.uint8),
+        "pore_type": numpy.full(read_count, "pore"),
+        "calibration_offset": numpy.ones(read_count, dtype=numpy.float32),
+        "calibration_scale": numpy.full(read_count, 0.5, dtype=numpy.float32),
+        "median_before": numpy.full(read_count, 100.0, dtype=numpy.float32),
+        "end_reason": numpy.full(read_count, "signal_positive"),
+        "run_info": numpy.full(read_count, "acquisition"),
+    }
+    return reads, columns, run_info
+
+
+def batch_slices(read_count):
+    """The slices of each batch of reads added at once"""
+    return [
+        slice(start, min(start + BATCH_SIZE, read_count))
+        for start in range(0, read_count, BATCH_SIZE)
+    ]
+
+
+def batch_chunk_args(reads, rows, contiguous):
+    """The pre-compressed signal arguments of add_reads_columns for a batch"""
+    chunks = [chunk for read in reads[rows] for chunk in read.signal_chunks]
+    args = {
+        "signal_chunk_lengths": numpy.array(
+            [length for read in reads[rows] for length in read.signal_chunk_lengths],
+            dtype=numpy.uint32,
+        ),
+        "signal_chunk_counts": numpy.array(
+            [len(read.signal_chunks) for read in reads[rows]], dtype=numpy.uint32
+        ),
+        "signal_chunks": chunks,
+    }
+    if contiguous:
+        offsets = numpy.zeros(len(chunks) + 1, dtype=numpy.uint64)
+        numpy.cumsum([len(chunk) for chunk in chunks], out=offsets[1:])
+        args["signal_chunks"] = numpy.concatenate(chunks)
+        args["signal_chunk_offsets"] = offsets
+    return args
+
+
+def write_reads(path, reads, columns, batches, run_info):
+    """Write the reads as CompressedRead objects"""
+    with p5.Writer(path) as writer:
+        for rows in batch_slices(len(reads)):
+            writer.add_reads(reads[rows])
+
+
+def write_columns(path, reads, columns, batches, run_info):
+    """Write the reads as columns with the prepared signal chunk arguments"""
+    with p5.Writer(path) as writer:
+        writer.add(run_info)
+        for rows, chunk_args in zip(batch_slices(len(reads)), batches):
+            writer.add_reads_columns(
+                {name: values[rows] for name, values in columns.items()},
+                **chunk_args,
+            )
+
+
+def time_write(write_func, path, repeats, *args):
+    """Time writing the reads to path, returning the best seconds"""
+    best = None
+    for _ in range(repeats):
+        path.unlink(missing_ok=True)
+        start = time.perf_counter()
+        write_func(path, *args)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--reads", type=int, default=50_000)
+    parser.add_argument("--samples", type=int, default=4000)
+    parser.add_argument("--chunk-size", type=int, default=1000)
+    parser.add_argument("--repeats", type=int, default=3)
+    args = parser.parse_args()
+
+    reads, columns, run_info = make_reads(args.reads, args.samples, args.chunk_size)
+    slices = batch_slices(args.reads)
+    list_batches = [batch_chunk_args(reads, rows, False) for rows in slices]
+    flat_batches = [batch_chunk_args(reads, rows, True) for rows in slices]
+
+    results = {}
+    with tempfile.TemporaryDirectory() as tmp:
+        for name, write_func, batches in [
+            ("compressed reads", write_reads, None),
+            ("chunk list", write_columns, list_batches),
+            ("contiguous chunks", write_columns, flat_batches),
+        ]:
+            path = Path(tmp) / f"{name.replace(' ', '_')}.pod5"
+            results[name] = time_write(
+                write_func, path, args.repeats, reads, columns, batches, run_info
+            )
+            with p5.Reader(path) as reader:
+                assert reader.num_reads == args.reads
+
+    print(
+        f"{args.reads} reads of {args.samples} samples in chunks of {args.chunk_size}"
+    )
+    for name, secs in results.items():
+        print(f"{name + ':':19} {secs:.4f} secs, {secs / args.reads * 1e6:.2f} us/read")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,121 @@
+#include "pod5_format/read_table_utils.h"
+
+#include <boost/uuid/random_generator.hpp>
+
+#include <algorithm>
+#include <chrono>
+#include <cstdlib>
+#include <iomanip>
+#include <iostream>
+#include <vector>
+
+// Micro-benchmark of read id lookups, comparing the time to build the lookup and sort queries on
+// one or all threads, and each search strategy over a range of query to file size ratios.
+//
+// Usage: read_id_search_benchmark [max file read count] [repeats]
+
+namespace {
+
+std::size_t const BATCH_SIZE = 1000;
+
+template <typename Func>
+double best_seconds(std::size_t repeats, Func const & func)
+{
+    double best = 0;
+    for (std::size_t i = 0; i < repeats; ++i) {
+        auto const start = std::chrono::steady_clock::now();
+        func();
+        std::chrono::duration<double> const elapsed = std::chrono::steady_clock::now() - start;
+        best = i == 0 ? elapsed.count() : std::min(best, elapsed.count());
+    }
+    return best;
+}
+
+char const * strategy_name(pod5::ReadIdSearchStrategy strategy)
+{
+    switch (strategy) {
+    case pod5::ReadIdSearchStrategy::Automatic:
+        return "automatic";
+    case pod5::ReadIdSearchStrategy::Merge:
+        return "merge";
+    case pod5::ReadIdSearchStrategy::Galloping:
+        return "galloping";
+    }
+    return "unknown";
+}
+
+}  // namespace
+
+int main(int argc, char ** argv)
+{
+    std::size_t const max_read_count = argc > 1 ? std::strtoull(argv[1], nullptr, 10) : 5'000'000;
+    std::size_t const repeats = argc > 2 ? std::strtoull(argv[2], nullptr, 10) : 3;
+    std::size_t const thread_count = std::max(1u, std::thread::hardware_concurrency());
+    std::vector<std::size_t> thread_counts{1};
+    if (thread_count > 1) {
+        thread_counts.push_back(thread_count);
+    }
+
+    auto uuid_gen = boost::uuids::random_generator_mt19937();
+
+    std::cout << std::fixed << std::setprecision(6);
+    for (std::size_t read_count : {100'000, 1'000'000, 5'000'000, 20'000'000}) {
+        if (read_count > max_read_count) {
+            break;
+        }
+
+        std::vector<boost::uuids::uuid> read_ids(read_count);
+        std::generate(read_ids.begin(), read_ids.end(), [&] { return uuid_gen(); });
+
+        std::vector<gsl::span<boost::uuids::uuid const>> batch_read_ids;
+        for (std::size_t start = 0; start < read_count; start += BATCH_SIZE) {
+            batch_read_ids.emplace_back(
+                read_ids.data() + start, std::min(BATCH_SIZE, read_count - start));
+        }
+
+        std::cout << "file reads: " << read_count << "\n";
+        for (std::size_t threads : thread_counts) {
+            auto const seconds = best_seconds(
+                repeats, [&] { (void)pod5::build_read_id_lookup(batch_read_ids, threads); });
+            std::cout << "  build lookup, " << threads << " threads: " << seconds << " s\n";
+        }
+
+        auto const lookup = pod5::build_read_id_lookup(batch_read_ids, thread_count);
+        std::vector<std::uint32_t> batch_counts(batch_read_ids.size());
+
+        for (std::size_t query_size = 10; query_size <= read_count; query_size *= 10) {
+            std::vector<boost::uuids::uuid> query(query_size);
+            for (std::size_t i = 0; i < query_size; ++i) {
+                query[i] = read_ids[(i * 7919) % read_count];
+            }
+
+            for (std::size_t threads : thread_counts) {
+                auto const seconds = best_seconds(
+                    repeats, [&] { pod5::ReadIdSearchInput(gsl::make_span(query), threads); });
+                std::cout << "  query " << query_size << " (1:" << read_count / query_size
+                          << "), sort on " << threads << " threads: " << seconds << " s\n";
+            }
+
+            pod5::ReadIdSearchInput const search_input(gsl::make_span(query), thread_count);
+            std::vector<std::uint32_t> batch_rows(query_size);
+            for (auto strategy :
+                 {pod5::ReadIdSearchStrategy::Merge,
+                  pod5::ReadIdSearchStrategy::Galloping,
+                  pod5::ReadIdSearchStrategy::Automatic})
+            {
+                auto const seconds = best_seconds(repeats, [&] {
+                    (void)pod5::search_read_id_lookup(
+                        gsl::make_span(lookup),
+                        search_input,
+                        gsl::make_span(batch_counts),
+                        gsl::make_span(batch_rows),
+                        strategy);
+                });
+                std::cout << "  query " << query_size << " (1:" << read_count / query_size << "), "
+                          << strategy_name(strategy) << " search: " << seconds << " s\n";
+            }
+        }
+    }
+
+    return EXIT_SUCCESS;
+}
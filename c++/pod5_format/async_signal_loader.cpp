@@ -1,5 +1,9 @@
 #include "pod5_format/async_signal_loader.h"
 
+#include <arrow/memory_pool.h>
+
+#include <numeric>
+
 namespace pod5 {
 
 const std::size_t AsyncSignalLoader::MINIMUM_JOB_SIZE = 50;
@@ -25,6 +29,7 @@ AsyncSignalLoader::AsyncSignalLoader(
 , m_finished(false)
 , m_has_error(false)
 , m_batches_size(0)
+, m_buffered_bytes(0)
 {
     // Setup first batch:
     {
@@ -41,12 +46,53 @@ AsyncSignalLoader::AsyncSignalLoader(
     }
 }
 
-AsyncSignalLoader::~AsyncSignalLoader()
+AsyncSignalLoader::~AsyncSignalLoader() { cancel(); }
+
+void AsyncSignalLoader::cancel()
 {
     m_finished = true;
     // Wait for all workers to complete:
-    for (std::size_t i = 0; i < m_workers.size(); ++i) {
-        m_workers[i].join();
+    for (auto & worker : m_workers) {
+        if (worker.joinable()) {
+            worker.join();
+        }
+    }
+
+    // Discard batches which may never be completed, and wake any reader waiting for one:
+    {
+        std::lock_guard<std::mutex> l(m_batches_sync);
+        m_batches.clear();
+        m_batches_size = 0;
+        m_buffered_bytes = 0;
+    }
+    m_batch_done.notify_all();
+    notify_batch_ready();
+}
+
+bool AsyncSignalLoader::is_next_batch_ready()
+{
+    if (m_has_error) {
+        return true;
+    }
+
+    std::lock_guard<std::mutex> l(m_batches_sync);
+    if (!m_batches.empty()) {
+        return m_batches.front()->is_complete();
+    }
+    return m_finished;
+}
+
+void AsyncSignalLoader::set_batch_ready_callback(std::function<void()> callback)
+{
+    std::lock_guard<std::mutex> l(m_callback_sync);
+    m_batch_ready_callback = std::move(callback);
+}
+
+void AsyncSignalLoader::notify_batch_ready()
+{
+    std::lock_guard<std::mutex> l(m_callback_sync);
+    if (m_batch_ready_callback) {
+        m_batch_ready_callback();
     }
 }
 
@@ -95,7 +141,9 @@ Result<std::unique_ptr<CachedBatchSignalData>> AsyncSignalLoader::release_next_b
             std::this_thread::sleep_for(std::chrono::milliseconds(1));
         }
 
-        return batch->release_data();
+        auto data = batch->release_data();
+        m_buffered_bytes -= data->samples_bytes();
+        return data;
     }
 
     // No more data - return null.
@@ -107,6 +155,7 @@ void AsyncSignalLoader::set_error(pod5::Status status)
     assert(!status.ok());
     m_error = status;
     m_has_error = true;
+    notify_batch_ready();
 }
 
 void AsyncSignalLoader::run_worker()
@@ -147,6 +196,7 @@ void AsyncSignalLoader::run_worker()
                 if (m_current_batch >= m_reads_batch_count) {
                     // No more work to do.
                     m_finished = true;
+                    notify_batch_ready();
                     break;
                 }
 
@@ -170,6 +220,9 @@ void AsyncSignalLoader::run_worker()
 
         // And report the work completed for anyone waiting:
         batch->complete_rows(m_worker_job_size);
+        if (batch->is_complete()) {
+            notify_batch_ready();
+        }
     }
 }
 
@@ -191,11 +244,22 @@ void AsyncSignalLoader::do_work(
         auto const signal_rows_span =
             gsl::make_span(signal_rows->raw_values(), signal_rows->length());
 
+        // Sample counts of contiguous batches are found when the batch is setup,
+        // so decompress straight into the batch's samples buffer:
+        if (m_samples_mode == SamplesMode::ContiguousSamples) {
+            auto samples_result =
+                m_reader->extract_samples(signal_rows_span, batch->contiguous_row_samples(i));
+            if (!samples_result.ok()) {
+                set_error(samples_result);
+                return;
+            }
+            continue;
+        }
+
         // Find the sample count for these rows:
         auto sample_count_result = m_reader->extract_sample_count(signal_rows_span);
         if (!sample_count_result.ok()) {
-            m_error = sample_count_result.status();
-            m_has_error = true;
+            set_error(sample_count_result.status());
             return;
         }
         std::uint64_t sample_count = *sample_count_result;
@@ -207,11 +271,11 @@ void AsyncSignalLoader::do_work(
             auto samples_result =
                 m_reader->extract_samples(signal_rows_span, gsl::make_span(samples));
             if (!samples_result.ok()) {
-                m_error = samples_result;
-                m_has_error = true;
+                set_error(samples_result);
                 return;
             }
             sample_count = samples.size();
+            m_buffered_bytes += samples.size() * sizeof(std::int16_t);
         }
 
         // Store the queried data into the batch:
@@ -235,6 +299,32 @@ Status AsyncSignalLoader::setup_next_in_progress_batch(std::unique_lock<std::mut
 
     m_in_progress_batch = std::make_shared<SignalCacheWorkPackage>(
         m_current_batch, row_count, next_specific_batch_rows, std::move(read_batch));
+    if (m_samples_mode == SamplesMode::ContiguousSamples) {
+        ARROW_RETURN_NOT_OK(allocate_contiguous_samples(*m_in_progress_batch));
+    }
+    return Status::OK();
+}
+
+Status AsyncSignalLoader::allocate_contiguous_samples(SignalCacheWorkPackage & batch)
+{
+    auto signal_column = batch.read_batch().signal_column();
+
+    std::vector<std::uint64_t> sample_counts(batch.job_row_count());
+    for (std::uint32_t i = 0; i < batch.job_row_count(); ++i) {
+        auto const signal_rows = std::static_pointer_cast<arrow::UInt64Array>(
+            signal_column->value_slice(batch.get_batch_row_to_query(i)));
+        ARROW_ASSIGN_OR_RAISE(
+            sample_counts[i],
+            m_reader->extract_sample_count(
+                gsl::make_span(signal_rows->raw_values(), signal_rows->length())));
+    }
+
+    auto const sample_bytes =
+        std::accumulate(sample_counts.begin(), sample_counts.end(), std::uint64_t(0))
+        * sizeof(std::int16_t);
+    ARROW_RETURN_NOT_OK(
+        batch.allocate_contiguous_samples(std::move(sample_counts), m_reader->memory_pool()));
+    m_buffered_bytes += sample_bytes;
     return Status::OK();
 }
 
@@ -247,6 +337,7 @@ void AsyncSignalLoader::release_in_progress_batch()
         m_batches_size += 1;
         m_batch_done.notify_all();
     }
+    notify_batch_ready();
 }
 
 }  // namespace pod5
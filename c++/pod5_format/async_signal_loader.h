@@ -7,10 +7,12 @@
 
 #include <arrow/array/array_nested.h>
 #include <arrow/array/array_primitive.h>
+#include <arrow/buffer.h>
 #include <boost/thread/synchronized_value.hpp>
 
 #include <condition_variable>
 #include <deque>
+#include <functional>
 #include <memory>
 #include <mutex>
 #include <thread>
@@ -34,6 +36,28 @@ class POD5_FORMAT_EXPORT CachedBatchSignalData {
     /// Find a list of signal samples counts for all requested batch rows.
     std::vector<std::vector<std::int16_t>> const & samples() const { return m_samples; }
 
+    /// Find the offset of each requested batch row in the contiguous samples buffer,
+    /// row i occupies samples [offsets[i], offsets[i + 1]).
+    /// \note Empty unless the batch was loaded contiguously.
+    std::vector<std::uint64_t> const & sample_offsets() const { return m_sample_offsets; }
+
+    /// Find the samples of all requested batch rows, stored in one contiguous int16 buffer.
+    /// \note Null unless the batch was loaded contiguously.
+    std::shared_ptr<arrow::Buffer> const & contiguous_samples() const
+    {
+        return m_contiguous_samples;
+    }
+
+    /// Find the region of the contiguous samples buffer for a requested batch row.
+    gsl::span<std::int16_t> contiguous_row_samples(std::size_t row)
+    {
+        auto const samples =
+            gsl::make_span(m_contiguous_samples->mutable_data(), m_contiguous_samples->size())
+                .as_span<std::int16_t>();
+        return samples.subspan(
+            m_sample_offsets[row], m_sample_offsets[row + 1] - m_sample_offsets[row]);
+    }
+
     void
     set_samples(std::size_t row, std::uint64_t sample_count, std::vector<std::int16_t> && samples)
     {
@@ -41,10 +65,43 @@ class POD5_FORMAT_EXPORT CachedBatchSignalData {
         m_samples[row] = std::move(samples);
     }
 
+    /// Find the number of bytes of loaded samples held by this batch.
+    std::size_t samples_bytes() const
+    {
+        if (m_contiguous_samples) {
+            return m_contiguous_samples->size();
+        }
+        std::size_t bytes = 0;
+        for (auto const & row_samples : m_samples) {
+            bytes += row_samples.size() * sizeof(std::int16_t);
+        }
+        return bytes;
+    }
+
+    /// Allocate one contiguous samples buffer holding the samples of all requested batch rows.
+    Status allocate_contiguous_samples(
+        std::vector<std::uint64_t> && sample_counts,
+        arrow::MemoryPool * pool)
+    {
+        m_sample_counts = std::move(sample_counts);
+        m_sample_offsets.resize(m_sample_counts.size() + 1);
+        m_sample_offsets[0] = 0;
+        for (std::size_t i = 0; i < m_sample_counts.size(); ++i) {
+            m_sample_offsets[i + 1] = m_sample_offsets[i] + m_sample_counts[i];
+        }
+
+        ARROW_ASSIGN_OR_RAISE(
+            m_contiguous_samples,
+            arrow::AllocateBuffer(m_sample_offsets.back() * sizeof(std::int16_t), pool));
+        return Status::OK();
+    }
+
 private:
     std::uint32_t m_batch_index;
     std::vector<std::uint64_t> m_sample_counts;
     std::vector<std::vector<std::int16_t>> m_samples;
+    std::vector<std::uint64_t> m_sample_offsets;
+    std::shared_ptr<arrow::Buffer> m_contiguous_samples;
 };
 
 class POD5_FORMAT_EXPORT SignalCacheWorkPackage {
@@ -71,6 +128,18 @@ class POD5_FORMAT_EXPORT SignalCacheWorkPackage {
         m_cached_data->set_samples(row, sample_count, std::move(samples));
     }
 
+    Status allocate_contiguous_samples(
+        std::vector<std::uint64_t> && sample_counts,
+        arrow::MemoryPool * pool)
+    {
+        return m_cached_data->allocate_contiguous_samples(std::move(sample_counts), pool);
+    }
+
+    gsl::span<std::int16_t> contiguous_row_samples(std::size_t row)
+    {
+        return m_cached_data->contiguous_row_samples(row);
+    }
+
     std::unique_ptr<CachedBatchSignalData> release_data() { return std::move(m_cached_data); }
 
     pod5::ReadTableRecordBatch const & read_batch() const { return m_read_batch; }
@@ -117,6 +186,8 @@ class POD5_FORMAT_EXPORT AsyncSignalLoader {
     enum class SamplesMode {
         NoSamples,
         Samples,
+        // Load the samples of each batch into one contiguous buffer, indexed by sample offsets.
+        ContiguousSamples,
     };
 
     AsyncSignalLoader(
@@ -132,6 +203,20 @@ class POD5_FORMAT_EXPORT AsyncSignalLoader {
     /// Find if all work is complete in the loader.
     bool is_finished() const { return m_finished; }
 
+    /// Find if a call to release_next_batch will return without waiting for work,
+    /// either because the next batch is complete, all work is finished or an error occurred.
+    bool is_next_batch_ready();
+
+    /// Find the number of bytes of samples loaded by the workers which have not yet been released.
+    std::size_t buffered_bytes() const { return m_buffered_bytes; }
+
+    /// Set a callback invoked from the worker threads whenever a batch may have become ready.
+    /// \note The callback must be thread safe and must not call back into the loader.
+    void set_batch_ready_callback(std::function<void()> callback);
+
+    /// Stop all outstanding work, discarding any unreleased batches, and wait for the worker threads to exit.
+    void cancel();
+
     /// Get the next batch of loaded signal, always returns the consecutive next signal batch
     /// \note Returns nullptr when timeoout occurs, or if all data is exhausted.
     Result<std::unique_ptr<CachedBatchSignalData>> release_next_batch(
@@ -141,6 +226,9 @@ class POD5_FORMAT_EXPORT AsyncSignalLoader {
     /// Set an error code that will stop all async loading and return an error to the caller.
     void set_error(pod5::Status status);
 
+    /// Invoke the batch ready callback, if one is set.
+    void notify_batch_ready();
+
     void run_worker();
     void do_work(
         std::shared_ptr<SignalCacheWorkPackage> const & batch,
@@ -153,6 +241,9 @@ class POD5_FORMAT_EXPORT AsyncSignalLoader {
     /// \note m_current_batch is used as the index of the next batch to begin.
     Status setup_next_in_progress_batch(std::unique_lock<std::mutex> & lock);
 
+    /// Find the sample counts of all rows in a batch and allocate its contiguous samples buffer.
+    Status allocate_contiguous_samples(SignalCacheWorkPackage & batch);
+
     /// Release the currently in progress batch to readers, if it exists.
     /// \note This call locks m_batches_sync internally.
     /// \note The batch must not have any work remaining to start, but can be completing already started work.
@@ -181,6 +272,10 @@ class POD5_FORMAT_EXPORT AsyncSignalLoader {
     std::mutex m_batches_sync;
     std::atomic<std::uint32_t> m_batches_size;
     std::deque<std::shared_ptr<SignalCacheWorkPackage>> m_batches;
+    std::atomic<std::size_t> m_buffered_bytes;
+
+    std::mutex m_callback_sync;
+    std::function<void()> m_batch_ready_callback;
 
     std::vector<std::thread> m_workers;
 };
@@ -40,7 +40,8 @@ class FileReaderImpl : public FileReader {
         MigrationResult && migration_result,
         RunInfoTableReader && run_info_table_reader,
         ReadTableReader && read_table_reader,
-        SignalTableReader && signal_table_reader)
+        SignalTableReader && signal_table_reader,
+        arrow::MemoryPool * memory_pool)
     : m_file_version_pre_migration(file_version_pre_migration)
     , m_migration_result(std::move(migration_result))
     , m_run_info_table_location(make_file_locaton(m_migration_result.footer().run_info_table))
@@ -49,6 +50,7 @@ class FileReaderImpl : public FileReader {
     , m_run_info_table_reader(std::move(run_info_table_reader))
     , m_read_table_reader(std::move(read_table_reader))
     , m_signal_table_reader(std::move(signal_table_reader))
+    , m_memory_pool(memory_pool)
     {
     }
 
@@ -135,8 +137,15 @@ class FileReaderImpl : public FileReader {
 
     Version file_version_pre_migration() const override { return m_file_version_pre_migration; }
 
+    boost::optional<FileStatistics> const & file_statistics() const override
+    {
+        return m_migration_result.footer().statistics;
+    }
+
     SignalType signal_type() const override { return m_signal_table_reader.signal_type(); }
 
+    arrow::MemoryPool * memory_pool() const override { return m_memory_pool; }
+
     Result<std::shared_ptr<RunInfoData const>> find_run_info(
         std::string const & acquisition_id) const override
     {
@@ -162,6 +171,7 @@ class FileReaderImpl : public FileReader {
     RunInfoTableReader m_run_info_table_reader;
     ReadTableReader m_read_table_reader;
     SignalTableReader m_signal_table_reader;
+    arrow::MemoryPool * m_memory_pool;
 };
 
 pod5::Result<std::shared_ptr<FileReader>> open_file_reader(
@@ -225,7 +235,8 @@ pod5::Result<std::shared_ptr<FileReader>> open_file_reader(
         std::move(migration_result),
         std::move(run_info_table_reader),
         std::move(read_table_reader),
-        std::move(signal_table_reader));
+        std::move(signal_table_reader),
+        pool);
 }
 
 }  // namespace pod5
@@ -1,10 +1,13 @@
 #pragma once
 
+#include "pod5_format/file_statistics.h"
 #include "pod5_format/pod5_format_export.h"
 #include "pod5_format/read_table_utils.h"
 #include "pod5_format/result.h"
 #include "pod5_format/signal_table_utils.h"
 
+#include <boost/optional/optional.hpp>
+
 #include <cstdint>
 #include <memory>
 
@@ -107,8 +110,15 @@ class POD5_FORMAT_EXPORT FileReader {
 
     virtual Version file_version_pre_migration() const = 0;
 
+    /// \brief Find the aggregate statistics recorded in the file footer.
+    /// \returns The statistics, or none if the file was written without footer statistics.
+    virtual boost::optional<FileStatistics> const & file_statistics() const = 0;
+
     virtual SignalType signal_type() const = 0;
 
+    /// \brief Find the memory pool the reader allocates batches and loaded samples from.
+    virtual arrow::MemoryPool * memory_pool() const = 0;
+
     virtual Result<std::shared_ptr<RunInfoData const>> find_run_info(
         std::string const & acquisition_id) const = 0;
 
@@ -0,0 +1,24 @@
+#pragma once
+
+#include <cstdint>
+#include <string>
+#include <vector>
+
+namespace pod5 {
+
+struct RunInfoReadCount {
+    std::string acquisition_id;
+    std::uint64_t read_count = 0;
+};
+
+/// \brief Aggregate statistics of the reads in a file, stored in the file footer on close.
+struct FileStatistics {
+    std::uint64_t read_count = 0;
+    std::uint64_t sample_count = 0;
+    std::uint64_t signal_bytes = 0;
+    std::uint64_t min_start_sample = 0;
+    std::uint64_t max_start_sample = 0;
+    std::vector<RunInfoReadCount> run_info_read_counts;
+};
+
+}  // namespace pod5
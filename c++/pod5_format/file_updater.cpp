@@ -57,7 +57,8 @@ pod5::Status update_file(
         metadata.writing_software,
         signal_info_table,
         run_info_info_table,
-        reads_info_table));
+        reads_info_table,
+        source->file_statistics()));
 
     return main_file->Close();
 }
@@ -1,6 +1,7 @@
 #include "pod5_format/file_writer.h"
 
 #include "pod5_format/file_recovery.h"
+#include "pod5_format/file_statistics.h"
 #include "pod5_format/internal/async_output_stream.h"
 #include "pod5_format/internal/combined_file_utils.h"
 #include "pod5_format/read_table_reader.h"
@@ -19,6 +20,7 @@
 #include <boost/optional/optional.hpp>
 #include <boost/uuid/random_generator.hpp>
 
+#include <algorithm>
 #include <iostream>
 
 namespace pod5 {
@@ -74,7 +76,15 @@ class FileWriterImpl {
     pod5::Result<RunInfoDictionaryIndex> add_run_info(RunInfoData const & run_info_data)
     {
         ARROW_RETURN_NOT_OK(m_run_info_table_writer->add_run_info(run_info_data));
-        return m_read_table_dict_writers.run_info_writer->add(run_info_data.acquisition_id);
+        ARROW_ASSIGN_OR_RAISE(
+            auto const index,
+            m_read_table_dict_writers.run_info_writer->add(run_info_data.acquisition_id));
+
+        if (std::size_t(index) >= m_run_info_read_counts.size()) {
+            m_run_info_read_counts.resize(index + 1);
+        }
+        m_run_info_read_counts[index].acquisition_id = run_info_data.acquisition_id;
+        return index;
     }
 
     pod5::Status add_complete_read(
@@ -91,7 +101,10 @@ class FileWriterImpl {
         // Write read data and signal row entries:
         auto read_table_row = m_read_table_writer->add_read(
             read_data, gsl::make_span(signal_rows.data(), signal_rows.size()), signal.size());
-        return read_table_row.status();
+        ARROW_RETURN_NOT_OK(read_table_row.status());
+
+        record_read_statistics(read_data, signal.size());
+        return arrow::Status::OK();
     }
 
     pod5::Status add_complete_read(
@@ -106,7 +119,10 @@ class FileWriterImpl {
         // Write read data and signal row entries:
         auto read_table_row =
             m_read_table_writer->add_read(read_data, signal_rows, signal_duration);
-        return read_table_row.status();
+        ARROW_RETURN_NOT_OK(read_table_row.status());
+
+        record_read_statistics(read_data, signal_duration);
+        return arrow::Status::OK();
     }
 
     pod5::Result<std::vector<SignalTableRowIndex>> add_signal(
@@ -200,9 +216,26 @@ class FileWriterImpl {
         if (is_closed()) {
             return nullptr;
         }
+        // Reads added directly to the table writer are not tracked in the file statistics:
+        m_statistics_complete = false;
         return m_read_table_writer.get_ptr();
     }
 
+    /// \brief Find the statistics of all reads written so far, or none if reads
+    ///        were added without passing through this writer.
+    /// \param signal_bytes The length in bytes of the written signal table.
+    boost::optional<FileStatistics> statistics(std::uint64_t signal_bytes) const
+    {
+        if (!m_statistics_complete) {
+            return boost::none;
+        }
+
+        FileStatistics result = m_statistics;
+        result.signal_bytes = signal_bytes;
+        result.run_info_read_counts = m_run_info_read_counts;
+        return result;
+    }
+
     SignalTableWriter * signal_table_writer()
     {
         if (is_closed()) {
@@ -212,12 +245,36 @@ class FileWriterImpl {
     }
 
 private:
+    void record_read_statistics(ReadData const & read_data, std::uint64_t sample_count)
+    {
+        if (m_statistics.read_count == 0) {
+            m_statistics.min_start_sample = read_data.start_sample;
+            m_statistics.max_start_sample = read_data.start_sample;
+        } else {
+            m_statistics.min_start_sample =
+                std::min(m_statistics.min_start_sample, read_data.start_sample);
+            m_statistics.max_start_sample =
+                std::max(m_statistics.max_start_sample, read_data.start_sample);
+        }
+        m_statistics.read_count += 1;
+        m_statistics.sample_count += sample_count;
+
+        if (read_data.run_info >= 0
+            && std::size_t(read_data.run_info) < m_run_info_read_counts.size()) {
+            m_run_info_read_counts[read_data.run_info].read_count += 1;
+        }
+    }
+
     DictionaryWriters m_read_table_dict_writers;
     boost::optional<RunInfoTableWriter> m_run_info_table_writer;
     boost::optional<ReadTableWriter> m_read_table_writer;
     boost::optional<SignalTableWriter> m_signal_table_writer;
     std::uint32_t m_signal_chunk_size;
     arrow::MemoryPool * m_pool;
+
+    FileStatistics m_statistics;
+    std::vector<RunInfoReadCount> m_run_info_read_counts;
+    bool m_statistics_complete = true;
 };
 
 class CombinedFileWriterImpl : public FileWriterImpl {
@@ -313,7 +370,8 @@ class CombinedFileWriterImpl : public FileWriterImpl {
             m_software_name,
             signal_table,
             run_info_info_table,
-            reads_info_table));
+            reads_info_table,
+            statistics(signal_table.file_length)));
         return arrow::Status::OK();
     }
 
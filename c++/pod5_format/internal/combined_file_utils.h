@@ -2,6 +2,7 @@
 
 #include "footer_generated.h"
 #include "pod5_format/file_reader.h"
+#include "pod5_format/file_statistics.h"
 #include "pod5_format/result.h"
 #include "pod5_format/version.h"
 
@@ -10,6 +11,7 @@
 #include <arrow/util/endian.h>
 #include <arrow/util/io_util.h>
 #include <boost/lexical_cast.hpp>
+#include <boost/optional/optional.hpp>
 #include <boost/uuid/uuid_io.hpp>
 #include <flatbuffers/flatbuffers.h>
 
@@ -82,16 +84,43 @@ struct ParsedFileInfo : FileInfo {
     }
 };
 
+inline flatbuffers::Offset<Minknow::ReadsFormat::FileStatistics> write_statistics_flatbuffer(
+    flatbuffers::FlatBufferBuilder & builder,
+    FileStatistics const & statistics)
+{
+    std::vector<flatbuffers::Offset<Minknow::ReadsFormat::RunInfoReadCount>> run_info_read_counts;
+    run_info_read_counts.reserve(statistics.run_info_read_counts.size());
+    for (auto const & run_info_read_count : statistics.run_info_read_counts) {
+        run_info_read_counts.push_back(Minknow::ReadsFormat::CreateRunInfoReadCountDirect(
+            builder, run_info_read_count.acquisition_id.c_str(), run_info_read_count.read_count));
+    }
+
+    return Minknow::ReadsFormat::CreateFileStatisticsDirect(
+        builder,
+        statistics.read_count,
+        statistics.sample_count,
+        statistics.signal_bytes,
+        statistics.min_start_sample,
+        statistics.max_start_sample,
+        &run_info_read_counts);
+}
+
 inline pod5::Result<std::int64_t> write_footer_flatbuffer(
     std::shared_ptr<arrow::io::OutputStream> const & sink,
     boost::uuids::uuid const & file_identifier,
     std::string const & software_name,
     FileInfo const & signal_table,
     FileInfo const & run_info_table,
-    FileInfo const & reads_table)
+    FileInfo const & reads_table,
+    boost::optional<FileStatistics> const & statistics)
 {
     flatbuffers::FlatBufferBuilder builder(1024);
 
+    flatbuffers::Offset<Minknow::ReadsFormat::FileStatistics> statistics_offset;
+    if (statistics) {
+        statistics_offset = write_statistics_flatbuffer(builder, *statistics);
+    }
+
     auto signal_file = Minknow::ReadsFormat::CreateEmbeddedFile(
         builder,
         signal_table.file_start_offset,
@@ -120,7 +149,8 @@ inline pod5::Result<std::int64_t> write_footer_flatbuffer(
         boost::uuids::to_string(file_identifier).c_str(),
         software_name.c_str(),
         Pod5Version.c_str(),
-        &files);
+        &files,
+        statistics_offset);
 
     builder.Finish(footer);
     ARROW_RETURN_NOT_OK(sink->Write(builder.GetBufferPointer(), builder.GetSize()));
@@ -134,13 +164,20 @@ inline pod5::Status write_footer(
     std::string const & software_name,
     FileInfo const & signal_table,
     FileInfo const & run_info_table,
-    FileInfo const & reads_table)
+    FileInfo const & reads_table,
+    boost::optional<FileStatistics> const & statistics = boost::none)
 {
     ARROW_RETURN_NOT_OK(write_footer_magic(sink));
     ARROW_ASSIGN_OR_RAISE(
         std::int64_t length,
         write_footer_flatbuffer(
-            sink, file_identifier, software_name, signal_table, run_info_table, reads_table));
+            sink,
+            file_identifier,
+            software_name,
+            signal_table,
+            run_info_table,
+            reads_table,
+            statistics));
     ARROW_RETURN_NOT_OK(pad_file(sink, 8));
 
     std::int64_t paded_flatbuffer_size = arrow::bit_util::ToLittleEndian(length);
@@ -158,6 +195,9 @@ struct ParsedFooter {
     ParsedFileInfo run_info_table;
     ParsedFileInfo reads_table;
     ParsedFileInfo signal_table;
+
+    // Only present in files written with footer statistics:
+    boost::optional<FileStatistics> statistics;
 };
 
 inline pod5::Status check_signature(
@@ -275,6 +315,26 @@ inline pod5::Result<ParsedFooter> read_footer(
         }
     }
 
+    if (auto const fb_statistics = fb_footer->statistics()) {
+        FileStatistics statistics;
+        statistics.read_count = fb_statistics->read_count();
+        statistics.sample_count = fb_statistics->sample_count();
+        statistics.signal_bytes = fb_statistics->signal_bytes();
+        statistics.min_start_sample = fb_statistics->min_start_sample();
+        statistics.max_start_sample = fb_statistics->max_start_sample();
+        if (auto const fb_run_info_read_counts = fb_statistics->run_info_read_counts()) {
+            for (auto const fb_run_info_read_count : *fb_run_info_read_counts) {
+                if (!fb_run_info_read_count->acquisition_id()) {
+                    return arrow::Status::IOError("Invalid footer statistics acquisition_id");
+                }
+                statistics.run_info_read_counts.push_back(
+                    {fb_run_info_read_count->acquisition_id()->str(),
+                     fb_run_info_read_count->read_count()});
+            }
+        }
+        footer.statistics = std::move(statistics);
+    }
+
     return footer;
 }
 
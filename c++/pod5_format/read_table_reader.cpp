@@ -227,38 +227,23 @@ Status ReadTableReader::build_read_id_lookup()
         return Status::OK();
     }
 
-    std::vector<IndexData> file_read_ids;
-
     auto const batch_count = num_record_batches();
-    std::size_t abs_row_count = 0;
 
-    // Loop each batch and copy read ids out into the index:
+    // Keep each batch open while its read ids are copied out into the index:
+    std::vector<ReadTableRecordBatch> batches;
+    std::vector<gsl::span<boost::uuids::uuid const>> batch_read_ids;
+    batches.reserve(batch_count);
+    batch_read_ids.reserve(batch_count);
     for (std::size_t i = 0; i < batch_count; ++i) {
         ARROW_ASSIGN_OR_RAISE(auto batch, read_record_batch(i));
-
-        if (file_read_ids.empty()) {
-            file_read_ids.reserve(batch.num_rows() * batch_count);
-        }
-        file_read_ids.resize(file_read_ids.size() + batch.num_rows());
-
         auto read_id_col = batch.read_id_column();
-        auto raw_read_id_values = read_id_col->raw_values();
-        for (std::size_t row = 0; row < (std::size_t)read_id_col->length(); ++row) {
-            // Record the id, and its location within the file:
-            file_read_ids[abs_row_count].id = raw_read_id_values[row];
-            file_read_ids[abs_row_count].batch = i;
-            file_read_ids[abs_row_count].batch_row = row;
-            abs_row_count += 1;
-        }
+        batch_read_ids.emplace_back(
+            read_id_col->raw_values(), static_cast<std::size_t>(read_id_col->length()));
+        batches.emplace_back(std::move(batch));
     }
 
-    // Sort by read id for searching later:
-    std::sort(file_read_ids.begin(), file_read_ids.end(), [](auto const & a, auto const & b) {
-        return a.id < b.id;
-    });
-
     // Move data out now we successfully build the index:
-    m_sorted_file_read_ids = std::move(file_read_ids);
+    m_sorted_file_read_ids = pod5::build_read_id_lookup(batch_read_ids);
 
     return Status::OK();
 }
@@ -266,55 +251,13 @@ Status ReadTableReader::build_read_id_lookup()
 Result<std::size_t> ReadTableReader::search_for_read_ids(
     ReadIdSearchInput const & search_input,
     gsl::span<uint32_t> const & batch_counts,
-    gsl::span<uint32_t> const & batch_rows)
+    gsl::span<uint32_t> const & batch_rows,
+    ReadIdSearchStrategy strategy)
 {
     ARROW_RETURN_NOT_OK(build_read_id_lookup());
 
-    std::size_t successes = 0;
-
-    std::vector<std::vector<std::uint32_t>> batch_data(batch_counts.size());
-    auto const initial_reserve_size = search_input.read_id_count() / batch_counts.size();
-    for (auto & br : batch_data) {
-        br.reserve(initial_reserve_size);
-    }
-
-    auto file_ids_current_it = m_sorted_file_read_ids.begin();
-    auto const file_ids_end = m_sorted_file_read_ids.end();
-    for (std::size_t i = 0; i < search_input.read_id_count(); ++i) {
-        auto const & search_item = search_input[i];
-
-        // Increment file pointer while less than the search term:
-        while (file_ids_current_it->id < search_item.id && file_ids_current_it != file_ids_end) {
-            ++file_ids_current_it;
-        }
-
-        // No more ids to search, both lists are sorted and we haven't found this one, we won't find any others.
-        if (file_ids_current_it == file_ids_end) {
-            break;
-        }
-
-        // If we found it record the location:
-        if (file_ids_current_it->id == search_item.id) {
-            batch_data[file_ids_current_it->batch].push_back(file_ids_current_it->batch_row);
-            successes += 1;
-        }
-    }
-
-    std::size_t full_size_so_far = 0;
-    for (std::size_t i = 0; i < batch_data.size(); ++i) {
-        auto & data = batch_data[i];
-        batch_counts[i] = data.size();
-
-        // Ensure the batch indices within the batch are sorted:
-        std::sort(data.begin(), data.end());
-
-        // Copy the row indices into the packed vector:
-        std::copy(data.begin(), data.end(), batch_rows.begin() + full_size_so_far);
-
-        full_size_so_far += data.size();
-    }
-
-    return successes;
+    return search_read_id_lookup(
+        gsl::make_span(m_sorted_file_read_ids), search_input, batch_counts, batch_rows, strategy);
 }
 
 //---------------------------------------------------------------------------------------------------------------------
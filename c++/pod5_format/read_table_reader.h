@@ -108,17 +108,12 @@ class POD5_FORMAT_EXPORT ReadTableReader : public TableReader {
     Result<std::size_t> search_for_read_ids(
         ReadIdSearchInput const & search_input,
         gsl::span<uint32_t> const & batch_counts,
-        gsl::span<uint32_t> const & batch_rows);
+        gsl::span<uint32_t> const & batch_rows,
+        ReadIdSearchStrategy strategy = ReadIdSearchStrategy::Automatic);
 
 private:
-    struct IndexData {
-        boost::uuids::uuid id;
-        std::size_t batch;
-        std::size_t batch_row;
-    };
-
     std::shared_ptr<ReadTableSchemaDescription const> m_field_locations;
-    std::vector<IndexData> m_sorted_file_read_ids;
+    std::vector<ReadIdLookupEntry> m_sorted_file_read_ids;
 
     mutable std::mutex m_batch_get_mutex;
 };
@@ -4,7 +4,123 @@
 
 namespace pod5 {
 
-ReadIdSearchInput::ReadIdSearchInput(gsl::span<boost::uuids::uuid const> const & input_ids)
+namespace {
+
+// Ranges smaller than this are sorted or filled on a single thread.
+std::size_t const MINIMUM_PARALLEL_RANGE = 1 << 16;
+
+// Queries smaller than the lookup by this factor are galloped over the lookup, as galloping
+// visits O(log(lookup / query)) lookup entries per query id, rather than merged. Below this
+// ratio the cache friendly linear merge is as fast (see read_id_search_benchmark).
+std::size_t const GALLOPING_LOOKUP_RATIO = 64;
+
+std::size_t parallel_range_count(std::size_t size, std::size_t thread_count)
+{
+    return std::max<std::size_t>(1, std::min(thread_count, size / MINIMUM_PARALLEL_RANGE));
+}
+
+// Joins every started thread when leaving scope, including when starting a thread throws.
+class ThreadJoiner {
+public:
+    explicit ThreadJoiner(std::vector<std::thread> & threads) : m_threads(threads) {}
+
+    ~ThreadJoiner()
+    {
+        for (auto & thread : m_threads) {
+            if (thread.joinable()) {
+                thread.join();
+            }
+        }
+    }
+
+private:
+    std::vector<std::thread> & m_threads;
+};
+
+// Run [task] for each index in [0, task_count), on a thread per task.
+template <typename Task>
+void run_in_parallel(std::size_t task_count, Task const & task)
+{
+    std::vector<std::thread> threads;
+    threads.reserve(task_count);
+    ThreadJoiner joiner(threads);
+    for (std::size_t i = 1; i < task_count; ++i) {
+        threads.emplace_back([&task, i] { task(i); });
+    }
+    if (task_count > 0) {
+        task(0);
+    }
+}
+
+// Sort equal ranges of [begin, end) on up to [thread_count] threads, then merge adjacent sorted
+// ranges pairwise in parallel until one sorted range remains.
+template <typename Iterator, typename Compare>
+void parallel_sort(Iterator begin, Iterator end, Compare const & compare, std::size_t thread_count)
+{
+    std::size_t const size = std::distance(begin, end);
+    std::size_t const range_count = parallel_range_count(size, thread_count);
+    if (range_count == 1) {
+        std::sort(begin, end, compare);
+        return;
+    }
+
+    std::vector<Iterator> bounds;
+    for (std::size_t i = 0; i < range_count; ++i) {
+        bounds.push_back(begin + (size * i) / range_count);
+    }
+    bounds.push_back(end);
+
+    run_in_parallel(
+        range_count, [&](std::size_t i) { std::sort(bounds[i], bounds[i + 1], compare); });
+
+    while (bounds.size() > 2) {
+        run_in_parallel((bounds.size() - 1) / 2, [&](std::size_t i) {
+            std::inplace_merge(bounds[2 * i], bounds[2 * i + 1], bounds[2 * i + 2], compare);
+        });
+
+        std::vector<Iterator> merged_bounds;
+        for (std::size_t i = 0; i < bounds.size(); i += 2) {
+            merged_bounds.push_back(bounds[i]);
+        }
+        if (merged_bounds.back() != end) {
+            merged_bounds.push_back(end);
+        }
+        bounds = std::move(merged_bounds);
+    }
+}
+
+// Find the first lookup entry not less than [id], starting from [current] and searching
+// exponentially larger steps forward before binary searching the last step.
+ReadIdLookupEntry const * gallop_to(
+    ReadIdLookupEntry const * current,
+    ReadIdLookupEntry const * end,
+    boost::uuids::uuid const & id)
+{
+    if (current == end || !(current->id < id)) {
+        return current;
+    }
+
+    std::size_t step = 1;
+    while (step < std::size_t(end - current) && current[step].id < id) {
+        current += step;
+        step *= 2;
+    }
+
+    auto const step_end = step < std::size_t(end - current) ? current + step : end;
+    return std::lower_bound(
+        current + 1,
+        step_end,
+        id,
+        [](ReadIdLookupEntry const & entry, boost::uuids::uuid const & id) {
+            return entry.id < id;
+        });
+}
+
+}  // namespace
+
+ReadIdSearchInput::ReadIdSearchInput(
+    gsl::span<boost::uuids::uuid const> const & input_ids,
+    std::size_t thread_count)
 : m_search_read_ids(input_ids.size())
 {
     // Copy in search input:
@@ -14,10 +130,116 @@ ReadIdSearchInput::ReadIdSearchInput(gsl::span<boost::uuids::uuid const> const &
     }
 
     // Sort input based on read id:
-    std::sort(
-        m_search_read_ids.begin(), m_search_read_ids.end(), [](auto const & a, auto const & b) {
-            return a.id < b.id;
-        });
+    parallel_sort(
+        m_search_read_ids.begin(),
+        m_search_read_ids.end(),
+        [](auto const & a, auto const & b) { return a.id < b.id; },
+        thread_count);
+}
+
+std::vector<ReadIdLookupEntry> build_read_id_lookup(
+    std::vector<gsl::span<boost::uuids::uuid const>> const & batch_read_ids,
+    std::size_t thread_count)
+{
+    std::vector<std::size_t> batch_offsets(batch_read_ids.size() + 1, 0);
+    for (std::size_t i = 0; i < batch_read_ids.size(); ++i) {
+        batch_offsets[i + 1] = batch_offsets[i] + batch_read_ids[i].size();
+    }
+
+    std::vector<ReadIdLookupEntry> lookup(batch_offsets.back());
+
+    // Record each id and its location within the file, splitting the batches between threads:
+    std::size_t const range_count = parallel_range_count(lookup.size(), thread_count);
+    run_in_parallel(range_count, [&](std::size_t range) {
+        auto const first_batch = (batch_read_ids.size() * range) / range_count;
+        auto const last_batch = (batch_read_ids.size() * (range + 1)) / range_count;
+        for (std::size_t batch = first_batch; batch < last_batch; ++batch) {
+            auto const & read_ids = batch_read_ids[batch];
+            auto entry = lookup.begin() + batch_offsets[batch];
+            for (std::size_t row = 0; row < read_ids.size(); ++row, ++entry) {
+                entry->id = read_ids[row];
+                entry->batch = batch;
+                entry->batch_row = row;
+            }
+        }
+    });
+
+    // Sort by read id for searching later:
+    parallel_sort(
+        lookup.begin(),
+        lookup.end(),
+        [](auto const & a, auto const & b) { return a.id < b.id; },
+        thread_count);
+
+    return lookup;
+}
+
+std::size_t search_read_id_lookup(
+    gsl::span<ReadIdLookupEntry const> const & lookup,
+    ReadIdSearchInput const & search_input,
+    gsl::span<std::uint32_t> const & batch_counts,
+    gsl::span<std::uint32_t> const & batch_rows,
+    ReadIdSearchStrategy strategy)
+{
+    auto const query_count = search_input.read_id_count();
+    if (strategy == ReadIdSearchStrategy::Automatic) {
+        strategy = query_count * GALLOPING_LOOKUP_RATIO < std::size_t(lookup.size())
+                       ? ReadIdSearchStrategy::Galloping
+                       : ReadIdSearchStrategy::Merge;
+    }
+
+    std::size_t successes = 0;
+
+    std::vector<std::vector<std::uint32_t>> batch_data(batch_counts.size());
+    if (!batch_counts.empty()) {
+        auto const initial_reserve_size = query_count / batch_counts.size();
+        for (auto & br : batch_data) {
+            br.reserve(initial_reserve_size);
+        }
+    }
+
+    auto file_ids_current_it = lookup.data();
+    auto const file_ids_end = lookup.data() + lookup.size();
+    for (std::size_t i = 0; i < query_count; ++i) {
+        auto const & search_item = search_input[i];
+
+        if (strategy == ReadIdSearchStrategy::Galloping) {
+            file_ids_current_it = gallop_to(file_ids_current_it, file_ids_end, search_item.id);
+        } else {
+            // Increment file pointer while less than the search term:
+            while (file_ids_current_it != file_ids_end && file_ids_current_it->id < search_item.id)
+            {
+                ++file_ids_current_it;
+            }
+        }
+
+        // No more ids to search, both lists are sorted and we haven't found this one, we won't find any others.
+        if (file_ids_current_it == file_ids_end) {
+            break;
+        }
+
+        // If we found it record the location:
+        if (file_ids_current_it->id == search_item.id) {
+            batch_data[file_ids_current_it->batch].push_back(file_ids_current_it->batch_row);
+            successes += 1;
+        }
+    }
+
+    std::size_t full_size_so_far = 0;
+    for (std::size_t i = 0; i < batch_data.size(); ++i) {
+        auto & data = batch_data[i];
+        batch_counts[i] = data.size();
+
+        // Ensure the batch indices within the batch are sorted:
+        std::sort(data.begin(), data.end());
+
+        // Copy the row indices into the packed vector:
+        std::copy(data.begin(), data.end(), batch_rows.begin() + full_size_so_far);
+
+        full_size_so_far += data.size();
+    }
+
+    return successes;
 }
 
 }  // namespace pod5
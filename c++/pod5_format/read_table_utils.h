@@ -9,6 +9,7 @@
 #include <chrono>
 #include <cstdint>
 #include <string>
+#include <thread>
 #include <vector>
 
 namespace pod5 {
@@ -277,7 +278,10 @@ class POD5_FORMAT_EXPORT ReadIdSearchInput {
         std::size_t index;
     };
 
-    ReadIdSearchInput(gsl::span<boost::uuids::uuid const> const & input_ids);
+    /// \brief Sort the [input_ids] for searching, on up to [thread_count] threads for large queries.
+    ReadIdSearchInput(
+        gsl::span<boost::uuids::uuid const> const & input_ids,
+        std::size_t thread_count = std::thread::hardware_concurrency());
 
     std::size_t read_id_count() const { return m_search_read_ids.size(); }
 
@@ -287,4 +291,45 @@ class POD5_FORMAT_EXPORT ReadIdSearchInput {
     std::vector<InputId> m_search_read_ids;
 };
 
+/// \brief The location of a read id within the read table of a file.
+struct ReadIdLookupEntry {
+    boost::uuids::uuid id;
+    std::size_t batch;
+    std::size_t batch_row;
+};
+
+/// \brief How a sorted search query is matched against a sorted read id lookup.
+enum class ReadIdSearchStrategy {
+    /// \brief Gallop when the query is much smaller than the lookup, otherwise merge.
+    Automatic,
+    /// \brief Step through the query and lookup together, visiting every lookup entry
+    ///        up to the last query id - O(query + lookup).
+    Merge,
+    /// \brief Search exponentially, then binary search, forward from the previous match
+    ///        for each query id - O(query * log(lookup / query)).
+    Galloping,
+};
+
+/// \brief Build a read id lookup sorted by read id from the read ids of each read table batch.
+/// \param batch_read_ids The read ids of each batch, in file order.
+/// \param thread_count The number of threads to fill and sort the lookup on, large lookups
+///                     are split between threads.
+POD5_FORMAT_EXPORT std::vector<ReadIdLookupEntry> build_read_id_lookup(
+    std::vector<gsl::span<boost::uuids::uuid const>> const & batch_read_ids,
+    std::size_t thread_count = std::thread::hardware_concurrency());
+
+/// \brief Find the read ids of a search query in a sorted read id lookup.
+/// \param lookup The read id lookup, sorted by read id, see build_read_id_lookup.
+/// \param search_input The read ids to find.
+/// \param[out] batch_counts The number of read ids found in each batch, sized to the batch count.
+/// \param[out] batch_rows The rows of the read ids found, grouped by batch in ascending order.
+/// \param strategy How the sorted query is matched against the lookup.
+/// \returns The number of read ids found.
+POD5_FORMAT_EXPORT std::size_t search_read_id_lookup(
+    gsl::span<ReadIdLookupEntry const> const & lookup,
+    ReadIdSearchInput const & search_input,
+    gsl::span<std::uint32_t> const & batch_counts,
+    gsl::span<std::uint32_t> const & batch_rows,
+    ReadIdSearchStrategy strategy = ReadIdSearchStrategy::Automatic);
+
 }  // namespace pod5
@@ -2,10 +2,19 @@
 
 #include "pod5_format/svb16/decode.hpp"
 #include "pod5_format/svb16/encode.hpp"
+#include "pod5_format/thread_pool.h"
 
 #include <arrow/buffer.h>
 #include <zstd.h>
 
+#include <algorithm>
+#include <condition_variable>
+#include <cstring>
+#include <functional>
+#include <mutex>
+#include <thread>
+#include <vector>
+
 namespace pod5 {
 
 std::size_t compressed_signal_max_size(std::size_t sample_count)
@@ -125,4 +134,491 @@ arrow::Result<std::shared_ptr<arrow::Buffer>> decompress_signal(
     ARROW_RETURN_NOT_OK(decompress_signal(compressed_bytes, pool, signal_span));
     return out;
 }
+
+arrow::Status decompress_signal_chunks(
+    gsl::span<gsl::span<std::uint8_t const> const> const & compressed_chunks,
+    gsl::span<std::uint32_t const> const & chunk_sample_counts,
+    arrow::MemoryPool * pool,
+    ThreadPool & thread_pool,
+    gsl::span<std::int16_t> const & destination)
+{
+    if (compressed_chunks.size() != chunk_sample_counts.size()) {
+        return pod5::Status::Invalid(
+            "Inconsistent number of chunks to decompress - signals: ",
+            compressed_chunks.size(),
+            ", counts: ",
+            chunk_sample_counts.size());
+    }
+
+    std::vector<gsl::span<std::int16_t>> chunk_destinations;
+    chunk_destinations.reserve(chunk_sample_counts.size());
+    std::size_t sample_offset = 0;
+    for (auto const sample_count : chunk_sample_counts) {
+        if (sample_offset + sample_count > destination.size()) {
+            return pod5::Status::Invalid(
+                "Destination too small for decompressed signal chunks (",
+                destination.size(),
+                " samples)");
+        }
+        chunk_destinations.push_back(destination.subspan(sample_offset, sample_count));
+        sample_offset += sample_count;
+    }
+    if (sample_offset != destination.size()) {
+        return pod5::Status::Invalid(
+            "Destination size ",
+            destination.size(),
+            " does not match decompressed signal chunk sample count ",
+            sample_offset);
+    }
+
+    std::mutex mutex;
+    std::condition_variable chunks_complete;
+    std::size_t remaining_chunks = compressed_chunks.size();
+    arrow::Status result;
+
+    auto decompress_chunk = [&](std::size_t index) {
+        arrow::Status status;
+        if (!chunk_destinations[index].empty()) {
+            status = decompress_signal(compressed_chunks[index], pool, chunk_destinations[index]);
+        }
+
+        std::lock_guard<std::mutex> lock(mutex);
+        if (!status.ok() && result.ok()) {
+            result = status;
+        }
+        remaining_chunks -= 1;
+        if (remaining_chunks == 0) {
+            chunks_complete.notify_all();
+        }
+    };
+
+    // Each chunk is posted to its own strand so chunks can run concurrently,
+    // the first chunk is decompressed on the calling thread while it waits.
+    for (std::size_t i = 1; i < compressed_chunks.size(); ++i) {
+        thread_pool.create_strand()->post([&decompress_chunk, i] { decompress_chunk(i); });
+    }
+    if (!compressed_chunks.empty()) {
+        decompress_chunk(0);
+    }
+
+    std::unique_lock<std::mutex> lock(mutex);
+    chunks_complete.wait(lock, [&] { return remaining_chunks == 0; });
+    return result;
+}
+
+namespace {
+
+arrow::Status validate_signal_chunks(SignalWindowChunks const & chunks)
+{
+    if (chunks.window_chunk_offsets.empty()
+        || chunks.window_chunk_offsets.size() != chunks.window_first_samples.size() + 1)
+    {
+        return pod5::Status::Invalid(
+            "Inconsistent number of signal windows - chunk offsets: ",
+            chunks.window_chunk_offsets.size(),
+            ", first samples: ",
+            chunks.window_first_samples.size());
+    }
+
+    if (chunks.buffer_compressed.size() != chunks.buffers.size()) {
+        return pod5::Status::Invalid(
+            "Inconsistent number of signal buffers - buffers: ",
+            chunks.buffers.size(),
+            ", compression flags: ",
+            chunks.buffer_compressed.size());
+    }
+
+    auto const chunk_count = chunks.chunk_buffers.size();
+    if (chunks.chunk_byte_begins.size() != chunk_count
+        || chunks.chunk_byte_ends.size() != chunk_count
+        || chunks.chunk_sample_counts.size() != chunk_count)
+    {
+        return pod5::Status::Invalid("Inconsistent number of signal window chunks");
+    }
+
+    auto const window_count = chunks.window_first_samples.size();
+    for (std::size_t i = 0; i < window_count; ++i) {
+        if (chunks.window_chunk_offsets[i] > chunks.window_chunk_offsets[i + 1]
+            || chunks.window_chunk_offsets[i + 1] > chunk_count)
+        {
+            return pod5::Status::Invalid("Invalid chunk offsets for signal window ", i);
+        }
+    }
+
+    for (std::size_t i = 0; i < chunk_count; ++i) {
+        auto const buffer_index = chunks.chunk_buffers[i];
+        if (buffer_index >= chunks.buffers.size()) {
+            return pod5::Status::Invalid("Invalid buffer index ", buffer_index, " for chunk ", i);
+        }
+        if (chunks.chunk_byte_begins[i] > chunks.chunk_byte_ends[i]
+            || chunks.chunk_byte_ends[i] > chunks.buffers[buffer_index].size())
+        {
+            return pod5::Status::Invalid("Invalid byte range for chunk ", i);
+        }
+        if (!chunks.buffer_compressed[buffer_index]
+            && chunks.chunk_byte_ends[i] - chunks.chunk_byte_begins[i]
+                   != chunks.chunk_sample_counts[i] * sizeof(SampleType))
+        {
+            return pod5::Status::Invalid("Uncompressed chunk ", i, " size does not match samples");
+        }
+    }
+
+    return pod5::Status::OK();
+}
+
+arrow::Status validate_signal_windows(
+    SignalWindowChunks const & chunks,
+    std::size_t window_length,
+    std::size_t destination_size)
+{
+    ARROW_RETURN_NOT_OK(validate_signal_chunks(chunks));
+
+    auto const window_count = chunks.window_first_samples.size();
+    if (window_count * window_length != destination_size) {
+        return pod5::Status::Invalid(
+            "Destination size ",
+            destination_size,
+            " does not match ",
+            window_count,
+            " windows of ",
+            window_length,
+            " samples");
+    }
+    return pod5::Status::OK();
+}
+
+/// Visit the first [sample_count] samples of [window], one chunk at a time.
+///
+/// [visit] is called with a pointer to the (possibly unaligned) bytes of the next samples, the
+/// number of samples and the number of samples of the window already visited. Compressed chunks
+/// are decompressed into [chunk_samples], which is reused between chunks so decoded samples stay
+/// in cache until visited.
+template <typename Visit>
+arrow::Status visit_signal_window(
+    SignalWindowChunks const & chunks,
+    std::size_t window,
+    std::size_t sample_count,
+    arrow::MemoryPool * pool,
+    std::vector<SampleType> & chunk_samples,
+    Visit && visit)
+{
+    std::size_t skip = chunks.window_first_samples[window];
+    std::size_t visited = 0;
+    for (auto chunk = chunks.window_chunk_offsets[window];
+         chunk < chunks.window_chunk_offsets[window + 1] && visited < sample_count;
+         ++chunk)
+    {
+        std::size_t const chunk_sample_count = chunks.chunk_sample_counts[chunk];
+        if (skip >= chunk_sample_count) {
+            skip -= chunk_sample_count;
+            continue;
+        }
+
+        auto const buffer_index = chunks.chunk_buffers[chunk];
+        auto const chunk_bytes = chunks.buffers[buffer_index].subspan(
+            chunks.chunk_byte_begins[chunk],
+            chunks.chunk_byte_ends[chunk] - chunks.chunk_byte_begins[chunk]);
+
+        // Uncompressed chunks are visited straight from their buffer:
+        auto sample_bytes = chunk_bytes.data();
+        if (chunks.buffer_compressed[buffer_index]) {
+            chunk_samples.resize(chunk_sample_count);
+            ARROW_RETURN_NOT_OK(
+                decompress_signal(chunk_bytes, pool, gsl::make_span(chunk_samples)));
+            sample_bytes = reinterpret_cast<std::uint8_t const *>(chunk_samples.data());
+        }
+
+        auto const visit_count = std::min(chunk_sample_count - skip, sample_count - visited);
+        visit(sample_bytes + skip * sizeof(SampleType), visit_count, visited);
+        visited += visit_count;
+        skip = 0;
+    }
+
+    if (visited != sample_count) {
+        return pod5::Status::Invalid(
+            "Signal window ", window, " exceeds the samples of its chunks");
+    }
+    return pod5::Status::OK();
+}
+
+arrow::Status decode_signal_window(
+    SignalWindowChunks const & chunks,
+    std::size_t window,
+    arrow::MemoryPool * pool,
+    std::vector<SampleType> & chunk_samples,
+    gsl::span<SampleType> const & destination)
+{
+    return visit_signal_window(
+        chunks,
+        window,
+        destination.size(),
+        pool,
+        chunk_samples,
+        [&](std::uint8_t const * sample_bytes, std::size_t count, std::size_t visited) {
+            std::memcpy(destination.data() + visited, sample_bytes, count * sizeof(SampleType));
+        });
+}
+
+/// Run [decode_windows] over ranges of windows in parallel on the thread pool.
+arrow::Status for_each_window_range(
+    std::size_t window_count,
+    ThreadPool & thread_pool,
+    std::function<arrow::Status(std::size_t, std::size_t)> const & decode_windows)
+{
+    // Split the windows into a few ranges per thread, to balance windows of differing cost:
+    std::size_t const range_count =
+        std::min<std::size_t>(window_count, std::max(1u, std::thread::hardware_concurrency()) * 4);
+    if (range_count == 0) {
+        return pod5::Status::OK();
+    }
+    std::size_t const range_size = (window_count + range_count - 1) / range_count;
+
+    std::mutex mutex;
+    std::condition_variable ranges_complete;
+    std::size_t remaining_ranges = 0;
+    arrow::Status result;
+
+    auto decode_range = [&](std::size_t begin) {
+        auto status = decode_windows(begin, std::min(begin + range_size, window_count));
+
+        std::lock_guard<std::mutex> lock(mutex);
+        if (!status.ok() && result.ok()) {
+            result = status;
+        }
+        remaining_ranges -= 1;
+        if (remaining_ranges == 0) {
+            ranges_complete.notify_all();
+        }
+    };
+
+    remaining_ranges = (window_count + range_size - 1) / range_size;
+    for (std::size_t begin = range_size; begin < window_count; begin += range_size) {
+        thread_pool.create_strand()->post([&decode_range, begin] { decode_range(begin); });
+    }
+    decode_range(0);
+
+    std::unique_lock<std::mutex> lock(mutex);
+    ranges_complete.wait(lock, [&] { return remaining_ranges == 0; });
+    return result;
+}
+
+/// Calibrate [count] (possibly unaligned) samples into [destination] as pico amps.
+template <typename Output, typename Convert>
+void calibrate_samples(
+    std::uint8_t const * sample_bytes,
+    std::size_t count,
+    float offset,
+    float scale,
+    Output * destination,
+    Convert const & convert)
+{
+    for (std::size_t i = 0; i < count; ++i) {
+        SampleType sample;
+        std::memcpy(&sample, sample_bytes + i * sizeof(SampleType), sizeof(sample));
+        destination[i] = convert((sample + offset) * scale);
+    }
+}
+
+/// Decode the whole signal of each read (window) calibrated to pico amps, converted by [convert].
+template <typename Output, typename Convert>
+arrow::Status decode_signal_pa_impl(
+    SignalWindowChunks const & chunks,
+    gsl::span<float const> const & calibration_offsets,
+    gsl::span<float const> const & calibration_scales,
+    gsl::span<std::uint64_t const> const & destination_offsets,
+    arrow::MemoryPool * pool,
+    ThreadPool & thread_pool,
+    gsl::span<Output> const & destination,
+    Convert const & convert)
+{
+    ARROW_RETURN_NOT_OK(validate_signal_chunks(chunks));
+    auto const read_count = chunks.window_first_samples.size();
+    if (calibration_offsets.size() != read_count || calibration_scales.size() != read_count) {
+        return pod5::Status::Invalid(
+            "Inconsistent number of calibrations for ", read_count, " reads");
+    }
+    if (destination_offsets.size() != read_count + 1 || destination_offsets[0] != 0
+        || destination_offsets[read_count] != std::uint64_t(destination.size()))
+    {
+        return pod5::Status::Invalid(
+            "Destination offsets do not cover the ",
+            destination.size(),
+            " samples of the destination for ",
+            read_count,
+            " reads");
+    }
+    for (std::size_t read = 0; read < read_count; ++read) {
+        if (destination_offsets[read] > destination_offsets[read + 1]) {
+            return pod5::Status::Invalid("Invalid destination offsets for read ", read);
+        }
+    }
+
+    return for_each_window_range(
+        read_count, thread_pool, [&](std::size_t begin, std::size_t end) -> arrow::Status {
+            std::vector<SampleType> chunk_samples;
+            for (std::size_t read = begin; read < end; ++read) {
+                auto const offset = calibration_offsets[read];
+                auto const scale = calibration_scales[read];
+                auto read_pa = destination.data() + destination_offsets[read];
+                ARROW_RETURN_NOT_OK(visit_signal_window(
+                    chunks,
+                    read,
+                    destination_offsets[read + 1] - destination_offsets[read],
+                    pool,
+                    chunk_samples,
+                    [&](std::uint8_t const * sample_bytes, std::size_t count, std::size_t visited) {
+                        calibrate_samples(
+                            sample_bytes, count, offset, scale, read_pa + visited, convert);
+                    }));
+            }
+            return pod5::Status::OK();
+        });
+}
+
+}  // namespace
+
+arrow::Status decode_signal_windows(
+    SignalWindowChunks const & chunks,
+    std::size_t window_length,
+    arrow::MemoryPool * pool,
+    ThreadPool & thread_pool,
+    gsl::span<std::int16_t> const & destination)
+{
+    ARROW_RETURN_NOT_OK(validate_signal_windows(chunks, window_length, destination.size()));
+
+    return for_each_window_range(
+        chunks.window_first_samples.size(),
+        thread_pool,
+        [&](std::size_t begin, std::size_t end) -> arrow::Status {
+            std::vector<SampleType> chunk_samples;
+            for (std::size_t window = begin; window < end; ++window) {
+                ARROW_RETURN_NOT_OK(decode_signal_window(
+                    chunks,
+                    window,
+                    pool,
+                    chunk_samples,
+                    destination.subspan(window * window_length, window_length)));
+            }
+            return pod5::Status::OK();
+        });
+}
+
+arrow::Status decode_signal_windows_pa(
+    SignalWindowChunks const & chunks,
+    gsl::span<float const> const & calibration_offsets,
+    gsl::span<float const> const & calibration_scales,
+    std::size_t window_length,
+    arrow::MemoryPool * pool,
+    ThreadPool & thread_pool,
+    gsl::span<float> const & destination)
+{
+    ARROW_RETURN_NOT_OK(validate_signal_windows(chunks, window_length, destination.size()));
+    auto const window_count = chunks.window_first_samples.size();
+    if (calibration_offsets.size() != window_count || calibration_scales.size() != window_count) {
+        return pod5::Status::Invalid(
+            "Inconsistent number of calibrations for ", window_count, " signal windows");
+    }
+
+    return for_each_window_range(
+        window_count, thread_pool, [&](std::size_t begin, std::size_t end) -> arrow::Status {
+            std::vector<SampleType> chunk_samples;
+            for (std::size_t window = begin; window < end; ++window) {
+                auto const offset = calibration_offsets[window];
+                auto const scale = calibration_scales[window];
+                auto window_pa = destination.data() + window * window_length;
+                ARROW_RETURN_NOT_OK(visit_signal_window(
+                    chunks,
+                    window,
+                    window_length,
+                    pool,
+                    chunk_samples,
+                    [&](std::uint8_t const * sample_bytes, std::size_t count, std::size_t visited) {
+                        calibrate_samples(
+                            sample_bytes,
+                            count,
+                            offset,
+                            scale,
+                            window_pa + visited,
+                            [](float value) { return value; });
+                    }));
+            }
+            return pod5::Status::OK();
+        });
+}
+
+arrow::Status decode_signal_pa(
+    SignalWindowChunks const & chunks,
+    gsl::span<float const> const & calibration_offsets,
+    gsl::span<float const> const & calibration_scales,
+    gsl::span<std::uint64_t const> const & destination_offsets,
+    arrow::MemoryPool * pool,
+    ThreadPool & thread_pool,
+    gsl::span<float> const & destination)
+{
+    return decode_signal_pa_impl(
+        chunks,
+        calibration_offsets,
+        calibration_scales,
+        destination_offsets,
+        pool,
+        thread_pool,
+        destination,
+        [](float value) { return value; });
+}
+
+arrow::Status decode_signal_pa(
+    SignalWindowChunks const & chunks,
+    gsl::span<float const> const & calibration_offsets,
+    gsl::span<float const> const & calibration_scales,
+    gsl::span<std::uint64_t const> const & destination_offsets,
+    arrow::MemoryPool * pool,
+    ThreadPool & thread_pool,
+    gsl::span<std::uint16_t> const & destination)
+{
+    return decode_signal_pa_impl(
+        chunks,
+        calibration_offsets,
+        calibration_scales,
+        destination_offsets,
+        pool,
+        thread_pool,
+        destination,
+        float_to_half);
+}
+
+std::uint16_t float_to_half(float value)
+{
+    // Round to nearest even conversion, after F. Giesen's public domain float_to_half_fast3_rtne.
+    std::uint32_t const f32_infinity = 255u << 23;
+    std::uint32_t const f16_max = (127u + 16) << 23;
+    std::uint32_t const denormal_magic = ((127u - 15) + (23 - 10) + 1) << 23;
+
+    std::uint32_t bits;
+    std::memcpy(&bits, &value, sizeof(bits));
+    std::uint32_t const sign = bits & 0x80000000u;
+    bits ^= sign;
+
+    std::uint16_t half;
+    if (bits >= f16_max) {
+        // Out of range values become infinity, and NaN stays (quiet) NaN:
+        half = bits > f32_infinity ? 0x7e00 : 0x7c00;
+    } else if (bits < (113u << 23)) {
+        // Subnormal or zero - let float addition round the mantissa into place:
+        float shifted;
+        float magic;
+        std::memcpy(&shifted, &bits, sizeof(shifted));
+        std::memcpy(&magic, &denormal_magic, sizeof(magic));
+        shifted += magic;
+        std::memcpy(&bits, &shifted, sizeof(bits));
+        half = static_cast<std::uint16_t>(bits - denormal_magic);
+    } else {
+        std::uint32_t const mantissa_odd = (bits >> 13) & 1;
+        // Rebias the exponent and round the mantissa:
+        bits += ((15u - 127) << 23) + 0xfff;
+        bits += mantissa_odd;
+        half = static_cast<std::uint16_t>(bits >> 13);
+    }
+    return half | static_cast<std::uint16_t>(sign >> 16);
+}
+
 }  // namespace pod5
@@ -5,6 +5,8 @@
 
 #include <gsl/gsl-lite.hpp>
 
+#include <cstdint>
+
 namespace arrow {
 class MemoryPool;
 class Buffer;
@@ -12,6 +14,8 @@ class Buffer;
 
 namespace pod5 {
 
+class ThreadPool;
+
 using SampleType = std::int16_t;
 
 POD5_FORMAT_EXPORT std::size_t compressed_signal_max_size(std::size_t sample_count);
@@ -35,4 +39,102 @@ POD5_FORMAT_EXPORT arrow::Status decompress_signal(
     arrow::MemoryPool * pool,
     gsl::span<std::int16_t> const & destination);
 
+/// \brief Decompress the chunks of a signal into a single destination buffer.
+/// \param compressed_chunks The compressed chunks forming the signal, in order.
+/// \param chunk_sample_counts The number of samples in each chunk.
+/// \param pool The memory pool used for intermediate decompression buffers.
+/// \param thread_pool The thread pool chunks are decompressed on, in parallel.
+/// \param destination The buffer to decompress into, each chunk is written directly
+///                    to its offset in the buffer, which must hold exactly the sum
+///                    of chunk_sample_counts samples.
+POD5_FORMAT_EXPORT arrow::Status decompress_signal_chunks(
+    gsl::span<gsl::span<std::uint8_t const> const> const & compressed_chunks,
+    gsl::span<std::uint32_t const> const & chunk_sample_counts,
+    arrow::MemoryPool * pool,
+    ThreadPool & thread_pool,
+    gsl::span<std::int16_t> const & destination);
+
+/// \brief The signal chunks overlapping a set of fixed length signal windows.
+struct SignalWindowChunks {
+    /// The buffers holding signal chunks, e.g. the data of each signal table batch.
+    gsl::span<gsl::span<std::uint8_t const> const> buffers;
+    /// Whether each buffer holds vbz compressed signal, or uncompressed int16 samples.
+    gsl::span<std::uint8_t const> buffer_compressed;
+    /// The buffer holding each chunk.
+    gsl::span<std::uint32_t const> chunk_buffers;
+    /// The byte range [begin, end) of each chunk within its buffer.
+    gsl::span<std::uint64_t const> chunk_byte_begins;
+    gsl::span<std::uint64_t const> chunk_byte_ends;
+    /// The number of samples in each chunk.
+    gsl::span<std::uint32_t const> chunk_sample_counts;
+    /// Window i overlaps chunks [window_chunk_offsets[i], window_chunk_offsets[i + 1]).
+    gsl::span<std::uint64_t const> window_chunk_offsets;
+    /// The sample in the first overlapping chunk each window starts at.
+    gsl::span<std::uint64_t const> window_first_samples;
+};
+
+/// \brief Decode fixed length windows of signal, decoding only the chunks overlapping each window.
+/// \param chunks The chunks overlapping each window.
+/// \param window_length The number of samples in each window.
+/// \param pool The memory pool used for intermediate decompression buffers.
+/// \param thread_pool The thread pool windows are decoded on, in parallel.
+/// \param destination The (windows, window_length) row major buffer to decode into.
+POD5_FORMAT_EXPORT arrow::Status decode_signal_windows(
+    SignalWindowChunks const & chunks,
+    std::size_t window_length,
+    arrow::MemoryPool * pool,
+    ThreadPool & thread_pool,
+    gsl::span<std::int16_t> const & destination);
+
+/// \brief Decode fixed length windows of signal calibrated to pico amps.
+/// \param calibration_offsets The calibration offset of the read each window is taken from.
+/// \param calibration_scales The calibration scale of the read each window is taken from.
+/// \see decode_signal_windows
+POD5_FORMAT_EXPORT arrow::Status decode_signal_windows_pa(
+    SignalWindowChunks const & chunks,
+    gsl::span<float const> const & calibration_offsets,
+    gsl::span<float const> const & calibration_scales,
+    std::size_t window_length,
+    arrow::MemoryPool * pool,
+    ThreadPool & thread_pool,
+    gsl::span<float> const & destination);
+
+/// \brief Decode the whole signal of a set of reads calibrated to pico amps.
+///
+/// Decompression and calibration are fused per chunk, so decoded samples never leave the cache
+/// before being calibrated into the destination.
+///
+/// \param chunks The chunks of each read, as windows starting at each read's first sample.
+/// \param calibration_offsets The calibration offset of each read.
+/// \param calibration_scales The calibration scale of each read.
+/// \param destination_offsets Read i is decoded into destination[destination_offsets[i],
+///                            destination_offsets[i + 1]).
+/// \param pool The memory pool used for intermediate decompression buffers.
+/// \param thread_pool The thread pool reads are decoded on, in parallel.
+/// \param destination The buffer to decode the signal of all reads into.
+POD5_FORMAT_EXPORT arrow::Status decode_signal_pa(
+    SignalWindowChunks const & chunks,
+    gsl::span<float const> const & calibration_offsets,
+    gsl::span<float const> const & calibration_scales,
+    gsl::span<std::uint64_t const> const & destination_offsets,
+    arrow::MemoryPool * pool,
+    ThreadPool & thread_pool,
+    gsl::span<float> const & destination);
+
+/// \brief Decode the whole signal of a set of reads calibrated to pico amps, as IEEE 754 half
+///        precision floats.
+/// \see decode_signal_pa
+POD5_FORMAT_EXPORT arrow::Status decode_signal_pa(
+    SignalWindowChunks const & chunks,
+    gsl::span<float const> const & calibration_offsets,
+    gsl::span<float const> const & calibration_scales,
+    gsl::span<std::uint64_t const> const & destination_offsets,
+    arrow::MemoryPool * pool,
+    ThreadPool & thread_pool,
+    gsl::span<std::uint16_t> const & destination);
+
+/// \brief Convert a float to the bits of the nearest IEEE 754 half precision float, rounding
+///        ties to even.
+POD5_FORMAT_EXPORT std::uint16_t float_to_half(float value);
+
 }  // namespace pod5
@@ -18,8 +18,36 @@
 #include <pybind11/pybind11.h>
 #include <pybind11/stl.h>
 
+#ifdef _WIN32
+#include <io.h>
+#else
+#include <unistd.h>
+#endif
+
 namespace py = pybind11;
 
+// Find the arrow memory pool named [backend_name], as reported by arrow::MemoryPool::backend_name,
+// or "default" for arrow's default memory pool.
+inline arrow::MemoryPool * find_memory_pool(std::string const & backend_name)
+{
+    if (backend_name == "default") {
+        return arrow::default_memory_pool();
+    }
+    if (backend_name == "system") {
+        return arrow::system_memory_pool();
+    }
+
+    arrow::MemoryPool * pool = nullptr;
+    if (backend_name == "jemalloc") {
+        POD5_PYTHON_RETURN_NOT_OK(arrow::jemalloc_memory_pool(&pool));
+    } else if (backend_name == "mimalloc") {
+        POD5_PYTHON_RETURN_NOT_OK(arrow::mimalloc_memory_pool(&pool));
+    } else {
+        throw std::invalid_argument("Unknown memory pool backend: '" + backend_name + "'");
+    }
+    return pool;
+}
+
 inline std::shared_ptr<pod5::FileWriter> create_file(
     char const * path,
     std::string const & writer_name,
@@ -61,6 +89,15 @@ class Pod5SignalCacheBatch {
     py::list samples() const
     {
         py::list py_samples;
+        if (m_samples_mode == pod5::AsyncSignalLoader::SamplesMode::ContiguousSamples) {
+            auto const samples = contiguous_samples_data();
+            auto const & offsets = m_cached_data.sample_offsets();
+            for (std::size_t i = 0; i + 1 < offsets.size(); ++i) {
+                py_samples.append(py::array_t<std::int16_t>(
+                    offsets[i + 1] - offsets[i], samples.data() + offsets[i]));
+            }
+            return py_samples;
+        }
         if (m_samples_mode != pod5::AsyncSignalLoader::SamplesMode::Samples) {
             return py_samples;
         }
@@ -71,9 +108,36 @@ class Pod5SignalCacheBatch {
         return py_samples;
     }
 
+    py::object contiguous_samples() const
+    {
+        if (m_samples_mode != pod5::AsyncSignalLoader::SamplesMode::ContiguousSamples) {
+            return py::none();
+        }
+
+        // The returned array references the samples buffer without copying,
+        // the capsule keeps the buffer alive for as long as the array is.
+        auto const samples = contiguous_samples_data();
+        auto owner = new std::shared_ptr<arrow::Buffer>(m_cached_data.contiguous_samples());
+        py::capsule buffer_owner(
+            owner, [](void * ptr) { delete static_cast<std::shared_ptr<arrow::Buffer> *>(ptr); });
+        return py::array_t<std::int16_t>(samples.size(), samples.data(), buffer_owner);
+    }
+
+    py::array_t<std::uint64_t> sample_offsets() const
+    {
+        return py::array_t<std::uint64_t>(
+            m_cached_data.sample_offsets().size(), m_cached_data.sample_offsets().data());
+    }
+
     std::uint32_t batch_index() const { return m_cached_data.batch_index(); }
 
 private:
+    gsl::span<std::int16_t const> contiguous_samples_data() const
+    {
+        auto const & buffer = m_cached_data.contiguous_samples();
+        return gsl::make_span(buffer->data(), buffer->size()).as_span<std::int16_t const>();
+    }
+
     pod5::AsyncSignalLoader::SamplesMode m_samples_mode;
     pod5::CachedBatchSignalData m_cached_data;
 };
@@ -135,7 +199,10 @@ class Pod5AsyncSignalLoader {
 
     std::shared_ptr<Pod5SignalCacheBatch> release_next_batch()
     {
-        auto batch = m_async_loader.release_next_batch();
+        auto batch = [&] {
+            py::gil_scoped_release release_gil;
+            return m_async_loader.release_next_batch();
+        }();
         if (!batch.ok()) {
             throw std::runtime_error(batch.status().ToString());
         }
@@ -148,6 +215,36 @@ class Pod5AsyncSignalLoader {
         return std::make_shared<Pod5SignalCacheBatch>(m_samples_mode, std::move(**batch));
     }
 
+    bool batch_ready() { return m_async_loader.is_next_batch_ready(); }
+
+    std::size_t buffered_bytes() const { return m_async_loader.buffered_bytes(); }
+
+    // Write a byte to the file descriptor [fd] each time a batch may have become ready,
+    // allowing event loops to wait on the loader without blocking. A negative [fd]
+    // removes the notification, after which [fd] may be closed.
+    void set_ready_fd(int fd)
+    {
+        if (fd < 0) {
+            m_async_loader.set_batch_ready_callback({});
+            return;
+        }
+
+        m_async_loader.set_batch_ready_callback([fd] {
+            char const ready = 1;
+#ifdef _WIN32
+            (void)::_write(fd, &ready, 1);
+#else
+            (void)::write(fd, &ready, 1);
+#endif
+        });
+    }
+
+    void cancel()
+    {
+        py::gil_scoped_release release_gil;
+        m_async_loader.cancel();
+    }
+
     std::vector<std::uint32_t> make_batch_counts(
         std::shared_ptr<pod5::FileReader> const & reader,
         py::array_t<std::uint32_t, py::array::c_style | py::array::forcecast> const & batches)
@@ -197,6 +294,31 @@ struct Pod5FileReaderPtr {
         return reader->file_version_pre_migration().to_string();
     }
 
+    py::object get_file_statistics() const
+    {
+        auto const & statistics = reader->file_statistics();
+        if (!statistics) {
+            return py::none();
+        }
+
+        py::dict run_info_read_counts;
+        for (auto const & run_info_read_count : statistics->run_info_read_counts) {
+            run_info_read_counts[py::str(run_info_read_count.acquisition_id)] =
+                run_info_read_count.read_count;
+        }
+
+        py::dict result;
+        result["read_count"] = statistics->read_count;
+        result["sample_count"] = statistics->sample_count;
+        result["signal_bytes"] = statistics->signal_bytes;
+        result["min_start_sample"] = statistics->min_start_sample;
+        result["max_start_sample"] = statistics->max_start_sample;
+        result["run_info_read_counts"] = run_info_read_counts;
+        return std::move(result);
+    }
+
+    arrow::MemoryPool * memory_pool() const { return reader->memory_pool(); }
+
     void close() { reader = nullptr; }
 
     std::size_t plan_traversal(
@@ -218,44 +340,54 @@ struct Pod5FileReaderPtr {
         return find_success_count;
     }
 
-    std::shared_ptr<Pod5AsyncSignalLoader> batch_get_signal(bool get_samples, bool get_sample_count)
+    std::shared_ptr<Pod5AsyncSignalLoader>
+    batch_get_signal(bool get_samples, bool get_sample_count, bool contiguous)
     {
         return std::make_shared<Pod5AsyncSignalLoader>(
-            reader,
-            get_samples ? pod5::AsyncSignalLoader::SamplesMode::Samples
-                        : pod5::AsyncSignalLoader::SamplesMode::NoSamples);
+            reader, samples_mode(get_samples, contiguous));
     }
 
     std::shared_ptr<Pod5AsyncSignalLoader> batch_get_signal_batches(
         bool get_samples,
         bool get_sample_count,
-        py::array_t<std::uint32_t, py::array::c_style | py::array::forcecast> && batches)
+        py::array_t<std::uint32_t, py::array::c_style | py::array::forcecast> && batches,
+        bool contiguous)
     {
         return std::make_shared<Pod5AsyncSignalLoader>(
-            reader,
-            get_samples ? pod5::AsyncSignalLoader::SamplesMode::Samples
-                        : pod5::AsyncSignalLoader::SamplesMode::NoSamples,
-            std::move(batches));
+            reader, samples_mode(get_samples, contiguous), std::move(batches));
     }
 
     std::shared_ptr<Pod5AsyncSignalLoader> batch_get_signal_selection(
         bool get_samples,
         bool get_sample_count,
         py::array_t<std::uint32_t, py::array::c_style | py::array::forcecast> && batch_counts,
-        py::array_t<std::uint32_t, py::array::c_style | py::array::forcecast> && batch_rows)
+        py::array_t<std::uint32_t, py::array::c_style | py::array::forcecast> && batch_rows,
+        bool contiguous)
     {
         return std::make_shared<Pod5AsyncSignalLoader>(
             reader,
-            get_samples ? pod5::AsyncSignalLoader::SamplesMode::Samples
-                        : pod5::AsyncSignalLoader::SamplesMode::NoSamples,
+            samples_mode(get_samples, contiguous),
             std::move(batch_counts),
             std::move(batch_rows));
     }
+
+    static pod5::AsyncSignalLoader::SamplesMode samples_mode(bool get_samples, bool contiguous)
+    {
+        if (!get_samples) {
+            return pod5::AsyncSignalLoader::SamplesMode::NoSamples;
+        }
+        return contiguous ? pod5::AsyncSignalLoader::SamplesMode::ContiguousSamples
+                          : pod5::AsyncSignalLoader::SamplesMode::Samples;
+    }
 };
 
-inline Pod5FileReaderPtr open_file(char const * filename)
+inline Pod5FileReaderPtr open_file(char const * filename, arrow::MemoryPool * memory_pool)
 {
-    POD5_PYTHON_ASSIGN_OR_RAISE(auto reader, pod5::open_file_reader(filename, {}));
+    pod5::FileReaderOptions options;
+    if (memory_pool) {
+        options.memory_pool(memory_pool);
+    }
+    POD5_PYTHON_ASSIGN_OR_RAISE(auto reader, pod5::open_file_reader(filename, options));
     return Pod5FileReaderPtr(std::move(reader));
 }
 
@@ -358,6 +490,28 @@ inline pod5::ReadData make_read_data(
         *time_since_mux_change.data(row_id)};
 }
 
+/// Check [read_id_data] holds a 16 byte read id, and every other read column a value, for each
+/// of [count] reads.
+template <typename... Columns>
+void check_read_columns(
+    std::size_t count,
+    py::array_t<std::uint8_t, py::array::c_style | py::array::forcecast> const & read_id_data,
+    Columns const &... columns)
+{
+    if (read_id_data.ndim() != 2 || read_id_data.shape(1) != 16) {
+        throw std::runtime_error("Read id array is of unexpected size");
+    }
+    if (static_cast<std::size_t>(read_id_data.shape(0)) < count) {
+        throw std::runtime_error("Read id array holds fewer read ids than the read count");
+    }
+    std::size_t const column_sizes[] = {static_cast<std::size_t>(columns.size())...};
+    for (auto const column_size : column_sizes) {
+        if (column_size < count) {
+            throw std::runtime_error("Read columns must hold a value for every read");
+        }
+    }
+}
+
 inline void FileWriter_add_reads(
     pod5::FileWriter & w,
     std::size_t count,
@@ -423,6 +577,92 @@ inline void FileWriter_add_reads(
     }
 }
 
+inline void FileWriter_add_reads_flat(
+    pod5::FileWriter & w,
+    std::size_t count,
+    py::array_t<std::uint8_t, py::array::c_style | py::array::forcecast> const & read_id_data,
+    py::array_t<std::uint32_t, py::array::c_style | py::array::forcecast> const & read_numbers,
+    py::array_t<std::uint64_t, py::array::c_style | py::array::forcecast> const & start_samples,
+    py::array_t<std::uint16_t, py::array::c_style | py::array::forcecast> const & channels,
+    py::array_t<std::uint8_t, py::array::c_style | py::array::forcecast> const & wells,
+    py::array_t<std::int16_t, py::array::c_style | py::array::forcecast> const & pore_types,
+    py::array_t<float, py::array::c_style | py::array::forcecast> const & calibration_offsets,
+    py::array_t<float, py::array::c_style | py::array::forcecast> const & calibration_scales,
+    py::array_t<float, py::array::c_style | py::array::forcecast> const & median_befores,
+    py::array_t<std::int16_t, py::array::c_style | py::array::forcecast> const & end_reasons,
+    py::array_t<bool, py::array::c_style | py::array::forcecast> const & end_reason_forceds,
+    py::array_t<std::int16_t, py::array::c_style | py::array::forcecast> const & run_infos,
+    py::array_t<std::uint64_t, py::array::c_style | py::array::forcecast> const &
+        num_minknow_events,
+    py::array_t<float, py::array::c_style | py::array::forcecast> const & tracked_scaling_scales,
+    py::array_t<float, py::array::c_style | py::array::forcecast> const & tracked_scaling_shifts,
+    py::array_t<float, py::array::c_style | py::array::forcecast> const & predicted_scaling_scales,
+    py::array_t<float, py::array::c_style | py::array::forcecast> const & predicted_scaling_shifts,
+    py::array_t<std::uint32_t, py::array::c_style | py::array::forcecast> const &
+        num_reads_since_mux_changes,
+    py::array_t<float, py::array::c_style | py::array::forcecast> const & time_since_mux_changes,
+    py::array_t<std::int16_t, py::array::c_style | py::array::forcecast> const & signal,
+    py::array_t<std::uint64_t, py::array::c_style | py::array::forcecast> const & signal_offsets)
+{
+    check_read_columns(
+        count,
+        read_id_data,
+        read_numbers,
+        start_samples,
+        channels,
+        wells,
+        pore_types,
+        calibration_offsets,
+        calibration_scales,
+        median_befores,
+        end_reasons,
+        end_reason_forceds,
+        run_infos,
+        num_minknow_events,
+        tracked_scaling_scales,
+        tracked_scaling_shifts,
+        predicted_scaling_scales,
+        predicted_scaling_shifts,
+        num_reads_since_mux_changes,
+        time_since_mux_changes);
+    if (static_cast<std::size_t>(signal_offsets.size()) != count + 1) {
+        throw std::runtime_error("Signal offsets must hold one more entry than the read count");
+    }
+
+    auto const offsets = signal_offsets.data();
+    auto const signal_size = static_cast<std::uint64_t>(signal.size());
+    for (std::size_t i = 0; i < count; ++i) {
+        if (offsets[i] > offsets[i + 1] || offsets[i + 1] > signal_size) {
+            throw std::runtime_error("Signal offsets are out of range of the signal data");
+        }
+        auto signal_span = gsl::make_span(signal.data() + offsets[i], offsets[i + 1] - offsets[i]);
+
+        auto read_data = make_read_data(
+            i,
+            read_id_data,
+            read_numbers,
+            start_samples,
+            channels,
+            wells,
+            pore_types,
+            calibration_offsets,
+            calibration_scales,
+            median_befores,
+            end_reasons,
+            end_reason_forceds,
+            run_infos,
+            num_minknow_events,
+            tracked_scaling_scales,
+            tracked_scaling_shifts,
+            predicted_scaling_scales,
+            predicted_scaling_shifts,
+            num_reads_since_mux_changes,
+            time_since_mux_changes);
+
+        throw_on_error(w.add_complete_read(read_data, signal_span));
+    }
+}
+
 inline void FileWriter_add_reads_pre_compressed(
     pod5::FileWriter & w,
     std::size_t count,
@@ -511,6 +751,127 @@ inline void FileWriter_add_reads_pre_compressed(
     }
 }
 
+inline void FileWriter_add_reads_pre_compressed_flat(
+    pod5::FileWriter & w,
+    std::size_t count,
+    py::array_t<std::uint8_t, py::array::c_style | py::array::forcecast> const & read_id_data,
+    py::array_t<std::uint32_t, py::array::c_style | py::array::forcecast> const & read_numbers,
+    py::array_t<std::uint64_t, py::array::c_style | py::array::forcecast> const & start_samples,
+    py::array_t<std::uint16_t, py::array::c_style | py::array::forcecast> const & channels,
+    py::array_t<std::uint8_t, py::array::c_style | py::array::forcecast> const & wells,
+    py::array_t<std::int16_t, py::array::c_style | py::array::forcecast> const & pore_types,
+    py::array_t<float, py::array::c_style | py::array::forcecast> const & calibration_offsets,
+    py::array_t<float, py::array::c_style | py::array::forcecast> const & calibration_scales,
+    py::array_t<float, py::array::c_style | py::array::forcecast> const & median_befores,
+    py::array_t<std::int16_t, py::array::c_style | py::array::forcecast> const & end_reasons,
+    py::array_t<bool, py::array::c_style | py::array::forcecast> const & end_reason_forceds,
+    py::array_t<std::int16_t, py::array::c_style | py::array::forcecast> const & run_infos,
+    py::array_t<std::uint64_t, py::array::c_style | py::array::forcecast> const &
+        num_minknow_events,
+    py::array_t<float, py::array::c_style | py::array::forcecast> const & tracked_scaling_scales,
+    py::array_t<float, py::array::c_style | py::array::forcecast> const & tracked_scaling_shifts,
+    py::array_t<float, py::array::c_style | py::array::forcecast> const & predicted_scaling_scales,
+    py::array_t<float, py::array::c_style | py::array::forcecast> const & predicted_scaling_shifts,
+    py::array_t<std::uint32_t, py::array::c_style | py::array::forcecast> const &
+        num_reads_since_mux_changes,
+    py::array_t<float, py::array::c_style | py::array::forcecast> const & time_since_mux_changes,
+    py::array_t<std::uint8_t, py::array::c_style | py::array::forcecast> const & signal_data,
+    py::array_t<std::uint64_t, py::array::c_style | py::array::forcecast> const &
+        signal_chunk_offsets,
+    py::array_t<std::uint32_t, py::array::c_style | py::array::forcecast> const & sample_counts,
+    py::array_t<std::uint32_t, py::array::c_style | py::array::forcecast> const &
+        signal_chunk_counts)
+{
+    check_read_columns(
+        count,
+        read_id_data,
+        read_numbers,
+        start_samples,
+        channels,
+        wells,
+        pore_types,
+        calibration_offsets,
+        calibration_scales,
+        median_befores,
+        end_reasons,
+        end_reason_forceds,
+        run_infos,
+        num_minknow_events,
+        tracked_scaling_scales,
+        tracked_scaling_shifts,
+        predicted_scaling_scales,
+        predicted_scaling_shifts,
+        num_reads_since_mux_changes,
+        time_since_mux_changes);
+    if (static_cast<std::size_t>(signal_chunk_counts.size()) != count) {
+        throw std::runtime_error("Signal chunk counts must hold one entry per read");
+    }
+    auto const chunk_total = static_cast<std::size_t>(sample_counts.size());
+    if (static_cast<std::size_t>(signal_chunk_offsets.size()) != chunk_total + 1) {
+        throw std::runtime_error(
+            "Signal chunk offsets must hold one more entry than the sample counts");
+    }
+
+    auto const read_ids = reinterpret_cast<boost::uuids::uuid const *>(read_id_data.data(0));
+    auto const data = signal_data.data();
+    auto const data_size = static_cast<std::uint64_t>(signal_data.size());
+    auto const offsets = signal_chunk_offsets.data();
+    auto const samples = sample_counts.data();
+    auto const chunk_counts = signal_chunk_counts.data();
+
+    std::size_t chunk_idx = 0;
+    std::vector<std::uint64_t> signal_rows;
+    for (std::size_t i = 0; i < count; ++i) {
+        auto const read_id = read_ids[i];
+
+        auto const signal_chunk_count = chunk_counts[i];
+        if (signal_chunk_count > chunk_total - chunk_idx) {
+            throw std::runtime_error("Missing signal data");
+        }
+
+        std::uint64_t signal_duration_count = 0;
+        signal_rows.resize(signal_chunk_count);
+        for (std::size_t signal_chunk_idx = 0; signal_chunk_idx < signal_chunk_count;
+             ++signal_chunk_idx, ++chunk_idx)
+        {
+            if (offsets[chunk_idx] > offsets[chunk_idx + 1] || offsets[chunk_idx + 1] > data_size) {
+                throw std::runtime_error(
+                    "Signal chunk offsets are out of range of the signal data");
+            }
+            auto compressed_signal_span = gsl::make_span(
+                data + offsets[chunk_idx], offsets[chunk_idx + 1] - offsets[chunk_idx]);
+
+            signal_rows[signal_chunk_idx] = throw_on_error(
+                w.add_pre_compressed_signal(read_id, compressed_signal_span, samples[chunk_idx]));
+            signal_duration_count += samples[chunk_idx];
+        }
+
+        auto read_data = make_read_data(
+            i,
+            read_id_data,
+            read_numbers,
+            start_samples,
+            channels,
+            wells,
+            pore_types,
+            calibration_offsets,
+            calibration_scales,
+            median_befores,
+            end_reasons,
+            end_reason_forceds,
+            run_infos,
+            num_minknow_events,
+            tracked_scaling_scales,
+            tracked_scaling_shifts,
+            predicted_scaling_scales,
+            predicted_scaling_shifts,
+            num_reads_since_mux_changes,
+            time_since_mux_changes);
+
+        throw_on_error(w.add_complete_read(read_data, signal_rows, signal_duration_count));
+    }
+}
+
 inline void decompress_signal_wrapper(
     py::array_t<uint8_t, py::array::c_style | py::array::forcecast> const & compressed_signal,
     py::array_t<std::int16_t, py::array::c_style | py::array::forcecast> & signal_out)
@@ -521,6 +882,207 @@ inline void decompress_signal_wrapper(
         gsl::make_span(signal_out.mutable_data(0), signal_out.shape(0))));
 }
 
+// Destination arrays are written in place, so must not be converted to another dtype
+// or layout, which would write into a temporary copy and leave them unchanged.
+template <typename T>
+inline gsl::span<T> signal_destination_span(py::array & signal_out, char const * dtype_name)
+{
+    if (!py::isinstance<py::array_t<T>>(signal_out)) {
+        throw std::runtime_error(
+            std::string("Signal destination must be a ") + dtype_name + " array");
+    }
+    if (!(signal_out.flags() & py::array::c_style) || !signal_out.writeable()) {
+        throw std::runtime_error("Signal destination must be a writeable contiguous array");
+    }
+    return gsl::make_span(static_cast<T *>(signal_out.mutable_data()), signal_out.size());
+}
+
+inline void decompress_signal_chunks_wrapper(
+    pod5::ThreadPool & thread_pool,
+    py::list const & compressed_chunks,
+    py::array_t<std::uint32_t, py::array::c_style | py::array::forcecast> const &
+        chunk_sample_counts,
+    py::array & signal_out)
+{
+    // Hold the chunk buffers for the duration of the call, so the GIL can be released
+    // while decompressing.
+    std::vector<py::buffer_info> chunk_buffers;
+    std::vector<gsl::span<std::uint8_t const>> chunk_spans;
+    chunk_buffers.reserve(compressed_chunks.size());
+    chunk_spans.reserve(compressed_chunks.size());
+    for (auto const & chunk : compressed_chunks) {
+        chunk_buffers.push_back(chunk.cast<py::buffer>().request());
+        auto const & info = chunk_buffers.back();
+        chunk_spans.emplace_back(
+            static_cast<std::uint8_t const *>(info.ptr), info.size * info.itemsize);
+    }
+
+    auto const sample_counts_span =
+        gsl::make_span(chunk_sample_counts.data(), chunk_sample_counts.size());
+    auto const signal_out_span = signal_destination_span<std::int16_t>(signal_out, "int16");
+
+    arrow::Status status;
+    {
+        py::gil_scoped_release release_gil;
+        status = pod5::decompress_signal_chunks(
+            gsl::make_span(chunk_spans),
+            sample_counts_span,
+            arrow::system_memory_pool(),
+            thread_pool,
+            signal_out_span);
+    }
+    throw_on_error(status);
+}
+
+// Holds the python buffers of signal windows to decode for the duration of a call,
+// so the GIL can be released while decoding.
+class SignalWindowChunksArgs {
+public:
+    SignalWindowChunksArgs(
+        py::list const & buffers,
+        py::array_t<std::uint8_t, py::array::c_style | py::array::forcecast> const &
+            buffer_compressed,
+        py::array_t<std::uint32_t, py::array::c_style | py::array::forcecast> const & chunk_buffers,
+        py::array_t<std::uint64_t, py::array::c_style | py::array::forcecast> const &
+            chunk_byte_begins,
+        py::array_t<std::uint64_t, py::array::c_style | py::array::forcecast> const &
+            chunk_byte_ends,
+        py::array_t<std::uint32_t, py::array::c_style | py::array::forcecast> const &
+            chunk_sample_counts,
+        py::array_t<std::uint64_t, py::array::c_style | py::array::forcecast> const &
+            window_chunk_offsets,
+        py::array_t<std::uint64_t, py::array::c_style | py::array::forcecast> const &
+            window_first_samples)
+    {
+        m_buffer_infos.reserve(buffers.size());
+        m_buffer_spans.reserve(buffers.size());
+        for (auto const & buffer : buffers) {
+            m_buffer_infos.push_back(buffer.cast<py::buffer>().request());
+            auto const & info = m_buffer_infos.back();
+            m_buffer_spans.emplace_back(
+                static_cast<std::uint8_t const *>(info.ptr), info.size * info.itemsize);
+        }
+
+        m_chunks.buffers = gsl::make_span(m_buffer_spans);
+        m_chunks.buffer_compressed =
+            gsl::make_span(buffer_compressed.data(), buffer_compressed.size());
+        m_chunks.chunk_buffers = gsl::make_span(chunk_buffers.data(), chunk_buffers.size());
+        m_chunks.chunk_byte_begins =
+            gsl::make_span(chunk_byte_begins.data(), chunk_byte_begins.size());
+        m_chunks.chunk_byte_ends = gsl::make_span(chunk_byte_ends.data(), chunk_byte_ends.size());
+        m_chunks.chunk_sample_counts =
+            gsl::make_span(chunk_sample_counts.data(), chunk_sample_counts.size());
+        m_chunks.window_chunk_offsets =
+            gsl::make_span(window_chunk_offsets.data(), window_chunk_offsets.size());
+        m_chunks.window_first_samples =
+            gsl::make_span(window_first_samples.data(), window_first_samples.size());
+    }
+
+    pod5::SignalWindowChunks const & chunks() const { return m_chunks; }
+
+private:
+    std::vector<py::buffer_info> m_buffer_infos;
+    std::vector<gsl::span<std::uint8_t const>> m_buffer_spans;
+    pod5::SignalWindowChunks m_chunks;
+};
+
+inline void decode_signal_windows_wrapper(
+    pod5::ThreadPool & thread_pool,
+    SignalWindowChunksArgs const & args,
+    std::size_t window_length,
+    py::array & signal_out)
+{
+    auto const signal_out_span = signal_destination_span<std::int16_t>(signal_out, "int16");
+
+    arrow::Status status;
+    {
+        py::gil_scoped_release release_gil;
+        status = pod5::decode_signal_windows(
+            args.chunks(),
+            window_length,
+            arrow::system_memory_pool(),
+            thread_pool,
+            signal_out_span);
+    }
+    throw_on_error(status);
+}
+
+inline void decode_signal_windows_pa_wrapper(
+    pod5::ThreadPool & thread_pool,
+    SignalWindowChunksArgs const & args,
+    py::array_t<float, py::array::c_style | py::array::forcecast> const & calibration_offsets,
+    py::array_t<float, py::array::c_style | py::array::forcecast> const & calibration_scales,
+    std::size_t window_length,
+    py::array & signal_out)
+{
+    auto const signal_out_span = signal_destination_span<float>(signal_out, "float32");
+
+    arrow::Status status;
+    {
+        py::gil_scoped_release release_gil;
+        status = pod5::decode_signal_windows_pa(
+            args.chunks(),
+            gsl::make_span(calibration_offsets.data(), calibration_offsets.size()),
+            gsl::make_span(calibration_scales.data(), calibration_scales.size()),
+            window_length,
+            arrow::system_memory_pool(),
+            thread_pool,
+            signal_out_span);
+    }
+    throw_on_error(status);
+}
+
+inline void decode_signal_pa_wrapper(
+    pod5::ThreadPool & thread_pool,
+    SignalWindowChunksArgs const & args,
+    py::array_t<float, py::array::c_style | py::array::forcecast> const & calibration_offsets,
+    py::array_t<float, py::array::c_style | py::array::forcecast> const & calibration_scales,
+    py::array_t<std::uint64_t, py::array::c_style | py::array::forcecast> const &
+        destination_offsets,
+    py::array & signal_out)
+{
+    // The destination is written in place, so must not be converted to another dtype:
+    auto const dtype = signal_out.dtype();
+    if (dtype.kind() != 'f' || (dtype.itemsize() != 4 && dtype.itemsize() != 2)) {
+        throw std::runtime_error("Signal destination must be a float32 or float16 array");
+    }
+    if (!(signal_out.flags() & py::array::c_style) || !signal_out.writeable()) {
+        throw std::runtime_error("Signal destination must be a writeable contiguous array");
+    }
+
+    auto const offsets_span =
+        gsl::make_span(calibration_offsets.data(), calibration_offsets.size());
+    auto const scales_span = gsl::make_span(calibration_scales.data(), calibration_scales.size());
+    auto const destination_offsets_span =
+        gsl::make_span(destination_offsets.data(), destination_offsets.size());
+
+    arrow::Status status;
+    {
+        py::gil_scoped_release release_gil;
+        if (dtype.itemsize() == 4) {
+            status = pod5::decode_signal_pa(
+                args.chunks(),
+                offsets_span,
+                scales_span,
+                destination_offsets_span,
+                arrow::system_memory_pool(),
+                thread_pool,
+                gsl::make_span(static_cast<float *>(signal_out.mutable_data()), signal_out.size()));
+        } else {
+            status = pod5::decode_signal_pa(
+                args.chunks(),
+                offsets_span,
+                scales_span,
+                destination_offsets_span,
+                arrow::system_memory_pool(),
+                thread_pool,
+                gsl::make_span(
+                    static_cast<std::uint16_t *>(signal_out.mutable_data()), signal_out.size()));
+        }
+    }
+    throw_on_error(status);
+}
+
 inline std::size_t compress_signal_wrapper(
     py::array_t<std::int16_t, py::array::c_style | py::array::forcecast> const & signal,
     py::array_t<std::uint8_t, py::array::c_style | py::array::forcecast> & compressed_signal_out)
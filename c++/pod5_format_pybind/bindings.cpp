@@ -11,6 +11,35 @@ PYBIND11_MODULE(pod5_format_pybind, m)
 
     auto thread_pool = pod5::make_thread_pool(std::thread::hardware_concurrency());
 
+    // Memory pools are owned by arrow and live for the lifetime of the process
+    py::class_<arrow::MemoryPool, std::unique_ptr<arrow::MemoryPool, py::nodelete>>(m, "MemoryPool")
+        .def_property_readonly("backend_name", &arrow::MemoryPool::backend_name)
+        .def_property_readonly("bytes_allocated", &arrow::MemoryPool::bytes_allocated)
+        .def_property_readonly("max_memory", &arrow::MemoryPool::max_memory);
+
+    m.def(
+        "memory_pool",
+        &find_memory_pool,
+        py::return_value_policy::reference,
+        "Find the memory pool of a backend: 'default', 'system', 'jemalloc' or 'mimalloc'",
+        py::arg("backend_name"));
+    m.def(
+        "supported_memory_backends",
+        &arrow::SupportedMemoryBackendNames,
+        "Find the names of the memory pool backends this library was built with");
+
+    py::enum_<pod5::SignalType>(m, "SignalType")
+        .value("UncompressedSignal", pod5::SignalType::UncompressedSignal)
+        .value("VbzSignal", pod5::SignalType::VbzSignal);
+
+    py::class_<pod5::ThreadPool, std::shared_ptr<pod5::ThreadPool>>(m, "ThreadPool");
+
+    m.def(
+        "make_thread_pool",
+        &pod5::make_thread_pool,
+        "Create a thread pool of worker_threads threads, which writers may share",
+        py::arg("worker_threads"));
+
     py::class_<FileWriterOptions>(m, "FileWriterOptions")
         .def(py::init([thread_pool]() {
             FileWriterOptions options;
@@ -32,10 +61,22 @@ PYBIND11_MODULE(pod5_format_pybind, m)
         .def_property(
             "signal_compression_type",
             &FileWriterOptions::signal_type,
-            &FileWriterOptions::set_signal_type);
+            &FileWriterOptions::set_signal_type)
+        .def_property(
+            "thread_pool", &FileWriterOptions::thread_pool, &FileWriterOptions::set_thread_pool)
+        .def_property(
+            "memory_pool",
+            [](FileWriterOptions const & options) { return options.memory_pool(); },
+            [](FileWriterOptions & options, arrow::MemoryPool * pool) {
+                options.memory_pool(pool);
+            },
+            py::return_value_policy::reference);
 
     py::class_<FileWriter, std::shared_ptr<FileWriter>>(m, "FileWriter")
-        .def("close", [](pod5::FileWriter & w) { throw_on_error(w.close()); })
+        .def(
+            "close",
+            [](pod5::FileWriter & w) { throw_on_error(w.close()); },
+            py::call_guard<py::gil_scoped_release>())
         .def(
             "add_pore",
             [](pod5::FileWriter & w, std::string pore_type) {
@@ -48,7 +89,9 @@ PYBIND11_MODULE(pod5_format_pybind, m)
             })
         .def("add_run_info", FileWriter_add_run_info)
         .def("add_reads", FileWriter_add_reads)
-        .def("add_reads_pre_compressed", FileWriter_add_reads_pre_compressed);
+        .def("add_reads_flat", FileWriter_add_reads_flat)
+        .def("add_reads_pre_compressed", FileWriter_add_reads_pre_compressed)
+        .def("add_reads_pre_compressed_flat", FileWriter_add_reads_pre_compressed_flat);
 
     py::class_<pod5::FileLocation>(m, "EmbeddedFileData")
         .def_readonly("file_path", &pod5::FileLocation::file_path)
@@ -57,13 +100,19 @@ PYBIND11_MODULE(pod5_format_pybind, m)
 
     py::class_<Pod5AsyncSignalLoader, std::shared_ptr<Pod5AsyncSignalLoader>>(
         m, "Pod5AsyncSignalLoader")
-        .def("release_next_batch", &Pod5AsyncSignalLoader::release_next_batch);
+        .def("release_next_batch", &Pod5AsyncSignalLoader::release_next_batch)
+        .def_property_readonly("batch_ready", &Pod5AsyncSignalLoader::batch_ready)
+        .def_property_readonly("buffered_bytes", &Pod5AsyncSignalLoader::buffered_bytes)
+        .def("set_ready_fd", &Pod5AsyncSignalLoader::set_ready_fd, py::arg("fd"))
+        .def("cancel", &Pod5AsyncSignalLoader::cancel);
 
     py::class_<Pod5SignalCacheBatch, std::shared_ptr<Pod5SignalCacheBatch>>(
         m, "Pod5SignalCacheBatch")
         .def_property_readonly("batch_index", &Pod5SignalCacheBatch::batch_index)
         .def_property_readonly("sample_count", &Pod5SignalCacheBatch::sample_count)
-        .def_property_readonly("samples", &Pod5SignalCacheBatch::samples);
+        .def_property_readonly("samples", &Pod5SignalCacheBatch::samples)
+        .def_property_readonly("contiguous_samples", &Pod5SignalCacheBatch::contiguous_samples)
+        .def_property_readonly("sample_offsets", &Pod5SignalCacheBatch::sample_offsets);
 
     py::class_<Pod5FileReaderPtr>(m, "Pod5FileReader")
         .def(
@@ -72,10 +121,31 @@ PYBIND11_MODULE(pod5_format_pybind, m)
         .def("get_file_read_table_location", &Pod5FileReaderPtr::get_file_read_table_location)
         .def("get_file_signal_table_location", &Pod5FileReaderPtr::get_file_signal_table_location)
         .def("get_file_version_pre_migration", &Pod5FileReaderPtr::get_file_version_pre_migration)
+        .def("get_file_statistics", &Pod5FileReaderPtr::get_file_statistics)
+        .def_property_readonly(
+            "memory_pool", &Pod5FileReaderPtr::memory_pool, py::return_value_policy::reference)
         .def("plan_traversal", &Pod5FileReaderPtr::plan_traversal)
-        .def("batch_get_signal", &Pod5FileReaderPtr::batch_get_signal)
-        .def("batch_get_signal_selection", &Pod5FileReaderPtr::batch_get_signal_selection)
-        .def("batch_get_signal_batches", &Pod5FileReaderPtr::batch_get_signal_batches)
+        .def(
+            "batch_get_signal",
+            &Pod5FileReaderPtr::batch_get_signal,
+            py::arg("get_samples"),
+            py::arg("get_sample_count"),
+            py::arg("contiguous") = false)
+        .def(
+            "batch_get_signal_selection",
+            &Pod5FileReaderPtr::batch_get_signal_selection,
+            py::arg("get_samples"),
+            py::arg("get_sample_count"),
+            py::arg("batch_counts"),
+            py::arg("batch_rows"),
+            py::arg("contiguous") = false)
+        .def(
+            "batch_get_signal_batches",
+            &Pod5FileReaderPtr::batch_get_signal_batches,
+            py::arg("get_samples"),
+            py::arg("get_sample_count"),
+            py::arg("batches"),
+            py::arg("contiguous") = false)
         .def("close", &Pod5FileReaderPtr::close);
 
     // Errors API
@@ -91,7 +161,12 @@ PYBIND11_MODULE(pod5_format_pybind, m)
         py::arg("options") = nullptr);
 
     // Opening files
-    m.def("open_file", &open_file, "Open a POD5 file for reading");
+    m.def(
+        "open_file",
+        &open_file,
+        "Open a POD5 file for reading",
+        py::arg("filename"),
+        py::arg("memory_pool") = nullptr);
     m.def("recover_file", &recover_file, "Recover a POD5 file which was not closed correctly");
 
     m.def(
@@ -101,6 +176,137 @@ PYBIND11_MODULE(pod5_format_pybind, m)
 
     // Signal API
     m.def("decompress_signal", &decompress_signal_wrapper, "Decompress a numpy array of signal");
+    m.def(
+        "decompress_signal_chunks",
+        [thread_pool](
+            py::list const & compressed_chunks,
+            py::array_t<std::uint32_t, py::array::c_style | py::array::forcecast> const &
+                chunk_sample_counts,
+            py::array & signal_out) {
+            decompress_signal_chunks_wrapper(
+                *thread_pool, compressed_chunks, chunk_sample_counts, signal_out);
+        },
+        "Decompress a list of signal chunks into a numpy array of signal in parallel");
+    m.def(
+        "decode_signal_windows",
+        [thread_pool](
+            py::list const & buffers,
+            py::array_t<std::uint8_t, py::array::c_style | py::array::forcecast> const &
+                buffer_compressed,
+            py::array_t<std::uint32_t, py::array::c_style | py::array::forcecast> const &
+                chunk_buffers,
+            py::array_t<std::uint64_t, py::array::c_style | py::array::forcecast> const &
+                chunk_byte_begins,
+            py::array_t<std::uint64_t, py::array::c_style | py::array::forcecast> const &
+                chunk_byte_ends,
+            py::array_t<std::uint32_t, py::array::c_style | py::array::forcecast> const &
+                chunk_sample_counts,
+            py::array_t<std::uint64_t, py::array::c_style | py::array::forcecast> const &
+                window_chunk_offsets,
+            py::array_t<std::uint64_t, py::array::c_style | py::array::forcecast> const &
+                window_first_samples,
+            std::size_t window_length,
+            py::array & signal_out) {
+            decode_signal_windows_wrapper(
+                *thread_pool,
+                SignalWindowChunksArgs(
+                    buffers,
+                    buffer_compressed,
+                    chunk_buffers,
+                    chunk_byte_begins,
+                    chunk_byte_ends,
+                    chunk_sample_counts,
+                    window_chunk_offsets,
+                    window_first_samples),
+                window_length,
+                signal_out);
+        },
+        "Decode fixed length windows of signal into a 2d numpy array, decoding only the "
+        "chunks overlapping each window");
+    m.def(
+        "decode_signal_windows_pa",
+        [thread_pool](
+            py::list const & buffers,
+            py::array_t<std::uint8_t, py::array::c_style | py::array::forcecast> const &
+                buffer_compressed,
+            py::array_t<std::uint32_t, py::array::c_style | py::array::forcecast> const &
+                chunk_buffers,
+            py::array_t<std::uint64_t, py::array::c_style | py::array::forcecast> const &
+                chunk_byte_begins,
+            py::array_t<std::uint64_t, py::array::c_style | py::array::forcecast> const &
+                chunk_byte_ends,
+            py::array_t<std::uint32_t, py::array::c_style | py::array::forcecast> const &
+                chunk_sample_counts,
+            py::array_t<std::uint64_t, py::array::c_style | py::array::forcecast> const &
+                window_chunk_offsets,
+            py::array_t<std::uint64_t, py::array::c_style | py::array::forcecast> const &
+                window_first_samples,
+            py::array_t<float, py::array::c_style | py::array::forcecast> const &
+                calibration_offsets,
+            py::array_t<float, py::array::c_style | py::array::forcecast> const &
+                calibration_scales,
+            std::size_t window_length,
+            py::array & signal_out) {
+            decode_signal_windows_pa_wrapper(
+                *thread_pool,
+                SignalWindowChunksArgs(
+                    buffers,
+                    buffer_compressed,
+                    chunk_buffers,
+                    chunk_byte_begins,
+                    chunk_byte_ends,
+                    chunk_sample_counts,
+                    window_chunk_offsets,
+                    window_first_samples),
+                calibration_offsets,
+                calibration_scales,
+                window_length,
+                signal_out);
+        },
+        "Decode fixed length windows of signal calibrated to pico amps into a 2d numpy array");
+    m.def(
+        "decode_signal_pa",
+        [thread_pool](
+            py::list const & buffers,
+            py::array_t<std::uint8_t, py::array::c_style | py::array::forcecast> const &
+                buffer_compressed,
+            py::array_t<std::uint32_t, py::array::c_style | py::array::forcecast> const &
+                chunk_buffers,
+            py::array_t<std::uint64_t, py::array::c_style | py::array::forcecast> const &
+                chunk_byte_begins,
+            py::array_t<std::uint64_t, py::array::c_style | py::array::forcecast> const &
+                chunk_byte_ends,
+            py::array_t<std::uint32_t, py::array::c_style | py::array::forcecast> const &
+                chunk_sample_counts,
+            py::array_t<std::uint64_t, py::array::c_style | py::array::forcecast> const &
+                read_chunk_offsets,
+            py::array_t<std::uint64_t, py::array::c_style | py::array::forcecast> const &
+                read_first_samples,
+            py::array_t<float, py::array::c_style | py::array::forcecast> const &
+                calibration_offsets,
+            py::array_t<float, py::array::c_style | py::array::forcecast> const &
+                calibration_scales,
+            py::array_t<std::uint64_t, py::array::c_style | py::array::forcecast> const &
+                signal_offsets,
+            py::array & signal_out) {
+            decode_signal_pa_wrapper(
+                *thread_pool,
+                SignalWindowChunksArgs(
+                    buffers,
+                    buffer_compressed,
+                    chunk_buffers,
+                    chunk_byte_begins,
+                    chunk_byte_ends,
+                    chunk_sample_counts,
+                    read_chunk_offsets,
+                    read_first_samples),
+                calibration_offsets,
+                calibration_scales,
+                signal_offsets,
+                signal_out);
+        },
+        "Decode the signal of reads calibrated to pico amps into a float32 or float16 numpy "
+        "array, fusing decompression and calibration");
     m.def("compress_signal", &compress_signal_wrapper, "Compress a numpy array of signal");
     m.def("vbz_compressed_signal_max_size", &vbz_compressed_signal_max_size);
 
@@ -15,6 +15,7 @@
 #include <boost/uuid/uuid_io.hpp>
 #include <catch2/catch.hpp>
 
+#include <atomic>
 #include <iostream>
 #include <numeric>
 
@@ -91,8 +92,22 @@ void run_file_reader_writer_tests()
     // Open the file for reading:
     // Write a file:
     {
-        auto reader = pod5::open_file_reader(file, {});
+        pod5::FileReaderOptions reader_options;
+        reader_options.memory_pool(arrow::system_memory_pool());
+        auto reader = pod5::open_file_reader(file, reader_options);
         REQUIRE_ARROW_STATUS_OK(reader);
+        CHECK((*reader)->memory_pool() == arrow::system_memory_pool());
+
+        auto const & statistics = (*reader)->file_statistics();
+        REQUIRE(statistics.has_value());
+        CHECK(statistics->read_count == 10);
+        CHECK(statistics->sample_count == 10 * signal_1.size());
+        CHECK(statistics->signal_bytes == (*reader)->signal_table_location().size);
+        CHECK(statistics->min_start_sample == start_sample);
+        CHECK(statistics->max_start_sample == start_sample);
+        REQUIRE(statistics->run_info_read_counts.size() == 1);
+        CHECK(statistics->run_info_read_counts[0].acquisition_id == run_info_data.acquisition_id);
+        CHECK(statistics->run_info_read_counts[0].read_count == 10);
 
         REQUIRE((*reader)->num_read_record_batches() == 10);
         for (std::size_t i = 0; i < 10; ++i) {
@@ -137,7 +152,8 @@ void run_file_reader_writer_tests()
 
         auto const samples_mode = GENERATE(
             pod5::AsyncSignalLoader::SamplesMode::NoSamples,
-            pod5::AsyncSignalLoader::SamplesMode::Samples);
+            pod5::AsyncSignalLoader::SamplesMode::Samples,
+            pod5::AsyncSignalLoader::SamplesMode::ContiguousSamples);
 
         pod5::AsyncSignalLoader async_no_samples_loader(
             *reader,
@@ -162,7 +178,46 @@ void run_file_reader_writer_tests()
             } else {
                 CHECK(first_batch->samples()[0].size() == 0);
             }
+
+            if (samples_mode == pod5::AsyncSignalLoader::SamplesMode::ContiguousSamples) {
+                CHECK(
+                    first_batch->sample_offsets()
+                    == std::vector<std::uint64_t>{0, signal_1.size()});
+                auto const & contiguous_samples = first_batch->contiguous_samples();
+                REQUIRE(contiguous_samples);
+                CHECK(
+                    gsl::make_span(contiguous_samples->data(), contiguous_samples->size())
+                        .as_span<std::int16_t const>()
+                    == gsl::make_span(signal_1));
+            } else {
+                CHECK(first_batch->sample_offsets().empty());
+                CHECK(!first_batch->contiguous_samples());
+            }
         }
+
+        // All batches are released, so the loader reports finished immediately:
+        CHECK(async_no_samples_loader.buffered_bytes() == 0);
+        CHECK(async_no_samples_loader.is_next_batch_ready());
+        auto end_batch = async_no_samples_loader.release_next_batch();
+        REQUIRE_ARROW_STATUS_OK(end_batch);
+        CHECK(!*end_batch);
+
+        // Readiness is signalled through the callback, and cancelling stops the workers:
+        std::atomic<std::size_t> ready_notifications{0};
+        pod5::AsyncSignalLoader async_notify_loader(*reader, samples_mode, {}, {});
+        async_notify_loader.set_batch_ready_callback([&] { ready_notifications += 1; });
+
+        auto notified_batch = async_notify_loader.release_next_batch();
+        REQUIRE_ARROW_STATUS_OK(notified_batch);
+        CHECK((*notified_batch)->batch_index() == 0);
+
+        async_notify_loader.cancel();
+        CHECK(async_notify_loader.is_finished());
+        CHECK(async_notify_loader.is_next_batch_ready());
+        CHECK(ready_notifications > 0);
+        auto cancelled_batch = async_notify_loader.release_next_batch();
+        REQUIRE_ARROW_STATUS_OK(cancelled_batch);
+        CHECK(!*cancelled_batch);
     }
 }
 
@@ -273,6 +328,9 @@ SCENARIO("Opening older files")
     auto metadata = (*reader)->schema_metadata();
     CHECK(metadata.writing_software == "Python API");
 
+    // Statistics were not recorded in the footer of older files:
+    CHECK(!(*reader)->file_statistics());
+
     std::size_t abs_row = 0;
 
     for (std::size_t i = 0; i < (*reader)->num_read_record_batches(); ++i) {
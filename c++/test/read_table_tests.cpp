@@ -15,6 +15,9 @@
 #include <boost/uuid/random_generator.hpp>
 #include <catch2/catch.hpp>
 
+#include <algorithm>
+#include <numeric>
+
 bool operator==(
     std::shared_ptr<arrow::UInt64Array> const & array,
     std::vector<std::uint64_t> const & vec)
@@ -223,3 +226,91 @@ SCENARIO("Read table Tests")
         }
     }
 }
+
+SCENARIO("Read id lookup Tests")
+{
+    using namespace pod5;
+
+    auto uuid_gen = boost::uuids::random_generator_mt19937();
+
+    // Large enough for the lookup to be built and sorted on several threads:
+    std::vector<std::vector<boost::uuids::uuid>> batch_ids{
+        std::vector<boost::uuids::uuid>(50'000),
+        {},
+        std::vector<boost::uuids::uuid>(100'000),
+    };
+    std::vector<gsl::span<boost::uuids::uuid const>> batch_spans;
+    for (auto & ids : batch_ids) {
+        std::generate(ids.begin(), ids.end(), [&] { return uuid_gen(); });
+        batch_spans.emplace_back(gsl::make_span(ids));
+    }
+
+    GIVEN("A read id lookup built on several threads")
+    {
+        auto const lookup = build_read_id_lookup(batch_spans, 4);
+
+        THEN("Every read id is sorted with its location")
+        {
+            REQUIRE(lookup.size() == 150'000);
+            CHECK(std::is_sorted(lookup.begin(), lookup.end(), [](auto const & a, auto const & b) {
+                return a.id < b.id;
+            }));
+            for (auto const & entry : lookup) {
+                REQUIRE(batch_ids[entry.batch][entry.batch_row] == entry.id);
+            }
+        }
+
+        for (std::size_t query_size : {std::size_t(5), std::size_t(2'000), std::size_t(150'000)}) {
+            AND_GIVEN("A query of " << query_size << " read ids and a missing read id")
+            {
+                std::vector<boost::uuids::uuid> query;
+                for (std::size_t i = 0; i < query_size; ++i) {
+                    auto const & ids = i % 3 ? batch_ids[2] : batch_ids[0];
+                    query.push_back(ids[(i * 7919) % ids.size()]);
+                }
+                query.push_back(uuid_gen());
+                // Repeated read ids are found once per occurrence:
+                std::size_t const expected_found = query_size;
+
+                ReadIdSearchInput const search_input(gsl::make_span(query), 4);
+                for (std::size_t i = 1; i < search_input.read_id_count(); ++i) {
+                    REQUIRE(!(search_input[i].id < search_input[i - 1].id));
+                }
+
+                THEN("Each search strategy finds the same rows")
+                {
+                    std::vector<std::uint32_t> expected_counts;
+                    std::vector<std::uint32_t> expected_rows;
+                    for (auto strategy :
+                         {ReadIdSearchStrategy::Merge,
+                          ReadIdSearchStrategy::Galloping,
+                          ReadIdSearchStrategy::Automatic})
+                    {
+                        std::vector<std::uint32_t> batch_counts(batch_ids.size());
+                        std::vector<std::uint32_t> batch_rows(query.size());
+                        auto const found = search_read_id_lookup(
+                            gsl::make_span(lookup),
+                            search_input,
+                            gsl::make_span(batch_counts),
+                            gsl::make_span(batch_rows),
+                            strategy);
+                        CHECK(found == expected_found);
+                        CHECK(batch_counts[1] == 0);
+                        CHECK(
+                            std::accumulate(batch_counts.begin(), batch_counts.end(), 0u)
+                            == expected_found);
+                        CHECK(std::is_sorted(
+                            batch_rows.begin(), batch_rows.begin() + batch_counts[0]));
+
+                        if (expected_counts.empty()) {
+                            expected_counts = batch_counts;
+                            expected_rows = batch_rows;
+                        }
+                        CHECK(batch_counts == expected_counts);
+                        CHECK(batch_rows == expected_rows);
+                    }
+                }
+            }
+        }
+    }
+}
@@ -1,5 +1,6 @@
 #include "pod5_format/signal_compression.h"
 
+#include "pod5_format/thread_pool.h"
 #include "test_utils.h"
 #include "utils.h"
 
@@ -8,6 +9,8 @@
 #include <catch2/catch.hpp>
 #include <gsl/gsl-lite.hpp>
 
+#include <cmath>
+#include <limits>
 #include <numeric>
 
 SCENARIO("Signal compression Tests")
@@ -28,3 +31,253 @@ SCENARIO("Signal compression Tests")
 
     CHECK(gsl::make_span(signal) == decompressed_span);
 }
+
+SCENARIO("Signal chunk decompression Tests")
+{
+    auto pool = arrow::system_memory_pool();
+    auto thread_pool = pod5::make_thread_pool(4);
+
+    std::vector<std::int16_t> signal(100'000);
+    std::iota(signal.begin(), signal.end(), 0);
+
+    std::vector<std::uint32_t> chunk_sample_counts{30'000, 30'000, 30'000, 10'000};
+    std::vector<std::shared_ptr<arrow::Buffer>> compressed_chunks;
+    std::vector<gsl::span<std::uint8_t const>> compressed_spans;
+    std::size_t offset = 0;
+    for (auto const count : chunk_sample_counts) {
+        auto compressed =
+            pod5::compress_signal(gsl::make_span(signal).subspan(offset, count), pool);
+        REQUIRE_ARROW_STATUS_OK(compressed);
+        compressed_chunks.push_back(*compressed);
+        compressed_spans.push_back(gsl::make_span((*compressed)->data(), (*compressed)->size()));
+        offset += count;
+    }
+
+    GIVEN("A destination sized for all chunks")
+    {
+        std::vector<std::int16_t> decompressed(signal.size());
+        auto status = pod5::decompress_signal_chunks(
+            gsl::make_span(compressed_spans),
+            gsl::make_span(chunk_sample_counts),
+            pool,
+            *thread_pool,
+            gsl::make_span(decompressed));
+        REQUIRE_ARROW_STATUS_OK(status);
+        CHECK(decompressed == signal);
+    }
+
+    GIVEN("A destination of the wrong size")
+    {
+        std::vector<std::int16_t> decompressed(signal.size() - 1);
+        auto status = pod5::decompress_signal_chunks(
+            gsl::make_span(compressed_spans),
+            gsl::make_span(chunk_sample_counts),
+            pool,
+            *thread_pool,
+            gsl::make_span(decompressed));
+        CHECK_ARROW_STATUS_NOT_OK(status);
+    }
+
+    GIVEN("Inconsistent chunk and sample counts")
+    {
+        std::vector<std::int16_t> decompressed(signal.size());
+        auto status = pod5::decompress_signal_chunks(
+            gsl::make_span(compressed_spans),
+            gsl::make_span(chunk_sample_counts).subspan(1),
+            pool,
+            *thread_pool,
+            gsl::make_span(decompressed));
+        CHECK_ARROW_STATUS_NOT_OK(status);
+    }
+}
+
+SCENARIO("Signal window decoding Tests")
+{
+    auto pool = arrow::system_memory_pool();
+    auto thread_pool = pod5::make_thread_pool(4);
+
+    std::vector<std::int16_t> signal(100'000);
+    std::iota(signal.begin(), signal.end(), 0);
+
+    // Buffer 0 holds compressed chunks back to back, buffer 1 the uncompressed signal:
+    std::vector<std::uint32_t> chunk_sample_counts{30'000, 30'000, 30'000, 10'000};
+    std::vector<std::uint8_t> compressed_buffer;
+    std::vector<std::uint32_t> chunk_buffers;
+    std::vector<std::uint64_t> chunk_byte_begins;
+    std::vector<std::uint64_t> chunk_byte_ends;
+    std::size_t offset = 0;
+    for (auto const count : chunk_sample_counts) {
+        auto compressed =
+            pod5::compress_signal(gsl::make_span(signal).subspan(offset, count), pool);
+        REQUIRE_ARROW_STATUS_OK(compressed);
+        chunk_buffers.push_back(0);
+        chunk_byte_begins.push_back(compressed_buffer.size());
+        compressed_buffer.insert(
+            compressed_buffer.end(),
+            (*compressed)->data(),
+            (*compressed)->data() + (*compressed)->size());
+        chunk_byte_ends.push_back(compressed_buffer.size());
+        offset += count;
+    }
+
+    chunk_buffers.push_back(1);
+    chunk_byte_begins.push_back(0);
+    chunk_byte_ends.push_back(signal.size() * sizeof(std::int16_t));
+    chunk_sample_counts.push_back(signal.size());
+
+    std::vector<gsl::span<std::uint8_t const>> buffers{
+        gsl::make_span(compressed_buffer), gsl::make_span(signal).as_span<std::uint8_t const>()};
+    std::vector<std::uint8_t> buffer_compressed{1, 0};
+
+    // Window 0 spans the first two compressed chunks, window 1 is uncompressed:
+    std::size_t const window_length = 20;
+    std::vector<std::uint64_t> window_chunk_offsets{0, 4, 5};
+    std::vector<std::uint64_t> window_first_samples{29'990, 50'000};
+
+    pod5::SignalWindowChunks chunks;
+    chunks.buffers = gsl::make_span(buffers);
+    chunks.buffer_compressed = gsl::make_span(buffer_compressed);
+    chunks.chunk_buffers = gsl::make_span(chunk_buffers);
+    chunks.chunk_byte_begins = gsl::make_span(chunk_byte_begins);
+    chunks.chunk_byte_ends = gsl::make_span(chunk_byte_ends);
+    chunks.chunk_sample_counts = gsl::make_span(chunk_sample_counts);
+    chunks.window_chunk_offsets = gsl::make_span(window_chunk_offsets);
+    chunks.window_first_samples = gsl::make_span(window_first_samples);
+
+    std::vector<std::int16_t> expected;
+    expected.insert(expected.end(), signal.begin() + 29'990, signal.begin() + 30'010);
+    expected.insert(expected.end(), signal.begin() + 50'000, signal.begin() + 50'020);
+
+    GIVEN("An int16 destination")
+    {
+        std::vector<std::int16_t> windows(2 * window_length);
+        auto status = pod5::decode_signal_windows(
+            chunks, window_length, pool, *thread_pool, gsl::make_span(windows));
+        REQUIRE_ARROW_STATUS_OK(status);
+        CHECK(windows == expected);
+    }
+
+    GIVEN("A calibrated float destination")
+    {
+        std::vector<float> calibration_offsets{1.0f, 0.0f};
+        std::vector<float> calibration_scales{0.5f, 2.0f};
+        std::vector<float> windows(2 * window_length);
+        auto status = pod5::decode_signal_windows_pa(
+            chunks,
+            gsl::make_span(calibration_offsets),
+            gsl::make_span(calibration_scales),
+            window_length,
+            pool,
+            *thread_pool,
+            gsl::make_span(windows));
+        REQUIRE_ARROW_STATUS_OK(status);
+        for (std::size_t i = 0; i < windows.size(); ++i) {
+            auto const window = i / window_length;
+            CHECK(
+                windows[i]
+                == Approx(
+                    (expected[i] + calibration_offsets[window]) * calibration_scales[window]));
+        }
+    }
+
+    GIVEN("Whole reads calibrated into float and half destinations")
+    {
+        // Read 0 is the compressed chunks, read 1 the uncompressed signal:
+        window_first_samples = {0, 0};
+        std::vector<std::uint64_t> destination_offsets{0, signal.size(), 2 * signal.size()};
+        std::vector<float> calibration_offsets{1.0f, -3.0f};
+        std::vector<float> calibration_scales{0.5f, 0.25f};
+
+        std::vector<float> signal_pa(2 * signal.size());
+        auto status = pod5::decode_signal_pa(
+            chunks,
+            gsl::make_span(calibration_offsets),
+            gsl::make_span(calibration_scales),
+            gsl::make_span(destination_offsets),
+            pool,
+            *thread_pool,
+            gsl::make_span(signal_pa));
+        REQUIRE_ARROW_STATUS_OK(status);
+
+        std::vector<std::uint16_t> signal_pa_half(2 * signal.size());
+        status = pod5::decode_signal_pa(
+            chunks,
+            gsl::make_span(calibration_offsets),
+            gsl::make_span(calibration_scales),
+            gsl::make_span(destination_offsets),
+            pool,
+            *thread_pool,
+            gsl::make_span(signal_pa_half));
+        REQUIRE_ARROW_STATUS_OK(status);
+
+        for (std::size_t i = 0; i < signal_pa.size(); ++i) {
+            auto const read = i / signal.size();
+            auto const expected_pa =
+                (signal[i % signal.size()] + calibration_offsets[read]) * calibration_scales[read];
+            CHECK(signal_pa[i] == expected_pa);
+            CHECK(signal_pa_half[i] == pod5::float_to_half(expected_pa));
+        }
+
+        std::vector<float> short_destination(2 * signal.size() - 1);
+        status = pod5::decode_signal_pa(
+            chunks,
+            gsl::make_span(calibration_offsets),
+            gsl::make_span(calibration_scales),
+            gsl::make_span(destination_offsets),
+            pool,
+            *thread_pool,
+            gsl::make_span(short_destination));
+        CHECK_ARROW_STATUS_NOT_OK(status);
+
+        // A read longer than the samples of its chunks:
+        destination_offsets = {0, signal.size() + 1, 2 * signal.size()};
+        status = pod5::decode_signal_pa(
+            chunks,
+            gsl::make_span(calibration_offsets),
+            gsl::make_span(calibration_scales),
+            gsl::make_span(destination_offsets),
+            pool,
+            *thread_pool,
+            gsl::make_span(signal_pa));
+        CHECK_ARROW_STATUS_NOT_OK(status);
+    }
+
+    GIVEN("A window exceeding its chunks")
+    {
+        window_first_samples[1] = signal.size() - 10;
+        std::vector<std::int16_t> windows(2 * window_length);
+        auto status = pod5::decode_signal_windows(
+            chunks, window_length, pool, *thread_pool, gsl::make_span(windows));
+        CHECK_ARROW_STATUS_NOT_OK(status);
+    }
+
+    GIVEN("A destination of the wrong size")
+    {
+        std::vector<std::int16_t> windows(2 * window_length - 1);
+        auto status = pod5::decode_signal_windows(
+            chunks, window_length, pool, *thread_pool, gsl::make_span(windows));
+        CHECK_ARROW_STATUS_NOT_OK(status);
+    }
+}
+
+SCENARIO("Half float conversion Tests")
+{
+    CHECK(pod5::float_to_half(0.0f) == 0x0000);
+    CHECK(pod5::float_to_half(-0.0f) == 0x8000);
+    CHECK(pod5::float_to_half(1.0f) == 0x3c00);
+    CHECK(pod5::float_to_half(-2.0f) == 0xc000);
+    CHECK(pod5::float_to_half(0.1f) == 0x2e66);
+    CHECK(pod5::float_to_half(65504.0f) == 0x7bff);
+
+    // Ties round to even:
+    CHECK(pod5::float_to_half(1.0f + 1.0f / 2048) == 0x3c00);
+    CHECK(pod5::float_to_half(1.0f + 3.0f / 2048) == 0x3c02);
+
+    // Subnormals, underflow and overflow:
+    CHECK(pod5::float_to_half(std::ldexp(1.0f, -24)) == 0x0001);
+    CHECK(pod5::float_to_half(std::ldexp(1.0f, -26)) == 0x0000);
+    CHECK(pod5::float_to_half(65520.0f) == 0x7c00);
+    CHECK(pod5::float_to_half(-1e10f) == 0xfc00);
+    CHECK(pod5::float_to_half(std::numeric_limits<float>::infinity()) == 0x7c00);
+    CHECK(pod5::float_to_half(std::numeric_limits<float>::quiet_NaN()) == 0x7e00);
+}
@@ -5,19 +5,29 @@ from .pod5_format_pybind import (
     EmbeddedFileData,
     FileWriter,
     FileWriterOptions,
+    MemoryPool,
     Pod5AsyncSignalLoader,
     Pod5FileReader,
     Pod5RepackerOutput,
     Pod5SignalCacheBatch,
     Repacker,
+    SignalType,
+    ThreadPool,
     compress_signal,
     create_file,
     recover_file,
     decompress_signal,
+    decompress_signal_chunks,
+    decode_signal_pa,
+    decode_signal_windows,
+    decode_signal_windows_pa,
     format_read_id_to_str,
     get_error_string,
     load_read_id_iterable,
+    make_thread_pool,
+    memory_pool,
     open_file,
+    supported_memory_backends,
     update_file,
     vbz_compressed_signal_max_size,
 )
@@ -28,19 +38,29 @@ __all__ = [
     "EmbeddedFileData",
     "FileWriter",
     "FileWriterOptions",
+    "MemoryPool",
     "Pod5AsyncSignalLoader",
     "Pod5FileReader",
     "Pod5RepackerOutput",
     "Pod5SignalCacheBatch",
     "Repacker",
+    "SignalType",
+    "ThreadPool",
     "compress_signal",
     "create_file",
     "recover_file",
     "decompress_signal",
+    "decompress_signal_chunks",
+    "decode_signal_pa",
+    "decode_signal_windows",
+    "decode_signal_windows_pa",
     "format_read_id_to_str",
     "get_error_string",
     "load_read_id_iterable",
+    "make_thread_pool",
+    "memory_pool",
     "open_file",
+    "supported_memory_backends",
     "update_file",
     "vbz_compressed_signal_max_size",
 ]
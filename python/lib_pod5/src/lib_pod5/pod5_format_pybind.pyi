@@ -8,7 +8,7 @@ c++ bindings for pod5_format
 # > pip install mypy
 # > stubgen -m lib_pod5.pod5_format_pybind
 
-from typing import Any, Iterable, List, Optional, Tuple, Union
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
 
 import numpy as np
 import numpy.typing as npt
@@ -50,6 +50,31 @@ class FileWriter:
         time_since_mux_changes: npt.NDArray[np.float32],
         signals: List[npt.NDArray[np.int16]],
     ) -> None: ...
+    def add_reads_flat(
+        self,
+        count: int,
+        read_ids: npt.NDArray[np.uint8],
+        read_numbers: npt.NDArray[np.uint32],
+        start_samples: npt.NDArray[np.uint64],
+        channels: npt.NDArray[np.uint16],
+        wells: npt.NDArray[np.uint8],
+        pore_types: npt.NDArray[np.int16],
+        calibration_offsets: npt.NDArray[np.float32],
+        calibration_scales: npt.NDArray[np.float32],
+        median_befores: npt.NDArray[np.float32],
+        end_reasons: npt.NDArray[np.int16],
+        end_reason_forceds: npt.NDArray[np.bool_],
+        run_infos: npt.NDArray[np.int16],
+        num_minknow_events: npt.NDArray[np.uint64],
+        tracked_scaling_scales: npt.NDArray[np.float32],
+        tracked_scaling_shifts: npt.NDArray[np.float32],
+        predicted_scaling_scales: npt.NDArray[np.float32],
+        predicted_scaling_shifts: npt.NDArray[np.float32],
+        num_reads_since_mux_changes: npt.NDArray[np.uint32],
+        time_since_mux_changes: npt.NDArray[np.float32],
+        signal: npt.NDArray[np.int16],
+        signal_offsets: npt.NDArray[np.uint64],
+    ) -> None: ...
     def add_reads_pre_compressed(
         self,
         count: int,
@@ -76,6 +101,33 @@ class FileWriter:
         signal_chunk_lengths: npt.NDArray[np.uint32],
         signal_chunk_counts: npt.NDArray[np.uint32],
     ) -> None: ...
+    def add_reads_pre_compressed_flat(
+        self,
+        count: int,
+        read_ids: npt.NDArray[np.uint8],
+        read_numbers: npt.NDArray[np.uint32],
+        start_samples: npt.NDArray[np.uint64],
+        channels: npt.NDArray[np.uint16],
+        wells: npt.NDArray[np.uint8],
+        pore_types: npt.NDArray[np.int16],
+        calibration_offsets: npt.NDArray[np.float32],
+        calibration_scales: npt.NDArray[np.float32],
+        median_befores: npt.NDArray[np.float32],
+        end_reasons: npt.NDArray[np.int16],
+        end_reason_forceds: npt.NDArray[np.bool_],
+        run_infos: npt.NDArray[np.int16],
+        num_minknow_events: npt.NDArray[np.uint64],
+        tracked_scaling_scales: npt.NDArray[np.float32],
+        tracked_scaling_shifts: npt.NDArray[np.float32],
+        predicted_scaling_scales: npt.NDArray[np.float32],
+        predicted_scaling_shifts: npt.NDArray[np.float32],
+        num_reads_since_mux_changes: npt.NDArray[np.uint32],
+        time_since_mux_changes: npt.NDArray[np.float32],
+        signal_data: npt.NDArray[np.uint8],
+        signal_chunk_offsets: npt.NDArray[np.uint64],
+        signal_chunk_lengths: npt.NDArray[np.uint32],
+        signal_chunk_counts: npt.NDArray[np.uint32],
+    ) -> None: ...
     def add_run_info(
         self,
         acquisition_id: str,
@@ -103,25 +155,55 @@ class FileWriter:
 
 class FileWriterOptions:
     max_signal_chunk_size: int
+    memory_pool: MemoryPool
     read_table_batch_size: int
-    signal_compression_type: Any
+    signal_compression_type: SignalType
     signal_table_batch_size: int
+    thread_pool: ThreadPool
+    def __init__(self, *args, **kwargs) -> None: ...
+
+class SignalType:
+    UncompressedSignal: SignalType
+    VbzSignal: SignalType
+    def __init__(self, value: int) -> None: ...
+    @property
+    def name(self) -> str: ...
+    @property
+    def value(self) -> int: ...
+
+class ThreadPool:
     def __init__(self, *args, **kwargs) -> None: ...
 
+class MemoryPool:
+    def __init__(self, *args, **kwargs) -> None: ...
+    @property
+    def backend_name(self) -> str: ...
+    @property
+    def bytes_allocated(self) -> int: ...
+    @property
+    def max_memory(self) -> int: ...
+
 class Pod5AsyncSignalLoader:
     def __init__(self, *args, **kwargs) -> None: ...
-    def release_next_batch(self) -> Pod5SignalCacheBatch: ...
+    def release_next_batch(self) -> Optional[Pod5SignalCacheBatch]: ...
+    @property
+    def batch_ready(self) -> bool: ...
+    @property
+    def buffered_bytes(self) -> int: ...
+    def set_ready_fd(self, fd: int) -> None: ...
+    def cancel(self) -> None: ...
 
 class Pod5FileReader:
     def __init__(self, *args, **kwargs) -> None: ...
     def batch_get_signal(
-        self, get_samples: bool, get_sample_count: bool
+        self, get_samples: bool, get_sample_count: bool, contiguous: bool = False
     ) -> Pod5AsyncSignalLoader: ...
     def batch_get_signal_batches(
         self,
         get_samples: bool,
-        get_samples_count: bool,
+        get_sample_count: bool,
         batches: npt.NDArray[np.uint32],
+        contiguous: bool = False,
     ) -> Pod5AsyncSignalLoader: ...
     def batch_get_signal_selection(
         self,
@@ -129,12 +211,16 @@ class Pod5FileReader:
         get_sample_count: bool,
         batch_counts: npt.NDArray[np.uint32],
         batch_rows: npt.NDArray[np.uint32],
+        contiguous: bool = False,
     ) -> Pod5AsyncSignalLoader: ...
     def close(self) -> None: ...
     def get_file_read_table_location(self) -> EmbeddedFileData: ...
     def get_file_run_info_table_location(self) -> EmbeddedFileData: ...
     def get_file_signal_table_location(self) -> EmbeddedFileData: ...
+    def get_file_statistics(self) -> Optional[Dict[str, Any]]: ...
     def get_file_version_pre_migration(self) -> str: ...
+    @property
+    def memory_pool(self) -> MemoryPool: ...
     def plan_traversal(
         self,
         read_id_data: npt.NDArray[np.uint8],
@@ -153,6 +239,10 @@ class Pod5SignalCacheBatch:
     def sample_count(self) -> npt.NDArray[np.uint64]: ...
     @property
     def samples(self) -> List[npt.NDArray[np.int16]]: ...
+    @property
+    def contiguous_samples(self) -> Optional[npt.NDArray[np.int16]]: ...
+    @property
+    def sample_offsets(self) -> npt.NDArray[np.uint64]: ...
 
 class Repacker:
     def __init__(self) -> None: ...
@@ -192,6 +282,51 @@ def decompress_signal(
     compressed_signal: Union[npt.NDArray[np.uint8], memoryview],
     signal_out: npt.NDArray[np.int16],
 ) -> None: ...
+def decompress_signal_chunks(
+    compressed_chunks: List[Union[npt.NDArray[np.uint8], memoryview]],
+    chunk_sample_counts: npt.NDArray[np.uint32],
+    signal_out: npt.NDArray[np.int16],
+) -> None: ...
+def decode_signal_windows(
+    buffers: List[Union[npt.NDArray[np.uint8], memoryview]],
+    buffer_compressed: npt.NDArray[np.uint8],
+    chunk_buffers: npt.NDArray[np.uint32],
+    chunk_byte_begins: npt.NDArray[np.uint64],
+    chunk_byte_ends: npt.NDArray[np.uint64],
+    chunk_sample_counts: npt.NDArray[np.uint32],
+    window_chunk_offsets: npt.NDArray[np.uint64],
+    window_first_samples: npt.NDArray[np.uint64],
+    window_length: int,
+    signal_out: npt.NDArray[np.int16],
+) -> None: ...
+def decode_signal_windows_pa(
+    buffers: List[Union[npt.NDArray[np.uint8], memoryview]],
+    buffer_compressed: npt.NDArray[np.uint8],
+    chunk_buffers: npt.NDArray[np.uint32],
+    chunk_byte_begins: npt.NDArray[np.uint64],
+    chunk_byte_ends: npt.NDArray[np.uint64],
+    chunk_sample_counts: npt.NDArray[np.uint32],
+    window_chunk_offsets: npt.NDArray[np.uint64],
+    window_first_samples: npt.NDArray[np.uint64],
+    calibration_offsets: npt.NDArray[np.float32],
+    calibration_scales: npt.NDArray[np.float32],
+    window_length: int,
+    signal_out: npt.NDArray[np.float32],
+) -> None: ...
+def decode_signal_pa(
+    buffers: List[Union[npt.NDArray[np.uint8], memoryview]],
+    buffer_compressed: npt.NDArray[np.uint8],
+    chunk_buffers: npt.NDArray[np.uint32],
+    chunk_byte_begins: npt.NDArray[np.uint64],
+    chunk_byte_ends: npt.NDArray[np.uint64],
+    chunk_sample_counts: npt.NDArray[np.uint32],
+    read_chunk_offsets: npt.NDArray[np.uint64],
+    read_first_samples: npt.NDArray[np.uint64],
+    calibration_offsets: npt.NDArray[np.float32],
+    calibration_scales: npt.NDArray[np.float32],
+    signal_offsets: npt.NDArray[np.uint64],
+    signal_out: Union[npt.NDArray[np.float32], npt.NDArray[np.float16]],
+) -> None: ...
 def format_read_id_to_str(
     read_id_data_out: npt.NDArray[np.uint8],
 ) -> List[str]: ...
@@ -199,6 +334,11 @@ def get_error_string() -> str: ...
 def load_read_id_iterable(
     read_ids_str: Iterable, read_id_data_out: npt.NDArray[np.uint8]
 ) -> int: ...
-def open_file(filename: str) -> Pod5FileReader: ...
+def make_thread_pool(worker_threads: int) -> ThreadPool: ...
+def memory_pool(backend_name: str) -> MemoryPool: ...
+def open_file(
+    filename: str, memory_pool: Optional[MemoryPool] = None
+) -> Pod5FileReader: ...
+def supported_memory_backends() -> List[str]: ...
 def update_file(reader: Pod5FileReader, output: str): ...
 def vbz_compressed_signal_max_size(sample_count: int) -> int: ...
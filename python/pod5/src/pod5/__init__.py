@@ -20,6 +20,8 @@ from .api_utils import (
     load_read_id_iterable,
     pack_read_ids,
 )
+from .dataset import Dataset
+from .filters import read_filter_expression
 from .pod5_types import (
     Calibration,
     CompressedRead,
@@ -29,11 +31,15 @@ from .pod5_types import (
     Read,
     RunInfo,
 )
-from .reader import Reader, ReadRecord, ReadRecordBatch
+from .read_id_index import ReadIdIndex
+from .reader import FileStats, MemoryUsage, Reader, ReadRecord, ReadRecordBatch
+from .sampling import SampledWindows, WindowSampler
+from .shared_reads import SharedReadBatch, SharedReadBuffers
 from .signal_tools import (
     vbz_compress_signal,
     vbz_decompress_signal,
     vbz_decompress_signal_chunked,
+    vbz_decompress_signal_chunked_into,
     vbz_decompress_signal_into,
 )
-from .writer import Writer
+from .writer import RotatingWriter, SignalType, Writer, WriterOptions
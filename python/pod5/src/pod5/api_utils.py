@@ -4,13 +4,22 @@ Utility functions for the pod5-format API
 
 
 import warnings
-from typing import Any, Collection, List, Union
+from typing import Any, Collection, List, Optional, Union
 
+import lib_pod5 as p5b
 import numpy as np
 import numpy.typing as npt
 import pyarrow as pa
 from lib_pod5 import format_read_id_to_str, load_read_id_iterable
 
+#: A memory pool for reading or writing pod5 files, either a
+#: :py:class:`pyarrow.MemoryPool` or the name of a memory pool backend
+MemoryPoolLike = Union[str, pa.MemoryPool]
+
+#: The memory pool backends which may be selected by name, "default" selects the
+#: default memory pool of arrow
+MEMORY_POOL_BACKENDS = ("default", "system", "jemalloc", "mimalloc")
+
 
 class Pod5ApiException(Exception):
     """Generic Pod5 API Exception"""
@@ -94,3 +103,53 @@ def safe_close(obj: Any, attr: str) -> None:
         getattr(obj, attr).close()
     except Exception:
         pass
+
+
+def resolve_memory_pool(
+    memory_pool: Optional[MemoryPoolLike],
+) -> Optional["p5b.MemoryPool"]:
+    """
+    Find the lib_pod5 memory pool matching a :py:class:`pyarrow.MemoryPool` or
+    memory pool backend name such as "jemalloc", "mimalloc" or "system".
+
+    lib_pod5 links its own copy of arrow, so a pyarrow memory pool selects the
+    lib_pod5 pool of the same backend rather than sharing the pyarrow pool itself.
+
+    Parameters
+    ----------
+    memory_pool : Optional[str, pyarrow.MemoryPool]
+        The memory pool, or its backend name, to resolve
+
+    Returns
+    -------
+    The lib_pod5 memory pool, or None if `memory_pool` is None
+
+    Raises
+    ------
+    ValueError
+        If the memory pool backend is unknown or not supported by lib_pod5
+    """
+    if memory_pool is None:
+        return None
+
+    if isinstance(memory_pool, pa.MemoryPool):
+        backend_name = memory_pool.backend_name
+    elif isinstance(memory_pool, str):
+        backend_name = memory_pool
+    else:
+        raise TypeError(
+            f"memory_pool must be a str or pyarrow.MemoryPool not {type(memory_pool)}"
+        )
+
+    if backend_name not in MEMORY_POOL_BACKENDS:
+        raise ValueError(
+            f"Unknown memory pool backend {backend_name!r}, "
+            f"expected one of {MEMORY_POOL_BACKENDS}"
+        )
+
+    try:
+        return p5b.memory_pool(backend_name)
+    except RuntimeError as exc:
+        raise ValueError(
+            f"Memory pool backend {backend_name!r} is not supported by lib_pod5"
+        ) from exc
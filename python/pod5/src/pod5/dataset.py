@@ -0,0 +1,580 @@
+"""
+Tools for accessing reads across many POD5 files
+"""
+
+import os
+import threading
+import weakref
+from collections import OrderedDict, deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
+from typing import (
+    Collection,
+    Deque,
+    Dict,
+    Generator,
+    Iterable,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+)
+
+import numpy as np
+import numpy.typing as npt
+
+from pod5.api_utils import pack_read_ids
+from pod5.filters import ReadFilter
+from pod5.pod5_types import PathOrStr
+from pod5.reader import Reader, ReadRecord, ReadRecordBatch
+
+DEFAULT_DATASET_THREADS = min(os.cpu_count() or 1, 8)
+DEFAULT_MAX_OPEN_READERS = 64
+
+# The traversal plan for a single file. See Reader._plan_traversal
+FilePlan = Tuple[npt.NDArray[np.uint32], npt.NDArray[np.uint32]]
+
+
+class DatasetReadIdIndex:
+    """
+    A sorted index of every read id in a :py:class:`Dataset` mapping each read id
+    to the file, read table batch and batch row which contains it.
+    """
+
+    def __init__(
+        self,
+        batch_counts: npt.NDArray[np.uint32],
+        sorted_read_ids: npt.NDArray[np.void],
+        files: npt.NDArray[np.uint32],
+        batches: npt.NDArray[np.uint32],
+        batch_rows: npt.NDArray[np.uint32],
+    ):
+        """
+        Create a DatasetReadIdIndex from sorted read ids (as numpy.void of 16 bytes)
+        and their respective file, batch and batch row indices.
+        Prefer :py:meth:`Dataset.read_id_index`.
+        """
+        self._batch_counts = batch_counts
+        self._sorted_read_ids = sorted_read_ids
+        self._files = files
+        self._batches = batches
+        self._batch_rows = batch_rows
+
+    @property
+    def read_count(self) -> int:
+        """Return the number of read ids in this index"""
+        return len(self._sorted_read_ids)
+
+    def locate(
+        self, read_ids: npt.NDArray[np.uint8]
+    ) -> Tuple[npt.NDArray[np.bool_], npt.NDArray[np.uint32], npt.NDArray[np.uint32]]:
+        """
+        Find the location of packed `read_ids` in the dataset.
+
+        Parameters
+        ----------
+        read_ids : numpy.ndarray[uint8]
+            Packed read ids of shape (n, 16) to search for
+
+        Returns
+        -------
+        found: numpy.array[bool]
+            True for each read id which was found in the dataset
+        files: numpy.array[uint32]
+            The file index of each found read id
+        locations: numpy.array[uint32]
+            The (batch, batch_row) of each found read id with shape (found, 2)
+        """
+        query = np.ascontiguousarray(read_ids, dtype=np.uint8).view("V16").ravel()
+
+        found = np.zeros(query.shape[0], dtype=np.bool_)
+        if self.read_count > 0:
+            positions = np.searchsorted(self._sorted_read_ids, query)
+            in_bounds = positions < self.read_count
+            found[in_bounds] = (
+                self._sorted_read_ids[positions[in_bounds]] == query[in_bounds]
+            )
+            positions = positions[found]
+        else:
+            positions = np.array([], dtype=np.intp)
+
+        locations = np.stack(
+            [self._batches[positions], self._batch_rows[positions]], axis=1
+        )
+        return found, self._files[positions], locations
+
+    def plan(self, read_ids: npt.NDArray[np.uint8]) -> Tuple[int, Dict[int, FilePlan]]:
+        """
+        Plan the traversal of packed `read_ids` across all files in the dataset.
+
+        Returns
+        -------
+        successful_find_count: int
+            The number of reads that were found from the array of read_ids given
+        plans: dict[int, tuple[numpy.array[uint32], numpy.array[uint32]]]
+            The per-batch counts and batch rows to traverse keyed by file index for
+            each file containing at least one of the `read_ids`
+        """
+        found, files, locations = self.locate(read_ids)
+        order = np.lexsort((locations[:, 1], locations[:, 0], files))
+        files = files[order]
+        locations = locations[order]
+
+        plans: Dict[int, FilePlan] = {}
+        file_indices, file_starts = np.unique(files, return_index=True)
+        file_ends = np.append(file_starts[1:], len(files))
+        for file_idx, start, end in zip(file_indices, file_starts, file_ends):
+            per_batch_counts = np.bincount(
+                locations[start:end, 0], minlength=self._batch_counts[file_idx]
+            ).astype(np.uint32)
+            batch_rows = locations[start:end, 1].astype(np.uint32)
+            plans[int(file_idx)] = (per_batch_counts, batch_rows)
+
+        return int(found.sum()), plans
+
+
+class Dataset:
+    """
+    A collection of pod5 files which can be read as one.
+
+    Reader handles are opened lazily and a bounded number of them are kept open
+    by the dataset, closing the least recently used once no batch loaded from it
+    is still being loaded or referenced. Reads are located across files using a global read id index
+    and batches are loaded concurrently on a thread pool
+    while being yielded in file order.
+    """
+
+    def __init__(
+        self,
+        paths: Union[PathOrStr, Iterable[PathOrStr]],
+        recursive: bool = False,
+        max_open_readers: int = DEFAULT_MAX_OPEN_READERS,
+        threads: int = DEFAULT_DATASET_THREADS,
+    ):
+        """
+        Open a collection of pod5 files for reading
+
+        Parameters
+        ----------
+        paths : os.PathLike, str or iterable of these
+            The pod5 files in this dataset. Directories are searched for files
+            matching "*.pod5".
+        recursive : bool
+            Search directories recursively
+        max_open_readers : int
+            The maximum number of :py:class:`Reader` handles held open by the
+            dataset, besides those of batches still loading or referenced
+        threads : int
+            The number of batches loaded concurrently when iterating the dataset
+        """
+        if isinstance(paths, (str, os.PathLike)):
+            paths = [paths]
+
+        if max_open_readers < 1:
+            raise ValueError("max_open_readers must be at least 1")
+        if threads < 1:
+            raise ValueError("threads must be at least 1")
+
+        self._paths = self._collect_paths(paths, recursive)
+        self._path_indices = {path: idx for idx, path in enumerate(self._paths)}
+        self._max_open_readers = max_open_readers
+        self._threads = threads
+
+        self._readers: "OrderedDict[int, Reader]" = OrderedDict()
+        self._readers_lock = threading.Lock()
+        # The number of batches of each reader by id which are being loaded or were
+        # yielded and are still referenced, and the released readers to close once
+        # those loads are done
+        self._reader_loads: Dict[int, int] = {}
+        self._released_readers: Dict[int, Reader] = {}
+        # Readers of yielded batches which were garbage collected while the readers
+        # lock could not be taken, finished by the next dataset call
+        self._collected_loads: Deque[Reader] = deque()
+        self._read_id_index: Optional[DatasetReadIdIndex] = None
+
+    @staticmethod
+    def _collect_paths(paths: Iterable[PathOrStr], recursive: bool) -> List[Path]:
+        """Resolve the dataset file paths searching any directories for pod5 files"""
+        collected: List[Path] = []
+        for path in (Path(p).absolute() for p in paths):
+            if path.is_dir():
+                glob = path.rglob if recursive else path.glob
+                collected.extend(sorted(p for p in glob("*.pod5") if p.is_file()))
+            elif path.is_file():
+                collected.append(path)
+            else:
+                raise FileNotFoundError(f"Failed to find pod5 input at: {path}")
+
+        # Remove duplicates preserving order
+        return list(dict.fromkeys(collected))
+
+    def __enter__(self) -> "Dataset":
+        return self
+
+    def __exit__(self, *exc_details) -> None:
+        self.close()
+
+    def __iter__(self) -> Generator[ReadRecord, None, None]:
+        """Iterate over all reads"""
+        yield from self.reads()
+
+    def close(self) -> None:
+        """
+        Close all reader handles held by the dataset. Readers of batches which are
+        being loaded or were yielded and are still referenced are closed once
+        those batches are released.
+        """
+        self._finish_collected_loads()
+        with self._readers_lock:
+            readers = list(self._readers.values())
+            self._readers.clear()
+            closing = [reader for reader in readers if self._release_reader(reader)]
+        for reader in closing:
+            reader.close()
+
+    @property
+    def paths(self) -> List[Path]:
+        """Return the paths to the pod5 files in this dataset"""
+        return list(self._paths)
+
+    @property
+    def num_files(self) -> int:
+        """Return the number of pod5 files in this dataset"""
+        return len(self._paths)
+
+    @property
+    def num_reads(self) -> int:
+        """Return the number of reads in this dataset"""
+        return self.read_id_index.read_count
+
+    def get_reader(self, path: Union[int, PathOrStr]) -> Reader:
+        """
+        Get the :py:class:`Reader` for a file in this dataset by index or path,
+        opening it if required.
+
+        The least recently used reader is closed by the dataset when more than
+        `max_open_readers` are open, once no batch loaded from it is still being
+        loaded or referenced, so the returned reader may be closed by later calls.
+        """
+        return self._open_reader(self._file_index(path))
+
+    def _file_index(self, path: Union[int, PathOrStr]) -> int:
+        """Return the index of a file in this dataset given its index or path"""
+        if isinstance(path, int):
+            file_idx = path
+            if not 0 <= file_idx < len(self._paths):
+                raise IndexError(f"Dataset file index out of range: {file_idx}")
+        else:
+            try:
+                file_idx = self._path_indices[Path(path).absolute()]
+            except KeyError as exc:
+                raise KeyError(f"{path} is not part of this dataset") from exc
+        return file_idx
+
+    def _open_reader(self, file_idx: int, load: bool = False) -> Reader:
+        """
+        Get the reader of a file opening it if required, closing the least recently
+        used readers beyond `max_open_readers`. If `load` is set a batch load is
+        counted against the reader until :py:meth:`_finish_load`.
+        """
+        self._finish_collected_loads()
+        with self._readers_lock:
+            reader = self._readers.get(file_idx)
+            if reader is not None:
+                self._readers.move_to_end(file_idx)
+                if load:
+                    self._start_load(reader)
+                return reader
+
+        # Open outside of the lock so that files can be opened concurrently
+        opened = Reader(self._paths[file_idx])
+
+        closing = []
+        with self._readers_lock:
+            reader = self._readers.setdefault(file_idx, opened)
+            if reader is not opened:
+                # Another thread opened the file first
+                closing.append(opened)
+            self._readers.move_to_end(file_idx)
+            if load:
+                self._start_load(reader)
+            while len(self._readers) > self._max_open_readers:
+                _, evicted = self._readers.popitem(last=False)
+                if self._release_reader(evicted):
+                    closing.append(evicted)
+
+        for unused in closing:
+            unused.close()
+        return reader
+
+    def _start_load(self, reader: Reader) -> None:
+        """Count a batch load from a reader, holding the readers lock"""
+        self._reader_loads[id(reader)] = self._reader_loads.get(id(reader), 0) + 1
+
+    def _finish_load(self, reader: Reader) -> None:
+        """Finish a batch load from a reader, closing it if released and unused"""
+        with self._readers_lock:
+            loads = self._reader_loads.pop(id(reader)) - 1
+            if loads:
+                self._reader_loads[id(reader)] = loads
+                return
+            released = self._released_readers.pop(id(reader), None)
+        if released is not None:
+            released.close()
+
+    def _batch_collected(self, reader: Reader) -> None:
+        """
+        Finish the load of a yielded batch once it is garbage collected. Batches
+        may be collected while this thread holds the readers lock, in which case
+        the load is finished by the next dataset call instead.
+        """
+        self._collected_loads.append(reader)
+        if self._readers_lock.acquire(blocking=False):
+            self._readers_lock.release()
+            self._finish_collected_loads()
+
+    def _finish_collected_loads(self) -> None:
+        """Finish the loads of the yielded batches which have been collected"""
+        while True:
+            try:
+                reader = self._collected_loads.popleft()
+            except IndexError:
+                return
+            self._finish_load(reader)
+
+    def _release_reader(self, reader: Reader) -> bool:
+        """
+        Release a reader no longer held by the dataset, holding the readers lock.
+        Return True if it should be closed now, otherwise it is closed once the
+        batches being loaded from it are done.
+        """
+        if id(reader) in self._reader_loads:
+            self._released_readers[id(reader)] = reader
+            return False
+        return True
+
+    @property
+    def read_id_index(self) -> DatasetReadIdIndex:
+        """
+        Return the global read id index for this dataset building it on first use.
+
+        Per-file read id index sidecars are used where available.
+        """
+        if self._read_id_index is None:
+            self._read_id_index = self._build_read_id_index()
+        return self._read_id_index
+
+    def _build_read_id_index(self) -> DatasetReadIdIndex:
+        """Build the global read id index from all files concurrently"""
+
+        def index_file(path: Path):
+            with Reader(path) as reader:
+                index = reader.read_id_index()
+                return (
+                    reader.batch_count,
+                    np.array(index.sorted_read_ids),
+                    np.array(index.batches, dtype=np.uint32),
+                    np.array(index.batch_rows, dtype=np.uint32),
+                )
+
+        with ThreadPoolExecutor(max_workers=self._threads) as executor:
+            file_indexes = list(executor.map(index_file, self._paths))
+
+        batch_counts = np.array([idx[0] for idx in file_indexes], dtype=np.uint32)
+        files = np.repeat(
+            np.arange(len(file_indexes), dtype=np.uint32),
+            [len(idx[1]) for idx in file_indexes],
+        ).astype(np.uint32)
+
+        if file_indexes:
+            read_ids = np.concatenate([idx[1] for idx in file_indexes])
+            batches = np.concatenate([idx[2] for idx in file_indexes])
+            batch_rows = np.concatenate([idx[3] for idx in file_indexes])
+        else:
+            read_ids = np.array([], dtype="V16")
+            batches = np.array([], dtype=np.uint32)
+            batch_rows = np.array([], dtype=np.uint32)
+
+        order = np.argsort(read_ids, kind="stable")
+        return DatasetReadIdIndex(
+            batch_counts,
+            read_ids[order],
+            files[order],
+            batches[order],
+            batch_rows[order],
+        )
+
+    def read_batches(
+        self,
+        selection: Optional[Union[Collection[str], npt.NDArray[np.uint8]]] = None,
+        missing_ok: bool = False,
+        preload: Optional[Set[str]] = None,
+        where: Optional[ReadFilter] = None,
+    ) -> Generator[ReadRecordBatch, None, None]:
+        """
+        Iterate batches in all files, optionally selecting certain reads.
+
+        Up to `threads` batches are loaded concurrently, bounding the number of
+        loaded batches held at once, and batches are yielded in file order.
+
+        Parameters
+        ----------
+        selection : iterable[str] or packed numpy.ndarray[uint8]
+            The read ids to walk in the dataset.
+        missing_ok : bool
+            If selection contains entries not found in the dataset, an error will be
+            raised.
+        preload : set[str]
+            Columns to preload - "samples", "sample_count" and "contiguous_samples"
+            are valid values
+        where : str or pyarrow.compute.Expression
+            A read filter evaluated over the read table columns of each file before
+            any signal is loaded, see :py:meth:`Reader.read_batches`
+
+        Returns
+        -------
+        An iterable of :py:class:`ReadRecordBatch` in the dataset.
+        """
+        if selection is None:
+            plans: Dict[int, Optional[FilePlan]] = {
+                idx: None for idx in range(len(self._paths))
+            }
+        else:
+            if not isinstance(selection, np.ndarray):
+                selection = pack_read_ids(selection, invalid_ok=missing_ok)
+
+            successful_finds, file_plans = self.read_id_index.plan(selection)
+            if not missing_ok and successful_finds != len(selection):
+                raise RuntimeError(
+                    f"Failed to find {len(selection) - successful_finds} "
+                    "requested reads in the dataset"
+                )
+            plans = {idx: plan for idx, plan in sorted(file_plans.items())}
+
+        yield from self._load_in_order(plans, preload, where)
+
+    def reads(
+        self,
+        selection: Optional[Union[Collection[str], npt.NDArray[np.uint8]]] = None,
+        missing_ok: bool = False,
+        preload: Optional[Set[str]] = None,
+        where: Optional[ReadFilter] = None,
+    ) -> Generator[ReadRecord, None, None]:
+        """
+        Iterate reads in all files, optionally filtering for certain read ids.
+
+        Parameters
+        ----------
+        selection : iterable[str] or packed numpy.ndarray[uint8]
+            The read ids to walk in the dataset.
+        missing_ok : bool
+            If selection contains entries not found in the dataset, an error will be
+            raised.
+        preload : set[str]
+            Columns to preload - "samples", "sample_count" and "contiguous_samples"
+            are valid values
+        where : str or pyarrow.compute.Expression
+            A read filter evaluated over the read table columns of each file before
+            any signal is loaded, see :py:meth:`Reader.reads`
+
+        Returns
+        -------
+        An iterable of :py:class:`ReadRecord` in the dataset.
+        """
+        for batch in self.read_batches(
+            selection=selection, missing_ok=missing_ok, preload=preload, where=where
+        ):
+            yield from batch.reads()
+
+    def _planned_batches(
+        self, plans: Dict[int, Optional[FilePlan]]
+    ) -> Generator[Tuple[int, int, Optional[npt.NDArray[np.uint32]]], None, None]:
+        """
+        Generate the file index, batch index and selected batch rows (or None for
+        all rows) of every batch to load following the traversal `plans`, in file
+        order
+        """
+        for file_idx, plan in plans.items():
+            if plan is None:
+                reader = self._open_reader(file_idx, load=True)
+                try:
+                    batch_count = reader.batch_count
+                finally:
+                    self._finish_load(reader)
+                for batch_idx in range(batch_count):
+                    yield file_idx, batch_idx, None
+                continue
+
+            per_batch_counts, batch_rows = plan
+            batch_ends = np.cumsum(per_batch_counts, dtype=np.uint64)
+            for batch_idx, count in enumerate(per_batch_counts):
+                if count > 0:
+                    end = int(batch_ends[batch_idx])
+                    yield file_idx, batch_idx, batch_rows[end - count : end]
+
+    def _load_in_order(
+        self,
+        plans: Dict[int, Optional[FilePlan]],
+        preload: Optional[Set[str]],
+        where: Optional[ReadFilter],
+    ) -> Generator[ReadRecordBatch, None, None]:
+        """
+        Load the batches of all planned files on a thread pool keeping at most
+        `threads` batches in flight and yielding the batches in file order. Each
+        batch counts as a load of its reader until it has been yielded and
+        released by the caller, so the reader of batches or records which are
+        still referenced is not closed when evicted.
+        """
+        pending: Deque[Tuple[Reader, "Future[Optional[ReadRecordBatch]]"]] = deque()
+        planned_batches = self._planned_batches(plans)
+
+        try:
+            with ThreadPoolExecutor(max_workers=self._threads) as executor:
+
+                def submit_next() -> None:
+                    item = next(planned_batches, None)
+                    if item is None:
+                        return
+                    file_idx, batch_idx, batch_rows = item
+                    reader = self._open_reader(file_idx, load=True)
+                    try:
+                        future = executor.submit(
+                            reader._read_planned_batch,
+                            batch_idx,
+                            batch_rows,
+                            preload,
+                            where,
+                        )
+                    except BaseException:
+                        self._finish_load(reader)
+                        raise
+                    pending.append((reader, future))
+
+                try:
+                    for _ in range(self._threads):
+                        submit_next()
+
+                    while pending:
+                        reader, future = pending.popleft()
+                        try:
+                            batch = future.result()
+                            submit_next()
+                        except BaseException:
+                            self._finish_load(reader)
+                            raise
+                        if batch is None:
+                            self._finish_load(reader)
+                            continue
+
+                        # Records hold their batch, so the reader stays open for
+                        # as long as any of them are referenced
+                        weakref.finalize(batch, self._batch_collected, reader)
+                        yield batch
+                finally:
+                    for _, future in pending:
+                        future.cancel()
+        finally:
+            # The executor has waited for any batches which could not be cancelled
+            for reader, _ in pending:
+                self._finish_load(reader)
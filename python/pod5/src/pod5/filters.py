@@ -0,0 +1,187 @@
+"""
+Filtering pod5 reads by their read table columns before any signal is loaded
+"""
+
+import ast
+from typing import Any, Optional, Union
+
+import numpy as np
+import numpy.typing as npt
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.dataset as ds
+
+#: A read filter, either a :py:class:`pyarrow.compute.Expression` or a string
+#: expression parsed by :py:func:`read_filter_expression`
+ReadFilter = Union[str, pc.Expression]
+
+# Name of the batch row index column added to read table batches while filtering
+_ROW_COLUMN = "__pod5_batch_row"
+
+_COMPARISONS = {
+    ast.Eq: lambda left, right: left == right,
+    ast.NotEq: lambda left, right: left != right,
+    ast.Lt: lambda left, right: left < right,
+    ast.LtE: lambda left, right: left <= right,
+    ast.Gt: lambda left, right: left > right,
+    ast.GtE: lambda left, right: left >= right,
+}
+
+# Comparisons with the operands swapped, for literals on the left e.g. "128 >= channel"
+_REFLECTED = {
+    ast.Eq: ast.Eq,
+    ast.NotEq: ast.NotEq,
+    ast.Lt: ast.Gt,
+    ast.LtE: ast.GtE,
+    ast.Gt: ast.Lt,
+    ast.GtE: ast.LtE,
+}
+
+
+def read_filter_expression(where: ReadFilter) -> pc.Expression:
+    """
+    Convert a read filter into a :py:class:`pyarrow.compute.Expression` over the
+    read table columns.
+
+    String filters are a small subset of python expressions, where names refer to
+    read table columns (e.g. "channel", "well", "num_samples", "read_number",
+    "end_reason" or "pore_type") and which support:
+
+    * comparisons with literals, including chained comparisons
+      e.g. ``"1 <= channel <= 128"``
+    * membership in a list, tuple or set of literals
+      e.g. ``"end_reason in ('signal_positive', 'signal_negative')"``
+    * ``and``, ``or``, ``not`` and parentheses
+
+    Dictionary columns such as "end_reason" compare against their string values,
+    for example ``"end_reason == 'signal_positive' and num_samples > 10000"``.
+
+    Parameters
+    ----------
+    where : str or pyarrow.compute.Expression
+        The read filter to convert. Expressions are returned unchanged.
+
+    Returns
+    -------
+    :py:class:`pyarrow.compute.Expression`
+
+    Raises
+    ------
+    ValueError
+        If a string filter is not a valid read filter expression
+    """
+    if isinstance(where, pc.Expression):
+        return where
+    if not isinstance(where, str):
+        raise TypeError(
+            f"Read filter must be a str or pyarrow.compute.Expression not {type(where)}"
+        )
+
+    try:
+        tree = ast.parse(where.strip(), mode="eval")
+    except SyntaxError as exc:
+        raise ValueError(f"Invalid read filter: {where!r}") from exc
+    return _convert_predicate(tree.body, where)
+
+
+def _convert_predicate(node: ast.AST, where: str) -> pc.Expression:
+    """Convert a boolean node of a parsed read filter into an Expression"""
+    if isinstance(node, ast.BoolOp):
+        values = [_convert_predicate(value, where) for value in node.values]
+        expression = values[0]
+        for value in values[1:]:
+            if isinstance(node.op, ast.And):
+                expression = expression & value
+            else:
+                expression = expression | value
+        return expression
+
+    if isinstance(node, ast.UnaryOp) and isinstance(node.op, ast.Not):
+        return ~_convert_predicate(node.operand, where)
+
+    if isinstance(node, ast.Compare):
+        expression = None
+        left = node.left
+        for op, right in zip(node.ops, node.comparators):
+            comparison = _convert_comparison(left, op, right, where)
+            expression = comparison if expression is None else expression & comparison
+            left = right
+        assert expression is not None
+        return expression
+
+    if isinstance(node, ast.Name):
+        # A bare boolean column e.g. "end_reason_forced"
+        return pc.field(node.id) == True  # noqa: E712
+
+    raise ValueError(f"Unsupported read filter expression {ast.dump(node)}: {where!r}")
+
+
+def _convert_comparison(
+    left: ast.AST, op: ast.cmpop, right: ast.AST, where: str
+) -> pc.Expression:
+    """Convert a single comparison between a column and literal(s)"""
+    if isinstance(op, (ast.In, ast.NotIn)):
+        if not isinstance(left, ast.Name):
+            raise ValueError(f"Membership must test a column name: {where!r}")
+        values = _literal(right, where)
+        if not isinstance(values, (list, tuple, set, frozenset)):
+            raise ValueError(f"Membership must test a collection of values: {where!r}")
+        expression = pc.field(left.id).isin(list(values))
+        return ~expression if isinstance(op, ast.NotIn) else expression
+
+    if type(op) not in _COMPARISONS:
+        raise ValueError(
+            f"Unsupported read filter comparison {ast.dump(op)}: {where!r}"
+        )
+
+    if isinstance(left, ast.Name):
+        return _COMPARISONS[type(op)](pc.field(left.id), _literal(right, where))
+    if isinstance(right, ast.Name):
+        reflected = _REFLECTED[type(op)]
+        return _COMPARISONS[reflected](pc.field(right.id), _literal(left, where))
+    raise ValueError(f"Comparisons must include a column name: {where!r}")
+
+
+def _literal(node: ast.AST, where: str) -> Any:
+    """Evaluate a literal value of a read filter"""
+    try:
+        return ast.literal_eval(node)
+    except ValueError as exc:
+        raise ValueError(
+            f"Expected a literal value not {ast.dump(node)}: {where!r}"
+        ) from exc
+
+
+def matching_batch_rows(
+    batch: pa.RecordBatch,
+    expression: pc.Expression,
+    batch_rows: Optional[npt.NDArray[np.uint32]] = None,
+) -> npt.NDArray[np.uint32]:
+    """
+    Evaluate a read filter expression over a read table batch, returning the
+    batch rows which match in ascending order, or in the order of `batch_rows`.
+
+    Parameters
+    ----------
+    batch : pyarrow.RecordBatch
+        The read table batch to filter
+    expression : pyarrow.compute.Expression
+        The read filter, see :py:func:`read_filter_expression`
+    batch_rows : numpy.ndarray[uint32]
+        Optionally, the only batch rows to consider, as in a traversal plan
+
+    Returns
+    -------
+    numpy.ndarray[uint32] of the matching batch rows
+    """
+    table = pa.Table.from_batches([batch]).append_column(
+        _ROW_COLUMN, pa.array(np.arange(batch.num_rows, dtype=np.uint32))
+    )
+
+    # Scanning only projects the row column, so the remaining read table columns
+    # are only read to evaluate the filter and are never copied
+    matches = ds.dataset(table).to_table(columns=[_ROW_COLUMN], filter=expression)
+    rows = matches.column(_ROW_COLUMN).to_numpy().astype(np.uint32, copy=False)
+    if batch_rows is None:
+        return rows
+    return batch_rows[np.isin(batch_rows, rows)]
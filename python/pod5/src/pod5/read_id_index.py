@@ -0,0 +1,318 @@
+"""
+Tools for building and loading persistent sorted read id indexes for pod5 files
+"""
+
+import os
+from pathlib import Path
+from typing import Optional, Tuple
+from uuid import UUID, uuid4
+
+import numpy as np
+import numpy.typing as npt
+
+from pod5.api_utils import Pod5ApiException
+from pod5.pod5_types import PathOrStr
+
+#: Suffix appended to a pod5 file path to locate its read id index sidecar
+READ_ID_INDEX_SUFFIX = ".idx"
+
+#: Magic bytes identifying a pod5 read id index
+READ_ID_INDEX_MAGIC = b"POD5RIDX"
+
+#: Current version of the read id index layout
+READ_ID_INDEX_VERSION = 1
+
+# Little-endian header: magic, version, reserved, file identifier, read count
+# and read table batch count. The sorted read ids, batch indices and batch row
+# indices follow the header as contiguous arrays.
+_HEADER_DTYPE = np.dtype(
+    [
+        ("magic", "S8"),
+        ("version", "<u4"),
+        ("reserved", "<u4"),
+        ("file_identifier", "V16"),
+        ("read_count", "<u8"),
+        ("batch_count", "<u8"),
+    ]
+)
+
+
+def read_id_index_path(path: PathOrStr) -> Path:
+    """Return the path of the read id index sidecar for the pod5 file at `path`"""
+    path = Path(path)
+    return path.with_name(path.name + READ_ID_INDEX_SUFFIX)
+
+
+class ReadIdIndex:
+    """
+    A sorted index of every read id in a pod5 file mapping each read id
+    to the read table batch and batch row which contains it.
+
+    The index can be saved to a versioned sidecar file alongside the pod5 file
+    which is memory-mapped when loaded, avoiding re-sorting all read ids each
+    time the pod5 file is opened.
+    """
+
+    def __init__(
+        self,
+        file_identifier: UUID,
+        batch_count: int,
+        sorted_read_ids: npt.NDArray[np.void],
+        batches: npt.NDArray[np.uint32],
+        batch_rows: npt.NDArray[np.uint32],
+    ):
+        """
+        Create a ReadIdIndex from sorted read ids (as numpy.void of 16 bytes)
+        and their respective read table batch indices and batch row indices.
+        Prefer :py:meth:`ReadIdIndex.from_read_ids` or :py:meth:`ReadIdIndex.load`.
+        """
+        self._file_identifier = file_identifier
+        self._batch_count = batch_count
+        self._sorted_read_ids = sorted_read_ids
+        self._batches = batches
+        self._batch_rows = batch_rows
+
+        # Set when memory-mapped from a sidecar by ReadIdIndex.load
+        self._path: Optional[Path] = None
+
+    @classmethod
+    def from_read_ids(
+        cls,
+        file_identifier: UUID,
+        read_ids: npt.NDArray[np.uint8],
+        batch_sizes: npt.NDArray[np.uint32],
+    ) -> "ReadIdIndex":
+        """
+        Build a ReadIdIndex from the packed read ids of a pod5 file in file order.
+
+        Parameters
+        ----------
+        file_identifier : UUID
+            The file identifier of the indexed pod5 file
+        read_ids : numpy.ndarray[uint8]
+            Packed read ids of shape (n, 16) in read table order
+        batch_sizes : numpy.ndarray[uint32]
+            The number of rows in each read table batch
+
+        Returns
+        -------
+        :py:class:`ReadIdIndex`
+        """
+        batch_sizes = np.asarray(batch_sizes, dtype=np.uint32)
+        read_count = int(batch_sizes.sum())
+        if read_ids.shape != (read_count, 16):
+            raise ValueError(
+                f"Read id array shape {read_ids.shape} does not match "
+                f"batch sizes totalling {read_count} reads"
+            )
+
+        batches = np.repeat(
+            np.arange(len(batch_sizes), dtype=np.uint32), batch_sizes
+        ).astype(np.uint32)
+        batch_starts = np.cumsum(batch_sizes, dtype=np.uint64) - batch_sizes
+        batch_rows = (
+            np.arange(read_count, dtype=np.uint64)
+            - np.repeat(batch_starts, batch_sizes)
+        ).astype(np.uint32)
+
+        ids = np.ascontiguousarray(read_ids, dtype=np.uint8).view("V16").ravel()
+        order = np.argsort(ids, kind="stable")
+
+        return cls(
+            file_identifier,
+            len(batch_sizes),
+            ids[order],
+            batches[order],
+            batch_rows[order],
+        )
+
+    @classmethod
+    def load(cls, path: PathOrStr, file_identifier: UUID) -> "ReadIdIndex":
+        """
+        Memory-map a read id index sidecar from `path`, validating that it was
+        built for the pod5 file with the given `file_identifier`.
+
+        Parameters
+        ----------
+        path : os.PathLike, str
+            The path to the read id index
+        file_identifier : UUID
+            The file identifier of the pod5 file this index is expected to describe
+
+        Returns
+        -------
+        :py:class:`ReadIdIndex`
+
+        Raises
+        ------
+        Pod5ApiException
+            If the index is malformed, of an unsupported version or does not match
+            the file identifier given
+        """
+        if Path(path).stat().st_size < _HEADER_DTYPE.itemsize:
+            raise Pod5ApiException(f"Read id index is truncated: {path}")
+
+        data = np.memmap(path, dtype=np.uint8, mode="r")
+
+        header = data[: _HEADER_DTYPE.itemsize].view(_HEADER_DTYPE)[0]
+        if header["magic"] != READ_ID_INDEX_MAGIC:
+            raise Pod5ApiException(f"Not a pod5 read id index: {path}")
+        if header["version"] != READ_ID_INDEX_VERSION:
+            raise Pod5ApiException(
+                f"Unsupported read id index version {header['version']}: {path}"
+            )
+
+        index_identifier = UUID(bytes=header["file_identifier"].tobytes())
+        if index_identifier != file_identifier:
+            raise Pod5ApiException(
+                f"Read id index file identifier {index_identifier} does not match "
+                f"pod5 file identifier {file_identifier}: {path}"
+            )
+
+        read_count = int(header["read_count"])
+        ids_start = _HEADER_DTYPE.itemsize
+        batches_start = ids_start + read_count * 16
+        rows_start = batches_start + read_count * 4
+        rows_end = rows_start + read_count * 4
+        if len(data) != rows_end:
+            raise Pod5ApiException(f"Read id index is truncated: {path}")
+
+        index = cls(
+            index_identifier,
+            int(header["batch_count"]),
+            data[ids_start:batches_start].view("V16"),
+            data[batches_start:rows_start].view("<u4"),
+            data[rows_start:rows_end].view("<u4"),
+        )
+        index._path = Path(path)
+        return index
+
+    def __reduce__(self):
+        """
+        Pickle indexes loaded from a sidecar by path, so they are memory-mapped
+        again rather than copied when unpickled
+        """
+        if self._path is not None:
+            return (ReadIdIndex.load, (self._path, self._file_identifier))
+        return (
+            ReadIdIndex,
+            (
+                self._file_identifier,
+                self._batch_count,
+                self._sorted_read_ids,
+                self._batches,
+                self._batch_rows,
+            ),
+        )
+
+    def save(self, path: PathOrStr) -> None:
+        """
+        Write this index to a sidecar file at `path`
+
+        The index is written to a temporary file beside `path` which then replaces
+        it, so processes which have an existing sidecar memory-mapped never see it
+        truncated and readers never open a partially written index.
+
+        Parameters
+        ----------
+        path : os.PathLike, str
+            The path to write the read id index to
+        """
+        header = np.zeros(1, dtype=_HEADER_DTYPE)
+        header["magic"] = READ_ID_INDEX_MAGIC
+        header["version"] = READ_ID_INDEX_VERSION
+        header["file_identifier"] = np.void(self._file_identifier.bytes)
+        header["read_count"] = self.read_count
+        header["batch_count"] = self._batch_count
+
+        path = Path(path)
+        temp_path = path.with_name(f".{path.name}.{uuid4().hex}.tmp")
+        try:
+            with temp_path.open("xb") as temp_file:
+                temp_file.write(header.tobytes())
+                temp_file.write(np.ascontiguousarray(self._sorted_read_ids).tobytes())
+                temp_file.write(self._batches.astype("<u4", copy=False).tobytes())
+                temp_file.write(self._batch_rows.astype("<u4", copy=False).tobytes())
+            os.replace(temp_path, path)
+        except BaseException:
+            if temp_path.exists():
+                temp_path.unlink()
+            raise
+
+    @property
+    def file_identifier(self) -> UUID:
+        """Return the file identifier of the pod5 file this index describes"""
+        return self._file_identifier
+
+    @property
+    def batch_count(self) -> int:
+        """Return the number of read table batches in the indexed pod5 file"""
+        return self._batch_count
+
+    @property
+    def read_count(self) -> int:
+        """Return the number of read ids in this index"""
+        return len(self._sorted_read_ids)
+
+    @property
+    def sorted_read_ids(self) -> npt.NDArray[np.void]:
+        """Return the sorted read ids of this index as numpy.void of 16 bytes"""
+        return self._sorted_read_ids
+
+    @property
+    def batches(self) -> npt.NDArray[np.uint32]:
+        """Return the read table batch index of each of the sorted read ids"""
+        return self._batches
+
+    @property
+    def batch_rows(self) -> npt.NDArray[np.uint32]:
+        """Return the read table batch row of each of the sorted read ids"""
+        return self._batch_rows
+
+    def search(
+        self, read_ids: npt.NDArray[np.uint8]
+    ) -> Tuple[int, npt.NDArray[np.uint32], npt.NDArray[np.uint32]]:
+        """
+        Search the index for the packed `read_ids` returning the same traversal
+        plan as :py:meth:`lib_pod5.Pod5FileReader.plan_traversal`.
+
+        Parameters
+        ----------
+        read_ids : numpy.ndarray[uint8]
+            Packed read ids of shape (n, 16) to search for
+
+        Returns
+        -------
+        successful_find_count: int
+            The number of reads that were found from the array of read_ids given
+        per_batch_counts: numpy.array[uint32]
+            The number of rows from the batch row ids to take to form each RecordBatch
+        batch_rows: numpy.array[uint32]
+            All batch row ids grouped by batch in ascending order
+        """
+        query = np.ascontiguousarray(read_ids, dtype=np.uint8).view("V16").ravel()
+
+        batch_rows = np.zeros(dtype=np.uint32, shape=query.shape[0])
+        if self.read_count == 0:
+            per_batch_counts = np.zeros(dtype=np.uint32, shape=self._batch_count)
+            return 0, per_batch_counts, batch_rows
+
+        positions = np.searchsorted(self._sorted_read_ids, query)
+        in_bounds = positions < self.read_count
+        found = np.zeros(query.shape[0], dtype=np.bool_)
+        found[in_bounds] = (
+            self._sorted_read_ids[positions[in_bounds]] == query[in_bounds]
+        )
+        positions = positions[found]
+
+        found_batches = self._batches[positions]
+        found_rows = self._batch_rows[positions]
+        order = np.lexsort((found_rows, found_batches))
+
+        successful_find_count = len(positions)
+        batch_rows[:successful_find_count] = found_rows[order]
+        per_batch_counts = np.bincount(
+            found_batches, minlength=self._batch_count
+        ).astype(np.uint32)
+
+        return successful_find_count, per_batch_counts, batch_rows
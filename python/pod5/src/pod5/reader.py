@@ -2,18 +2,29 @@
 Tools for accessing POD5 data from PyArrow files
 """
 
+import asyncio
 import mmap
-from collections import namedtuple
-from dataclasses import fields
+import os
+import threading
+import time
+import weakref
+from collections import Counter, OrderedDict, namedtuple
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from dataclasses import dataclass, field, fields
 from io import IOBase
 from pathlib import Path
 from typing import (
+    Any,
+    AsyncGenerator,
     Collection,
     Dict,
+    IO,
     Generator,
     Iterable,
     List,
     Optional,
+    Sequence,
     Set,
     Tuple,
     Union,
@@ -37,8 +48,21 @@ from pod5.pod5_types import (
     ShiftScalePair,
 )
 
-from .api_utils import Pod5ApiException, format_read_ids, pack_read_ids, safe_close
-from .signal_tools import vbz_decompress_signal, vbz_decompress_signal_into
+from .api_utils import (
+    MemoryPoolLike,
+    Pod5ApiException,
+    format_read_ids,
+    pack_read_ids,
+    resolve_memory_pool,
+    safe_close,
+)
+from .filters import ReadFilter, matching_batch_rows, read_filter_expression
+from .read_id_index import ReadIdIndex, read_id_index_path
+from .signal_tools import (
+    _signal_batch_data,
+    vbz_decompress_signal,
+    vbz_decompress_signal_chunked_into,
+)
 
 ReadRecordV3Columns = namedtuple(
     "ReadRecordV3Columns",
@@ -73,13 +97,394 @@ SignalRowInfo = namedtuple(
     "SignalRowInfo",
     ["batch_index", "batch_row_index", "sample_count", "byte_count"],
 )
+SignalCacheInfo = namedtuple(
+    "SignalCacheInfo",
+    ["hits", "misses", "evictions", "entries", "current_bytes", "max_bytes"],
+)
+
+ReadaheadInfo = namedtuple(
+    "ReadaheadInfo",
+    [
+        "batches",
+        "prefetched_batches",
+        "prefetched_bytes",
+        "fetch_seconds",
+        "process_seconds",
+    ],
+)
+
+
+def _signal_row_view(signal: pa.LargeListArray, row: int) -> npt.NDArray[np.int16]:
+    """
+    Return a read-only zero-copy view of the uncompressed signal at `row` of a
+    signal table batch, backed by the (memory-mapped) arrow buffers.
+    """
+    # Buffers are: list validity, list offsets, values validity, values data
+    buffers = signal.buffers()
+    offsets = np.frombuffer(buffers[1], dtype=np.int64)
+    values = np.frombuffer(buffers[3], dtype=np.int16)
+
+    values_offset = signal.values.offset
+    start = offsets[signal.offset + row] + values_offset
+    end = offsets[signal.offset + row + 1] + values_offset
+
+    view = values[start:end]
+    view.setflags(write=False)
+    return view
+
+
+def _signal_loader_flags(preload: Set[str]) -> Tuple[bool, bool, bool]:
+    """
+    Convert the `preload` column names into the samples, sample count and
+    contiguous flags of the lib_pod5 async signal loaders.
+    """
+    contiguous = "contiguous_samples" in preload
+    return contiguous or "samples" in preload, "sample_count" in preload, contiguous
+
+
+#: The buffers of signal, and the chunks of each read within them, in the form taken
+#: by the native signal decoders
+_SignalChunks = Tuple[
+    List[Union[npt.NDArray[np.uint8], memoryview]],
+    npt.NDArray[np.uint8],
+    npt.NDArray[np.uint32],
+    npt.NDArray[np.uint64],
+    npt.NDArray[np.uint64],
+    npt.NDArray[np.uint32],
+    npt.NDArray[np.uint64],
+    npt.NDArray[np.uint64],
+]
+
+#: A plan of (batch index, selected batch rows or None for all rows) to iterate
+#: and the async signal loader preloading the signal of each planned batch
+_BatchPlan = Tuple[
+    List[Tuple[int, Optional[npt.NDArray[np.uint32]]]],
+    Optional[p5b.Pod5AsyncSignalLoader],
+]
+
+
+class _PlannedSignal:
+    """
+    The signal released by an async signal loader held until its planned batch is
+    iterated. Loaders release a (possibly empty) signal batch for every loaded
+    batch in file order, while batches may be planned in any order, so signal
+    released ahead of its planned batch is held, and that of batches which were
+    not planned is dropped.
+    """
+
+    def __init__(
+        self, plan: Sequence[Tuple[int, Optional[npt.NDArray[np.uint32]]]]
+    ) -> None:
+        self._uses = Counter(batch_idx for batch_idx, _ in plan)
+        self._released: Dict[int, p5b.Pod5SignalCacheBatch] = {}
+
+    def add(self, cached_signal: Optional[p5b.Pod5SignalCacheBatch]) -> None:
+        """
+        Hold signal released by the loader if its batch is planned, raising if the
+        loader released nothing because it was cancelled or has no batches left
+        """
+        if cached_signal is None:
+            raise RuntimeError(
+                "Signal loader was cancelled or ran out of batches before releasing "
+                "the signal of every planned batch"
+            )
+        if self._uses[cached_signal.batch_index] > 0:
+            self._released[cached_signal.batch_index] = cached_signal
+
+    def take(self, batch_idx: int) -> Optional[p5b.Pod5SignalCacheBatch]:
+        """
+        Take the signal of the planned batch `batch_idx`, or None if it has not
+        been released yet
+        """
+        cached_signal = self._released.get(batch_idx)
+        if cached_signal is not None:
+            self._uses[batch_idx] -= 1
+            if self._uses[batch_idx] == 0:
+                del self._released[batch_idx]
+        return cached_signal
+
+
+def _release_planned_signal(
+    signal_cache: p5b.Pod5AsyncSignalLoader,
+    planned_signal: _PlannedSignal,
+    batch_idx: int,
+) -> p5b.Pod5SignalCacheBatch:
+    """
+    Release the signal of the planned batch `batch_idx` from an async signal
+    loader, holding that of other planned batches released before it
+    """
+    cached_signal = planned_signal.take(batch_idx)
+    while cached_signal is None:
+        planned_signal.add(signal_cache.release_next_batch())
+        cached_signal = planned_signal.take(batch_idx)
+    return cached_signal
+
+
+_RUN_INFO_FIELDS = [run_info_field.name for run_info_field in fields(RunInfo)]
+
+
+def _make_run_info(row: Dict[str, Any]) -> RunInfo:
+    """Create a :py:class:`RunInfo` from a run info table row given as a dict"""
+    values = {name: row[name] for name in _RUN_INFO_FIELDS}
+    for name in ("tracking_id", "context_tags"):
+        values[name] = {k: v for k, v in values[name]}
+    return RunInfo(**values)
+
+
+@dataclass(frozen=True)
+class FileStats:
+    """
+    Aggregate statistics of the reads in a pod5 file
+
+    Parameters
+    ----------
+
+    read_count : int
+        The number of reads in the file
+    sample_count : int
+        The total number of signal samples across all reads
+    signal_bytes : int
+        The length in bytes of the (compressed) signal table
+    min_start_sample : int
+        The smallest start sample of any read (0 if there are no reads)
+    max_start_sample : int
+        The largest start sample of any read (0 if there are no reads)
+    run_info_read_counts : Dict[str, int]
+        The number of reads written against each run info keyed by acquisition_id
+    """
+
+    #: The number of reads in the file
+    read_count: int
+    #: The total number of signal samples across all reads
+    sample_count: int
+    #: The length in bytes of the (compressed) signal table
+    signal_bytes: int
+    #: The smallest start sample of any read (0 if there are no reads)
+    min_start_sample: int
+    #: The largest start sample of any read (0 if there are no reads)
+    max_start_sample: int
+    #: The number of reads written against each run info keyed by acquisition_id
+    run_info_read_counts: Dict[str, int] = field(hash=False, compare=True)
+
+
+@dataclass(frozen=True)
+class MemoryUsage:
+    """
+    The memory held by a :py:class:`Reader`, see :py:meth:`Reader.memory_usage`
+
+    Parameters
+    ----------
+
+    mapped_bytes : Optional[int]
+        The resident bytes of the memory maps of the file, or None if the platform
+        does not report them
+    signal_cache_bytes : int
+        The bytes of signal table batches held in the signal batch cache
+    loader_bytes : int
+        The bytes of preloaded signal held by signal loaders and not yet consumed
+    pool_backend : str
+        The backend name of the memory pool used by lib_pod5
+    pool_bytes_allocated : int
+        The bytes currently allocated from the memory pool
+    pool_max_memory : int
+        The peak bytes allocated from the memory pool
+    """
+
+    #: The resident bytes of the memory maps of the file, or None if unknown
+    mapped_bytes: Optional[int]
+    #: The bytes of signal table batches held in the signal batch cache
+    signal_cache_bytes: int
+    #: The bytes of preloaded signal held by signal loaders and not yet consumed
+    loader_bytes: int
+    #: The backend name of the memory pool used by lib_pod5
+    pool_backend: str
+    #: The bytes currently allocated from the memory pool
+    pool_bytes_allocated: int
+    #: The peak bytes allocated from the memory pool
+    pool_max_memory: int
+
+
+def _mapped_resident_bytes(path: Path) -> Optional[int]:
+    """
+    Find the resident bytes of this process's memory maps of the file at `path`
+    from /proc/self/smaps. Pages mapped more than once are counted for each
+    mapping. Returns None if the platform does not report memory maps.
+    """
+    try:
+        with open("/proc/self/smaps", "r") as smaps:
+            lines = smaps.readlines()
+    except OSError:
+        return None
+
+    target = os.path.realpath(path)
+    resident = 0
+    in_target = False
+    for line in lines:
+        parts = line.split(None, 5)
+        if not parts:
+            continue
+        if parts[0].endswith(":"):
+            if in_target and parts[0] == "Rss:":
+                resident += int(parts[1]) * 1024
+        else:
+            # A mapping header: address perms offset dev inode [pathname]
+            in_target = len(parts) == 6 and parts[5].rstrip("\n") == target
+    return resident
+
+
+#: Default byte budget of the signal batch cache held by each :py:class:`Reader`
+DEFAULT_SIGNAL_CACHE_BYTES = 256 * 1024 * 1024
+
+
+class SignalBatchCache:
+    """
+    A thread-safe least-recently-used cache of signal table batches bounded by
+    the total number of bytes held by the cached batches.
+    """
+
+    def __init__(self, max_bytes: Optional[int] = DEFAULT_SIGNAL_CACHE_BYTES):
+        """
+        Create a signal batch cache holding at most `max_bytes` of signal data.
+        If `max_bytes` is None the cache is unbounded and if it is 0 no batches
+        are retained.
+        """
+        if max_bytes is not None and max_bytes < 0:
+            raise ValueError(f"signal cache size must be >= 0, got: {max_bytes}")
+
+        self._max_bytes = max_bytes
+        self._batches: "OrderedDict[int, Tuple[Signal, int]]" = OrderedDict()
+        self._current_bytes = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._lock = threading.Lock()
+
+    def get(self, batch_id: int) -> Optional[Signal]:
+        """Return the cached :py:class:`Signal` at batch_id or None if not cached"""
+        with self._lock:
+            entry = self._batches.get(batch_id)
+            if entry is None:
+                self._misses += 1
+                return None
+
+            self._hits += 1
+            self._batches.move_to_end(batch_id)
+            return entry[0]
+
+    def put(self, batch_id: int, signal_batch: Signal) -> None:
+        """
+        Insert a :py:class:`Signal` batch evicting the least recently used
+        batches until the cache is within its byte budget.
+        """
+        nbytes = signal_batch.signal.nbytes + signal_batch.samples.nbytes
+        with self._lock:
+            if self._max_bytes is not None and nbytes > self._max_bytes:
+                return
+
+            previous = self._batches.pop(batch_id, None)
+            if previous is not None:
+                self._current_bytes -= previous[1]
+
+            self._batches[batch_id] = (signal_batch, nbytes)
+            self._current_bytes += nbytes
+
+            if self._max_bytes is None:
+                return
+
+            while self._current_bytes > self._max_bytes:
+                _, (_, evicted_bytes) = self._batches.popitem(last=False)
+                self._current_bytes -= evicted_bytes
+                self._evictions += 1
+
+    def clear(self) -> None:
+        """Drop all cached batches, releasing any file handles they keep open"""
+        with self._lock:
+            self._batches.clear()
+            self._current_bytes = 0
+
+    def info(self) -> SignalCacheInfo:
+        """Return the :py:class:`SignalCacheInfo` counters of this cache"""
+        with self._lock:
+            return SignalCacheInfo(
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+                entries=len(self._batches),
+                current_bytes=self._current_bytes,
+                max_bytes=self._max_bytes,
+            )
+
+
+def _column_numpy(column: pa.Array) -> npt.NDArray:
+    """
+    Convert an arrow array to numpy, viewing the buffers of numeric, boolean and
+    fixed size binary arrays without nulls directly, as `Array.to_numpy` has a
+    fixed cost per call which dominates for the arrays of a single batch.
+    """
+    if column.null_count or len(column) == 0:
+        return column.to_numpy(zero_copy_only=False)
+
+    data = column.buffers()[1]
+    if pa.types.is_integer(column.type) or pa.types.is_floating(column.type):
+        dtype = np.dtype(column.type.to_pandas_dtype())
+        return np.frombuffer(
+            data, dtype=dtype, count=len(column), offset=column.offset * dtype.itemsize
+        )
+    if pa.types.is_boolean(column.type):
+        bits = np.unpackbits(np.frombuffer(data, dtype=np.uint8), bitorder="little")
+        return bits[column.offset : column.offset + len(column)].astype(bool)
+    if pa.types.is_fixed_size_binary(column.type):
+        width = column.type.byte_width
+        return np.frombuffer(
+            data, dtype=f"V{width}", count=len(column), offset=column.offset * width
+        )
+    return column.to_numpy(zero_copy_only=False)
+
+
+class _ColumnValues(dict):
+    """
+    The python values of every row of the columns of a read table batch, keyed by
+    column name and converted through NumPy on first lookup. Dictionary columns
+    give the dictionary value of each row, and their indices as "<name>.index".
+    """
+
+    def __init__(self, batch: pa.RecordBatch):
+        super().__init__()
+        self._batch = batch
+
+    def __missing__(self, name: str) -> List[Any]:
+        column_name, _, part = name.partition(".")
+        column = self._batch.column(column_name)
+        if column.null_count:
+            values = column.to_pylist()
+        elif not pa.types.is_dictionary(column.type):
+            values = _column_numpy(column).tolist()
+        elif part == "index":
+            values = _column_numpy(column.indices).tolist()
+        else:
+            dictionary = column.dictionary.to_pylist()
+            values = [dictionary[index] for index in self[f"{column_name}.index"]]
+        self[name] = values
+        return values
 
 
 class ReadRecord:
     """
     Represents the data for a single read from a pod5 record.
+
+    A ReadRecord is a lightweight view of a row of a :py:class:`ReadRecordBatch`,
+    whose column values are converted once per batch and shared by all of its
+    records.
     """
 
+    __slots__ = (
+        "_reader",
+        "_batch",
+        "_row",
+        "_batch_signal_cache",
+        "_selected_batch_index",
+    )
+
     def __init__(
         self,
         reader: "Reader",
@@ -100,42 +505,42 @@ class ReadRecord:
         """
         Get the unique read identifier for the read as a `UUID`.
         """
-        return UUID(bytes=self._batch.columns.read_id[self._row].as_py())
+        return UUID(bytes=self._batch._values["read_id"][self._row])
 
     @property
     def read_number(self) -> int:
         """
         Get the integer read number of the read.
         """
-        return self._batch.columns.read_number[self._row].as_py()  # type: ignore
+        return self._batch._values["read_number"][self._row]
 
     @property
     def start_sample(self) -> int:
         """
         Get the absolute sample which the read started.
         """
-        return self._batch.columns.start[self._row].as_py()  # type: ignore
+        return self._batch._values["start"][self._row]
 
     @property
     def num_samples(self) -> int:
         """
         Get the number of samples in the reads signal data.
         """
-        return self._batch.columns.num_samples[self._row].as_py()  # type: ignore
+        return self._batch._values["num_samples"][self._row]
 
     @property
     def median_before(self) -> float:
         """
         Get the median before level (in pico amps) for the read.
         """
-        return self._batch.columns.median_before[self._row].as_py()  # type: ignore
+        return self._batch._values["median_before"][self._row]
 
     @property
     def num_minknow_events(self) -> float:
         """
         Find the number of minknow events in the read.
         """
-        return self._batch.columns.num_minknow_events[self._row].as_py()  # type: ignore
+        return self._batch._values["num_minknow_events"][self._row]
 
     @property
     def tracked_scaling(self) -> ShiftScalePair:
@@ -143,8 +548,8 @@ class ReadRecord:
         Find the tracked scaling value in the read.
         """
         return ShiftScalePair(
-            self._batch.columns.tracked_scaling_shift[self._row].as_py(),
-            self._batch.columns.tracked_scaling_scale[self._row].as_py(),
+            self._batch._values["tracked_scaling_shift"][self._row],
+            self._batch._values["tracked_scaling_scale"][self._row],
         )
 
     @property
@@ -153,8 +558,8 @@ class ReadRecord:
         Find the predicted scaling value in the read.
         """
         return ShiftScalePair(
-            self._batch.columns.predicted_scaling_shift[self._row].as_py(),
-            self._batch.columns.predicted_scaling_scale[self._row].as_py(),
+            self._batch._values["predicted_scaling_shift"][self._row],
+            self._batch._values["predicted_scaling_scale"][self._row],
         )
 
     @property
@@ -162,14 +567,14 @@ class ReadRecord:
         """
         Number of selected reads since the last mux change on this reads channel.
         """
-        return self._batch.columns.num_reads_since_mux_change[self._row].as_py()  # type: ignore
+        return self._batch._values["num_reads_since_mux_change"][self._row]
 
     @property
     def time_since_mux_change(self) -> float:
         """
         Time in seconds since the last mux change on this reads channel.
         """
-        return self._batch.columns.time_since_mux_change[self._row].as_py()  # type: ignore
+        return self._batch._values["time_since_mux_change"][self._row]
 
     @property
     def pore(self) -> Pore:
@@ -177,9 +582,9 @@ class ReadRecord:
         Get the pore data associated with the read.
         """
         return Pore(
-            self._batch.columns.channel[self._row].as_py(),
-            self._batch.columns.well[self._row].as_py(),
-            self._batch.columns.pore_type[self._row].as_py(),
+            self._batch._values["channel"][self._row],
+            self._batch._values["well"][self._row],
+            self._batch._values["pore_type"][self._row],
         )
 
     @property
@@ -188,8 +593,8 @@ class ReadRecord:
         Get the calibration data associated with the read.
         """
         return Calibration(
-            self._batch.columns.calibration_offset[self._row].as_py(),
-            self._batch.columns.calibration_scale[self._row].as_py(),
+            self._batch._values["calibration_offset"][self._row],
+            self._batch._values["calibration_scale"][self._row],
         )
 
     @property
@@ -215,12 +620,7 @@ class ReadRecord:
         """
         Get the end reason data associated with the read.
         """
-        return EndReason(
-            reason=EndReasonEnum[
-                self._batch.columns.end_reason[self._row].as_py().upper()
-            ],
-            forced=self._batch.columns.end_reason_forced[self._row].as_py(),
-        )
+        return self._batch._end_reason_values()[self._row]
 
     @property
     def run_info(self) -> RunInfo:
@@ -235,14 +635,14 @@ class ReadRecord:
         Get the dictionary index of the end reason data associated with the read.
         This property is the same as the EndReason enumeration value.
         """
-        return self._batch.columns.end_reason[self._row].index.as_py()  # type: ignore
+        return self._batch._values["end_reason.index"][self._row]
 
     @property
     def run_info_index(self) -> int:
         """
         Get the dictionary index of the run info data associated with the read.
         """
-        return self._batch.columns.run_info[self._row].index.as_py()  # type: ignore
+        return self._batch._values["run_info.index"][self._row]
 
     @property
     def sample_count(self) -> int:
@@ -256,6 +656,8 @@ class ReadRecord:
         """
         Get the number of bytes used to store the reads data.
         """
+        if self._batch._iterating_reads:
+            return self._batch._byte_counts()[self._row]
         return sum(r.byte_count for r in self.signal_rows)
 
     @property
@@ -270,6 +672,9 @@ class ReadRecord:
         """
         Get the full signal for the read.
 
+        For files with uncompressed signal, reads stored in a single chunk are
+        returned as a read-only view of the memory-mapped file without copying.
+
         Returns
         -------
         numpy.ndarray[int16]
@@ -282,27 +687,29 @@ class ReadRecord:
 
         rows = self._batch.columns.signal[self._row]
         batch_data = [self._find_signal_row_index(r.as_py()) for r in rows]
+
+        if not self._reader.is_vbz_compressed:
+            views = [
+                _signal_row_view(batch.signal, batch_row_index)
+                for batch, _, batch_row_index in batch_data
+            ]
+            if len(views) == 1:
+                return views[0]
+            return np.concatenate(views) if views else np.empty(0, dtype=np.int16)
+
         sample_counts = []
         for batch, _, batch_row_index in batch_data:
             sample_counts.append(batch.samples[batch_row_index].as_py())
 
         output = np.empty(dtype=np.int16, shape=(sum(sample_counts),))
-        current_sample_index = 0
-
-        for i, (batch, _, batch_row_index) in enumerate(batch_data):
-            signal = batch.signal
-            current_row_count = sample_counts[i]
-            output_slice = output[
-                current_sample_index : current_sample_index + current_row_count
-            ]
-            if self._reader.is_vbz_compressed:
-                vbz_decompress_signal_into(
-                    memoryview(signal[batch_row_index].as_buffer()), output_slice
-                )
-            else:
-                output_slice[:] = signal.to_numpy()
-            current_sample_index += current_row_count
-        return output
+        return vbz_decompress_signal_chunked_into(
+            [
+                memoryview(batch.signal[batch_row_index].as_buffer())
+                for batch, _, batch_row_index in batch_data
+            ],
+            sample_counts,
+            output,
+        )
 
     @property
     def signal_pa(self) -> npt.NDArray[np.float32]:
@@ -316,6 +723,89 @@ class ReadRecord:
         """
         return self.calibrate_signal_array(self.signal)
 
+    def signal_range(self, start_sample: int, end_sample: int) -> npt.NDArray[np.int16]:
+        """
+        Get the signal for the read between `start_sample` (inclusive) and
+        `end_sample` (exclusive), decoding only the signal chunks which overlap the
+        range. `end_sample` is clipped to the number of samples in the read.
+
+        Parameters
+        ----------
+        start_sample : int
+            The index of the first sample to return
+        end_sample : int
+            The index after the last sample to return
+
+        Returns
+        -------
+        numpy.ndarray[int16]
+            A numpy array of signal data with int16 type.
+
+        Raises
+        ------
+        ValueError
+            If `start_sample` is negative or greater than `end_sample`
+        """
+        if start_sample < 0 or end_sample < start_sample:
+            raise ValueError(
+                f"Invalid signal range [{start_sample}, {end_sample}) for read "
+                f"{self.read_id}"
+            )
+        end_sample = min(end_sample, self.num_samples)
+        start_sample = min(start_sample, end_sample)
+
+        output = np.empty(dtype=np.int16, shape=(end_sample - start_sample,))
+        self._signal_range_into(start_sample, output)
+        return output
+
+    def _signal_range_into(
+        self, start_sample: int, output: npt.NDArray[np.int16]
+    ) -> None:
+        """
+        Decode the signal starting at `start_sample` into `output`, decoding only
+        the signal chunks which overlap the requested samples.
+        """
+        end_sample = start_sample + len(output)
+        if end_sample > self.num_samples:
+            raise ValueError(
+                f"Signal range [{start_sample}, {end_sample}) exceeds the "
+                f"{self.num_samples} samples in read {self.read_id}"
+            )
+
+        if self._batch_signal_cache is not None:
+            output[:] = self.signal[start_sample:end_sample]
+            return
+
+        chunk_start = 0
+        for row in self._batch.columns.signal[self._row]:
+            if chunk_start >= end_sample:
+                break
+
+            batch, _, batch_row_index = self._find_signal_row_index(row.as_py())
+            chunk_end = chunk_start + batch.samples[batch_row_index].as_py()
+            if chunk_end > start_sample:
+                chunk = self._decode_signal_row(batch, batch_row_index)
+                overlap_start = max(chunk_start, start_sample)
+                overlap_end = min(chunk_end, end_sample)
+                output[
+                    overlap_start - start_sample : overlap_end - start_sample
+                ] = chunk[overlap_start - chunk_start : overlap_end - chunk_start]
+            chunk_start = chunk_end
+
+    def _decode_signal_row(
+        self, batch: Signal, batch_row_index: int
+    ) -> npt.NDArray[np.int16]:
+        """
+        Decode the signal chunk at `batch_row_index` of a signal table batch.
+        Uncompressed signal is returned as a read-only view without copying.
+        """
+        if self._reader.is_vbz_compressed:
+            return vbz_decompress_signal(
+                memoryview(batch.signal[batch_row_index].as_buffer()),
+                batch.samples[batch_row_index].as_py(),
+            )
+        return _signal_row_view(batch.signal, batch_row_index)
+
     def signal_for_chunk(self, index: int) -> npt.NDArray[np.int16]:
         """
         Get the signal for a given chunk of the read.
@@ -344,12 +834,12 @@ class ReadRecord:
             sig_row = sig_row.as_py()
 
             batch, batch_index, batch_row_index = self._find_signal_row_index(sig_row)
-            return SignalRowInfo(
-                batch_index,
-                batch_row_index,
-                batch.samples[batch_row_index].as_py(),
-                len(batch.signal[batch_row_index].as_buffer()),
-            )
+            sample_count = batch.samples[batch_row_index].as_py()
+            if self._reader.is_vbz_compressed:
+                byte_count = len(batch.signal[batch_row_index].as_buffer())
+            else:
+                byte_count = sample_count * np.dtype(np.int16).itemsize
+            return SignalRowInfo(batch_index, batch_row_index, sample_count, byte_count)
 
         return [map_signal_row(r) for r in self._batch.columns.signal[self._row]]
 
@@ -363,9 +853,14 @@ class ReadRecord:
         -------
         A numpy array of signal data with float32 type.
         """
-        offset = np.float32(self.calibration.offset)
-        scale = np.float32(self.calibration.scale)
-        return (signal_array_adc + offset) * scale
+        signal_pa = np.empty_like(signal_array_adc, dtype=np.float32)
+        _calibrate_signal_into(
+            signal_array_adc,
+            np.float32(self.calibration.offset),
+            np.float32(self.calibration.scale),
+            signal_pa,
+        )
+        return signal_pa
 
     def _find_signal_row_index(self, signal_row: int) -> Tuple[Signal, int, int]:
         """
@@ -391,15 +886,7 @@ class ReadRecord:
         A numpy array of signal data with int16 type.
         """
         batch, _, batch_row_index = self._find_signal_row_index(signal_row)
-
-        signal = batch.signal
-        if self._reader.is_vbz_compressed:
-            sample_count = batch.samples[batch_row_index].as_py()
-            return vbz_decompress_signal(
-                memoryview(signal[batch_row_index].as_buffer()), sample_count
-            )
-
-        return signal.to_numpy()
+        return self._decode_signal_row(batch, batch_row_index)
 
     def to_read(self) -> Read:
         """
@@ -410,6 +897,10 @@ class ReadRecord:
         -------
             :py:class:`pod5.pod5_types.Read`
         """
+        signal = self.signal
+        # Uncompressed signal may be a read-only view of the file
+        if not signal.flags.writeable:
+            signal = signal.copy()
         return Read(
             read_id=self.read_id,
             pore=self.pore,
@@ -419,7 +910,7 @@ class ReadRecord:
             read_number=self.read_number,
             run_info=self.run_info,
             start_sample=self.start_sample,
-            signal=self.signal,
+            signal=signal,
         )
 
 
@@ -435,9 +926,20 @@ class ReadRecordBatch:
         self._batch: pa.RecordBatch = batch
 
         self._signal_cache: Optional[p5b.Pod5SignalCacheBatch] = None
+        self._contiguous_samples: Optional[
+            Tuple[npt.NDArray[np.int16], npt.NDArray[np.uint64]]
+        ] = None
         self._selected_batch_rows: Optional[Iterable[int]] = None
         self._columns: Optional[ReadRecordV3Columns] = None
 
+        # Row values shared by every ReadRecord view of this batch
+        self._values = _ColumnValues(batch)
+        self._end_reasons: Optional[List[EndReason]] = None
+        self._read_byte_counts: Optional[List[int]] = None
+        # Set once every read of this batch is iterated, so byte counts are then
+        # computed for the whole batch rather than for each read
+        self._iterating_reads = False
+
     @property
     def columns(self) -> ReadRecordV3Columns:
         """Return the data from this batch as a ReadRecordColumns instance"""
@@ -450,9 +952,41 @@ class ReadRecordBatch:
             )
         return self._columns
 
+    def _end_reason_values(self) -> List[EndReason]:
+        """Get the (immutable) :py:class:`EndReason` of every row of this batch"""
+        if self._end_reasons is None:
+            end_reasons: Dict[Tuple[str, bool], EndReason] = {}
+            for key in zip(
+                self._values["end_reason"], self._values["end_reason_forced"]
+            ):
+                if key not in end_reasons:
+                    end_reasons[key] = EndReason(
+                        reason=EndReasonEnum[key[0].upper()], forced=key[1]
+                    )
+            self._end_reasons = [
+                end_reasons[key]
+                for key in zip(
+                    self._values["end_reason"], self._values["end_reason_forced"]
+                )
+            ]
+        return self._end_reasons
+
+    def _byte_counts(self) -> List[int]:
+        """Get the number of bytes of signal stored for every row of this batch"""
+        if self._read_byte_counts is None:
+            chunk_args, _ = self._signal_chunks(None)
+            read_chunk_offsets = chunk_args[6]
+            chunk_byte_ends = np.zeros(len(chunk_args[3]) + 1, dtype=np.uint64)
+            np.cumsum(chunk_args[4] - chunk_args[3], out=chunk_byte_ends[1:])
+            self._read_byte_counts = np.diff(
+                chunk_byte_ends[read_chunk_offsets]
+            ).tolist()
+        return self._read_byte_counts
+
     def set_cached_signal(self, signal_cache: p5b.Pod5SignalCacheBatch) -> None:
         """Set the signal cache"""
         self._signal_cache = signal_cache
+        self._contiguous_samples = None
 
     def set_selected_batch_rows(self, selected_batch_rows: Iterable[int]) -> None:
         """Set the selected batch rows"""
@@ -469,7 +1003,12 @@ class ReadRecordBatch:
         """
 
         signal_cache = None
-        if self._signal_cache and self._signal_cache.samples:
+        if self._is_contiguous_signal_cache():
+            samples, offsets = self.cached_contiguous_samples
+            signal_cache = [
+                samples[start:end] for start, end in zip(offsets[:-1], offsets[1:])
+            ]
+        elif self._signal_cache and self._signal_cache.samples:
             signal_cache = self._signal_cache.samples
 
         if self._selected_batch_rows is not None:
@@ -482,6 +1021,7 @@ class ReadRecordBatch:
                     selected_batch_index=idx,
                 )
         else:
+            self._iterating_reads = True
             for i in range(self.num_reads):
                 yield ReadRecord(self._reader, self, i, batch_signal_cache=signal_cache)
 
@@ -489,6 +1029,176 @@ class ReadRecordBatch:
         """Get the ReadRecord at row index"""
         return ReadRecord(self._reader, self, row)
 
+    def signal_windows(
+        self, start_samples: Sequence[int], window_length: int
+    ) -> npt.NDArray[np.int16]:
+        """
+        Get a fixed length window of signal from each read in this batch, decoding
+        only the signal chunks which overlap each window.
+
+        Parameters
+        ----------
+        start_samples : Sequence[int]
+            The first sample of the window for each read in the order given by
+            :py:meth:`ReadRecordBatch.reads`
+        window_length : int
+            The number of samples in every window
+
+        Returns
+        -------
+        numpy.ndarray[int16]
+            A numpy array of signal data of shape (reads, window_length)
+
+        Raises
+        ------
+        ValueError
+            If the number of `start_samples` does not match the number of reads or
+            a window exceeds the signal of its read
+        """
+        starts = np.asarray(start_samples, dtype=np.int64)
+        reads = list(self.reads())
+        if starts.shape != (len(reads),):
+            raise ValueError(
+                f"Expected {len(reads)} window start samples, got: {starts.shape}"
+            )
+        if window_length < 0 or np.any(starts < 0):
+            raise ValueError("Signal windows must have non-negative bounds")
+
+        output = np.empty(dtype=np.int16, shape=(len(reads), window_length))
+        for read, start_sample, window in zip(reads, starts, output):
+            read._signal_range_into(int(start_sample), window)
+        return output
+
+    def signal_pa_batch(
+        self, out: Optional[npt.NDArray] = None, dtype: npt.DTypeLike = np.float32
+    ) -> Tuple[npt.NDArray, npt.NDArray[np.uint64]]:
+        """
+        Get the signal of every read in this batch calibrated to pico amps as one
+        contiguous buffer, in the layout of
+        :py:attr:`ReadRecordBatch.cached_contiguous_samples`.
+
+        All reads are calibrated in a single native pass which fuses VBZ
+        decompression with calibration, so the decoded int16 samples of each chunk
+        are calibrated while still in cache. Cached signal is calibrated without
+        decoding.
+
+        Parameters
+        ----------
+        out : numpy.ndarray
+            A C-contiguous 1-d float32 or float16 array of the total number of
+            samples of the reads to calibrate into. A new array is allocated if not
+            given.
+        dtype : numpy.dtype
+            The dtype of the allocated array when `out` is not given, float32 or
+            float16. Float16 halves the memory bandwidth of the output, e.g. for
+            inference.
+
+        Returns
+        -------
+        samples : numpy.ndarray[float32] or numpy.ndarray[float16]
+            The calibrated samples of all reads, concatenated in the order given
+            by :py:meth:`ReadRecordBatch.reads`
+        offsets : numpy.ndarray[uint64]
+            The offsets of each read in `samples`, of length reads + 1, such that
+            read i occupies samples[offsets[i]:offsets[i + 1]]
+
+        Raises
+        ------
+        ValueError
+            If `out` is not a float32 or float16 array of the total sample count
+        """
+        columns = self.columns
+        calibration_offsets = _column_numpy(columns.calibration_offset)
+        calibration_scales = _column_numpy(columns.calibration_scale)
+        if self._selected_batch_rows is not None:
+            rows = np.asarray(self._selected_batch_rows, dtype=np.int64)
+            calibration_offsets = calibration_offsets[rows]
+            calibration_scales = calibration_scales[rows]
+        calibration_offsets = calibration_offsets.astype(np.float32, copy=False)
+        calibration_scales = calibration_scales.astype(np.float32, copy=False)
+
+        # Batches preloaded with only "sample_count" hold no samples to calibrate
+        if self._is_contiguous_signal_cache() or (
+            self._signal_cache and self._signal_cache.samples
+        ):
+            samples, offsets = self.cached_contiguous_samples
+            chunk_args = _contiguous_signal_chunks(samples, offsets)
+        else:
+            chunk_args, offsets = self._signal_chunks(self._selected_batch_rows)
+
+        sample_count = int(offsets[-1])
+        if out is None:
+            out = np.empty(sample_count, dtype=dtype)
+        if (
+            out.shape != (sample_count,)
+            or out.dtype not in (np.float32, np.float16)
+            or not out.flags.c_contiguous
+        ):
+            raise ValueError(
+                "out must be a C-contiguous float32 or float16 array of shape "
+                f"{(sample_count,)}, got: {out.dtype} {out.shape}"
+            )
+
+        p5b.decode_signal_pa(
+            *chunk_args, calibration_offsets, calibration_scales, offsets, out
+        )
+        return out, offsets
+
+    def _signal_chunks(
+        self, rows: Optional[Iterable[int]]
+    ) -> Tuple[_SignalChunks, npt.NDArray[np.uint64]]:
+        """
+        Describe the signal table chunks of the reads at `rows` of this batch, or
+        of every read if None, in the form taken by the native signal decoders,
+        and return them with the offset of each read in the decoded signal of all
+        reads.
+        """
+        signal = self.columns.signal
+        if rows is not None:
+            signal = signal.take(pa.array(rows))
+        read_chunk_offsets = _column_numpy(signal.offsets).astype(np.uint64)
+        read_chunk_offsets -= read_chunk_offsets[0]
+        signal_rows = _column_numpy(signal.flatten()).astype(np.uint64)
+
+        chunk_count = len(signal_rows)
+        chunk_byte_begins = np.zeros(chunk_count, dtype=np.uint64)
+        chunk_byte_ends = np.zeros(chunk_count, dtype=np.uint64)
+        chunk_sample_counts = np.zeros(chunk_count, dtype=np.uint32)
+
+        row_count = max(self._reader.signal_batch_row_count, 1)
+        signal_batches, chunk_buffers = np.unique(
+            signal_rows // np.uint64(row_count), return_inverse=True
+        )
+        buffers: List[Union[npt.NDArray[np.uint8], memoryview]] = []
+        for buffer_idx, signal_batch_idx in enumerate(signal_batches):
+            signal_batch = self._reader._get_signal_batch(int(signal_batch_idx))
+            data, byte_offsets = _signal_batch_data(signal_batch.signal)
+            buffers.append(data)
+
+            chunks = chunk_buffers == buffer_idx
+            batch_rows = signal_rows[chunks] - signal_batch_idx * np.uint64(row_count)
+            chunk_byte_begins[chunks] = byte_offsets[batch_rows]
+            chunk_byte_ends[chunks] = byte_offsets[batch_rows + np.uint64(1)]
+            chunk_sample_counts[chunks] = _column_numpy(signal_batch.samples)[
+                batch_rows
+            ]
+
+        chunk_sample_ends = np.zeros(chunk_count + 1, dtype=np.uint64)
+        np.cumsum(chunk_sample_counts, out=chunk_sample_ends[1:])
+        offsets = chunk_sample_ends[read_chunk_offsets]
+
+        chunk_args: _SignalChunks = (
+            buffers,
+            np.full(len(buffers), self._reader.is_vbz_compressed, dtype=np.uint8),
+            chunk_buffers.astype(np.uint32),
+            chunk_byte_begins,
+            chunk_byte_ends,
+            chunk_sample_counts,
+            read_chunk_offsets,
+            np.zeros(len(read_chunk_offsets) - 1, dtype=np.uint64),
+        )
+        return chunk_args, offsets
+
     @property
     def num_reads(self) -> int:
         """Return the number of rows in this RecordBatch"""
@@ -530,11 +1240,153 @@ class ReadRecordBatch:
             raise RuntimeError("No cached signal data available")
         return self._signal_cache.samples
 
+    @property
+    def cached_contiguous_samples(
+        self,
+    ) -> Tuple[npt.NDArray[np.int16], npt.NDArray[np.uint64]]:
+        """
+        Get the cached samples of every read in this batch as one contiguous buffer.
+
+        When the batch was preloaded with "contiguous_samples" the buffer is the
+        one decoded into by the signal loader and is returned without copying.
+
+        Returns
+        -------
+        samples : numpy.ndarray[int16]
+            The samples of all reads, concatenated in batch order
+        offsets : numpy.ndarray[uint64]
+            The offsets of each read in `samples`, of length reads + 1, such that
+            read i occupies samples[offsets[i]:offsets[i + 1]]
+        """
+        if not self._signal_cache:
+            raise RuntimeError("No cached signal data available")
+
+        if self._contiguous_samples is None:
+            contiguous_samples = self._signal_cache.contiguous_samples
+            if contiguous_samples is not None:
+                self._contiguous_samples = (
+                    contiguous_samples,
+                    self._signal_cache.sample_offsets,
+                )
+            else:
+                column = self._signal_cache.samples
+                offsets = np.zeros(len(column) + 1, dtype=np.uint64)
+                np.cumsum([len(samples) for samples in column], out=offsets[1:])
+                samples = (
+                    np.concatenate(column) if column else np.empty(0, dtype=np.int16)
+                )
+                self._contiguous_samples = (samples, offsets)
+        return self._contiguous_samples
+
+    @property
+    def cached_samples_array(self) -> pa.LargeListArray:
+        """
+        Get the cached samples of every read in this batch as an arrow
+        LargeListArray of int16 sharing the memory of
+        :py:attr:`ReadRecordBatch.cached_contiguous_samples`
+        """
+        samples, offsets = self.cached_contiguous_samples
+        return pa.LargeListArray.from_arrays(
+            pa.array(offsets.view(np.int64)), pa.array(samples)
+        )
+
+    def _is_contiguous_signal_cache(self) -> bool:
+        """Return True if the signal cache was loaded into a contiguous buffer"""
+        return (
+            self._signal_cache is not None
+            and self._signal_cache.contiguous_samples is not None
+        )
+
+
+def _calibrate_signal_into(
+    signal: npt.NDArray[np.int16],
+    offset: np.float32,
+    scale: np.float32,
+    out: npt.NDArray,
+) -> None:
+    """
+    Calibrate int16 `signal` to pico amps into the float32 or float16 array `out`
+    without allocating temporaries for float32 output.
+    """
+    if out.dtype == np.float32:
+        np.add(signal, offset, out=out)
+        np.multiply(out, scale, out=out)
+    else:
+        signal_pa = np.add(signal, offset, dtype=np.float32)
+        np.multiply(signal_pa, scale, out=signal_pa)
+        out[...] = signal_pa
+
+
+def _contiguous_signal_chunks(
+    samples: npt.NDArray[np.int16], offsets: npt.NDArray[np.uint64]
+) -> _SignalChunks:
+    """
+    Describe contiguous decoded `samples` as one uncompressed chunk per read in
+    the form taken by the native signal decoders.
+    """
+    read_count = len(offsets) - 1
+    return (
+        [samples.view(np.uint8)],
+        np.zeros(1, dtype=np.uint8),
+        np.zeros(read_count, dtype=np.uint32),
+        offsets[:-1] * np.uint64(2),
+        offsets[1:] * np.uint64(2),
+        np.diff(offsets).astype(np.uint32),
+        np.arange(read_count + 1, dtype=np.uint64),
+        np.zeros(read_count, dtype=np.uint64),
+    )
+
+
+class FileMapping:
+    """
+    A file handle and read-only memory map of a whole pod5 file, shared by the
+    :py:class:`ArrowTableHandle` of each table in the file
+    """
+
+    def __init__(self, path: PathOrStr) -> None:
+        """
+        Open and memory map the file at `path`. If the file cannot be memory mapped
+        :py:attr:`FileMapping.mmap` is None.
+
+        Parameters
+        ----------
+        path : os.PathLike, str
+            The path to the pod5 file
+        """
+        self.path = Path(path)
+        self._fh = self.path.open("rb")
+        self.mmap: Optional[mmap.mmap] = None
+        self.view: Optional[memoryview] = None
+        self.address = 0
+
+        try:
+            self.mmap = mmap.mmap(self._fh.fileno(), length=0, access=mmap.ACCESS_READ)
+        except OSError:
+            return
+        self.view = memoryview(self.mmap)
+        self.address = pa.py_buffer(self.view).address
+
+    def close(self) -> None:
+        """
+        Close the file handle and release the memory map, which is unmapped once
+        no arrow buffers reference it
+        """
+        self.view = None
+        self.mmap = None
+        safe_close(self, "_fh")
+
+    def __del__(self) -> None:
+        self.close()
+
 
 class ArrowTableHandle:
     """Class for managing arrow file handles and memory view mapping of tables"""
 
-    def __init__(self, location: p5b.EmbeddedFileData) -> None:
+    def __init__(
+        self,
+        location: p5b.EmbeddedFileData,
+        mapping: Optional[FileMapping] = None,
+    ) -> None:
         """
         Open a pod5 file at the given `path` and use the location data to load
         an arrow table (e.g. signal table)
@@ -544,6 +1396,9 @@ class ArrowTableHandle:
         location : lib_pod5.pod5_format_pybind.EmbeddedFileData
             Location data for how a pod5 file should be spit in memory to read a table.
             This is returned from p5b.Pod5FileReader.get_file_X_location methods
+        mapping : Optional[FileMapping]
+            The mapping of the file shared with the other tables of the file. If not
+            given the file is mapped for this table alone.
 
         Raises
         ------
@@ -554,18 +1409,25 @@ class ArrowTableHandle:
         # The location data is passed from the p5b.Pod5FileReader.get_file_X_location
         # methods
         self._location = location
-        self._path = Path(self._location.file_path)
-
-        # Open the file
-        self._fh = self._path.open("rb")
+        self._owns_mapping = mapping is None
+        self._mapping: Optional[FileMapping] = (
+            FileMapping(location.file_path) if mapping is None else mapping
+        )
+        self._path = self._mapping.path
+        self._fh: Optional[IO[bytes]] = None
 
-        # Create a memory view of the file and select the region for the table
-        try:
-            self._reader = self._open_with_mmap()
-        except OSError:
+        # Select the region of the mapped file for the table
+        if self._mapping.view is not None:
+            self._reader = self._open_with_mmap(self._mapping.view)
+        else:
             # If we fail fall back to a traditional open.
             self._reader = self._open_without_mmap()
 
+    @property
+    def _mmap(self) -> Optional[mmap.mmap]:
+        """The memory map of the file, or None if the table is not memory mapped"""
+        return None if self._mapping is None else self._mapping.mmap
+
     def _open_without_mmap(self):
         class File(IOBase):
             def __init__(self, handle, location):
@@ -589,12 +1451,11 @@ class ArrowTableHandle:
             def read(self, size=-1):
                 return self._handle.read(size)
 
+        # Each table seeks independently, so reads through its own file handle
+        self._fh = self._path.open("rb")
         return pa.ipc.open_file(pa.PythonFile(File(self._fh, self._location)))
 
-    def _open_with_mmap(self):
-        _mmap = mmap.mmap(self._fh.fileno(), length=0, access=mmap.ACCESS_READ)
-        file_view = memoryview(_mmap)
-
+    def _open_with_mmap(self, file_view: memoryview):
         arrow_table_view = file_view[
             self._location.offset : self._location.offset + self._location.length
         ]
@@ -613,11 +1474,56 @@ class ArrowTableHandle:
 
         raise RuntimeError(f"Could not open pyarrow reader: {p5b.get_error_string()}")
 
+    def batch_extent(self, index: int) -> Optional[Tuple[int, int]]:
+        """
+        Find the page aligned (offset, length) of the memory-mapped file spanned by
+        the buffers of the record batch at `index`, or None if the table is not
+        memory-mapped.
+        """
+        mapping = self._mapping
+        if mapping is None or mapping.mmap is None:
+            return None
+
+        start, end = len(mapping.mmap), 0
+        for column in self.reader.get_batch(index).columns:
+            for buffer in column.buffers():
+                if buffer is None or buffer.size == 0:
+                    continue
+                offset = buffer.address - mapping.address
+                if 0 <= offset < len(mapping.mmap):
+                    start = min(start, offset)
+                    end = max(end, offset + buffer.size)
+
+        if end <= start:
+            return None
+        start -= start % mmap.PAGESIZE
+        return start, end - start
+
+    def prefetch(self, offset: int, length: int) -> None:
+        """
+        Ask the operating system to read ahead a page aligned region of the
+        memory-mapped file, as returned by :py:meth:`ArrowTableHandle.batch_extent`.
+        Where madvise is unavailable the pages are touched instead, which blocks
+        until they are read.
+        """
+        _mmap = self._mmap
+        if _mmap is None:
+            return
+
+        if hasattr(mmap, "MADV_WILLNEED"):
+            _mmap.madvise(mmap.MADV_WILLNEED, offset, length)
+        else:
+            pages = np.frombuffer(_mmap, dtype=np.uint8, count=length, offset=offset)
+            pages[:: mmap.PAGESIZE].sum()
+
     def close(self) -> None:
         """
         Cleanly close the open file handles and memory views.
         """
         self._reader = None
+        if getattr(self, "_owns_mapping", False):
+            safe_close(self, "_mapping")
+        self._mapping = None
         safe_close(self, "_fh")
 
     def __enter__(self) -> "ArrowTableHandle":
@@ -630,77 +1536,434 @@ class ArrowTableHandle:
         self.close()
 
 
-class Reader:
+class ReadaheadCounters:
     """
-    The base reader for POD5 data
+    Thread-safe throughput counters of batch iteration with readahead, showing
+    how much batch processing overlapped with prefetching.
     """
 
-    def __init__(self, path: PathOrStr):
-        """
-        Open a pod5 filepath for reading
-        """
+    def __init__(self) -> None:
+        self._batches = 0
+        self._prefetched_batches = 0
+        self._prefetched_bytes = 0
+        self._fetch_seconds = 0.0
+        self._process_seconds = 0.0
+        self._lock = threading.Lock()
+
+    def add_prefetch(self, nbytes: int) -> None:
+        """Record a table batch of `nbytes` which was prefetched"""
+        with self._lock:
+            self._prefetched_batches += 1
+            self._prefetched_bytes += nbytes
+
+    def add_batch(self, fetch_seconds: float, process_seconds: float) -> None:
+        """
+        Record a yielded batch, the time spent fetching it and the time the
+        caller spent processing it
+        """
+        with self._lock:
+            self._batches += 1
+            self._fetch_seconds += fetch_seconds
+            self._process_seconds += process_seconds
+
+    def info(self) -> ReadaheadInfo:
+        """Return the :py:class:`ReadaheadInfo` counters"""
+        with self._lock:
+            return ReadaheadInfo(
+                batches=self._batches,
+                prefetched_batches=self._prefetched_batches,
+                prefetched_bytes=self._prefetched_bytes,
+                fetch_seconds=self._fetch_seconds,
+                process_seconds=self._process_seconds,
+            )
 
-        self._path = Path(path).absolute()
 
-        self._file_reader: Optional[p5b.Pod5FileReader] = None
-        self._read_handle: Optional[ArrowTableHandle] = None
-        self._run_info_handle: Optional[ArrowTableHandle] = None
-        self._signal_handle: Optional[ArrowTableHandle] = None
+class _AsyncSignalLoaderWaiter:
+    """
+    Await the batches of an async signal loader from an asyncio event loop.
 
-        (
-            self._file_reader,
-            self._read_handle,
-            self._run_info_handle,
-            self._signal_handle,
-        ) = self._open_arrow_table_handles(self._path)
+    The loader writes to a pipe watched by the event loop whenever a batch may
+    have become ready, so waiting for a batch neither blocks the loop nor polls.
+    """
 
-        schema_metadata = self.read_table.schema.metadata
-        self._file_identifier = UUID(
-            schema_metadata[b"MINKNOW:file_identifier"].decode("utf-8")
-        )
-        self._writing_software = schema_metadata[b"MINKNOW:software"].decode("utf-8")
-        writing_version_str = schema_metadata[b"MINKNOW:pod5_version"].decode("utf-8")
-        writing_version = packaging.version.parse(writing_version_str)
+    def __init__(self, signal_cache: p5b.Pod5AsyncSignalLoader):
+        self._signal_cache = signal_cache
+        self._loop = asyncio.get_running_loop()
+        self._ready = asyncio.Event()
+        self._fds: Optional[Tuple[int, int]] = None
+
+        read_fd, write_fd = os.pipe()
+        # The loader never blocks on a full pipe, the loop is signalled already
+        os.set_blocking(read_fd, False)
+        os.set_blocking(write_fd, False)
+        try:
+            self._loop.add_reader(read_fd, self._on_ready, read_fd)
+        except NotImplementedError:
+            # Event loops such as the Windows proactor cannot watch pipes
+            os.close(read_fd)
+            os.close(write_fd)
+            return
+
+        self._fds = (read_fd, write_fd)
+        signal_cache.set_ready_fd(write_fd)
+
+    def _on_ready(self, read_fd: int) -> None:
+        """Drain the pipe and wake the waiting task, run on the event loop"""
+        try:
+            while os.read(read_fd, 4096):
+                pass
+        except BlockingIOError:
+            pass
+        self._ready.set()
+
+    async def release_next_batch(self) -> Optional[p5b.Pod5SignalCacheBatch]:
+        """
+        Await and release the next batch of the signal loader, or None once it
+        was cancelled or has no batches left
+        """
+        if self._fds is None:
+            # The event loop cannot watch the ready pipe, wait on a thread
+            return await self._loop.run_in_executor(
+                None, self._signal_cache.release_next_batch
+            )
+
+        while True:
+            self._ready.clear()
+            if self._signal_cache.batch_ready:
+                return self._signal_cache.release_next_batch()
+            await self._ready.wait()
+
+    def close(self) -> None:
+        """Stop the worker threads of the signal loader and close the pipe"""
+        self._signal_cache.cancel()
+
+        if self._fds is not None:
+            self._signal_cache.set_ready_fd(-1)
+            self._loop.remove_reader(self._fds[0])
+            for fd in self._fds:
+                os.close(fd)
+            self._fds = None
+
+
+class _BatchReadahead:
+    """
+    Prefetch the pages of the next read table batches of an iteration, and of
+    the signal table batches they reference, on a background thread while the
+    current batch is processed.
+    """
+
+    def __init__(
+        self,
+        reader: "Reader",
+        plan: Sequence[Tuple[int, Optional[npt.NDArray[np.uint32]]]],
+        depth: int,
+    ):
+        """
+        Prefetch `depth` batches ahead of the read table batches in `plan`, given
+        as (batch index, selected batch rows or None for all rows)
+        """
+        if depth < 0:
+            raise ValueError(f"readahead must be >= 0, got: {depth}")
+
+        self._reader = reader
+        self._plan = plan
+        self._depth = depth
+        self._scheduled = 0
+        self._signal_batches: Set[int] = set()
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._resumed = time.perf_counter()
+
+    def __enter__(self) -> "_BatchReadahead":
+        if self._depth > 0:
+            self._executor = ThreadPoolExecutor(
+                max_workers=1, thread_name_prefix="pod5-readahead"
+            )
+        self._resumed = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_details) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
+    @contextmanager
+    def yielding(self, position: int) -> Generator[None, None, None]:
+        """
+        Wrap yielding the batch at `position` in the plan, prefetching the
+        following batches while the caller processes it
+        """
+        fetched = time.perf_counter()
+        fetch_seconds = fetched - self._resumed
+        if self._executor is not None:
+            end = min(len(self._plan), position + self._depth + 1)
+            for scheduled in range(max(self._scheduled, position + 1), end):
+                extents = self._extents(*self._plan[scheduled])
+                self._executor.submit(self._prefetch, extents)
+            self._scheduled = max(self._scheduled, end)
+
+        try:
+            yield
+        finally:
+            self._resumed = time.perf_counter()
+            if self._executor is not None:
+                self._reader._readahead_counters.add_batch(
+                    fetch_seconds, self._resumed - fetched
+                )
+
+    def _extents(
+        self, batch_index: int, batch_rows: Optional[npt.NDArray[np.uint32]]
+    ) -> List[Tuple["ArrowTableHandle", int, int]]:
+        """
+        Find the memory-mapped extents of a read table batch and of the signal
+        table batches holding the signal of its (selected) rows
+        """
+        reader = self._reader
+        extents: List[Tuple["ArrowTableHandle", int, int]] = []
+        if batch_rows is not None and len(batch_rows) == 0:
+            return extents
+
+        read_handle = reader._read_handle
+        if read_handle is not None:
+            extent = read_handle.batch_extent(batch_index)
+            if extent is not None:
+                extents.append((read_handle, *extent))
+
+        try:
+            signal_handle = reader._table_handle("signal")
+        except RuntimeError:
+            return extents
+        if reader.signal_batch_row_count == 0:
+            return extents
+
+        signal = reader.read_table.get_batch(batch_index).column("signal")
+        if batch_rows is not None:
+            signal = signal.take(pa.array(batch_rows))
+        signal_rows = signal.flatten().to_numpy()
+        if len(signal_rows) == 0:
+            return extents
+
+        first = int(signal_rows.min()) // reader.signal_batch_row_count
+        last = int(signal_rows.max()) // reader.signal_batch_row_count
+        for signal_batch in range(first, last + 1):
+            if signal_batch in self._signal_batches:
+                continue
+            self._signal_batches.add(signal_batch)
+            extent = signal_handle.batch_extent(signal_batch)
+            if extent is not None:
+                extents.append((signal_handle, *extent))
+        return extents
+
+    def _prefetch(self, extents: List[Tuple["ArrowTableHandle", int, int]]) -> None:
+        """Prefetch the extents of table batches, run on the readahead thread"""
+        for handle, offset, length in extents:
+            handle.prefetch(offset, length)
+            self._reader._readahead_counters.add_prefetch(length)
+
+
+class Reader:
+    """
+    The base reader for POD5 data
+    """
+
+    def __init__(
+        self,
+        path: PathOrStr,
+        signal_cache_bytes: Optional[int] = DEFAULT_SIGNAL_CACHE_BYTES,
+        memory_pool: Optional[MemoryPoolLike] = None,
+    ):
+        """
+        Open a pod5 filepath for reading
+
+        Parameters
+        ----------
+        path : os.PathLike, str
+            The path to the pod5 file
+        signal_cache_bytes : Optional[int]
+            The maximum number of bytes of signal table batches kept in the
+            least-recently-used signal cache. None disables the limit and 0
+            disables caching.
+        memory_pool : Optional[str, pyarrow.MemoryPool]
+            The memory pool lib_pod5 allocates batches and preloaded signal from,
+            either a :py:class:`pyarrow.MemoryPool` or a backend name such as
+            "jemalloc", "mimalloc" or "system". By default arrow's default memory
+            pool is used.
+        """
+
+        self._path = Path(path).absolute()
+        self._init_state(signal_cache_bytes, resolve_memory_pool(memory_pool))
+        self._open()
+
+    def _init_state(
+        self,
+        signal_cache_bytes: Optional[int],
+        memory_pool: Optional["p5b.MemoryPool"],
+    ) -> None:
+        """Initialise the handles and caches of a reader which is not yet opened"""
+        self._memory_pool = memory_pool
+        self._file_reader: Optional[p5b.Pod5FileReader] = None
+        # One mapping of the file is shared by the table handles. The run info and
+        # signal tables are opened on first use.
+        self._mapping: Optional[FileMapping] = None
+        self._read_handle: Optional[ArrowTableHandle] = None
+        self._run_info_handle: Optional[ArrowTableHandle] = None
+        self._signal_handle: Optional[ArrowTableHandle] = None
 
+        # Set when unpickled, the file is reopened on first access to its tables
+        self._reopen_pending = False
+        self._open_lock = threading.Lock()
+
+        self._file_identifier: Optional[UUID] = None
         self._columns_type = ReadRecordV3Columns
         self._reads_table_version = 3
 
-        self._file_version = writing_version
-        self._file_version_pre_migration = packaging.version.Version(
-            self._file_reader.get_file_version_pre_migration()
-        )
-
         # Warning: The cached signal maintains an open file handle. So ensure that
-        # this dictionary is cleared before closing.
-        self._cached_signal_batches: Dict[int, Signal] = {}
+        # this cache is cleared before closing.
+        self._signal_cache = SignalBatchCache(signal_cache_bytes)
+        self._readahead_counters = ReadaheadCounters()
+        # The live signal loaders preloading signal, for memory_usage
+        self._signal_loaders: "weakref.WeakSet[p5b.Pod5AsyncSignalLoader]" = (
+            weakref.WeakSet()
+        )
         self._cached_run_infos: Dict[str, RunInfo] = {}
+        self._run_info_rows: Optional[Dict[str, Tuple[int, int]]] = None
 
         self._is_vbz_compressed: Optional[bool] = None
         self._signal_batch_row_count: Optional[int] = None
+        self._stats: Optional[FileStats] = None
+
+        # The read id index sidecar is memory-mapped on first use in _plan_traversal
+        self._read_id_index: Optional[ReadIdIndex] = None
+        self._read_id_index_checked = False
+
+    def _open(self) -> None:
+        """
+        Open the file handles and memory maps of this reader, checking the file
+        identifier matches if this reader was previously opened
+        """
+        (
+            self._file_reader,
+            self._mapping,
+            self._read_handle,
+        ) = self._open_arrow_table_handles(self._path, self._memory_pool)
+
+        schema_metadata = self._read_handle.reader.schema.metadata
+        file_identifier = UUID(
+            schema_metadata[b"MINKNOW:file_identifier"].decode("utf-8")
+        )
+        if self._file_identifier not in (None, file_identifier):
+            self.close()
+            raise Pod5ApiException(
+                f"File identifier of {self._path} changed from "
+                f"{self._file_identifier} to {file_identifier} since it was opened"
+            )
+        self._file_identifier = file_identifier
+
+        self._writing_software = schema_metadata[b"MINKNOW:software"].decode("utf-8")
+        writing_version_str = schema_metadata[b"MINKNOW:pod5_version"].decode("utf-8")
+        self._file_version = packaging.version.parse(writing_version_str)
+        self._file_version_pre_migration = packaging.version.Version(
+            self._file_reader.get_file_version_pre_migration()
+        )
+
+    def _ensure_open(self) -> None:
+        """Reopen an unpickled reader on first use"""
+        if self._reopen_pending:
+            with self._open_lock:
+                if self._reopen_pending:
+                    self._open()
+                    self._reopen_pending = False
+
+    def __getstate__(self) -> Dict[str, Any]:
+        """
+        Return the state needed to reopen this reader, for example in a worker
+        process. File handles, memory maps and signal caches are not pickled,
+        the file is reopened when its tables are first accessed after unpickling.
+        """
+        if self._file_reader is None and not self._reopen_pending:
+            raise RuntimeError("Cannot pickle a closed Reader")
+
+        return {
+            "path": self._path,
+            "file_identifier": self._file_identifier,
+            "writing_software": self._writing_software,
+            "file_version": str(self._file_version),
+            "file_version_pre_migration": str(self._file_version_pre_migration),
+            "signal_cache_bytes": self._signal_cache.info().max_bytes,
+            "memory_pool": (
+                None if self._memory_pool is None else self._memory_pool.backend_name
+            ),
+            "stats": self._stats,
+            "read_id_index": self._read_id_index,
+        }
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        """Restore a pickled reader which is reopened lazily on first use"""
+        self._path = state["path"]
+        self._init_state(
+            state["signal_cache_bytes"], resolve_memory_pool(state["memory_pool"])
+        )
+        self._reopen_pending = True
+
+        self._file_identifier = state["file_identifier"]
+        self._writing_software = state["writing_software"]
+        self._file_version = packaging.version.parse(state["file_version"])
+        self._file_version_pre_migration = packaging.version.Version(
+            state["file_version_pre_migration"]
+        )
+        self._stats = state["stats"]
+        if state["read_id_index"] is not None:
+            self._read_id_index = state["read_id_index"]
+            self._read_id_index_checked = True
 
     @staticmethod
     def _open_arrow_table_handles(
         path: Path,
-    ) -> Tuple[
-        p5b.Pod5FileReader, ArrowTableHandle, ArrowTableHandle, ArrowTableHandle
-    ]:
-        """Open handles to the underlying arrow tables within this pod5 file"""
+        memory_pool: Optional["p5b.MemoryPool"] = None,
+    ) -> Tuple[p5b.Pod5FileReader, FileMapping, ArrowTableHandle]:
+        """
+        Open the file, its shared mapping and the handle of the read table within
+        this pod5 file
+        """
         if not path.is_file():
             raise FileNotFoundError(f"Failed to open pod5 file at: {path}")
 
-        file_reader = p5b.open_file(str(path))
+        if memory_pool is None:
+            file_reader = p5b.open_file(str(path))
+        else:
+            file_reader = p5b.open_file(str(path), memory_pool)
         if not file_reader:
             raise Pod5ApiException(
                 f"Failed to open reader for {path} Reason: {p5b.get_error_string()}"
             )
 
-        read_handle = ArrowTableHandle(file_reader.get_file_read_table_location())
-        run_info_handle = ArrowTableHandle(
-            file_reader.get_file_run_info_table_location()
-        )
-        signal_handle = ArrowTableHandle(file_reader.get_file_signal_table_location())
-
-        return file_reader, read_handle, run_info_handle, signal_handle
+        # Tables of migrated files are located in the migrated file
+        location = file_reader.get_file_read_table_location()
+        mapping = FileMapping(location.file_path)
+        return file_reader, mapping, ArrowTableHandle(location, mapping)
+
+    def _table_handle(self, table: str) -> ArrowTableHandle:
+        """
+        Find the handle of the "read", "run_info" or "signal" table, opening the
+        run info and signal tables in the shared mapping on first use
+        """
+        self._ensure_open()
+        attr = f"_{table}_handle"
+        handle = getattr(self, attr)
+        if handle is not None:
+            return handle
+
+        with self._open_lock:
+            handle = getattr(self, attr)
+            if handle is None:
+                if self._file_reader is None or self._mapping is None:
+                    raise RuntimeError("ArrowTableHandle has been closed!")
+                location = getattr(
+                    self._file_reader, f"get_file_{table}_table_location"
+                )()
+                shared = Path(location.file_path) == self._mapping.path
+                handle = ArrowTableHandle(location, self._mapping if shared else None)
+                setattr(self, attr, handle)
+        return handle
 
     def __del__(self) -> None:
         self.close()
@@ -717,6 +1980,7 @@ class Reader:
 
     def close(self) -> None:
         """Close files handles"""
+        self._reopen_pending = False
 
         safe_close(self, "_read_handle")
         self._read_handle = None
@@ -727,11 +1991,16 @@ class Reader:
         safe_close(self, "_signal_handle")
         self._signal_handle = None
 
+        safe_close(self, "_mapping")
+        self._mapping = None
+
         safe_close(self, "_file_reader")
         self._file_reader = None
 
-        # Explicitly clear this dictionary to close file handles used in cache
-        self._cached_signal_batches = {}
+        # Explicitly clear this cache to close file handles used in cache
+        if hasattr(self, "_signal_cache"):
+            self._signal_cache.clear()
+        self._read_id_index = None
 
     @property
     def path(self) -> Path:
@@ -741,6 +2010,7 @@ class Reader:
     @property
     def inner_file_reader(self) -> p5b.Pod5FileReader:
         """Access the inner c_api Pod5FileReader - use with caution"""
+        self._ensure_open()
         if self._file_reader is None:
             raise RuntimeError("Pod5FileReader has been closed!")
         return self._file_reader
@@ -748,23 +2018,23 @@ class Reader:
     @property
     def read_table(self) -> pa.ipc.RecordBatchFileReader:
         """Access the pod5 read table"""
+        self._ensure_open()
         if self._read_handle is None:
             raise RuntimeError("ArrowTableHandle has been closed!")
         return self._read_handle.reader
 
     @property
     def run_info_table(self) -> pa.ipc.RecordBatchFileReader:
-        """Access the pod5 run_info table"""
-        if self._run_info_handle is None:
-            raise RuntimeError("ArrowTableHandle has been closed!")
-        return self._run_info_handle.reader
+        """Access the pod5 run_info table, which is opened on first access"""
+        return self._table_handle("run_info").reader
 
     @property
     def signal_table(self) -> pa.ipc.RecordBatchFileReader:
-        """Access the pod5 signal table - use with caution"""
-        if self._signal_handle is None:
-            raise RuntimeError("ArrowTableHandle has been closed!")
-        return self._signal_handle.reader
+        """
+        Access the pod5 signal table, which is opened on first access - use with
+        caution
+        """
+        return self._table_handle("signal").reader
 
     @property
     def file_version(self) -> packaging.version.Version:
@@ -780,6 +2050,7 @@ class Reader:
 
     @property
     def file_identifier(self) -> UUID:
+        assert self._file_identifier is not None
         return self._file_identifier
 
     @property
@@ -795,6 +2066,50 @@ class Reader:
             ).type.equals(pa.large_binary())
         return self._is_vbz_compressed
 
+    def signal_cache_info(self) -> SignalCacheInfo:
+        """
+        Return the hit, miss and eviction counters and the current size of the
+        signal batch cache used when accessing :py:attr:`ReadRecord.signal`
+
+        Returns
+        -------
+        :py:class:`SignalCacheInfo`
+        """
+        return self._signal_cache.info()
+
+    def memory_usage(self) -> MemoryUsage:
+        """
+        Return the memory held by this reader, to help size the memory of
+        processes reading pod5 files.
+
+        The memory pool may be shared with other readers and writers in the
+        process, so its allocations are not exclusive to this reader.
+
+        Returns
+        -------
+        :py:class:`MemoryUsage`
+        """
+        pool = self.inner_file_reader.memory_pool
+        return MemoryUsage(
+            mapped_bytes=_mapped_resident_bytes(
+                self._path if self._mapping is None else self._mapping.path
+            ),
+            signal_cache_bytes=self._signal_cache.info().current_bytes,
+            loader_bytes=sum(
+                loader.buffered_bytes for loader in list(self._signal_loaders)
+            ),
+            pool_backend=pool.backend_name,
+            pool_bytes_allocated=pool.bytes_allocated,
+            pool_max_memory=pool.max_memory,
+        )
+
+    def _track_signal_loader(
+        self, signal_loader: p5b.Pod5AsyncSignalLoader
+    ) -> p5b.Pod5AsyncSignalLoader:
+        """Record a live signal loader so its buffers are reported by memory_usage"""
+        self._signal_loaders.add(signal_loader)
+        return signal_loader
+
     @property
     def signal_batch_row_count(self) -> int:
         """Return signal batch row count"""
@@ -817,7 +2132,77 @@ class Reader:
         """
         Find the number of reads in the file.
         """
-        return sum(batch.num_reads for batch in self.read_batches())
+        footer_stats = self._footer_stats()
+        if footer_stats is not None:
+            return footer_stats.read_count
+
+        return sum(
+            self.read_table.get_batch(idx).num_rows for idx in range(self.batch_count)
+        )
+
+    @property
+    def stats(self) -> FileStats:
+        """
+        Return the aggregate :py:class:`FileStats` of this file.
+
+        The statistics are read from the file footer when recorded by the writer,
+        otherwise they are computed from the read table columns on first access.
+        """
+        if self._stats is None:
+            self._stats = self._footer_stats()
+        if self._stats is None:
+            self._stats = self._compute_stats()
+        return self._stats
+
+    def _footer_stats(self) -> Optional[FileStats]:
+        """Return the :py:class:`FileStats` recorded in the file footer if present"""
+        footer_stats = self.inner_file_reader.get_file_statistics()
+        if footer_stats is None:
+            return None
+        return FileStats(**footer_stats)
+
+    def _compute_stats(self) -> FileStats:
+        """Compute the :py:class:`FileStats` of this file from the read table"""
+        read_count = 0
+        sample_count = 0
+        min_start_sample: Optional[int] = None
+        max_start_sample: Optional[int] = None
+        run_info_read_counts: Dict[str, int] = {}
+
+        for idx in range(self.batch_count):
+            batch = self.read_table.get_batch(idx)
+            if batch.num_rows == 0:
+                continue
+
+            read_count += batch.num_rows
+            num_samples = batch.column("num_samples").to_numpy()
+            sample_count += int(num_samples.sum(dtype=np.uint64))
+
+            start = batch.column("start").to_numpy()
+            batch_min, batch_max = int(start.min()), int(start.max())
+            if min_start_sample is None or batch_min < min_start_sample:
+                min_start_sample = batch_min
+            if max_start_sample is None or batch_max > max_start_sample:
+                max_start_sample = batch_max
+
+            run_info = batch.column("run_info")
+            counts = np.bincount(
+                run_info.indices.to_numpy(zero_copy_only=False),
+                minlength=len(run_info.dictionary),
+            )
+            for acquisition_id, count in zip(run_info.dictionary.to_pylist(), counts):
+                run_info_read_counts[acquisition_id] = run_info_read_counts.get(
+                    acquisition_id, 0
+                ) + int(count)
+
+        return FileStats(
+            read_count=read_count,
+            sample_count=sample_count,
+            signal_bytes=self.inner_file_reader.get_file_signal_table_location().length,
+            min_start_sample=min_start_sample or 0,
+            max_start_sample=max_start_sample or 0,
+            run_info_read_counts=run_info_read_counts,
+        )
 
     @property
     def read_ids_raw(self) -> pa.ChunkedArray:
@@ -850,6 +2235,93 @@ class Reader:
         )
         return format_read_ids(read_ids)
 
+    def to_table(
+        self,
+        batch_selection: Optional[Iterable[int]] = None,
+        columns: Optional[Iterable[str]] = None,
+    ) -> pa.Table:
+        """
+        Export the read metadata as a single arrow table without creating
+        :py:class:`ReadRecord` instances.
+
+        The dictionary columns (pore_type, end_reason and run_info) are returned
+        resolved to their string values.
+
+        Parameters
+        ----------
+        batch_selection : iterable[int]
+            The read batches to export. All batches are exported by default.
+        columns : iterable[str]
+            The read table columns to export. All columns except for the
+            "signal" row indices are exported by default.
+
+        Returns
+        -------
+        :py:class:`pyarrow.Table` of read metadata
+        """
+        if batch_selection is None:
+            table = self.read_table.read_all()
+        else:
+            table = pa.Table.from_batches(
+                [self.read_table.get_batch(idx) for idx in batch_selection],
+                schema=self.read_table.schema,
+            )
+
+        if columns is None:
+            columns = [name for name in table.column_names if name != "signal"]
+        table = table.select(list(columns))
+
+        for idx, schema_field in enumerate(table.schema):
+            if pa.types.is_dictionary(schema_field.type):
+                decoded = pa.chunked_array(
+                    [chunk.dictionary_decode() for chunk in table.column(idx).chunks],
+                    type=schema_field.type.value_type,
+                )
+                table = table.set_column(idx, schema_field.name, decoded)
+
+        return table
+
+    def to_numpy(
+        self,
+        batch_selection: Optional[Iterable[int]] = None,
+        columns: Optional[Iterable[str]] = None,
+    ) -> Dict[str, npt.NDArray]:
+        """
+        Export the read metadata as a dictionary of numpy arrays keyed by column
+        name without creating :py:class:`ReadRecord` instances.
+
+        The "read_id" column is returned as packed `numpy.ndarray[uint8]` of shape
+        (n, 16) which can be formatted with :py:func:`pod5.api_utils.format_read_ids`.
+        The dictionary columns (pore_type, end_reason and run_info) are returned
+        resolved to their string values. See :py:meth:`Reader.to_table`.
+
+        Parameters
+        ----------
+        batch_selection : iterable[int]
+            The read batches to export. All batches are exported by default.
+        columns : iterable[str]
+            The read table columns to export. All columns except for the
+            "signal" row indices are exported by default.
+
+        Returns
+        -------
+        dict[str, numpy.ndarray] of read metadata
+        """
+        table = self.to_table(batch_selection=batch_selection, columns=columns)
+
+        arrays: Dict[str, npt.NDArray] = {}
+        for name, column in zip(table.column_names, table.columns):
+            if name == "read_id":
+                read_ids = column.combine_chunks()
+                id_buffer = np.frombuffer(read_ids.buffers()[1], dtype=np.uint8)
+                offset = read_ids.offset * 16
+                arrays[name] = id_buffer[offset : offset + len(read_ids) * 16].reshape(
+                    (len(read_ids), 16)
+                )
+            else:
+                arrays[name] = column.to_numpy()
+        return arrays
+
     def get_batch(self, index: int) -> ReadRecordBatch:
         """
         Get a read batch in the file.
@@ -867,6 +2339,8 @@ class Reader:
         batch_selection: Optional[Iterable[int]] = None,
         missing_ok: bool = False,
         preload: Optional[Set[str]] = None,
+        readahead: int = 0,
+        where: Optional[ReadFilter] = None,
     ) -> Generator[ReadRecordBatch, None, None]:
         """
         Iterate batches in the file, optionally selecting certain rows.
@@ -880,29 +2354,56 @@ class Reader:
         missing_ok : bool
             If selection contains entries not found in the file, an error will be raised.
         preload : set[str]
-            Columns to preload - "samples" and "sample_count" are valid values
+            Columns to preload - "samples", "sample_count" and "contiguous_samples"
+            are valid values. "contiguous_samples" loads the samples of each batch
+            into one contiguous buffer, see
+            :py:attr:`ReadRecordBatch.cached_samples_array`
+        readahead : int
+            The number of batches to prefetch ahead of the current batch. The pages
+            of the upcoming read table batches, and the signal table batches they
+            reference, are requested from the operating system in the background
+            while the current batch is processed. See :py:meth:`Reader.readahead_info`
+        where : str or pyarrow.compute.Expression
+            A read filter evaluated over the read table columns before any signal is
+            loaded, see :py:func:`pod5.filters.read_filter_expression`. Only the rows
+            matching the filter are selected, and only batches with matching rows
+            are yielded. Selected batches are walked in file order.
 
         Returns
         -------
         An iterable of :py:class:`ReadRecordBatch` in the file.
         """
-        if selection is not None:
-            if batch_selection is not None:
-                raise ValueError("selection and batch_selection are mutually exclusive")
+        if selection is not None and batch_selection is not None:
+            raise ValueError("selection and batch_selection are mutually exclusive")
+
+        if where is not None:
+            yield from self._iterate_batch_plan(
+                *self._plan_where_batches(
+                    where, selection, batch_selection, missing_ok, preload
+                ),
+                readahead,
+            )
+        elif selection is not None:
             yield from self._select_read_batches(
-                selection, missing_ok=missing_ok, preload=preload
+                list(selection),
+                missing_ok=missing_ok,
+                preload=preload,
+                readahead=readahead,
             )
         elif batch_selection is not None:
-            assert not selection
-            yield from self._read_some_batches(batch_selection, preload=preload)
+            yield from self._read_some_batches(
+                batch_selection, preload=preload, readahead=readahead
+            )
         else:
-            yield from self._reads_batches(preload=preload)
+            yield from self._reads_batches(preload=preload, readahead=readahead)
 
     def reads(
         self,
         selection: Optional[Iterable[str]] = None,
         missing_ok: bool = False,
         preload: Optional[Set[str]] = None,
+        readahead: int = 0,
+        where: Optional[ReadFilter] = None,
     ) -> Generator[ReadRecord, None, None]:
         """
         Iterate reads in the file, optionally filtering for certain read ids.
@@ -914,82 +2415,254 @@ class Reader:
         missing_ok : bool
             If selection contains entries not found in the file, an error will be raised.
         preload : set[str]
-            Columns to preload - "samples" and "sample_count" are valid values
+            Columns to preload - "samples", "sample_count" and "contiguous_samples"
+            are valid values. "contiguous_samples" loads the samples of each batch
+            into one contiguous buffer, see
+            :py:attr:`ReadRecordBatch.cached_samples_array`
+        readahead : int
+            The number of batches to prefetch ahead of the current batch,
+            see :py:meth:`Reader.read_batches`
+        where : str or pyarrow.compute.Expression
+            A read filter evaluated over the read table columns before any signal is
+            loaded, for example ``"channel <= 128 and num_samples > 10000"``.
+            See :py:func:`pod5.filters.read_filter_expression`
 
         Returns
         -------
         An iterable of :py:class:`ReadRecord` in the file.
         """
-        if selection is None:
-            yield from self._reads(preload=preload)
-        else:
-            yield from self._select_reads(
-                list(selection), missing_ok=missing_ok, preload=preload
-            )
-
-    def _reads(
-        self, preload: Optional[Set[str]] = None
-    ) -> Generator[ReadRecord, None, None]:
-        """Generate all reads"""
-        for batch in self.read_batches(preload=preload):
+        for batch in self.read_batches(
+            selection=None if selection is None else list(selection),
+            missing_ok=missing_ok,
+            preload=preload,
+            readahead=readahead,
+            where=where,
+        ):
             for read in batch.reads():
                 yield read
 
-    def _select_reads(
+    async def aread_batches(
         self,
-        selection: List[str],
+        selection: Optional[Iterable[str]] = None,
+        batch_selection: Optional[Iterable[int]] = None,
         missing_ok: bool = False,
         preload: Optional[Set[str]] = None,
-    ) -> Generator[ReadRecord, None, None]:
-        """Generate selected reads"""
-        for batch in self._select_read_batches(selection, missing_ok, preload=preload):
-            for read in batch.reads():
-                yield read
+        where: Optional[ReadFilter] = None,
+    ) -> AsyncGenerator[ReadRecordBatch, None]:
+        """
+        Asynchronously iterate batches in the file, optionally selecting certain
+        rows, see :py:meth:`Reader.read_batches`.
 
-    def _reads_batches(
-        self, preload: Optional[Set[str]] = None
-    ) -> Generator[ReadRecordBatch, None, None]:
-        """Generate the record batches"""
-        signal_cache = None
-        if preload:
-            signal_cache = self.inner_file_reader.batch_get_signal(
-                "samples" in preload,
-                "sample_count" in preload,
+        Preloaded signal is loaded by background worker threads and awaited
+        without blocking the running event loop. Cancelling the iterating task, or
+        closing the generator, stops the worker threads.
+
+        Parameters
+        ----------
+        selection : iterable[str]
+            The read ids to walk in the file.
+        batch_selection : iterable[int]
+            The read batches to walk in the file.
+        missing_ok : bool
+            If selection contains entries not found in the file, an error will be raised.
+        preload : set[str]
+            Columns to preload - "samples", "sample_count" and "contiguous_samples"
+            are valid values.
+        where : str or pyarrow.compute.Expression
+            A read filter evaluated over the read table columns before any signal is
+            loaded, see :py:meth:`Reader.read_batches`
+
+        Returns
+        -------
+        An async iterable of :py:class:`ReadRecordBatch` in the file.
+        """
+        if selection is not None and batch_selection is not None:
+            raise ValueError("selection and batch_selection are mutually exclusive")
+
+        if where is not None:
+            planned = self._plan_where_batches(
+                where, selection, batch_selection, missing_ok, preload
             )
+        elif selection is not None:
+            planned = self._plan_selected_batches(list(selection), missing_ok, preload)
+        elif batch_selection is not None:
+            planned = self._plan_some_batches(batch_selection, preload)
+        else:
+            planned = self._plan_all_batches(preload)
 
-        for idx in range(self.read_table.num_record_batches):
-            batch = self.get_batch(idx)
-            if signal_cache:
-                batch.set_cached_signal(signal_cache.release_next_batch())
+        async for batch in self._aiterate_batch_plan(*planned):
             yield batch
 
+    async def areads(
+        self,
+        selection: Optional[Iterable[str]] = None,
+        missing_ok: bool = False,
+        preload: Optional[Set[str]] = None,
+        where: Optional[ReadFilter] = None,
+    ) -> AsyncGenerator[ReadRecord, None]:
+        """
+        Asynchronously iterate reads in the file, optionally filtering for certain
+        read ids, see :py:meth:`Reader.aread_batches`.
+
+        Parameters
+        ----------
+        selection : iterable[str]
+            The read ids to walk in the file.
+        missing_ok : bool
+            If selection contains entries not found in the file, an error will be raised.
+        preload : set[str]
+            Columns to preload - "samples", "sample_count" and "contiguous_samples"
+            are valid values.
+        where : str or pyarrow.compute.Expression
+            A read filter evaluated over the read table columns before any signal is
+            loaded, see :py:meth:`Reader.reads`
+
+        Returns
+        -------
+        An async iterable of :py:class:`ReadRecord` in the file.
+        """
+        batches = self.aread_batches(
+            selection=selection, missing_ok=missing_ok, preload=preload, where=where
+        )
+        try:
+            async for batch in batches:
+                for read in batch.reads():
+                    yield read
+        finally:
+            await batches.aclose()
+
+    def readahead_info(self) -> ReadaheadInfo:
+        """
+        Return the throughput counters of batches iterated with readahead.
+
+        `fetch_seconds` is the time spent waiting for the next batch and
+        `process_seconds` the time spent by the caller processing batches, during
+        which the `prefetched_bytes` of upcoming batches were read ahead.
+
+        Returns
+        -------
+        :py:class:`ReadaheadInfo`
+        """
+        return self._readahead_counters.info()
+
+    def _reads_batches(
+        self, preload: Optional[Set[str]] = None, readahead: int = 0
+    ) -> Generator[ReadRecordBatch, None, None]:
+        """Generate the record batches"""
+        yield from self._iterate_batch_plan(*self._plan_all_batches(preload), readahead)
+
     def _read_some_batches(
         self,
         batch_selection: Iterable[int],
         preload: Optional[Set[str]] = None,
+        readahead: int = 0,
     ) -> Generator[ReadRecordBatch, None, None]:
         """Generate the selected record batches"""
-        signal_cache = None
-        if preload:
-            signal_cache = self.inner_file_reader.batch_get_signal_batches(
-                "samples" in preload,
-                "sample_count" in preload,
-                np.array(batch_selection, dtype=np.uint32),
-            )
-
-        for i in batch_selection:
-            batch = self.get_batch(i)
-            if signal_cache:
-                batch.set_cached_signal(signal_cache.release_next_batch())
-            yield batch
+        yield from self._iterate_batch_plan(
+            *self._plan_some_batches(batch_selection, preload), readahead
+        )
 
     def _select_read_batches(
         self,
         selection: List[str],
         missing_ok: bool = False,
         preload: Optional[Set[str]] = None,
+        readahead: int = 0,
     ) -> Generator[ReadRecordBatch, None, None]:
         """Generate the selected record batches"""
+        yield from self._iterate_batch_plan(
+            *self._plan_selected_batches(selection, missing_ok, preload), readahead
+        )
+
+    def _read_planned_batches(
+        self,
+        per_batch_counts: npt.NDArray[np.uint32],
+        batch_rows: npt.NDArray[np.uint32],
+        preload: Optional[Set[str]] = None,
+        readahead: int = 0,
+        where: Optional[ReadFilter] = None,
+    ) -> Generator[ReadRecordBatch, None, None]:
+        """
+        Generate the record batches selecting the batch rows of a traversal plan
+        as returned by :py:meth:`Reader._plan_traversal`. If a read filter is given
+        only the batches with matching rows are generated.
+        """
+        if where is None:
+            planned = self._plan_traversal_batches(
+                per_batch_counts, batch_rows, preload
+            )
+        else:
+            plan, _ = self._plan_traversal_batches(per_batch_counts, batch_rows, None)
+            planned = self._plan_filtered_batches(plan, where, preload)
+        yield from self._iterate_batch_plan(*planned, readahead)
+
+    def _read_planned_batch(
+        self,
+        batch_idx: int,
+        batch_rows: Optional[npt.NDArray[np.uint32]],
+        preload: Optional[Set[str]] = None,
+        where: Optional[ReadFilter] = None,
+    ) -> Optional[ReadRecordBatch]:
+        """
+        Read a single record batch, selecting its batch rows if given. If a read
+        filter is given None is returned when none of the rows match.
+        """
+        plan: List[Tuple[int, Optional[npt.NDArray[np.uint32]]]] = [
+            (batch_idx, batch_rows)
+        ]
+        if where is not None:
+            planned = self._plan_filtered_batches(plan, where, preload)
+        elif batch_rows is None:
+            planned = self._plan_some_batches([batch_idx], preload)
+        else:
+            planned = self._plan_row_batches(plan, preload)
+        batches = list(self._iterate_batch_plan(*planned, 0))
+        return batches[0] if batches else None
+
+    def _plan_all_batches(self, preload: Optional[Set[str]]) -> _BatchPlan:
+        """Plan iterating all record batches"""
+        signal_cache = None
+        if preload:
+            samples, sample_count, contiguous = _signal_loader_flags(preload)
+            signal_cache = self._track_signal_loader(
+                self.inner_file_reader.batch_get_signal(
+                    samples, sample_count, contiguous=contiguous
+                )
+            )
+
+        plan: List[Tuple[int, Optional[npt.NDArray[np.uint32]]]] = [
+            (idx, None) for idx in range(self.read_table.num_record_batches)
+        ]
+        return plan, signal_cache
+
+    def _plan_some_batches(
+        self, batch_selection: Iterable[int], preload: Optional[Set[str]]
+    ) -> _BatchPlan:
+        """Plan iterating the selected record batches"""
+        batch_selection = list(batch_selection)
+        signal_cache = None
+        if preload:
+            samples, sample_count, contiguous = _signal_loader_flags(preload)
+            signal_cache = self._track_signal_loader(
+                # Loaders release signal in file order, which the batches are
+                # taken from in the selected order
+                self.inner_file_reader.batch_get_signal_batches(
+                    samples,
+                    sample_count,
+                    np.array(sorted(set(batch_selection)), dtype=np.uint32),
+                    contiguous=contiguous,
+                )
+            )
+
+        plan: List[Tuple[int, Optional[npt.NDArray[np.uint32]]]] = [
+            (idx, None) for idx in batch_selection
+        ]
+        return plan, signal_cache
+
+    def _plan_selected_batches(
+        self, selection: List[str], missing_ok: bool, preload: Optional[Set[str]]
+    ) -> _BatchPlan:
+        """Plan iterating the record batches holding the selected read ids"""
         successful_finds, per_batch_counts, batch_rows = self._plan_traversal(
             selection, missing_ok=missing_ok
         )
@@ -999,27 +2672,166 @@ class Reader:
                 f"Failed to find {len(selection) - successful_finds} requested reads in the file"
             )
 
+        return self._plan_traversal_batches(per_batch_counts, batch_rows, preload)
+
+    def _plan_traversal_batches(
+        self,
+        per_batch_counts: npt.NDArray[np.uint32],
+        batch_rows: npt.NDArray[np.uint32],
+        preload: Optional[Set[str]],
+    ) -> _BatchPlan:
+        """Plan iterating the record batches of a traversal plan"""
         signal_cache: Optional[p5b.Pod5AsyncSignalLoader] = None
         if preload:
-            signal_cache = self.inner_file_reader.batch_get_signal_selection(
-                "samples" in preload,
-                "sample_count" in preload,
-                per_batch_counts,
-                batch_rows,
+            samples, sample_count, contiguous = _signal_loader_flags(preload)
+            signal_cache = self._track_signal_loader(
+                self.inner_file_reader.batch_get_signal_selection(
+                    samples,
+                    sample_count,
+                    per_batch_counts,
+                    batch_rows,
+                    contiguous=contiguous,
+                )
             )
 
-        current_offset = 0
-        for batch_idx, batch_count in enumerate(per_batch_counts):
-            current_batch_rows = batch_rows[
-                current_offset : current_offset + batch_count
-            ]
-            current_offset += batch_count
+        batch_offsets = np.cumsum(per_batch_counts, dtype=np.uint64) - per_batch_counts
+        plan: List[Tuple[int, Optional[npt.NDArray[np.uint32]]]] = [
+            (batch_idx, batch_rows[offset : offset + count])
+            for batch_idx, (offset, count) in enumerate(
+                zip(batch_offsets, per_batch_counts)
+            )
+        ]
+        return plan, signal_cache
 
-            batch = self.get_batch(batch_idx)
-            batch.set_selected_batch_rows(current_batch_rows)
-            if signal_cache:
-                batch.set_cached_signal(signal_cache.release_next_batch())
-            yield batch
+    def _plan_where_batches(
+        self,
+        where: ReadFilter,
+        selection: Optional[Iterable[str]],
+        batch_selection: Optional[Iterable[int]],
+        missing_ok: bool,
+        preload: Optional[Set[str]],
+    ) -> _BatchPlan:
+        """Plan iterating the rows of the selected record batches matching `where`"""
+        if selection is not None:
+            plan, _ = self._plan_selected_batches(list(selection), missing_ok, None)
+        elif batch_selection is not None:
+            # Filtered signal is loaded in file order, so walk batches in file order
+            plan = [(idx, None) for idx in sorted(set(batch_selection))]
+        else:
+            plan, _ = self._plan_all_batches(None)
+        return self._plan_filtered_batches(plan, where, preload)
+
+    def _plan_filtered_batches(
+        self,
+        plan: Sequence[Tuple[int, Optional[npt.NDArray[np.uint32]]]],
+        where: ReadFilter,
+        preload: Optional[Set[str]],
+    ) -> _BatchPlan:
+        """
+        Filter the rows of a plan (in file order) by evaluating the read filter
+        `where` over each planned read table batch, dropping batches without
+        matching rows. Signal is only preloaded for the matching rows.
+        """
+        expression = read_filter_expression(where)
+
+        filtered_plan: List[Tuple[int, Optional[npt.NDArray[np.uint32]]]] = []
+        for batch_idx, batch_rows in plan:
+            if batch_rows is not None and len(batch_rows) == 0:
+                continue
+            rows = matching_batch_rows(
+                self.read_table.get_batch(batch_idx), expression, batch_rows
+            )
+            if len(rows) > 0:
+                filtered_plan.append((batch_idx, rows))
+        return self._plan_row_batches(filtered_plan, preload)
+
+    def _plan_row_batches(
+        self,
+        plan: List[Tuple[int, Optional[npt.NDArray[np.uint32]]]],
+        preload: Optional[Set[str]],
+    ) -> _BatchPlan:
+        """
+        Plan iterating the selected rows of record batches given in file order,
+        preloading the signal of only those rows
+        """
+        selected_rows: List[npt.NDArray[np.uint32]] = [np.empty(0, dtype=np.uint32)]
+        per_batch_counts = np.zeros(self.batch_count, dtype=np.uint32)
+        for batch_idx, rows in plan:
+            assert rows is not None
+            selected_rows.append(rows)
+            per_batch_counts[batch_idx] = len(rows)
+
+        signal_cache: Optional[p5b.Pod5AsyncSignalLoader] = None
+        if preload:
+            samples, sample_count, contiguous = _signal_loader_flags(preload)
+            signal_cache = self._track_signal_loader(
+                self.inner_file_reader.batch_get_signal_selection(
+                    samples,
+                    sample_count,
+                    per_batch_counts,
+                    np.concatenate(selected_rows),
+                    contiguous=contiguous,
+                )
+            )
+        return plan, signal_cache
+
+    def _planned_batch(
+        self, batch_idx: int, batch_rows: Optional[npt.NDArray[np.uint32]]
+    ) -> ReadRecordBatch:
+        """Get a planned record batch, selecting its batch rows if given"""
+        batch = self.get_batch(batch_idx)
+        if batch_rows is not None:
+            batch.set_selected_batch_rows(batch_rows)
+        return batch
+
+    def _iterate_batch_plan(
+        self,
+        plan: Sequence[Tuple[int, Optional[npt.NDArray[np.uint32]]]],
+        signal_cache: Optional[p5b.Pod5AsyncSignalLoader],
+        readahead: int,
+    ) -> Generator[ReadRecordBatch, None, None]:
+        """Generate the record batches of a plan, with signal from the signal cache"""
+        planned_signal = _PlannedSignal(plan)
+        with _BatchReadahead(self, plan, readahead) as prefetcher:
+            for position, (batch_idx, batch_rows) in enumerate(plan):
+                batch = self._planned_batch(batch_idx, batch_rows)
+                if signal_cache:
+                    batch.set_cached_signal(
+                        _release_planned_signal(signal_cache, planned_signal, batch_idx)
+                    )
+                with prefetcher.yielding(position):
+                    yield batch
+
+    async def _aiterate_batch_plan(
+        self,
+        plan: Sequence[Tuple[int, Optional[npt.NDArray[np.uint32]]]],
+        signal_cache: Optional[p5b.Pod5AsyncSignalLoader],
+    ) -> AsyncGenerator[ReadRecordBatch, None]:
+        """
+        Generate the record batches of a plan, awaiting signal from the signal
+        cache without blocking the running event loop
+        """
+        if signal_cache is None:
+            for batch_idx, batch_rows in plan:
+                # Batches without preloaded signal are memory-mapped, so only
+                # yield control to other tasks between them
+                await asyncio.sleep(0)
+                yield self._planned_batch(batch_idx, batch_rows)
+            return
+
+        planned_signal = _PlannedSignal(plan)
+        waiter = _AsyncSignalLoaderWaiter(signal_cache)
+        try:
+            for batch_idx, batch_rows in plan:
+                cached_signal = planned_signal.take(batch_idx)
+                while cached_signal is None:
+                    planned_signal.add(await waiter.release_next_batch())
+                    cached_signal = planned_signal.take(batch_idx)
+                batch = self._planned_batch(batch_idx, batch_rows)
+                batch.set_cached_signal(cached_signal)
+                yield batch
+        finally:
+            waiter.close()
 
     def _plan_traversal(
         self,
@@ -1051,6 +2863,10 @@ class Reader:
 
         assert isinstance(read_ids, np.ndarray)
 
+        read_id_index = self._load_read_id_index()
+        if read_id_index is not None:
+            return read_id_index.search(read_ids)
+
         batch_rows = np.empty(dtype="u4", shape=read_ids.shape[0])
         per_batch_counts = np.empty(dtype="u4", shape=self.batch_count)
 
@@ -1062,47 +2878,158 @@ class Reader:
 
         return successful_find_count, per_batch_counts, batch_rows
 
+    def read_id_index(self) -> ReadIdIndex:
+        """
+        Return the :py:class:`pod5.read_id_index.ReadIdIndex` of this file,
+        memory-mapping its sidecar if one exists or building it otherwise.
+
+        Returns
+        -------
+        :py:class:`pod5.read_id_index.ReadIdIndex`
+        """
+        read_id_index = self._load_read_id_index()
+        if read_id_index is None:
+            read_id_index = self.build_read_id_index()
+        return read_id_index
+
+    def build_read_id_index(self) -> ReadIdIndex:
+        """
+        Build a sorted :py:class:`pod5.read_id_index.ReadIdIndex` of all read ids
+        in this file.
+
+        Returns
+        -------
+        :py:class:`pod5.read_id_index.ReadIdIndex`
+        """
+        batch_sizes = np.array(
+            [
+                self.read_table.get_batch(idx).num_rows
+                for idx in range(self.batch_count)
+            ],
+            dtype=np.uint32,
+        )
+        read_ids = self.to_numpy(columns=["read_id"])["read_id"]
+        return ReadIdIndex.from_read_ids(self.file_identifier, read_ids, batch_sizes)
+
+    def write_read_id_index(self, path: Optional[PathOrStr] = None) -> Path:
+        """
+        Build and write a read id index sidecar for this file. When the sidecar is
+        found next to the pod5 file, selecting reads by read id memory-maps the
+        index instead of sorting all read ids in the file on each open.
+
+        Parameters
+        ----------
+        path : os.PathLike, str
+            Optional output path. Defaults to the pod5 file path with an additional
+            ".idx" suffix which is found automatically when reading.
+
+        Returns
+        -------
+        The path to the written read id index
+        """
+        index_path = read_id_index_path(self._path) if path is None else Path(path)
+        self.build_read_id_index().save(index_path)
+
+        # Pick up the new sidecar on the next traversal
+        self._read_id_index_checked = False
+        return index_path
+
+    def _load_read_id_index(self) -> Optional[ReadIdIndex]:
+        """
+        Memory-map the read id index sidecar for this file if one exists.
+        Sidecars which do not match this file are ignored.
+        """
+        if self._read_id_index_checked:
+            return self._read_id_index
+        self._read_id_index_checked = True
+
+        index_path = read_id_index_path(self._path)
+        if not index_path.is_file():
+            return None
+
+        try:
+            read_id_index = ReadIdIndex.load(index_path, self.file_identifier)
+        except Pod5ApiException:
+            return None
+
+        if read_id_index.batch_count != self.batch_count:
+            return None
+
+        self._read_id_index = read_id_index
+        return self._read_id_index
+
     def _get_signal_batch(self, batch_id: int) -> Signal:
         """Get the :py:class:`Signal` from the signal_reader batch at batch_id"""
-        if batch_id in self._cached_signal_batches:
-            return self._cached_signal_batches[batch_id]
+        signal_batch = self._signal_cache.get(batch_id)
+        if signal_batch is not None:
+            return signal_batch
 
         batch = self.signal_table.get_batch(batch_id)
 
         signal_batch = Signal(*[batch.column(name) for name in Signal._fields])
 
-        self._cached_signal_batches[batch_id] = signal_batch
+        self._signal_cache.put(batch_id, signal_batch)
         return signal_batch
 
-    def _lookup_run_info(self, batch: ReadRecordBatch, batch_row_id: int) -> RunInfo:
-        """Get the :py:class:`RunInfo` from the batch at batch_row_id"""
-
-        acquisition_id = batch.columns.run_info[batch_row_id].as_py()
+    def run_infos(self) -> Dict[str, RunInfo]:
+        """
+        Decode every :py:class:`RunInfo` in the run info table in a single pass.
 
-        if acquisition_id in self._cached_run_infos:
-            return self._cached_run_infos[acquisition_id]
+        The returned :py:class:`RunInfo` instances are immutable and are shared
+        with the records yielded by this reader.
 
-        run_info = None
+        Returns
+        -------
+        dict[str, :py:class:`RunInfo`]
+            All run infos in this file keyed by their acquisition_id
+        """
+        run_infos: Dict[str, RunInfo] = {}
         for idx in range(self.run_info_table.num_record_batches):
             run_info_batch = self.run_info_table.get_batch(idx)
-            acquisition_id_col = run_info_batch.column("acquisition_id")
-            for row in range(run_info_batch.num_rows):
-                if acquisition_id_col[row].as_py() == acquisition_id:
-                    values = {}
-                    for field in fields(RunInfo):
-                        col = run_info_batch.column(field.name)
-                        values[field.name] = col[row].as_py()
+            for row in run_info_batch.to_pylist():
+                acquisition_id = row["acquisition_id"]
+                if acquisition_id in run_infos:
+                    continue
+                run_infos[acquisition_id] = self._cached_run_infos.setdefault(
+                    acquisition_id, _make_run_info(row)
+                )
 
-                        if field.name in ("tracking_id", "context_tags"):
-                            values[field.name] = {k: v for k, v in values[field.name]}
+        return run_infos
 
-                    run_info = RunInfo(**values)
-                    break
+    def _get_run_info_rows(self) -> Dict[str, Tuple[int, int]]:
+        """
+        Return the (batch, row) in the run info table of each acquisition_id,
+        building the map on first use
+        """
+        if self._run_info_rows is None:
+            run_info_rows: Dict[str, Tuple[int, int]] = {}
+            for idx in range(self.run_info_table.num_record_batches):
+                acquisition_ids = self.run_info_table.get_batch(idx).column(
+                    "acquisition_id"
+                )
+                for row, acquisition_id in enumerate(acquisition_ids.to_pylist()):
+                    run_info_rows.setdefault(acquisition_id, (idx, row))
+            self._run_info_rows = run_info_rows
+
+        return self._run_info_rows
+
+    def _lookup_run_info(self, batch: ReadRecordBatch, batch_row_id: int) -> RunInfo:
+        """Get the :py:class:`RunInfo` from the batch at batch_row_id"""
 
-        if not run_info:
+        acquisition_id = batch._values["run_info"][batch_row_id]
+
+        if acquisition_id in self._cached_run_infos:
+            return self._cached_run_infos[acquisition_id]
+
+        location = self._get_run_info_rows().get(acquisition_id)
+        if location is None:
             raise Exception(
                 f"Failed to find run info '{acquisition_id}' in run info table"
             )
 
+        run_info_batch = self.run_info_table.get_batch(location[0])
+        row = run_info_batch.slice(location[1], 1)
+        run_info = _make_run_info(row.to_pylist()[0])
+
         self._cached_run_infos[acquisition_id] = run_info
         return run_info
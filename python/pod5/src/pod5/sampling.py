@@ -0,0 +1,532 @@
+"""
+Tools for sampling fixed length windows of signal across POD5 files for training
+"""
+
+import os
+from collections import OrderedDict, namedtuple
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Generator, Iterable, List, Optional, Tuple, Union
+
+import lib_pod5 as p5b
+import numpy as np
+import numpy.typing as npt
+
+from pod5.dataset import DEFAULT_DATASET_THREADS, DEFAULT_MAX_OPEN_READERS, Dataset
+from pod5.pod5_types import PathOrStr
+from pod5.reader import Reader
+from pod5.signal_tools import _signal_batch_data
+
+#: A set of sampled signal windows, given by the file index, the read table row
+#: within that file and the first sample of each window
+SampledWindows = namedtuple("SampledWindows", ["files", "reads", "offsets"])
+
+# The signal chunks of a single file. Chunk arrays are indexed by signal table row
+# and slot arrays list the signal table rows of each read in read table order.
+_FileChunks = namedtuple(
+    "_FileChunks",
+    [
+        "compressed",
+        "signal_batch_count",
+        "chunk_batches",
+        "chunk_byte_begins",
+        "chunk_byte_ends",
+        "chunk_sample_counts",
+        "read_slot_counts",
+        "slot_rows",
+        "calibration_offsets",
+        "calibration_scales",
+    ],
+)
+
+
+def _concatenate(arrays: List[npt.NDArray], dtype) -> npt.NDArray:
+    """Concatenate `arrays` as `dtype`, allowing for an empty list of arrays"""
+    if not arrays:
+        return np.empty(0, dtype=dtype)
+    return np.concatenate(arrays).astype(dtype, copy=False)
+
+
+def _index_file_chunks(path: Path) -> _FileChunks:
+    """Index the signal chunks of every read in the pod5 file at `path`"""
+    with Reader(path) as reader:
+        chunk_batches = []
+        chunk_byte_offsets = []
+        chunk_sample_counts = []
+        for batch_idx in range(reader.signal_table.num_record_batches):
+            batch = reader.signal_table.get_batch(batch_idx)
+            _, offsets = _signal_batch_data(batch.column("signal"))
+            chunk_batches.append(np.full(batch.num_rows, batch_idx, dtype=np.uint32))
+            chunk_byte_offsets.append(offsets)
+            chunk_sample_counts.append(batch.column("samples").to_numpy())
+
+        read_slot_counts = []
+        slot_rows = []
+        for batch_idx in range(reader.read_table.num_record_batches):
+            signal = reader.read_table.get_batch(batch_idx).column("signal")
+            read_slot_counts.append(signal.value_lengths().to_numpy())
+            slot_rows.append(signal.flatten().to_numpy())
+
+        calibration = reader.to_numpy(
+            columns=["calibration_offset", "calibration_scale"]
+        )
+
+        return _FileChunks(
+            compressed=reader.is_vbz_compressed,
+            signal_batch_count=reader.signal_table.num_record_batches,
+            chunk_batches=_concatenate(chunk_batches, np.uint32),
+            chunk_byte_begins=_concatenate(
+                [offsets[:-1] for offsets in chunk_byte_offsets], np.uint64
+            ),
+            chunk_byte_ends=_concatenate(
+                [offsets[1:] for offsets in chunk_byte_offsets], np.uint64
+            ),
+            chunk_sample_counts=_concatenate(chunk_sample_counts, np.uint32),
+            read_slot_counts=_concatenate(read_slot_counts, np.uint64),
+            slot_rows=_concatenate(slot_rows, np.uint64),
+            calibration_offsets=calibration["calibration_offset"].astype(np.float32),
+            calibration_scales=calibration["calibration_scale"].astype(np.float32),
+        )
+
+
+class _SignalChunkIndex:
+    """
+    The signal chunks of every read across a set of pod5 files as flat arrays.
+
+    Reads are numbered across all files in file order and each read owns a
+    contiguous range of chunk "slots". Slots hold the signal buffer, byte range
+    and sample count of each chunk, where the signal buffers are the signal table
+    batches of all files numbered in file order.
+    """
+
+    def __init__(self, paths: List[Path], threads: int):
+        with ThreadPoolExecutor(max_workers=threads) as executor:
+            files = list(executor.map(_index_file_chunks, paths))
+
+        self.paths = paths
+        self.file_compressed = np.array([f.compressed for f in files], dtype=np.bool_)
+        self.file_buffer_starts = np.zeros(len(files) + 1, dtype=np.uint64)
+        np.cumsum(
+            [f.signal_batch_count for f in files], out=self.file_buffer_starts[1:]
+        )
+        self.buffer_compressed = np.repeat(
+            self.file_compressed, [f.signal_batch_count for f in files]
+        ).astype(np.uint8)
+        self.file_read_starts = np.zeros(len(files) + 1, dtype=np.uint64)
+        np.cumsum(
+            [len(f.read_slot_counts) for f in files], out=self.file_read_starts[1:]
+        )
+
+        self.read_files = _concatenate(
+            [
+                np.full(len(f.read_slot_counts), idx, dtype=np.uint32)
+                for idx, f in enumerate(files)
+            ],
+            np.uint32,
+        )
+        self.read_rows = _concatenate(
+            [np.arange(len(f.read_slot_counts), dtype=np.uint64) for f in files],
+            np.uint64,
+        )
+        self.calibration_offsets = _concatenate(
+            [f.calibration_offsets for f in files], np.float32
+        )
+        self.calibration_scales = _concatenate(
+            [f.calibration_scales for f in files], np.float32
+        )
+
+        self.slot_buffers = _concatenate(
+            [
+                f.chunk_batches[f.slot_rows] + np.uint32(self.file_buffer_starts[idx])
+                for idx, f in enumerate(files)
+            ],
+            np.uint32,
+        )
+        self.slot_byte_begins = _concatenate(
+            [f.chunk_byte_begins[f.slot_rows] for f in files], np.uint64
+        )
+        self.slot_byte_ends = _concatenate(
+            [f.chunk_byte_ends[f.slot_rows] for f in files], np.uint64
+        )
+        self.slot_sample_counts = _concatenate(
+            [f.chunk_sample_counts[f.slot_rows] for f in files], np.uint32
+        )
+        self.slot_sample_ends = np.cumsum(self.slot_sample_counts, dtype=np.uint64)
+
+        # Reads are addressed by their first sample in the concatenated signal
+        read_slot_offsets = np.zeros(len(self.read_files) + 1, dtype=np.uint64)
+        np.cumsum(
+            _concatenate([f.read_slot_counts for f in files], np.uint64),
+            out=read_slot_offsets[1:],
+        )
+        sample_ends = np.concatenate([[0], self.slot_sample_ends]).astype(np.uint64)
+        self.read_sample_starts = sample_ends[read_slot_offsets[:-1]]
+        self.read_sample_counts = sample_ends[read_slot_offsets[1:]] - (
+            self.read_sample_starts
+        )
+
+
+class WindowSampler:
+    """
+    Sample fixed length windows of signal from the reads of one or more pod5
+    files, for example to train models.
+
+    Reads are sampled with probability proportional to their number of samples
+    and windows are placed uniformly within each read, skipping reads shorter than
+    the window. Sampled windows are filled into one preallocated
+    (windows, window_length) array, decoding only the signal chunks overlapping
+    each window. Windows are decoded in parallel by the native library.
+
+    The chunks of every read are indexed as flat arrays, so sampling and filling
+    windows creates no per-read python objects. Samplers can be sharded so that
+    each worker (e.g. of a data loader) samples from a disjoint subset of reads
+    with its own random stream, and can be pickled to be sent to worker processes
+    where files are reopened on first use. A bounded number of files are kept
+    open, closing the least recently used::
+
+        sampler = WindowSampler(paths, window_length=4096, seed=1)
+        worker_sampler = sampler.shard(worker_id, num_workers)
+        for signal, windows in worker_sampler.batches(batch_size=64):
+            ...
+    """
+
+    def __init__(
+        self,
+        paths: Union[PathOrStr, Iterable[PathOrStr]],
+        window_length: int,
+        seed: Optional[int] = None,
+        shard: int = 0,
+        num_shards: int = 1,
+        recursive: bool = False,
+        threads: int = DEFAULT_DATASET_THREADS,
+        max_open_readers: int = DEFAULT_MAX_OPEN_READERS,
+    ):
+        """
+        Index the signal of the pod5 files at `paths` for sampling
+
+        Parameters
+        ----------
+        paths : os.PathLike, str or iterable of these
+            The pod5 files to sample from. Directories are searched for files
+            matching "*.pod5".
+        window_length : int
+            The number of samples in each window
+        seed : int
+            The seed of the random stream, windows are sampled non-deterministically
+            if not given
+        shard : int
+            The index of the shard of reads to sample from
+        num_shards : int
+            The number of disjoint shards the reads are split into
+        recursive : bool
+            Search directories recursively
+        threads : int
+            The number of files indexed concurrently
+        max_open_readers : int
+            The maximum number of :py:class:`Reader` handles held open by the
+            sampler, besides those of the files a single fill decodes from
+        """
+        if window_length < 1:
+            raise ValueError(f"window_length must be at least 1, got: {window_length}")
+        if threads < 1:
+            raise ValueError("threads must be at least 1")
+        if max_open_readers < 1:
+            raise ValueError("max_open_readers must be at least 1")
+
+        if isinstance(paths, (str, os.PathLike)):
+            paths = [paths]
+        index = _SignalChunkIndex(Dataset._collect_paths(paths, recursive), threads)
+        eligible = np.flatnonzero(index.read_sample_counts >= window_length)
+        self._max_open_readers = max_open_readers
+        self._init_shard(index, window_length, seed, (), eligible, shard, num_shards)
+
+    def _init_shard(
+        self,
+        index: _SignalChunkIndex,
+        window_length: int,
+        seed: Optional[int],
+        spawn_key: Tuple[int, ...],
+        reads: npt.NDArray[np.int64],
+        shard: int,
+        num_shards: int,
+    ) -> None:
+        """
+        Select the shard of the `reads` of the `index` and seed its random stream
+        as that shard of the stream at `spawn_key`
+        """
+        if num_shards < 1 or not 0 <= shard < num_shards:
+            raise ValueError(f"Invalid shard {shard} of {num_shards} shards")
+
+        self._index = index
+        self._window_length = window_length
+        self._seed = seed
+        self._spawn_key = spawn_key + (shard,)
+
+        self._reads = reads[shard::num_shards]
+        self._cumulative_samples = np.cumsum(
+            index.read_sample_counts[self._reads], dtype=np.uint64
+        )
+        self._rng = np.random.default_rng(
+            np.random.SeedSequence(seed, spawn_key=self._spawn_key)
+        )
+
+        self._readers: "OrderedDict[int, Reader]" = OrderedDict()
+        self._buffers: List[npt.NDArray[np.uint8]] = []
+
+    def shard(self, shard: int, num_shards: int) -> "WindowSampler":
+        """
+        Return a sampler over a disjoint shard of the reads of this sampler, with
+        its own random stream derived from the same seed. The file index is shared
+        rather than rebuilt and sharding a shard splits only the reads of that shard.
+
+        Parameters
+        ----------
+        shard : int
+            The index of the shard, e.g. the data loader worker id
+        num_shards : int
+            The number of shards, e.g. the number of data loader workers
+
+        Returns
+        -------
+        :py:class:`WindowSampler`
+        """
+        sampler = WindowSampler.__new__(WindowSampler)
+        sampler._max_open_readers = self._max_open_readers
+        sampler._init_shard(
+            self._index,
+            self._window_length,
+            self._seed,
+            self._spawn_key,
+            self._reads,
+            shard,
+            num_shards,
+        )
+        return sampler
+
+    def __getstate__(self) -> dict:
+        state = self.__dict__.copy()
+        state["_readers"] = OrderedDict()
+        state["_buffers"] = []
+        return state
+
+    def __enter__(self) -> "WindowSampler":
+        return self
+
+    def __exit__(self, *exc_details) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Close the files opened to fill windows, they are reopened when required"""
+        for reader in self._readers.values():
+            reader.close()
+        self._readers = OrderedDict()
+        self._buffers = []
+
+    @property
+    def paths(self) -> List[Path]:
+        """Return the paths to the pod5 files sampled from"""
+        return list(self._index.paths)
+
+    @property
+    def window_length(self) -> int:
+        """Return the number of samples in each window"""
+        return self._window_length
+
+    @property
+    def num_reads(self) -> int:
+        """Return the number of reads in this shard long enough to be sampled"""
+        return len(self._reads)
+
+    def sample(self, count: int) -> SampledWindows:
+        """
+        Sample `count` windows from the reads of this shard.
+
+        Returns
+        -------
+        :py:class:`SampledWindows`
+            The file index, read table row and first sample of each window
+        """
+        if self.num_reads == 0:
+            raise ValueError(
+                f"No reads with at least {self._window_length} samples to sample from"
+            )
+
+        total_samples = self._cumulative_samples[-1]
+        picks = np.searchsorted(
+            self._cumulative_samples,
+            self._rng.integers(0, total_samples, size=count, dtype=np.uint64),
+            side="right",
+        )
+        reads = self._reads[picks]
+        last_offsets = self._index.read_sample_counts[reads] - self._window_length
+        offsets = self._rng.integers(0, last_offsets.astype(np.int64) + 1, size=count)
+
+        return SampledWindows(
+            files=self._index.read_files[reads],
+            reads=self._index.read_rows[reads].astype(np.int64),
+            offsets=offsets,
+        )
+
+    def fill(
+        self,
+        windows: SampledWindows,
+        out: Optional[npt.NDArray] = None,
+        pico_amps: bool = False,
+    ) -> npt.NDArray:
+        """
+        Decode the signal of `windows` into one (windows, window_length) array,
+        decoding only the signal chunks which overlap each window.
+
+        Parameters
+        ----------
+        windows : :py:class:`SampledWindows`
+            The windows to decode, as returned by :py:meth:`WindowSampler.sample`
+        out : numpy.ndarray
+            A C-contiguous (windows, window_length) array to decode into, of int16
+            or of float32 when `pico_amps` is set. A new array is allocated if not
+            given.
+        pico_amps : bool
+            Calibrate the signal to pico amps
+
+        Returns
+        -------
+        numpy.ndarray[int16] or numpy.ndarray[float32]
+            The signal of each window
+        """
+        index = self._index
+        length = self._window_length
+        if np.any(np.asarray(windows.offsets) < 0):
+            raise ValueError("Signal windows must have non-negative offsets")
+        files = np.asarray(windows.files, dtype=np.uint64)
+        offsets = np.asarray(windows.offsets, dtype=np.uint64)
+        reads = index.file_read_starts[files] + np.asarray(windows.reads, np.uint64)
+        count = len(reads)
+
+        dtype = np.float32 if pico_amps else np.int16
+        if out is None:
+            out = np.empty((count, length), dtype=dtype)
+        elif (
+            out.shape != (count, length)
+            or out.dtype != dtype
+            or not out.flags.c_contiguous
+        ):
+            raise ValueError(
+                f"out must be a C-contiguous {np.dtype(dtype)} array of shape "
+                f"{(count, length)}, got: {out.dtype} {out.shape}"
+            )
+        if np.any(offsets + length > index.read_sample_counts[reads]):
+            raise ValueError("Signal windows exceed the samples of their reads")
+
+        # Find the range of chunk slots overlapping each window
+        window_starts = index.read_sample_starts[reads] + offsets
+        first_slots = np.searchsorted(index.slot_sample_ends, window_starts, "right")
+        last_slots = np.searchsorted(
+            index.slot_sample_ends, window_starts + np.uint64(length - 1), "right"
+        )
+        slot_counts = last_slots - first_slots + 1
+        window_chunk_offsets = np.zeros(count + 1, dtype=np.int64)
+        np.cumsum(slot_counts, out=window_chunk_offsets[1:])
+        slots = np.arange(window_chunk_offsets[-1]) + np.repeat(
+            first_slots - window_chunk_offsets[:-1], slot_counts
+        )
+        window_first_samples = window_starts - (
+            index.slot_sample_ends[first_slots] - index.slot_sample_counts[first_slots]
+        )
+
+        chunk_args = (
+            self._signal_buffers(np.unique(files)),
+            index.buffer_compressed,
+            index.slot_buffers[slots],
+            index.slot_byte_begins[slots],
+            index.slot_byte_ends[slots],
+            index.slot_sample_counts[slots],
+            window_chunk_offsets.astype(np.uint64),
+            window_first_samples,
+        )
+
+        if pico_amps:
+            calibration_offsets = index.calibration_offsets[reads]
+            calibration_scales = index.calibration_scales[reads]
+            p5b.decode_signal_windows_pa(
+                *chunk_args, calibration_offsets, calibration_scales, length, out
+            )
+            return out
+
+        p5b.decode_signal_windows(*chunk_args, length, out)
+        return out
+
+    def batches(
+        self,
+        batch_size: int,
+        count: Optional[int] = None,
+        pico_amps: bool = False,
+    ) -> Generator[Tuple[npt.NDArray, SampledWindows], None, None]:
+        """
+        Sample and fill batches of windows.
+
+        Parameters
+        ----------
+        batch_size : int
+            The number of windows in each batch
+        count : int
+            The number of batches to generate, batches are generated indefinitely
+            if not given
+        pico_amps : bool
+            Calibrate the signal to pico amps
+
+        Returns
+        -------
+        An iterable of the (batch_size, window_length) signal array of each batch
+        with the :py:class:`SampledWindows` it was filled from
+        """
+        generated = 0
+        while count is None or generated < count:
+            windows = self.sample(batch_size)
+            yield self.fill(windows, pico_amps=pico_amps), windows
+            generated += 1
+
+    def _signal_buffers(
+        self, files: Iterable[int]
+    ) -> List[Union[npt.NDArray[np.uint8], memoryview]]:
+        """
+        Return the signal data buffers of all files, opening the given `files`
+        if required. Buffers of files which are not open are left empty.
+
+        The least recently used files beyond `max_open_readers` are closed, other
+        than the given `files`.
+        """
+        index = self._index
+        if not self._buffers:
+            self._buffers = [
+                np.empty(0, dtype=np.uint8)
+                for _ in range(int(index.file_buffer_starts[-1]))
+            ]
+
+        files = [int(f) for f in files]
+        for file_idx in files:
+            if file_idx in self._readers:
+                self._readers.move_to_end(file_idx)
+                continue
+            reader = Reader(index.paths[file_idx])
+            self._readers[file_idx] = reader
+
+            start = int(index.file_buffer_starts[file_idx])
+            for batch_idx in range(reader.signal_table.num_record_batches):
+                batch = reader.signal_table.get_batch(batch_idx)
+                data, _ = _signal_batch_data(batch.column("signal"))
+                self._buffers[start + batch_idx] = data
+
+        # The given files were used last, so are the last to be evicted
+        requested = set(files)
+        while len(self._readers) > self._max_open_readers:
+            file_idx = next(iter(self._readers))
+            if file_idx in requested:
+                break
+            evicted = self._readers.pop(file_idx)
+            start = int(index.file_buffer_starts[file_idx])
+            end = int(index.file_buffer_starts[file_idx + 1])
+            for buffer_idx in range(start, end):
+                self._buffers[buffer_idx] = np.empty(0, dtype=np.uint8)
+            evicted.close()
+
+        return list(self._buffers)
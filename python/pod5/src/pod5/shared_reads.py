@@ -0,0 +1,432 @@
+"""
+Tools for passing compressed reads from producer processes to a writing process
+through shared memory
+"""
+
+import multiprocessing as mp
+import shutil
+from dataclasses import dataclass, field
+from pathlib import Path
+from queue import Empty
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+import numpy.typing as npt
+
+from pod5.pod5_types import BaseRead, CompressedRead
+from pod5.writer import _READ_COLUMNS, RotatingWriter, Writer
+
+try:
+    from multiprocessing import shared_memory
+except ImportError:  # python 3.7
+    shared_memory = None  # type: ignore [assignment]
+
+#: The default size in bytes of each shared memory slot
+DEFAULT_SLOT_BYTES = 32 * 1024 * 1024
+
+# Columns are placed in a slot at offsets aligned to this many bytes
+_ALIGNMENT = 8
+
+# The path of the file system backing shared memory where it is limited in size
+_SHARED_MEMORY_PATH = Path("/dev/shm")
+
+# The read columns holding the index of a pore type, end reason or run info among
+# the objects of a batch, with the function returning that object of a read
+_OBJECT_COLUMNS: Dict[str, Callable[[BaseRead], Any]] = {
+    "pore_type": lambda read: read.pore.pore_type,
+    "end_reason": lambda read: read.end_reason,
+    "run_info": lambda read: read.run_info,
+}
+
+# The functions returning the value of each other read column of a read
+_VALUE_COLUMNS: Dict[str, Callable[[BaseRead], Any]] = {
+    "read_number": lambda read: read.read_number,
+    "start": lambda read: read.start_sample,
+    "channel": lambda read: read.pore.channel,
+    "well": lambda read: read.pore.well,
+    "calibration_offset": lambda read: read.calibration.offset,
+    "calibration_scale": lambda read: read.calibration.scale,
+    "median_before": lambda read: read.median_before,
+    "end_reason_forced": lambda read: read.end_reason.forced,
+    "num_minknow_events": lambda read: read.num_minknow_events,
+    "tracked_scaling_scale": lambda read: read.tracked_scaling.scale,
+    "tracked_scaling_shift": lambda read: read.tracked_scaling.shift,
+    "predicted_scaling_scale": lambda read: read.predicted_scaling.scale,
+    "predicted_scaling_shift": lambda read: read.predicted_scaling.shift,
+    "num_reads_since_mux_change": lambda read: read.num_reads_since_mux_change,
+    "time_since_mux_change": lambda read: read.time_since_mux_change,
+}
+
+# The bytes of each read in a slot, other than those of its signal chunks: its read
+# id, read columns and signal chunk count
+_READ_ROW_BYTES = (
+    16
+    + sum(np.dtype(dtype).itemsize for dtype, _ in _READ_COLUMNS.values())
+    + np.dtype(np.uint32).itemsize
+)
+
+# The bytes of each signal chunk in a slot, other than its data: its sample count
+# and offset
+_CHUNK_ROW_BYTES = np.dtype(np.uint32).itemsize + np.dtype(np.uint64).itemsize
+
+# The bytes of a slot which may be lost aligning its columns, and the final offset
+# of the signal chunks
+_SLOT_OVERHEAD_BYTES = (len(_READ_COLUMNS) + 5) * _ALIGNMENT + 8
+
+
+@dataclass
+class SharedSlotReads:
+    """The layout of the compressed reads placed in one shared memory slot"""
+
+    #: The slot holding the reads
+    slot: int
+    #: The number of reads in the slot
+    read_count: int
+    #: The byte offset, dtype and shape of each column in the slot
+    layout: Dict[str, Tuple[int, str, Tuple[int, ...]]]
+    #: The distinct pore types, end reasons and run infos indexed by the columns
+    #: of the same name in the slot
+    objects: Dict[str, List[Any]]
+
+
+@dataclass
+class SharedReadBatch:
+    """
+    A batch of compressed reads placed in the slots of :py:class:`SharedReadBuffers`,
+    which is cheap to pickle as it holds only the layout of each slot.
+
+    Reads which do not fit in a slot on their own are held, and pickled, as they
+    are.
+    """
+
+    #: The reads placed in each slot, in the order of the packed reads
+    slots: List[SharedSlotReads] = field(default_factory=list)
+    #: The reads which did not fit in a slot
+    reads: List[CompressedRead] = field(default_factory=list)
+
+    @property
+    def read_count(self) -> int:
+        """Return the number of reads in the slots"""
+        return sum(slot.read_count for slot in self.slots)
+
+    def __len__(self) -> int:
+        """Return the number of reads in the batch"""
+        return self.read_count + len(self.reads)
+
+
+class SharedReadBuffers:
+    """
+    A ring of fixed size shared memory slots through which any number of producer
+    processes pass compressed reads to a single writing process.
+
+    A producer calls :py:meth:`pack` to copy a list of reads into as many free
+    slots as they fill and sends the returned :py:class:`SharedReadBatch` to the
+    writing process, which calls :py:meth:`write` to add the reads to a
+    :py:class:`Writer` directly from the slots, freeing them for reuse. The signal
+    chunks of the reads are copied once, into the slot, instead of being pickled
+    and unpickled.
+
+    Buffers are shared with producer processes by passing them as an argument to
+    the process when it is started, as for a :py:class:`multiprocessing.Queue`.
+    The process creating the buffers must :py:meth:`close` them to free the
+    shared memory.
+
+    Parameters
+    ----------
+    slot_count : int
+        The number of slots, bounding the number of batches in flight
+    slot_bytes : int
+        The size in bytes of each slot
+    context : multiprocessing context, optional
+        The multiprocessing context of the producer processes
+    timeout : float, optional
+        The seconds to wait for a free slot, by default forever
+
+    Raises
+    ------
+    RuntimeError
+        If shared memory is not available on this version of python
+    """
+
+    def __init__(
+        self,
+        slot_count: int,
+        slot_bytes: int = DEFAULT_SLOT_BYTES,
+        context: Optional[Any] = None,
+        timeout: Optional[float] = None,
+    ) -> None:
+        if shared_memory is None:
+            raise RuntimeError("Shared memory requires python 3.8 or later")
+        if slot_count < 1:
+            raise ValueError(f"slot_count must be at least 1, got {slot_count}")
+        if slot_bytes <= _SLOT_OVERHEAD_BYTES:
+            raise ValueError(
+                f"slot_bytes must be greater than {_SLOT_OVERHEAD_BYTES}, "
+                f"got {slot_bytes}"
+            )
+
+        context = context if context is not None else mp.get_context()
+        self._slot_bytes = slot_bytes
+        self._timeout = timeout
+        self._owner = True
+        self._slots: List[Any] = []
+        try:
+            for _ in range(slot_count):
+                self._slots.append(
+                    shared_memory.SharedMemory(create=True, size=slot_bytes)
+                )
+        except Exception:
+            self.close()
+            raise
+
+        self._free: mp.Queue = context.Queue()
+        for slot in range(slot_count):
+            self._free.put(slot)
+        # Held while a batch acquires its slots, so producers packing at once
+        # cannot each hold part of the slots the other awaits
+        self._packing = context.Lock()
+
+    @staticmethod
+    def available(slot_count: int, slot_bytes: int = DEFAULT_SLOT_BYTES) -> bool:
+        """
+        Return True if shared memory is available for `slot_count` slots of
+        `slot_bytes` each
+        """
+        if shared_memory is None:
+            return False
+        if not _SHARED_MEMORY_PATH.is_dir():
+            return True
+        return shutil.disk_usage(_SHARED_MEMORY_PATH).free >= slot_count * slot_bytes
+
+    @property
+    def slot_count(self) -> int:
+        """Return the number of slots"""
+        return len(self._slots)
+
+    @property
+    def slot_bytes(self) -> int:
+        """Return the size in bytes of each slot"""
+        return self._slot_bytes
+
+    def __getstate__(self) -> Dict[str, Any]:
+        """Return the state needed to attach to the slots in another process"""
+        return {
+            "names": [slot.name for slot in self._slots],
+            "slot_bytes": self._slot_bytes,
+            "timeout": self._timeout,
+            "free": self._free,
+            "packing": self._packing,
+        }
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        """Attach to the slots created by another process"""
+        self._slot_bytes = state["slot_bytes"]
+        self._timeout = state["timeout"]
+        self._free = state["free"]
+        self._packing = state["packing"]
+        self._owner = False
+        self._slots = [
+            shared_memory.SharedMemory(name=name)  # type: ignore [union-attr]
+            for name in state["names"]
+        ]
+
+    def __enter__(self) -> "SharedReadBuffers":
+        return self
+
+    def __exit__(self, *exc_details) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """
+        Detach from the slots, freeing the shared memory if this process created
+        them
+        """
+        for slot in self._slots:
+            if self._owner:
+                slot.unlink()
+            try:
+                slot.close()
+            except BufferError:
+                # Arrays still view the slot, it is unmapped once they are freed
+                pass
+        self._slots = []
+
+    def pack(self, reads: Sequence[CompressedRead]) -> SharedReadBatch:
+        """
+        Copy `reads` into as many free slots as they fill, waiting for slots if
+        none are free, and return the batch to pass to :py:meth:`write`.
+
+        Reads are placed in slots in order. A read which does not fit in a slot on
+        its own is held by the batch as it is, as are the reads beyond the first
+        :py:attr:`slot_count` slots, which could never all be free at once.
+
+        Parameters
+        ----------
+        reads : Sequence of :py:class:`CompressedRead`
+            The reads to pack
+
+        Raises
+        ------
+        TimeoutError
+            If no slot was freed within the timeout
+        """
+        capacity = self._slot_bytes - _SLOT_OVERHEAD_BYTES
+        groups: List[List[CompressedRead]] = []
+        held: List[CompressedRead] = []
+        group_bytes = capacity
+        for read in reads:
+            read_bytes = (
+                _READ_ROW_BYTES
+                + _CHUNK_ROW_BYTES * len(read.signal_chunks)
+                + sum(len(chunk) for chunk in read.signal_chunks)
+            )
+            if read_bytes > capacity:
+                held.append(read)
+                continue
+            if group_bytes + read_bytes > capacity:
+                groups.append([])
+                group_bytes = 0
+            groups[-1].append(read)
+            group_bytes += read_bytes
+
+        batch = SharedReadBatch(reads=held)
+        for group in groups[self.slot_count :]:
+            batch.reads.extend(group)
+        groups = groups[: self.slot_count]
+        if not groups:
+            return batch
+
+        if not self._packing.acquire(timeout=self._timeout):
+            raise TimeoutError(f"No free shared memory slot in {self._timeout} seconds")
+        try:
+            for group in groups:
+                batch.slots.append(self._pack_slot(group))
+        except BaseException:
+            self.release(batch)
+            raise
+        finally:
+            self._packing.release()
+        return batch
+
+    def _pack_slot(self, reads: List[CompressedRead]) -> SharedSlotReads:
+        """Copy reads which fit in a slot into a free slot, waiting for one"""
+        count = len(reads)
+        chunks = [chunk for read in reads for chunk in read.signal_chunks]
+        chunk_lengths = np.array([len(chunk) for chunk in chunks], dtype=np.uint64)
+
+        layout: Dict[str, Tuple[int, str, Tuple[int, ...]]] = {}
+        offset = 0
+
+        def place(name: str, dtype: Any, shape: Tuple[int, ...]) -> None:
+            nonlocal offset
+            dtype = np.dtype(dtype)
+            layout[name] = (offset, dtype.str, shape)
+            offset += int(np.prod(shape, dtype=np.int64)) * dtype.itemsize
+            offset = -(-offset // _ALIGNMENT) * _ALIGNMENT
+
+        place("read_id", np.uint8, (count, 16))
+        for name, (dtype, _) in _READ_COLUMNS.items():
+            place(name, dtype, (count,))
+        place("signal_chunk_lengths", np.uint32, (len(chunks),))
+        place("signal_chunk_counts", np.uint32, (count,))
+        place("signal_chunk_offsets", np.uint64, (len(chunks) + 1,))
+        place("signal_data", np.uint8, (int(chunk_lengths.sum()),))
+
+        slot = self._acquire()
+        try:
+            views = self._views(slot, layout)
+            views["read_id"][:] = np.frombuffer(
+                b"".join(read.read_id.bytes for read in reads), dtype=np.uint8
+            ).reshape(count, 16)
+
+            objects: Dict[str, List[Any]] = {}
+            for name, get_object in _OBJECT_COLUMNS.items():
+                indices: Dict[Any, int] = {}
+                views[name][:] = [
+                    indices.setdefault(get_object(read), len(indices)) for read in reads
+                ]
+                objects[name] = list(indices)
+            for name, get_value in _VALUE_COLUMNS.items():
+                views[name][:] = [get_value(read) for read in reads]
+
+            views["signal_chunk_lengths"][:] = [
+                length for read in reads for length in read.signal_chunk_lengths
+            ]
+            views["signal_chunk_counts"][:] = [
+                len(read.signal_chunks) for read in reads
+            ]
+            views["signal_chunk_offsets"][0] = 0
+            np.cumsum(chunk_lengths, out=views["signal_chunk_offsets"][1:])
+            if chunks:
+                np.concatenate(chunks, out=views["signal_data"])
+            del views
+        except BaseException:
+            self._free.put(slot)
+            raise
+
+        return SharedSlotReads(
+            slot=slot, read_count=count, layout=layout, objects=objects
+        )
+
+    def write(
+        self, batch: SharedReadBatch, writer: Union[Writer, RotatingWriter]
+    ) -> int:
+        """
+        Add the reads of a batch returned by :py:meth:`pack` to `writer`, freeing
+        its slots, and return the number of reads added.
+
+        Parameters
+        ----------
+        batch : :py:class:`SharedReadBatch`
+            The batch of reads to write
+        writer : :py:class:`Writer`, :py:class:`RotatingWriter`
+            The writer to add the reads to
+        """
+        count = len(batch)
+        try:
+            for slot in batch.slots:
+                views = self._views(slot.slot, slot.layout)
+                columns: Dict[str, npt.NDArray] = {
+                    name: views[name] for name in ("read_id", *_READ_COLUMNS)
+                }
+                for name, objects in slot.objects.items():
+                    lookup = np.array(
+                        [writer.add(obj) for obj in objects], dtype=np.int16
+                    )
+                    columns[name] = lookup[views[name]]
+
+                writer.add_reads_columns(
+                    columns,
+                    signal_chunks=views["signal_data"],
+                    signal_chunk_lengths=views["signal_chunk_lengths"],
+                    signal_chunk_counts=views["signal_chunk_counts"],
+                    signal_chunk_offsets=views["signal_chunk_offsets"],
+                )
+                del columns, views
+            writer.add_reads(batch.reads)
+        finally:
+            self.release(batch)
+        return count
+
+    def release(self, batch: SharedReadBatch) -> None:
+        """Free the slots of a batch returned by :py:meth:`pack` without writing it"""
+        for slot in batch.slots:
+            self._free.put(slot.slot)
+        batch.slots = []
+
+    def _acquire(self) -> int:
+        """Await a free slot raising TimeoutError if none is freed in time"""
+        try:
+            return self._free.get(timeout=self._timeout)
+        except Empty:
+            raise TimeoutError(f"No free shared memory slot in {self._timeout} seconds")
+
+    def _views(
+        self, slot: int, layout: Dict[str, Tuple[int, str, Tuple[int, ...]]]
+    ) -> Dict[str, npt.NDArray]:
+        """Return a numpy array viewing each column in the layout of a slot"""
+        buffer = self._slots[slot].buf
+        return {
+            name: np.ndarray(shape, dtype=dtype, buffer=buffer, offset=offset)
+            for name, (offset, dtype, shape) in layout.items()
+        }
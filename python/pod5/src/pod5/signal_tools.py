@@ -2,11 +2,12 @@
 Tools for handling pod5 signals
 """
 
-from typing import List, Tuple, Union
+from typing import List, Sequence, Tuple, Union
 
 import lib_pod5 as p5b
 import numpy as np
 import numpy.typing as npt
+import pyarrow as pa
 
 DEFAULT_SIGNAL_CHUNK_SIZE = 102400
 
@@ -67,17 +68,79 @@ def vbz_decompress_signal_chunked(
     if len(compressed_signal_chunks) == 0:
         return np.array([], dtype=np.int16)
 
-    decompressed_signal: npt.NDArray[
-        np.int16
-    ] = np.concatenate(  # type:ignore [no-untyped-call]
-        [
-            vbz_decompress_signal(signal_chunk, sample_count)
-            for signal_chunk, sample_count in zip(
-                compressed_signal_chunks, sample_counts
-            )
-        ]
+    output_array = np.empty(sum(sample_counts), dtype=np.int16)
+    return vbz_decompress_signal_chunked_into(
+        compressed_signal_chunks, sample_counts, output_array
     )
-    return decompressed_signal
+
+
+def vbz_decompress_signal_chunked_into(
+    compressed_signal_chunks: Sequence[Union[npt.NDArray[np.uint8], memoryview]],
+    sample_counts: Sequence[int],
+    output_array: npt.NDArray[np.int16],
+) -> npt.NDArray[np.int16]:
+    """
+    Decompress chunks of compressed signal data into consecutive regions of the
+    destination "output_array".
+
+    When there is more than one chunk, all chunks are handed over in a single
+    native call which releases the GIL and decompresses the chunks in parallel.
+
+    Parameters
+    ----------
+    compressed_signal_chunks : List[numpy.ndarray[uint8]]
+        A list of compressed signal data chunks to decompress.
+    sample_counts : List[int]
+        The number of samples in the original signal chunks
+    output_array : numpy.ndarray[int16]
+        The destination location for signal, sized to the sum of `sample_counts`
+
+    Returns
+    -------
+    A decompressed signal array numpy.ndarray[int16]
+
+    Raises
+    ------
+    ValueError
+        Inconsistent parameter lengths, or an output array which cannot be
+        decompressed into in place
+    """
+    if len(compressed_signal_chunks) != len(sample_counts):
+        raise ValueError(
+            f"Inconsistent number of chunks to decompress - "
+            f"signals: {len(compressed_signal_chunks)}, counts: {len(sample_counts)}"
+        )
+    if len(output_array) != sum(sample_counts):
+        raise ValueError(
+            f"Output array length {len(output_array)} does not match "
+            f"decompressed signal length {sum(sample_counts)}"
+        )
+    if (
+        output_array.dtype != np.int16
+        or not output_array.flags.c_contiguous
+        or not output_array.flags.writeable
+    ):
+        raise ValueError(
+            "Output array must be a writeable C-contiguous int16 array, got: "
+            f"{output_array.dtype}"
+        )
+
+    if len(compressed_signal_chunks) > 1:
+        p5b.decompress_signal_chunks(
+            list(compressed_signal_chunks),
+            np.asarray(sample_counts, dtype=np.uint32),
+            output_array,
+        )
+        return output_array
+
+    current_sample_index = 0
+    for signal_chunk, sample_count in zip(compressed_signal_chunks, sample_counts):
+        vbz_decompress_signal_into(
+            signal_chunk,
+            output_array[current_sample_index : current_sample_index + sample_count],
+        )
+        current_sample_index += sample_count
+    return output_array
 
 
 def vbz_decompress_signal_into(
@@ -161,3 +224,31 @@ def vbz_compress_signal_chunked(
         signal_chunk_lengths.append(len(signal_slice))
 
     return signal_chunks, signal_chunk_lengths
+
+
+def _signal_batch_data(
+    signal: Union[pa.LargeBinaryArray, pa.LargeListArray]
+) -> Tuple[npt.NDArray[np.uint8], npt.NDArray[np.int64]]:
+    """
+    Return the data buffer of the signal column of a signal table batch and the
+    byte offset of each row within it (with one extra trailing offset) as views of
+    the (memory-mapped) arrow buffers.
+    """
+    buffers = signal.buffers()
+    offsets = np.frombuffer(
+        buffers[1], dtype=np.int64, count=len(signal) + 1, offset=signal.offset * 8
+    )
+
+    if pa.types.is_large_binary(signal.type):
+        data = buffers[2]
+        if data is None:
+            return np.empty(0, dtype=np.uint8), offsets
+        return np.frombuffer(data, dtype=np.uint8), offsets
+
+    # Uncompressed signal, offsets count int16 samples of the values array
+    values = signal.values
+    data = values.buffers()[1]
+    if data is None:
+        return np.empty(0, dtype=np.uint8), offsets * 2
+    value_bytes = np.frombuffer(data, dtype=np.uint8)[values.offset * 2 :]
+    return value_bytes, offsets * 2
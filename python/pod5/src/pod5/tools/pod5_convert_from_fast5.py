@@ -30,6 +30,7 @@ import more_itertools
 import vbz_h5py_plugin  # noqa: F401
 
 import pod5 as p5
+from pod5.shared_reads import SharedReadBatch, SharedReadBuffers
 from pod5.signal_tools import DEFAULT_SIGNAL_CHUNK_SIZE, vbz_compress_signal_chunked
 from pod5.tools.parsers import pod5_convert_from_fast5_argparser, run_tool
 from pod5.tools.utils import (
@@ -56,9 +57,14 @@ class QueueManager:
         inputs: Collection[Path],
         threads: int,
         timeout: float,
+        read_buffers: Optional[SharedReadBuffers] = None,
     ) -> None:
-        """Manager for balancing work queues"""
+        """
+        Manager for balancing work queues. Compressed reads are passed through the
+        shared memory of read_buffers if given, otherwise they are pickled.
+        """
         self._requests_size = threads * 2
+        self._read_buffers = read_buffers
         self._inputs: mp.Queue = context.Queue(maxsize=len(inputs))
         self._requests: mp.Queue = context.Queue(maxsize=self._requests_size)
         self._data: mp.Queue = context.Queue()
@@ -92,12 +98,15 @@ class QueueManager:
         the total count of reads converted for that path.
         Otherwise, if path is None, mark the child process as being empty.
         """
-        self._data.put((path, reads), timeout=self._timeout)
+        data: Union[List[CompressedRead], SharedReadBatch, int, None] = reads
+        if self._read_buffers is not None and isinstance(reads, List) and reads:
+            data = self._read_buffers.pack(reads)
+        self._data.put((path, data), timeout=self._timeout)
 
     @logged(log_time=True)
     def await_data(
         self,
-    ) -> Tuple[Optional[Path], Union[List[CompressedRead], int, None]]:
+    ) -> Tuple[Optional[Path], Union[List[CompressedRead], SharedReadBatch, int, None]]:
         """
         Await compressed reads or the total count of reads compressed (file end) for
         a input filepath. Enqueues the next request if necessary
@@ -109,11 +118,25 @@ class QueueManager:
             return None, None
 
         # Add another request if we received compressed reads
-        if isinstance(item, List):
+        if isinstance(item, (List, SharedReadBatch)):
             self.enqueue_request()
 
         return path, item
 
+    def write_data(
+        self, writer: p5.Writer, data: Union[List[CompressedRead], SharedReadBatch]
+    ) -> int:
+        """Write compressed reads returned by await_data returning the count written"""
+        if isinstance(data, SharedReadBatch):
+            return self._read_buffers.write(data, writer)  # type: ignore [union-attr]
+        writer.add_reads(data)
+        return len(data)
+
+    def discard_data(self, data: Union[List[CompressedRead], SharedReadBatch]) -> None:
+        """Discard compressed reads returned by await_data which won't be written"""
+        if isinstance(data, SharedReadBatch):
+            self._read_buffers.release(data)  # type: ignore [union-attr]
+
     @logged(log_args=True)
     def enqueue_exception(self, path: Path, exception: Exception, trace: str) -> None:
         self._exceptions.put((path, exception, trace), timeout=self._timeout)
@@ -740,10 +763,10 @@ def process_conversion_tasks(
             logger.warn(
                 f"Trying to write to {path} writer which was closed by an exception"
             )
+            queues.discard_data(data)
         else:
             logger.info(f"Writing {len(data)} reads to {path.name} using {writer}")
-            writer.add_reads(data)
-            status.increment_reads(len(data))
+            status.increment_reads(queues.write_data(writer, data))
 
     status.close()
 
@@ -784,11 +807,19 @@ def convert_from_fast5(
 
     threads = min(threads, len(pending_fast5s))
     ctx = mp.get_context("spawn")
+    read_buffers = None
+    if SharedReadBuffers.available(threads * 2):
+        read_buffers = SharedReadBuffers(
+            slot_count=threads * 2, context=ctx, timeout=TIMEOUT_SECONDS
+        )
+    else:
+        logger.warning("Insufficient shared memory - passing reads by pickling")
     queues = QueueManager(
         context=ctx,
         inputs=pending_fast5s,
         threads=threads,
         timeout=TIMEOUT_SECONDS,
+        read_buffers=read_buffers,
     )
 
     active_processes = []
@@ -822,6 +853,8 @@ def convert_from_fast5(
 
     finally:
         output_handler.close_all()
+        if read_buffers is not None:
+            read_buffers.close()
         logger.disabled = True
 
 
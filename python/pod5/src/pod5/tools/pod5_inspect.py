@@ -176,17 +176,23 @@ def do_summary_command(reader: p5.Reader, **kwargs):
     )
     print(f"File version on disk {reader.file_version_pre_migration}.")
 
-    for batch in reader.read_batches():
+    for idx in range(reader.batch_count):
         batch_count += 1
 
-        batch_read_count = 0
-        for _ in batch.reads():
-            batch_read_count += 1
+        batch_read_count = reader.read_table.get_batch(idx).num_rows
 
         print(f"Batch {batch_count}, {batch_read_count} reads")
         total_read_count += batch_read_count
     print(f"Found {batch_count} batches, {total_read_count} reads")
 
+    stats = reader.stats
+    print(
+        f"{stats.sample_count} samples, {stats.signal_bytes} signal bytes, "
+        f"start samples from {stats.min_start_sample} to {stats.max_start_sample}"
+    )
+    for acquisition_id, read_count in stats.run_info_read_counts.items():
+        print(f"Run info {acquisition_id}, {read_count} reads")
+
 
 def inspect_pod5(
     command: str, input_files: List[Path], recursive: bool = False, **kwargs
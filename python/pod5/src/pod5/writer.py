@@ -2,13 +2,20 @@
 Tools for writing POD5 data
 """
 import datetime
+import enum
+import functools
 import itertools
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
 from pathlib import Path
 from typing import (
     Any,
     Callable,
     Dict,
+    Iterable,
+    Iterator,
     List,
+    Mapping,
     Optional,
     Sequence,
     Tuple,
@@ -19,23 +26,164 @@ from typing import (
 
 import lib_pod5 as p5b
 import numpy as np
+import numpy.typing as npt
+import pyarrow as pa
 import pytz
 
-from pod5.api_utils import Pod5ApiException, safe_close
+from pod5.api_utils import (
+    MemoryPoolLike,
+    Pod5ApiException,
+    resolve_memory_pool,
+    safe_close,
+)
 from pod5.pod5_types import (
     BaseRead,
     CompressedRead,
     EndReason,
+    EndReasonEnum,
     PathOrStr,
     Read,
     RunInfo,
 )
+from pod5.signal_tools import _signal_batch_data
 
 DEFAULT_SOFTWARE_NAME = "Python API"
 
 PoreType = str
 T = TypeVar("T", bound=Union[EndReason, PoreType, RunInfo])
 
+#: The columns of reads given to :py:meth:`Writer.add_reads_columns`, either a
+#: mapping of column name to numpy or arrow array, or an arrow record batch
+ReadColumns = Union[Mapping[str, Any], pa.RecordBatch]
+
+#: The VBZ compressed signal chunks given to :py:meth:`Writer.add_reads_columns`,
+#: either a sequence of uint8 arrays, one contiguous uint8 array of every chunk
+#: with their offsets given separately, or an arrow large binary array
+SignalChunks = Union[
+    Sequence[npt.NDArray[np.uint8]], npt.NDArray[np.uint8], pa.LargeBinaryArray
+]
+
+#: The numeric read columns accepted by :py:meth:`Writer.add_reads_columns`, in the
+#: order the native writer takes them, with their types and default values. Columns
+#: without a default are required.
+_READ_COLUMNS: Dict[str, Tuple[Type, Any]] = {
+    "read_number": (np.uint32, None),
+    "start": (np.uint64, None),
+    "channel": (np.uint16, None),
+    "well": (np.uint8, None),
+    "pore_type": (np.int16, None),
+    "calibration_offset": (np.float32, None),
+    "calibration_scale": (np.float32, None),
+    "median_before": (np.float32, None),
+    "end_reason": (np.int16, None),
+    "end_reason_forced": (np.bool_, None),
+    "run_info": (np.int16, None),
+    "num_minknow_events": (np.uint64, 0),
+    "tracked_scaling_scale": (np.float32, np.nan),
+    "tracked_scaling_shift": (np.float32, np.nan),
+    "predicted_scaling_scale": (np.float32, np.nan),
+    "predicted_scaling_shift": (np.float32, np.nan),
+    "num_reads_since_mux_change": (np.uint32, 0),
+    "time_since_mux_change": (np.float32, 0.0),
+}
+
+#: Read table columns which are derived from the signal given to
+#: :py:meth:`Writer.add_reads_columns` and are ignored if present
+_DERIVED_READ_COLUMNS = ("signal", "num_samples")
+
+
+class SignalType(enum.Enum):
+    """The encoding of the signal written to a pod5 file"""
+
+    #: VBZ compressed signal
+    VBZ = "vbz"
+    #: Uncompressed int16 signal
+    UNCOMPRESSED = "uncompressed"
+
+
+@dataclass(frozen=True)
+class WriterOptions:
+    """
+    Options controlling how a :py:class:`Writer` writes a pod5 file.
+
+    Larger signal chunks and table batches write faster and compress better, while
+    smaller ones let readers load less data to reach a read or a range of signal.
+
+    Parameters
+    ----------
+
+    max_signal_chunk_size : int
+        The maximum number of samples in each signal table row, longer reads are
+        split into several chunks
+    signal_table_batch_size : int
+        The number of signal chunks in each signal table batch
+    read_table_batch_size : int
+        The number of reads in each read table batch
+    signal_type : SignalType, str
+        Whether signal is written VBZ compressed or uncompressed
+    writer_threads : Optional[int]
+        The number of threads compressing and writing table batches. Writers given
+        the same number of threads share one thread pool. By default writers share
+        a pool of one thread per core.
+    """
+
+    #: The maximum number of samples in each signal table row
+    max_signal_chunk_size: int = 102_400
+    #: The number of signal chunks in each signal table batch
+    signal_table_batch_size: int = 100
+    #: The number of reads in each read table batch
+    read_table_batch_size: int = 1000
+    #: Whether signal is written VBZ compressed or uncompressed
+    signal_type: Union[SignalType, str] = SignalType.VBZ
+    #: The number of threads compressing and writing table batches
+    writer_threads: Optional[int] = None
+
+    def __post_init__(self) -> None:
+        for name in (
+            "max_signal_chunk_size",
+            "signal_table_batch_size",
+            "read_table_batch_size",
+        ):
+            if getattr(self, name) <= 0:
+                raise ValueError(f"{name} must be positive, got {getattr(self, name)}")
+        if self.max_signal_chunk_size > np.iinfo(np.uint32).max:
+            raise ValueError(
+                f"max_signal_chunk_size must fit in 32 bits, "
+                f"got {self.max_signal_chunk_size}"
+            )
+        if self.writer_threads is not None and self.writer_threads <= 0:
+            raise ValueError(
+                f"writer_threads must be positive, got {self.writer_threads}"
+            )
+        # Allow the signal type to be given by its value e.g. "uncompressed"
+        object.__setattr__(self, "signal_type", SignalType(self.signal_type))
+
+    def _file_writer_options(
+        self, memory_pool: Optional["p5b.MemoryPool"] = None
+    ) -> p5b.FileWriterOptions:
+        """Create the lib_pod5 FileWriterOptions of these options"""
+        options = p5b.FileWriterOptions()
+        options.max_signal_chunk_size = self.max_signal_chunk_size
+        options.signal_table_batch_size = self.signal_table_batch_size
+        options.read_table_batch_size = self.read_table_batch_size
+        if memory_pool is not None:
+            options.memory_pool = memory_pool
+
+        options.signal_compression_type = (
+            p5b.SignalType.VbzSignal
+            if self.signal_type == SignalType.VBZ
+            else p5b.SignalType.UncompressedSignal
+        )
+        if self.writer_threads is not None:
+            options.thread_pool = _writer_thread_pool(self.writer_threads)
+        return options
+
+
+@functools.lru_cache(maxsize=None)
+def _writer_thread_pool(writer_threads: int) -> p5b.ThreadPool:
+    """Return the lib_pod5 thread pool shared by writers of `writer_threads` threads"""
+    return p5b.make_thread_pool(writer_threads)
+
 
 def force_type_and_default(value, dtype, count, default_value=None):
     if default_value is not None and value is None:
@@ -66,7 +214,13 @@ def timestamp_to_int(time_stamp: Union[datetime.datetime, int]) -> int:
 class Writer:
     """Pod5 File Writer"""
 
-    def __init__(self, path: PathOrStr, software_name: str = DEFAULT_SOFTWARE_NAME):
+    def __init__(
+        self,
+        path: PathOrStr,
+        software_name: str = DEFAULT_SOFTWARE_NAME,
+        memory_pool: Optional[MemoryPoolLike] = None,
+        options: Optional[WriterOptions] = None,
+    ):
         """
         Open a pod5 file for Writing.
 
@@ -76,6 +230,13 @@ class Writer:
             The path to the pod5 file to create
         software_name : str
             The name of the application used to create this pod5 file
+        memory_pool : Optional[str, pyarrow.MemoryPool]
+            The memory pool lib_pod5 allocates table batches from, either a
+            :py:class:`pyarrow.MemoryPool` or a backend name such as "jemalloc",
+            "mimalloc" or "system". By default arrow's default memory pool is used.
+        options : Optional[:py:class:`WriterOptions`]
+            The signal chunk size, table batch sizes, signal type and writer threads
+            of the file. By default the lib_pod5 defaults are used.
         """
         self._path = Path(path).absolute()
         self._software_name = software_name
@@ -85,8 +246,14 @@ class Writer:
                 f"Input path already exists. Refusing to overwrite: {self._path}"
             )
 
+        self._options = options if options is not None else WriterOptions()
+        pool = resolve_memory_pool(memory_pool)
+        file_writer_options = None
+        if pool is not None or options is not None:
+            file_writer_options = self._options._file_writer_options(pool)
+
         self._writer: Optional[p5b.FileWriter] = p5b.create_file(
-            str(self._path), software_name, None
+            str(self._path), software_name, file_writer_options
         )
         if not self._writer:
             raise Pod5ApiException(
@@ -132,6 +299,11 @@ class Writer:
         """Return the software name used to open this file"""
         return self._software_name
 
+    @property
+    def options(self) -> WriterOptions:
+        """Return the options this file is written with"""
+        return self._options
+
     def add(self, obj: Union[EndReason, PoreType, RunInfo]) -> int:
         """
         Add a :py:class:`EndReason`, :py:class:`PoreType`, or
@@ -279,24 +451,250 @@ class Writer:
                 [r.signal for r in reads],  # type: ignore
             )
         elif isinstance(reads[0], CompressedRead):
-            signal_chunks = [r.signal_chunks for r in reads]  # type: ignore
-            signal_chunk_lengths = [r.signal_chunk_lengths for r in reads]  # type: ignore
+            # Join all signal data into one list, the chunks of each read are
+            # separate arrays so are passed as they are rather than copied into
+            # one contiguous buffer
+            signal_chunks = list(
+                itertools.chain.from_iterable(
+                    r.signal_chunks for r in reads  # type: ignore [union-attr]
+                )
+            )
+
+            # Join all read sample counts into one array
+            signal_chunk_lengths = np.fromiter(
+                itertools.chain.from_iterable(
+                    r.signal_chunk_lengths for r in reads  # type: ignore [union-attr]
+                ),
+                dtype=np.uint32,
+            )
 
             # Array containing the number of chunks for each signal
-            signal_chunk_counts = np.array(
-                [len(samples_per_chunk) for samples_per_chunk in signal_chunk_lengths],
+            signal_chunk_counts = np.fromiter(
+                (
+                    len(r.signal_chunk_lengths)  # type: ignore [union-attr]
+                    for r in reads
+                ),
                 dtype=np.uint32,
+                count=len(reads),
             )
 
             return self._writer.add_reads_pre_compressed(  # type: ignore [call-arg]
                 *self._prepare_add_reads_args(reads),
-                # Join all signal data into one list
-                list(itertools.chain(*signal_chunks)),
-                # Join all read sample counts into one array
-                np.concatenate(signal_chunk_lengths).astype(np.uint32),  # type: ignore [no-untyped-call]
+                signal_chunks,
+                signal_chunk_lengths,
                 signal_chunk_counts,
             )
 
+    def add_reads_columns(
+        self,
+        columns: ReadColumns,
+        signal: Optional[Union[npt.NDArray[np.int16], pa.Array]] = None,
+        signal_offsets: Optional[npt.NDArray[np.uint64]] = None,
+        signal_chunks: Optional[SignalChunks] = None,
+        signal_chunk_lengths: Optional[npt.NDArray[np.uint32]] = None,
+        signal_chunk_counts: Optional[npt.NDArray[np.uint32]] = None,
+        signal_chunk_offsets: Optional[npt.NDArray[np.uint64]] = None,
+    ) -> None:
+        """
+        Add reads held as columns of numpy or arrow arrays as records in the open
+        POD5 file, without creating a :py:class:`Read` object per read.
+
+        Columns are named as in the read table of a pod5 file:
+
+        * ``read_id`` - an arrow fixed size binary(16) array, a numpy array of
+          16 byte values ("S16" or "V16") or an (N, 16) uint8 array.
+        * ``read_number``, ``start``, ``channel``, ``well``,
+          ``calibration_offset``, ``calibration_scale`` and ``median_before`` -
+          numeric arrays.
+        * ``pore_type``, ``end_reason`` and ``run_info`` - either integer indices
+          returned by :py:meth:`add`, or the pore type strings, end reason names
+          and run info acquisition ids, as arrays of strings or arrow dictionary
+          arrays. Each distinct value is added to the file once. Run infos
+          must have been added with :py:meth:`add` before they are named.
+        * ``end_reason_forced`` - optional, by default the forced flag of each
+          end reason.
+        * ``num_minknow_events``, ``tracked_scaling_scale``,
+          ``tracked_scaling_shift``, ``predicted_scaling_scale``,
+          ``predicted_scaling_shift``, ``num_reads_since_mux_change`` and
+          ``time_since_mux_change`` - optional, defaulting as in :py:class:`Read`.
+
+        The ``signal`` and ``num_samples`` columns of a read table are ignored.
+
+        The signal of the reads is given either uncompressed, as `signal` and
+        `signal_offsets`, or pre-compressed, as `signal_chunks`,
+        `signal_chunk_lengths` and `signal_chunk_counts`. Pre-compressed chunks
+        held in one contiguous buffer, given with `signal_chunk_offsets` or as an
+        arrow large binary array, are written without copying them per chunk.
+
+        A writer is not thread safe. Reads are added holding the GIL, so calls
+        from several threads are serialised, but a writer must not be closed
+        while another thread is adding reads to it.
+
+        Parameters
+        ----------
+        columns : dict[str, numpy.ndarray | pyarrow.Array], pyarrow.RecordBatch
+            The columns of the reads to add
+        signal : numpy.ndarray[int16], pyarrow.Array
+            The uncompressed signal of every read concatenated, or an arrow list
+            array of the signal of each read if `signal_offsets` is not given
+        signal_offsets : numpy.ndarray[uint64]
+            The offsets of the signal of each read in `signal`, holding one more
+            entry than there are reads. The signal of read i is
+            ``signal[signal_offsets[i]:signal_offsets[i + 1]]``
+        signal_chunks : list[numpy.ndarray[uint8]], numpy.ndarray[uint8], pyarrow.LargeBinaryArray
+            The VBZ compressed signal chunks of every read, in read order, as a
+            list of arrays, one contiguous array if `signal_chunk_offsets` is
+            given, or an arrow large binary array
+        signal_chunk_lengths : numpy.ndarray[uint32]
+            The number of samples in each of the `signal_chunks`
+        signal_chunk_counts : numpy.ndarray[uint32]
+            The number of `signal_chunks` of each read
+        signal_chunk_offsets : numpy.ndarray[uint64]
+            The byte offsets of each chunk in contiguous `signal_chunks`, holding
+            one more entry than there are chunks. Chunk i is
+            ``signal_chunks[signal_chunk_offsets[i]:signal_chunk_offsets[i + 1]]``
+
+        Raises
+        ------
+        ValueError
+            If a required column is missing, columns differ in length, or the
+            signal does not match the reads
+        TypeError
+            If the read ids are not 16 byte values or the signal is not integer
+        KeyError
+            If a run info acquisition id has not been added to this file
+        """
+        if self._writer is None:
+            raise Pod5ApiException("Writer handle has been closed")
+
+        args = self._prepare_add_reads_columns_args(columns)
+        count = args[0]
+
+        if (signal is None) == (signal_chunks is None):
+            raise ValueError(
+                "Exactly one of signal or signal_chunks must be given to add reads"
+            )
+
+        if signal_chunks is not None:
+            if signal_chunk_lengths is None or signal_chunk_counts is None:
+                raise ValueError(
+                    "signal_chunk_lengths and signal_chunk_counts must be given "
+                    "with signal_chunks"
+                )
+            chunk_lengths = np.asarray(signal_chunk_lengths, dtype=np.uint32)
+            chunk_counts = np.asarray(signal_chunk_counts, dtype=np.uint32)
+            if len(chunk_counts) != count:
+                raise ValueError(
+                    f"Expected {count} signal chunk counts, got {len(chunk_counts)}"
+                )
+            chunk_total = int(chunk_counts.sum(dtype=np.uint64))
+            flat_chunks = _flat_signal_chunks(signal_chunks, signal_chunk_offsets)
+            given = (
+                len(signal_chunks) if flat_chunks is None else len(flat_chunks[1]) - 1
+            )
+            if given != chunk_total or len(chunk_lengths) != chunk_total:
+                raise ValueError(
+                    f"Expected {chunk_total} signal chunks and lengths, got "
+                    f"{given} chunks and {len(chunk_lengths)} lengths"
+                )
+            if flat_chunks is not None:
+                chunk_data, chunk_offsets = flat_chunks
+                if np.any(chunk_offsets[1:] < chunk_offsets[:-1]) or (
+                    chunk_total and chunk_offsets[-1] > len(chunk_data)
+                ):
+                    raise ValueError(
+                        "Signal chunk offsets are out of range of the signal chunks"
+                    )
+            if not count:
+                return
+
+            if flat_chunks is None:
+                self._writer.add_reads_pre_compressed(  # type: ignore [call-arg]
+                    *args, list(signal_chunks), chunk_lengths, chunk_counts
+                )
+                return
+
+            self._writer.add_reads_pre_compressed_flat(  # type: ignore [call-arg]
+                *args, chunk_data, chunk_offsets, chunk_lengths, chunk_counts
+            )
+            return
+
+        flat_signal, offsets = _flat_signal(signal, signal_offsets)
+        if len(offsets) != count + 1:
+            raise ValueError(f"Expected {count + 1} signal offsets, got {len(offsets)}")
+        if np.any(offsets[1:] < offsets[:-1]) or (
+            count and offsets[-1] > len(flat_signal)
+        ):
+            raise ValueError("Signal offsets are out of range of the signal data")
+        if not count:
+            return
+
+        self._writer.add_reads_flat(  # type: ignore [call-arg]
+            *args, flat_signal, offsets
+        )
+
+    def _prepare_add_reads_columns_args(self, columns: ReadColumns) -> List[Any]:
+        """
+        Converts the columns of reads into the list of arrays of data to be supplied
+        to the c api, resolving pore types, end reasons and run infos to their
+        indices in this file.
+        """
+        columns = _column_mapping(columns)
+        unknown = (
+            set(columns) - set(_READ_COLUMNS) - {"read_id", *_DERIVED_READ_COLUMNS}
+        )
+        if unknown:
+            raise ValueError(f"Unknown read columns: {sorted(unknown)}")
+        if "read_id" not in columns:
+            raise ValueError("Missing read column: read_id")
+
+        read_id = _read_id_column(columns["read_id"])
+        count = read_id.shape[0]
+
+        to_objects = _dictionary_column_objects(self._run_infos, self)
+        object_counts = {
+            "pore_type": len(self._pores),
+            "end_reason": len(self._end_reasons),
+            "run_info": len(self._run_infos),
+        }
+
+        arrays: Dict[str, npt.NDArray] = {}
+        for name, (dtype, default) in _READ_COLUMNS.items():
+            values = columns.get(name)
+            if values is None:
+                if name == "end_reason_forced":
+                    values = self._end_reasons_forced(arrays["end_reason"])
+                elif default is None:
+                    raise ValueError(f"Missing read column: {name}")
+                else:
+                    values = np.full(count, default, dtype=dtype)
+            elif name in to_objects:
+                values = _dictionary_column_indices(
+                    name, values, self.add, to_objects[name], object_counts[name]
+                )
+            else:
+                values = _numpy_column(name, values).astype(dtype, copy=False)
+
+            if values.shape != (count,):
+                raise ValueError(
+                    f"Read column {name} has shape {values.shape}, expected ({count},)"
+                )
+            arrays[name] = values
+        return [count, read_id, *arrays.values()]
+
+    def _end_reasons_forced(
+        self, end_reasons: npt.NDArray[np.int16]
+    ) -> npt.NDArray[np.bool_]:
+        """Return the forced flag of each end reason index added to this file"""
+        forced = {
+            index: end_reason.forced for end_reason, index in self._end_reasons.items()
+        }
+        unique, inverse = np.unique(end_reasons, return_inverse=True)
+        lookup = np.array(
+            [forced.get(index, False) for index in unique], dtype=np.bool_
+        )
+        return lookup[inverse]
+
     def _prepare_add_reads_args(self, reads: Sequence[BaseRead]) -> List[Any]:
         """
         Converts the List of reads into the list of ctypes arrays of data to be supplied
@@ -372,3 +770,557 @@ class Writer:
             num_reads_since_mux_change,
             time_since_mux_change,
         ]
+
+
+class RotatingWriter:
+    """
+    Pod5 File Writer which writes reads to a series of files, starting the next
+    file when the current one reaches a number of reads or bytes of signal.
+
+    Finished files are closed in the background while the next file is written,
+    with every file sharing the writer thread pool of its :py:class:`WriterOptions`.
+    """
+
+    def __init__(
+        self,
+        template: PathOrStr,
+        max_reads: Optional[int] = None,
+        max_bytes: Optional[int] = None,
+        software_name: str = DEFAULT_SOFTWARE_NAME,
+        memory_pool: Optional[MemoryPoolLike] = None,
+        options: Optional[WriterOptions] = None,
+        max_open_files: int = 2,
+    ):
+        """
+        Prepare to write a series of pod5 files, the first of which is created
+        when the first read is added.
+
+        Parameters
+        ----------
+        template : os.PathLike, str
+            The path of the files to create, formatted with the index of each file
+            as ``index``, e.g. ``"output/reads_{index:04d}.pod5"``
+        max_reads : Optional[int]
+            The maximum number of reads written to each file
+        max_bytes : Optional[int]
+            The maximum number of bytes of signal, as given to this writer, written
+            to each file. A read larger than this is written to a file of its own.
+        software_name : str
+            The name of the application used to create these pod5 files
+        memory_pool : Optional[str, pyarrow.MemoryPool]
+            The memory pool lib_pod5 allocates table batches from, see
+            :py:class:`Writer`
+        options : Optional[:py:class:`WriterOptions`]
+            The options every file is written with
+        max_open_files : int
+            The maximum number of files open at once, the file being written and
+            those being closed in the background. When reached, starting the next
+            file waits for the oldest file to close.
+        """
+        self._template = str(template)
+        if "{index" not in self._template:
+            raise ValueError(
+                f"Path template must contain an {{index}} field: {self._template}"
+            )
+        for name, value in (
+            ("max_reads", max_reads),
+            ("max_bytes", max_bytes),
+            ("max_open_files", max_open_files),
+        ):
+            if value is not None and value <= 0:
+                raise ValueError(f"{name} must be positive, got {value}")
+
+        self._max_reads = max_reads
+        self._max_bytes = max_bytes
+        self._software_name = software_name
+        self._memory_pool = memory_pool
+        self._options = options
+        self._max_open_files = max_open_files
+
+        self._paths: List[Path] = []
+        self._writer: Optional[Writer] = None
+        self._file_reads = 0
+        self._file_bytes = 0
+        self._closing: List[Future] = []
+        self._closer: Optional[ThreadPoolExecutor] = None
+        if max_open_files > 1:
+            self._closer = ThreadPoolExecutor(
+                max_workers=max_open_files - 1, thread_name_prefix="pod5-writer-close"
+            )
+
+        # Objects added to this writer indexed independently of any one file, each
+        # file adds the objects its reads use when they are written
+        self._objects: Dict[Type, List[Any]] = {
+            EndReason: [],
+            PoreType: [],
+            RunInfo: [],
+        }
+        self._indices: Dict[Type, Dict[Any, int]] = {
+            EndReason: {},
+            PoreType: {},
+            RunInfo: {},
+        }
+
+    def __enter__(self) -> "RotatingWriter":
+        return self
+
+    def __exit__(self, *exc_details) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Close the current file and wait for every file to finish closing"""
+        if self._writer is not None:
+            writer, self._writer = self._writer, None
+            writer.close()
+        closing, self._closing = self._closing, []
+        if self._closer is not None:
+            self._closer.shutdown(wait=True)
+            self._closer = None
+        for future in closing:
+            future.result()
+
+    @property
+    def paths(self) -> List[Path]:
+        """Return the paths of the files created so far"""
+        return list(self._paths)
+
+    def add(self, obj: Union[EndReason, PoreType, RunInfo]) -> int:
+        """
+        Add a :py:class:`EndReason`, :py:class:`PoreType`, or
+        :py:class:`RunInfo` object to this writer (if it doesn't already exist)
+        and return its index, which may be used in the columns given to
+        :py:meth:`add_reads_columns`. Each file adds the objects its reads use.
+
+        Parameters
+        ----------
+        obj : :py:class:`EndReason`, :py:class:`PoreType`, :py:class:`RunInfo`
+            Object to add to this writer
+
+        Returns
+        -------
+        index : int
+            The index of the object in this writer
+        """
+        indices = self._indices[type(obj)]
+        if obj not in indices:
+            indices[obj] = len(self._objects[type(obj)])
+            self._objects[type(obj)].append(obj)
+        return indices[obj]
+
+    def add_read(self, read: Union[Read, CompressedRead]) -> None:
+        """
+        Add a record to the current POD5 file, see :py:meth:`Writer.add_read`
+
+        Parameters
+        ----------
+        read : :py:class:`Read`, :py:class:`CompressedRead`
+            POD5 Read or CompressedRead object to add as a record to the POD5 file.
+        """
+        self.add_reads([read])
+
+    def add_reads(self, reads: Sequence[Union[Read, CompressedRead]]) -> None:
+        """
+        Add reads as records in the POD5 files, starting new files as each is
+        filled, see :py:meth:`Writer.add_reads`
+
+        Parameters
+        ----------
+        reads : Sequence of :py:class:`Read` or :py:class:`CompressedRead` exclusively
+            List of Read object to be added to the POD5 files
+        """
+        read_bytes = np.array(
+            [
+                read.signal.nbytes
+                if isinstance(read, Read)
+                else sum(chunk.nbytes for chunk in read.signal_chunks)
+                for read in reads
+            ],
+            dtype=np.int64,
+        )
+        for writer, start, stop in self._file_rows(read_bytes):
+            writer.add_reads(reads[start:stop])
+
+    def add_reads_columns(
+        self,
+        columns: ReadColumns,
+        signal: Optional[Union[npt.NDArray[np.int16], pa.Array]] = None,
+        signal_offsets: Optional[npt.NDArray[np.uint64]] = None,
+        signal_chunks: Optional[SignalChunks] = None,
+        signal_chunk_lengths: Optional[npt.NDArray[np.uint32]] = None,
+        signal_chunk_counts: Optional[npt.NDArray[np.uint32]] = None,
+        signal_chunk_offsets: Optional[npt.NDArray[np.uint64]] = None,
+    ) -> None:
+        """
+        Add reads held as columns as records in the POD5 files, starting new files
+        as each is filled, see :py:meth:`Writer.add_reads_columns`.
+
+        Integer ``pore_type``, ``end_reason`` and ``run_info`` columns hold the
+        indices returned by :py:meth:`add` of this writer.
+
+        Parameters
+        ----------
+        columns : dict[str, numpy.ndarray | pyarrow.Array], pyarrow.RecordBatch
+            The columns of the reads to add
+        signal : numpy.ndarray[int16], pyarrow.Array
+            The uncompressed signal of every read concatenated, or an arrow list
+            array of the signal of each read if `signal_offsets` is not given
+        signal_offsets : numpy.ndarray[uint64]
+            The offsets of the signal of each read in `signal`
+        signal_chunks : list[numpy.ndarray[uint8]], numpy.ndarray[uint8], pyarrow.LargeBinaryArray
+            The VBZ compressed signal chunks of every read, in read order
+        signal_chunk_lengths : numpy.ndarray[uint32]
+            The number of samples in each of the `signal_chunks`
+        signal_chunk_counts : numpy.ndarray[uint32]
+            The number of `signal_chunks` of each read
+        signal_chunk_offsets : numpy.ndarray[uint64]
+            The byte offsets of each chunk in contiguous `signal_chunks`
+        """
+        columns = dict(_column_mapping(columns))
+        if "read_id" not in columns:
+            raise ValueError("Missing read column: read_id")
+        columns["read_id"] = _read_id_column(columns["read_id"])
+        count = len(columns["read_id"])
+
+        to_objects = _dictionary_column_objects(self._objects[RunInfo], self)
+        for name, to_object in to_objects.items():
+            if name in columns:
+                columns[name] = _dictionary_column_indices(
+                    name, columns[name], self.add, to_object
+                )
+
+        if (signal is None) == (signal_chunks is None):
+            raise ValueError(
+                "Exactly one of signal or signal_chunks must be given to add reads"
+            )
+
+        if signal_chunks is not None:
+            if signal_chunk_lengths is None or signal_chunk_counts is None:
+                raise ValueError(
+                    "signal_chunk_lengths and signal_chunk_counts must be given "
+                    "with signal_chunks"
+                )
+            chunk_counts = np.asarray(signal_chunk_counts, dtype=np.uint32)
+            if len(chunk_counts) != count:
+                raise ValueError(
+                    f"Expected {count} signal chunk counts, got {len(chunk_counts)}"
+                )
+            chunk_bounds = np.zeros(count + 1, dtype=np.int64)
+            np.cumsum(chunk_counts, out=chunk_bounds[1:])
+            flat_chunks = _flat_signal_chunks(signal_chunks, signal_chunk_offsets)
+            if flat_chunks is None:
+                chunk_bytes = np.zeros(len(signal_chunks) + 1, dtype=np.int64)
+                np.cumsum(
+                    [chunk.nbytes for chunk in signal_chunks], out=chunk_bytes[1:]
+                )
+            else:
+                chunk_bytes = flat_chunks[1].astype(np.int64)
+            chunk_lengths = np.asarray(signal_chunk_lengths, dtype=np.uint32)
+            given = len(chunk_bytes) - 1
+            if given != chunk_bounds[-1] or len(chunk_lengths) != chunk_bounds[-1]:
+                raise ValueError(
+                    f"Expected {chunk_bounds[-1]} signal chunks and lengths, got "
+                    f"{given} chunks and {len(chunk_lengths)} lengths"
+                )
+            read_bytes = chunk_bytes[chunk_bounds[1:]] - chunk_bytes[chunk_bounds[:-1]]
+
+            def signal_args(start: int, stop: int) -> Dict[str, Any]:
+                chunks = slice(chunk_bounds[start], chunk_bounds[stop])
+                args: Dict[str, Any] = {
+                    "signal_chunk_lengths": chunk_lengths[chunks],
+                    "signal_chunk_counts": chunk_counts[start:stop],
+                }
+                if flat_chunks is None:
+                    args["signal_chunks"] = signal_chunks[chunks]  # type: ignore [index]
+                else:
+                    args["signal_chunks"] = flat_chunks[0]
+                    args["signal_chunk_offsets"] = flat_chunks[1][
+                        chunk_bounds[start] : chunk_bounds[stop] + 1
+                    ]
+                return args
+
+        else:
+            flat_signal, offsets = _flat_signal(signal, signal_offsets)
+            if len(offsets) != count + 1:
+                raise ValueError(
+                    f"Expected {count + 1} signal offsets, got {len(offsets)}"
+                )
+            read_bytes = (offsets[1:] - offsets[:-1]).astype(np.int64) * 2
+
+            def signal_args(start: int, stop: int) -> Dict[str, Any]:
+                return {
+                    "signal": flat_signal,
+                    "signal_offsets": offsets[start : stop + 1],
+                }
+
+        for writer, start, stop in self._file_rows(read_bytes):
+            file_columns = {
+                name: values[start:stop] for name, values in columns.items()
+            }
+            for name, kind in (
+                ("pore_type", PoreType),
+                ("end_reason", EndReason),
+                ("run_info", RunInfo),
+            ):
+                if name in file_columns:
+                    file_columns[name] = self._file_indices(
+                        writer, kind, file_columns[name]
+                    )
+            writer.add_reads_columns(file_columns, **signal_args(start, stop))
+
+    def _file_indices(
+        self, writer: Writer, kind: Type, indices: npt.NDArray[np.int16]
+    ) -> npt.NDArray[np.int16]:
+        """
+        Convert indices of objects added to this writer to their indices in the
+        file of `writer`, adding the objects used to the file
+        """
+        objects = self._objects[kind]
+        unique, inverse = np.unique(indices, return_inverse=True)
+        if len(unique) and (unique[0] < 0 or unique[-1] >= len(objects)):
+            raise ValueError(
+                f"{kind.__name__} indices must be returned by RotatingWriter.add, "
+                f"got {unique[0] if unique[0] < 0 else unique[-1]}"
+            )
+        lookup = np.array([writer.add(objects[idx]) for idx in unique], dtype=np.int16)
+        return lookup[inverse]
+
+    def _file_rows(self, read_bytes: npt.NDArray) -> Iterator[Tuple[Writer, int, int]]:
+        """
+        Split reads of the given byte sizes into the rows written to each file,
+        yielding the writer of each file with the start and stop row written to it
+        """
+        start = 0
+        while start < len(read_bytes):
+            stop = len(read_bytes)
+            if self._max_reads is not None:
+                stop = min(stop, start + self._max_reads - self._file_reads)
+            if self._max_bytes is not None:
+                cumulative_bytes = np.cumsum(read_bytes[start:stop])
+                stop = start + int(
+                    np.searchsorted(
+                        cumulative_bytes, self._max_bytes - self._file_bytes, "right"
+                    )
+                )
+
+            if stop == start:
+                if self._file_reads:
+                    self._finish_file()
+                    continue
+                # Write a read too large for any file to a file of its own
+                stop = start + 1
+
+            yield self._current_writer(), start, stop
+            self._file_reads += stop - start
+            self._file_bytes += int(read_bytes[start:stop].sum())
+            start = stop
+
+            if (
+                self._max_reads is not None and self._file_reads >= self._max_reads
+            ) or (self._max_bytes is not None and self._file_bytes >= self._max_bytes):
+                self._finish_file()
+
+    def _current_writer(self) -> Writer:
+        """Return the writer of the current file, creating the next file if needed"""
+        if self._writer is None:
+            # Wait for the oldest file to close before opening too many at once
+            while len(self._closing) >= self._max_open_files - 1 and self._closing:
+                self._closing.pop(0).result()
+            path = Path(self._template.format(index=len(self._paths)))
+            self._writer = Writer(
+                path, self._software_name, self._memory_pool, self._options
+            )
+            self._paths.append(self._writer.path)
+        return self._writer
+
+    def _finish_file(self) -> None:
+        """Close the current file in the background, the next read starts a new one"""
+        if self._writer is None:
+            return
+        writer, self._writer = self._writer, None
+        self._file_reads = 0
+        self._file_bytes = 0
+        if self._closer is None:
+            writer.close()
+        else:
+            self._closing.append(self._closer.submit(writer.close))
+
+
+def _numpy_column(name: str, values: Any) -> npt.NDArray:
+    """Convert a column of reads given as a numpy or arrow array to numpy"""
+    if isinstance(values, (pa.Array, pa.ChunkedArray)):
+        if values.null_count:
+            raise ValueError(f"Read column {name} contains nulls")
+        values = values.to_numpy(zero_copy_only=False)
+    values = np.asarray(values)
+    if values.ndim != 1:
+        raise ValueError(f"Read column {name} must be one dimensional")
+    return values
+
+
+def _read_id_column(values: Any) -> npt.NDArray[np.uint8]:
+    """
+    Convert a column of read ids to the (N, 16) uint8 array of their bytes supplied
+    to the c api
+    """
+    if isinstance(values, pa.ChunkedArray):
+        values = values.combine_chunks()
+    if isinstance(values, pa.ExtensionArray):
+        values = values.storage
+    if isinstance(values, pa.Array):
+        if (
+            not pa.types.is_fixed_size_binary(values.type)
+            or values.type.byte_width != 16
+        ):
+            raise TypeError(
+                f"Read id column must be fixed size binary(16), got {values.type}"
+            )
+        if values.null_count:
+            raise ValueError("Read column read_id contains nulls")
+        return np.frombuffer(
+            values.buffers()[1],
+            dtype=np.uint8,
+            count=len(values) * 16,
+            offset=values.offset * 16,
+        ).reshape(-1, 16)
+
+    values = np.ascontiguousarray(values)
+    if values.dtype.kind in "SV" and values.dtype.itemsize == 16 and values.ndim == 1:
+        return values.view(np.uint8).reshape(-1, 16)
+    if values.dtype == np.uint8 and values.ndim == 2 and values.shape[1] == 16:
+        return values
+    raise TypeError(
+        "Read id column must hold 16 byte values or be an (N, 16) uint8 array, "
+        f"got {values.dtype} of shape {values.shape}"
+    )
+
+
+def _flat_signal(
+    signal: Any, signal_offsets: Optional[npt.NDArray[np.uint64]]
+) -> Tuple[npt.NDArray[np.int16], npt.NDArray[np.uint64]]:
+    """
+    Return the concatenated signal of reads and the offset of each read's signal
+    in it, given either both, or an arrow list array of the signal of each read
+    """
+    if signal_offsets is None:
+        if not isinstance(signal, (pa.ListArray, pa.LargeListArray)):
+            raise ValueError(
+                "signal_offsets must be given unless signal is an arrow list array"
+            )
+        offsets = signal.offsets.to_numpy().astype(np.uint64)
+        signal = signal.values
+    else:
+        offsets = np.asarray(signal_offsets, dtype=np.uint64)
+
+    if isinstance(signal, (pa.Array, pa.ChunkedArray)):
+        signal = signal.to_numpy(zero_copy_only=False)
+    signal = np.asarray(signal)
+    if not np.can_cast(signal.dtype, np.int16, "same_kind"):
+        raise TypeError(f"Signal must hold integer samples, got {signal.dtype}")
+    return np.ascontiguousarray(signal, dtype=np.int16), offsets
+
+
+def _flat_signal_chunks(
+    signal_chunks: SignalChunks, signal_chunk_offsets: Optional[npt.NDArray[np.uint64]]
+) -> Optional[Tuple[npt.NDArray[np.uint8], npt.NDArray[np.uint64]]]:
+    """
+    Return the contiguous data of pre-compressed signal chunks and the byte offset
+    of each chunk in it, given either both or an arrow large binary array, or None
+    if the chunks are given as a sequence of arrays
+    """
+    if isinstance(signal_chunks, pa.ChunkedArray):
+        signal_chunks = signal_chunks.combine_chunks()
+    if isinstance(signal_chunks, pa.LargeBinaryArray):
+        if signal_chunk_offsets is not None:
+            raise ValueError(
+                "signal_chunk_offsets must not be given with an arrow signal_chunks"
+            )
+        if signal_chunks.null_count:
+            raise ValueError("Signal chunks contain nulls")
+        data, offsets = _signal_batch_data(signal_chunks)
+        return data, offsets.astype(np.uint64)
+
+    if isinstance(signal_chunks, np.ndarray) != (signal_chunk_offsets is not None):
+        raise ValueError(
+            "signal_chunk_offsets must be given with signal_chunks if, and only if, "
+            "the chunks are one contiguous array"
+        )
+    if signal_chunk_offsets is None:
+        return None
+    return (
+        np.ascontiguousarray(signal_chunks, dtype=np.uint8),
+        np.asarray(signal_chunk_offsets, dtype=np.uint64),
+    )
+
+
+def _column_mapping(columns: ReadColumns) -> Mapping[str, Any]:
+    """Return the columns of reads given as a record batch or mapping as a mapping"""
+    if isinstance(columns, pa.RecordBatch):
+        return dict(zip(columns.schema.names, columns.columns))
+    return columns
+
+
+def _dictionary_column_objects(
+    run_infos: Iterable[RunInfo], writer: Any
+) -> Dict[str, Callable[[str], Union[EndReason, PoreType, RunInfo]]]:
+    """
+    Return the functions finding the pore type, end reason or run info named by a
+    value of each dictionary column, run infos being found by acquisition id among
+    the `run_infos` added to `writer`
+    """
+
+    def find_run_info(acquisition_id: str) -> RunInfo:
+        for run_info in run_infos:
+            if run_info.acquisition_id == acquisition_id:
+                return run_info
+        raise KeyError(
+            f"Could not find run info {acquisition_id} in Pod5 file writer: {writer}"
+        )
+
+    return {
+        "pore_type": PoreType,
+        "end_reason": lambda name: EndReason.from_reason_with_default_forced(
+            EndReasonEnum[name.upper()]
+        ),
+        "run_info": find_run_info,
+    }
+
+
+def _dictionary_column_indices(
+    name: str,
+    values: Any,
+    add: Callable[[Any], int],
+    to_object: Callable[[str], Union[EndReason, PoreType, RunInfo]],
+    object_count: Optional[int] = None,
+) -> npt.NDArray[np.int16]:
+    """
+    Return the indices of the pore types, end reasons or run infos of a column,
+    calling `add` once for each distinct value named by the column. Integer
+    columns already hold indices and are returned as they are, after checking
+    they index the `object_count` objects added if given.
+    """
+    if isinstance(values, pa.ChunkedArray):
+        values = values.combine_chunks()
+    if isinstance(values, pa.DictionaryArray):
+        if values.null_count:
+            raise ValueError(f"Read column {name} contains nulls")
+        names = values.dictionary.to_pylist()
+        indices = _numpy_column(name, values.indices)
+        used = np.unique(indices)
+        lookup = np.zeros(len(names), dtype=np.int16)
+        lookup[used] = [add(to_object(names[idx])) for idx in used]
+        return lookup[indices]
+
+    values = _numpy_column(name, values)
+    if values.dtype.kind in "iu":
+        if object_count is not None and len(values):
+            low, high = values.min(), values.max()
+            if low < 0 or high >= object_count:
+                raise ValueError(
+                    f"Read column {name} indices must be returned by Writer.add, "
+                    f"got {low if low < 0 else high}"
+                )
+        return values.astype(np.int16, copy=False)
+
+    unique, inverse = np.unique(values, return_inverse=True)
+    lookup = np.array([add(to_object(str(value))) for value in unique], dtype=np.int16)
+    return lookup[inverse]
@@ -4,6 +4,7 @@ from pathlib import Path
 from typing import Union
 from uuid import UUID, uuid4, uuid5
 
+import lib_pod5 as p5b
 import numpy as np
 import pytest
 
@@ -225,6 +226,21 @@ def run_reader_test(reader: p5.Reader):
     assert found_ids == set(r.read_id for r in search_reads)
 
 
+@pytest.mark.parametrize(
+    "name",
+    [
+        "decompress_signal_chunks",
+        "decode_signal_pa",
+        "decode_signal_windows",
+        "decode_signal_windows_pa",
+    ],
+)
+def test_native_exports(name: str):
+    """Assert lib_pod5 exports the native functions which pod5 calls directly"""
+    assert name in p5b.__all__
+    assert callable(getattr(p5b, name))
+
+
 @pytest.mark.filterwarnings("ignore: pod5.")
 def test_pyarrow_from_pathlib():
     with tempfile.TemporaryDirectory() as temp:
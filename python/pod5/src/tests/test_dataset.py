@@ -0,0 +1,212 @@
+"""
+Testing the pod5 Dataset
+"""
+import gc
+import time
+from pathlib import Path
+from typing import List, Optional
+from uuid import uuid4
+
+import numpy
+import pytest
+
+import pod5 as p5
+
+
+@pytest.fixture(scope="function")
+def dataset_paths(pod5_factory) -> List[Path]:
+    """Create a few pod5 files with distinct reads"""
+    return [
+        pod5_factory(10, name="dataset_a.pod5"),
+        pod5_factory(1100, name="dataset_b.pod5"),
+        pod5_factory(25, name="dataset_c.pod5"),
+    ]
+
+
+class TestDataset:
+    def test_all_reads(self, dataset_paths: List[Path]) -> None:
+        """Assert all reads are yielded in file order"""
+        expected: List[str] = []
+        for path in dataset_paths:
+            with p5.Reader(path) as reader:
+                expected.extend(reader.read_ids)
+
+        with p5.Dataset(dataset_paths, threads=2) as dataset:
+            assert dataset.num_files == 3
+            assert dataset.num_reads == len(expected)
+            assert [str(read.read_id) for read in dataset.reads()] == expected
+            assert [str(read.read_id) for read in dataset] == expected
+
+    def test_selection(self, dataset_paths: List[Path]) -> None:
+        """Assert selected reads are found across files"""
+        all_ids: List[str] = []
+        for path in dataset_paths:
+            with p5.Reader(path) as reader:
+                all_ids.extend(reader.read_ids)
+
+        numpy.random.seed(1)
+        selection = list(numpy.random.choice(all_ids, 100, replace=False))
+
+        with p5.Dataset(dataset_paths, threads=3) as dataset:
+            records = list(dataset.reads(selection, preload={"samples"}))
+            assert sorted(str(r.read_id) for r in records) == sorted(selection)
+
+            for record in records[:5]:
+                assert record.has_cached_signal
+                assert len(record.signal) == record.num_samples
+
+            # File order is preserved
+            files = [dataset.paths.index(r._reader.path) for r in records]
+            assert files == sorted(files)
+
+    def test_where(self, dataset_paths: List[Path]) -> None:
+        """Assert read filters are applied in every file, with and without selections"""
+        where = "num_samples > 40000 and channel > 100"
+
+        def matches(read: p5.ReadRecord) -> bool:
+            return read.num_samples > 40000 and read.pore.channel > 100
+
+        with p5.Dataset(dataset_paths, threads=2) as dataset:
+            expected = [str(read.read_id) for read in dataset.reads() if matches(read)]
+            assert 0 < len(expected) < dataset.num_reads
+
+            records = list(dataset.reads(where=where, preload={"samples"}))
+            assert [str(read.read_id) for read in records] == expected
+            assert all(read.has_cached_signal for read in records)
+
+            selection = [str(read.read_id) for read in dataset.reads()][::2]
+            selected = [
+                str(read.read_id) for read in dataset.reads(selection) if matches(read)
+            ]
+            filtered = dataset.reads(selection, where=where, preload={"samples"})
+            assert sorted(str(read.read_id) for read in filtered) == sorted(selected)
+
+    def test_selection_missing(self, dataset_paths: List[Path]) -> None:
+        """Assert missing read ids raise unless missing_ok"""
+        with p5.Dataset(dataset_paths) as dataset:
+            selection = [dataset.get_reader(0).read_ids[0], str(uuid4())]
+
+            with pytest.raises(RuntimeError, match="Failed to find 1"):
+                list(dataset.reads(selection))
+
+            found = list(dataset.reads(selection, missing_ok=True))
+            assert [str(r.read_id) for r in found] == selection[:1]
+
+    def test_locate(self, dataset_paths: List[Path]) -> None:
+        """Assert read ids are located in the correct file, batch and row"""
+        with p5.Dataset(dataset_paths) as dataset:
+            reader = dataset.get_reader(1)
+            packed = p5.pack_read_ids([reader.read_ids[1050], str(uuid4())])
+
+            found, files, locations = dataset.read_id_index.locate(packed)
+            assert found.tolist() == [True, False]
+            assert files.tolist() == [1]
+            assert locations.tolist() == [[1, 50]]
+
+    def test_bounded_readers(self, dataset_paths: List[Path]) -> None:
+        """Assert the number of readers held by the dataset is bounded"""
+        with p5.Dataset(dataset_paths, max_open_readers=1, threads=1) as dataset:
+            assert len(list(dataset.reads())) == 1135
+            assert len(dataset._readers) == 1
+
+            assert dataset.get_reader(dataset_paths[0]) is dataset.get_reader(0)
+            with pytest.raises(KeyError):
+                dataset.get_reader("not_in_dataset.pod5")
+
+    def test_evicted_readers_closed(self, dataset_paths: List[Path]) -> None:
+        """Assert evicted readers are closed once no batch is loaded from them"""
+        with p5.Dataset(dataset_paths, max_open_readers=1, threads=2) as dataset:
+            first = dataset.get_reader(0)
+            assert dataset.get_reader(1) is not first
+            assert first._file_reader is None
+
+            readers = []
+            for batch in dataset.read_batches():
+                # The reader of a yielded batch is open even once evicted
+                assert batch._reader._file_reader is not None
+                assert all(
+                    read.num_samples == len(read.signal) for read in batch.reads()
+                )
+                readers.append(batch._reader)
+            del batch
+            assert not dataset._reader_loads
+            assert not dataset._released_readers
+            assert [reader._file_reader is None for reader in readers] == [
+                True,
+                True,
+                True,
+                False,
+            ]
+            last = readers[-1]
+        assert last._file_reader is None
+
+    def test_referenced_batches_keep_readers(self, dataset_paths: List[Path]) -> None:
+        """Assert evicted readers stay open while records loaded from them are held"""
+        with p5.Dataset(dataset_paths, max_open_readers=1, threads=1) as dataset:
+            records = list(dataset.reads())
+            readers = list(
+                {id(read._reader): read._reader for read in records}.values()
+            )
+            assert len(readers) == 3
+
+            # Signal is read lazily from the reader of each record
+            for read in records[::100] + records[-1:]:
+                assert read._reader._file_reader is not None
+                assert len(read.signal) == read.num_samples
+
+            del records, read
+            gc.collect()
+            assert not dataset._reader_loads
+            assert not dataset._released_readers
+            assert [reader._file_reader is None for reader in readers] == [
+                True,
+                True,
+                False,
+            ]
+
+    def test_duplicate_reader_closed(
+        self, dataset_paths: List[Path], monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Assert a reader opened by losing a race to open its file is closed"""
+        opened: List[p5.Reader] = []
+
+        with p5.Dataset(dataset_paths) as dataset:
+            winner = p5.Reader(dataset_paths[0])
+
+            def open_after_another_thread(path: Path) -> p5.Reader:
+                dataset._readers[0] = winner
+                opened.append(p5.Reader(path))
+                return opened[-1]
+
+            monkeypatch.setattr("pod5.dataset.Reader", open_after_another_thread)
+            assert dataset.get_reader(0) is winner
+            assert opened[0]._file_reader is None
+
+    def test_bounded_batches(
+        self, dataset_paths: List[Path], monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Assert at most `threads` batches are loaded ahead of the one yielded"""
+        loaded: List[int] = []
+        read_planned_batch = p5.Reader._read_planned_batch
+
+        def load(reader: p5.Reader, *args, **kwargs) -> Optional[p5.ReadRecordBatch]:
+            batch = read_planned_batch(reader, *args, **kwargs)
+            loaded.append(1)
+            return batch
+
+        monkeypatch.setattr(p5.Reader, "_read_planned_batch", load)
+        with p5.Dataset(dataset_paths, threads=1) as dataset:
+            for yielded, batch in enumerate(dataset.read_batches(), 1):
+                # Wait for loading to stall on the bounded window of batches
+                time.sleep(0.1)
+                assert len(loaded) - yielded <= 1
+            assert yielded == 4
+            assert len(loaded) == 4
+
+    def test_directory(self, dataset_paths: List[Path]) -> None:
+        """Assert directories are searched for pod5 files"""
+        with p5.Dataset(dataset_paths[0].parent) as dataset:
+            assert set(dataset_paths).issubset(set(dataset.paths))
+
+        with pytest.raises(FileNotFoundError):
+            p5.Dataset(dataset_paths[0].parent / "missing.pod5")
@@ -0,0 +1,86 @@
+"""
+Testing pod5 read filters
+"""
+import numpy
+import pyarrow as pa
+import pyarrow.compute as pc
+import pytest
+
+from pod5.filters import matching_batch_rows, read_filter_expression
+
+
+class TestReadFilterExpression:
+    @pytest.mark.parametrize(
+        "where,expected",
+        [
+            ("channel <= 128", pc.field("channel") <= 128),
+            ("128 >= channel", pc.field("channel") <= 128),
+            (
+                "1 <= channel < 129",
+                (pc.field("channel") >= 1) & (pc.field("channel") < 129),
+            ),
+            (
+                "end_reason == 'signal_positive' and num_samples > 10000",
+                (pc.field("end_reason") == "signal_positive")
+                & (pc.field("num_samples") > 10000),
+            ),
+            (
+                "not (well == 1 or well != 2)",
+                ~((pc.field("well") == 1) | (pc.field("well") != 2)),
+            ),
+            ("well in (1, 2)", pc.field("well").isin([1, 2])),
+            ("pore_type not in ['a']", ~pc.field("pore_type").isin(["a"])),
+            ("end_reason_forced", pc.field("end_reason_forced") == True),  # noqa: E712
+        ],
+    )
+    def test_parse(self, where: str, expected: pc.Expression) -> None:
+        """Assert string filters are parsed to the expected expressions"""
+        assert read_filter_expression(where).equals(expected)
+
+    def test_expression_unchanged(self) -> None:
+        """Assert expressions are passed through"""
+        expression = pc.field("channel") == 1
+        assert read_filter_expression(expression) is expression
+
+    @pytest.mark.parametrize(
+        "where",
+        [
+            "channel <=",
+            "channel + 1 > 2",
+            "channel > well",
+            "1 < 2",
+            "channel in 5",
+            "channel > __import__('os')",
+            "channel is None",
+        ],
+    )
+    def test_invalid(self, where: str) -> None:
+        """Assert invalid string filters are rejected"""
+        with pytest.raises(ValueError):
+            read_filter_expression(where)
+
+        with pytest.raises(TypeError):
+            read_filter_expression(1)  # type: ignore
+
+
+class TestMatchingBatchRows:
+    def test_matching_batch_rows(self) -> None:
+        """Assert the matching batch rows are returned, limited to any selection"""
+        batch = pa.RecordBatch.from_arrays(
+            [
+                pa.array(numpy.arange(10, dtype=numpy.uint16)),
+                pa.array(["a", "b"] * 5).dictionary_encode(),
+            ],
+            names=["channel", "end_reason"],
+        )
+        expression = read_filter_expression("channel >= 4 and end_reason == 'a'")
+
+        rows = matching_batch_rows(batch, expression)
+        assert rows.dtype == numpy.uint32
+        assert rows.tolist() == [4, 6, 8]
+
+        selected = numpy.array([1, 6, 8, 9], dtype=numpy.uint32)
+        assert matching_batch_rows(batch, expression, selected).tolist() == [6, 8]
+
+        nothing = read_filter_expression("channel > 100")
+        assert len(matching_batch_rows(batch, nothing)) == 0
@@ -20,3 +20,15 @@ class TestReads:
         lines = str(capsys.readouterr().out).splitlines()
         assert len(lines) == 1 + 10 + 25
         assert sum("read_id" in line for line in lines) == 1
+
+
+class TestSummary:
+    def test_summary(self, capsys: pytest.CaptureFixture, pod5_factory) -> None:
+        """Assert that pod5 inspect summary reports batch and read counts"""
+        inspect_pod5("summary", [pod5_factory(1100)])
+
+        lines = str(capsys.readouterr().out).splitlines()
+        assert "Batch 1, 1000 reads" in lines
+        assert "Batch 2, 100 reads" in lines
+        assert "Found 2 batches, 1100 reads" in lines
+        assert sum(line.startswith("Run info") for line in lines) > 0
@@ -0,0 +1,178 @@
+"""
+Testing the pod5 read id index
+"""
+import pickle
+from pathlib import Path
+from uuid import uuid4
+
+import numpy
+import pytest
+
+import pod5 as p5
+from pod5.api_utils import Pod5ApiException, pack_read_ids
+from pod5.read_id_index import read_id_index_path
+
+
+class TestReadIdIndex:
+    def test_search_matches_file_reader(self, pod5_factory) -> None:
+        """Assert the index traversal plan is identical to the native plan"""
+        path = pod5_factory(1100)
+        with p5.Reader(path) as reader:
+            index = reader.build_read_id_index()
+            assert index.read_count == 1100
+            assert index.batch_count == reader.batch_count
+            assert index.file_identifier == reader.file_identifier
+
+            numpy.random.seed(1)
+            selection = list(numpy.random.choice(reader.read_ids, 50, replace=False))
+            selection += [str(uuid4()) for _ in range(5)]
+            packed = pack_read_ids(selection)
+
+            found, counts, rows = index.search(packed)
+
+            batch_rows = numpy.empty(dtype="u4", shape=packed.shape[0])
+            batch_counts = numpy.empty(dtype="u4", shape=reader.batch_count)
+            expected = reader.inner_file_reader.plan_traversal(
+                packed, batch_counts, batch_rows
+            )
+
+            assert found == expected == 50
+            assert counts.tolist() == batch_counts.tolist()
+            assert rows[:found].tolist() == batch_rows[:found].tolist()
+
+    def test_save_load(self, tmp_path: Path, pod5_factory) -> None:
+        """Assert a saved index can be loaded and searched"""
+        path = pod5_factory(10)
+        with p5.Reader(path) as reader:
+            index = reader.build_read_id_index()
+            index.save(tmp_path / "test.idx")
+
+            loaded = p5.ReadIdIndex.load(tmp_path / "test.idx", reader.file_identifier)
+            assert loaded.read_count == 10
+            assert loaded.batch_count == reader.batch_count
+
+            packed = pack_read_ids(reader.read_ids[3:6])
+            found, counts, rows = loaded.search(packed)
+            assert found == 3
+            assert counts.tolist() == [3]
+            assert rows.tolist() == [3, 4, 5]
+
+    def test_save_replaces(self, tmp_path: Path, pod5_factory) -> None:
+        """Assert saving over a sidecar replaces it without leaving temporary files"""
+        path = pod5_factory(10)
+        with p5.Reader(path) as reader:
+            index_path = tmp_path / "test.idx"
+            reader.build_read_id_index().save(index_path)
+            loaded = p5.ReadIdIndex.load(index_path, reader.file_identifier)
+
+            reader.build_read_id_index().save(index_path)
+            assert [entry.name for entry in tmp_path.iterdir()] == ["test.idx"]
+            assert loaded.read_count == 10
+            assert len(loaded.sorted_read_ids.tobytes()) == 10 * 16
+
+    def test_load_raises(self, tmp_path: Path, pod5_factory) -> None:
+        """Assert that invalid index files are rejected"""
+        path = pod5_factory(10)
+        with p5.Reader(path) as reader:
+            reader.build_read_id_index().save(tmp_path / "test.idx")
+
+            with pytest.raises(Pod5ApiException, match="does not match"):
+                p5.ReadIdIndex.load(tmp_path / "test.idx", uuid4())
+
+            (tmp_path / "bad.idx").write_bytes(b"not an index" * 10)
+            with pytest.raises(Pod5ApiException, match="Not a pod5 read id index"):
+                p5.ReadIdIndex.load(tmp_path / "bad.idx", reader.file_identifier)
+
+            (tmp_path / "empty.idx").write_bytes(b"")
+            with pytest.raises(Pod5ApiException, match="truncated"):
+                p5.ReadIdIndex.load(tmp_path / "empty.idx", reader.file_identifier)
+
+    def test_reader_sidecar(self, tmp_path: Path, pod5_factory) -> None:
+        """Assert the Reader selects reads using the index sidecar"""
+        path = tmp_path / "sidecar.pod5"
+        path.write_bytes(pod5_factory(1100).read_bytes())
+
+        with p5.Reader(path) as reader:
+            index_path = reader.write_read_id_index()
+            assert index_path == read_id_index_path(path)
+            assert index_path.is_file()
+
+        with p5.Reader(path) as reader:
+            selection = [reader.read_ids[idx] for idx in [1099, 3, 1000, 999]]
+            read_ids = [str(read.read_id) for read in reader.reads(selection)]
+            assert reader._read_id_index is not None
+            assert sorted(read_ids) == sorted(selection)
+
+            with pytest.raises(RuntimeError, match="Failed to find"):
+                list(reader.reads([str(uuid4())]))
+
+    def test_reader_ignores_mismatched_sidecar(
+        self, tmp_path: Path, pod5_factory
+    ) -> None:
+        """Assert the Reader ignores a sidecar from a different file"""
+        path = tmp_path / "mismatched.pod5"
+        path.write_bytes(pod5_factory(10).read_bytes())
+
+        with p5.Reader(pod5_factory(100)) as other:
+            other.write_read_id_index(read_id_index_path(path))
+
+        with p5.Reader(path) as reader:
+            selection = reader.read_ids[:2]
+            assert len(list(reader.reads(selection))) == 2
+            assert reader._read_id_index is None
+
+    def test_reader_ignores_empty_sidecar(self, tmp_path: Path, pod5_factory) -> None:
+        """Assert the Reader ignores a zero-byte sidecar"""
+        path = tmp_path / "empty.pod5"
+        path.write_bytes(pod5_factory(10).read_bytes())
+        read_id_index_path(path).write_bytes(b"")
+
+        with p5.Reader(path) as reader:
+            selection = reader.read_ids[:2]
+            assert len(list(reader.reads(selection))) == 2
+            assert reader._read_id_index is None
+
+    def test_pickle(self, tmp_path: Path, pod5_factory) -> None:
+        """Assert sidecar indexes are pickled by path and others by value"""
+        path = pod5_factory(20)
+        with p5.Reader(path) as reader:
+            index = reader.build_read_id_index()
+            index_path = tmp_path / "index.idx"
+            index.save(index_path)
+            packed = pack_read_ids(reader.read_ids)
+
+            loaded = p5.ReadIdIndex.load(index_path, reader.file_identifier)
+            for original in (index, loaded):
+                restored = pickle.loads(pickle.dumps(original))
+                assert restored.file_identifier == original.file_identifier
+                _, counts, rows = restored.search(packed)
+                _, expected_counts, expected_rows = original.search(packed)
+                assert numpy.array_equal(counts, expected_counts)
+                assert numpy.array_equal(rows, expected_rows)
+
+            assert len(pickle.dumps(loaded)) < len(pickle.dumps(index))
+            assert pickle.loads(pickle.dumps(loaded))._path == index_path
+
+    def test_reader_read_id_index(self, tmp_path: Path, pod5_factory) -> None:
+        """Assert the Reader prefers the sidecar and exposes the index arrays"""
+        path = tmp_path / "accessors.pod5"
+        path.write_bytes(pod5_factory(1100).read_bytes())
+
+        with p5.Reader(path) as reader:
+            built = reader.read_id_index()
+            assert not read_id_index_path(path).exists()
+            assert built.sorted_read_ids.shape == (1100,)
+            assert built.batches.shape == built.batch_rows.shape == (1100,)
+
+            read_ids = sorted(
+                bytes(read_id) for read_id in pack_read_ids(reader.read_ids)
+            )
+            assert [bytes(read_id) for read_id in built.sorted_read_ids] == read_ids
+            reader.write_read_id_index()
+
+        with p5.Reader(path) as reader:
+            loaded = reader.read_id_index()
+            assert reader._read_id_index is loaded
+            assert numpy.array_equal(loaded.sorted_read_ids, built.sorted_read_ids)
+            assert numpy.array_equal(loaded.batches, built.batches)
+            assert numpy.array_equal(loaded.batch_rows, built.batch_rows)
@@ -1,7 +1,14 @@
 """
 Testing Pod5Reader
 """
-from typing import Type
+import asyncio
+from dataclasses import replace
+import mmap
+import multiprocessing
+import os
+import pickle
+import threading
+from typing import List, Type
 from unittest import mock
 from uuid import UUID, uuid4
 
@@ -10,15 +17,24 @@ import numpy.typing
 import packaging
 from pathlib import Path
 import pyarrow as pa
+import pyarrow.compute as pc
 
 import pytest
 import lib_pod5 as p5b
 
 import pod5 as p5
-from pod5.api_utils import format_read_ids
+from pod5.api_utils import Pod5ApiException, format_read_ids
 from pod5.pod5_types import Calibration, EndReason, RunInfo
-from pod5.reader import ArrowTableHandle, ReadRecordBatch, SignalRowInfo
-from tests.conftest import POD5_PATH
+from pod5.reader import (
+    ArrowTableHandle,
+    ReadRecordBatch,
+    Signal,
+    SignalRowInfo,
+    _AsyncSignalLoaderWaiter,
+    _PlannedSignal,
+    _release_planned_signal,
+)
+from tests.conftest import POD5_PATH, _random_read_pre_compressed
 
 
 class TestPod5Reader:
@@ -165,6 +181,47 @@ class TestPod5Reader:
         # Clean reader resources
         del pod5_file_reader
 
+    def test_lazy_tables(self, pod5_factory) -> None:
+        """Assert the run info and signal tables are opened in one shared mapping"""
+        path = pod5_factory(10)
+        with p5.Reader(path) as reader:
+            assert reader._run_info_handle is None
+            assert reader._signal_handle is None
+            assert len(reader.read_ids) == 10
+
+            assert reader.signal_table.num_record_batches > 0
+            assert reader.run_info_table.num_record_batches > 0
+            assert reader._signal_handle is not None
+            assert reader._run_info_handle is not None
+            for handle in (
+                reader._read_handle,
+                reader._run_info_handle,
+                reader._signal_handle,
+            ):
+                assert handle._mapping is reader._mapping
+            assert reader._mapping.mmap is not None
+
+        with pytest.raises(RuntimeError, match="closed"):
+            reader.signal_table
+
+    def test_lazy_tables_without_mmap(self, pod5_factory) -> None:
+        """Assert tables open through file handles when the file cannot be mapped"""
+        path = pod5_factory(10)
+        with p5.Reader(path) as reader:
+            expected = {read.read_id: read.signal for read in reader.reads()}
+
+        with mock.patch("pod5.reader.mmap.mmap", side_effect=OSError):
+            with p5.Reader(path) as reader:
+                assert reader._mapping is not None
+                assert reader._mapping.mmap is None
+                signals = {read.read_id: read.signal for read in reader.reads()}
+                assert reader._signal_handle is not None
+                assert reader._signal_handle._fh is not None
+
+        assert signals.keys() == expected.keys()
+        for read_id, signal in signals.items():
+            assert numpy.array_equal(signal, expected[read_id])
+
 
 class TestRecordBatch:
     def test_get_read(self, pod5_factory) -> None:
@@ -206,6 +263,48 @@ class TestRecordBatch:
             # assert type(batch.read_number_column.to_numpy().tolist()) == list
             assert batch.read_number_column.to_numpy().tolist() == rnums
 
+    def test_read_record_views(self, pod5_factory) -> None:
+        """Assert slotted read records match the arrow scalars of their batch"""
+        path = pod5_factory(10)
+        with p5.Reader(path) as reader:
+            batch = reader.get_batch(0)
+            columns = batch.columns
+            for row, read in enumerate(batch.reads()):
+                assert not hasattr(read, "__dict__")
+
+                assert read.read_id == UUID(bytes=columns.read_id[row].as_py())
+                assert read.read_number == columns.read_number[row].as_py()
+                assert read.start_sample == columns.start[row].as_py()
+                assert read.num_samples == columns.num_samples[row].as_py()
+                assert read.median_before == columns.median_before[row].as_py()
+                assert read.pore.pore_type == columns.pore_type[row].as_py()
+                assert read.pore.well == columns.well[row].as_py()
+                assert read.calibration.scale == columns.calibration_scale[row].as_py()
+                assert (
+                    read.tracked_scaling.shift
+                    == columns.tracked_scaling_shift[row].as_py()
+                )
+                assert read.end_reason.forced == columns.end_reason_forced[row].as_py()
+                assert read.end_reason.name == columns.end_reason[row].as_py()
+                assert read.end_reason_index == columns.end_reason[row].index.as_py()
+                assert read.run_info_index == columns.run_info[row].index.as_py()
+                assert read.run_info.acquisition_id == columns.run_info[row].as_py()
+                assert read.byte_count == sum(r.byte_count for r in read.signal_rows)
+                assert type(read.read_number) is int
+                assert type(read.median_before) is float
+
+            # Columns are converted once per batch and shared by every record
+            assert batch._values["channel"] is batch._values["channel"]
+            first, second = batch.get_read(0), batch.get_read(1)
+            if first.end_reason == second.end_reason:
+                assert first.end_reason is second.end_reason
+
+            # A single record counts the bytes of its own signal rows only
+            single = reader.get_batch(0).get_read(3)
+            assert single.byte_count == sum(r.byte_count for r in single.signal_rows)
+            assert single._batch._read_byte_counts is None
+            assert batch._read_byte_counts is not None
+
     def test_read_batches(self, pod5_factory) -> None:
         n_reads = 1100
         path = pod5_factory(n_reads)
@@ -238,3 +337,950 @@ class TestRecordBatch:
                 batch.cached_sample_count_column
             with pytest.raises(RuntimeError, match="No cached signal data available"):
                 batch.cached_samples_column
+            with pytest.raises(RuntimeError, match="No cached signal data available"):
+                batch.cached_contiguous_samples
+            with pytest.raises(RuntimeError, match="No cached signal data available"):
+                batch.cached_samples_array
+
+    def test_contiguous_samples(self, pod5_factory) -> None:
+        """Assert preloaded samples are available as one contiguous buffer"""
+        path = pod5_factory(1100)
+        with p5.Reader(path) as reader:
+            expected = {read.read_id: read.signal for read in reader.reads()}
+            selection = reader.read_ids[::7]
+
+            for batch in reader.read_batches(preload={"contiguous_samples"}):
+                samples, offsets = batch.cached_contiguous_samples
+                assert samples.dtype == numpy.int16
+                assert offsets.dtype == numpy.uint64
+                assert len(offsets) == batch.num_reads + 1
+                assert offsets[-1] == len(samples)
+
+                array = batch.cached_samples_array
+                assert isinstance(array, pa.LargeListArray)
+                assert array.values.buffers()[1].address == samples.ctypes.data
+
+                for read, read_samples in zip(batch.reads(), array):
+                    assert read.has_cached_signal
+                    assert numpy.array_equal(read.signal, expected[read.read_id])
+                    assert numpy.array_equal(
+                        read_samples.values.to_numpy(), expected[read.read_id]
+                    )
+
+            batches = reader.read_batches(
+                selection=selection, preload={"contiguous_samples"}
+            )
+            for batch in batches:
+                samples, offsets = batch.cached_contiguous_samples
+                assert len(offsets) == len(batch.read_id_column) + 1
+                for read in batch.reads():
+                    start, end = offsets[read._selected_batch_index :][:2]
+                    assert numpy.array_equal(samples[start:end], read.signal)
+                    assert numpy.array_equal(read.signal, expected[read.read_id])
+
+    def test_contiguous_signal_cache(self, pod5_factory) -> None:
+        """Assert reads are views of a natively loaded contiguous signal cache"""
+        path = pod5_factory(10)
+        with p5.Reader(path) as reader:
+            expected = [read.signal for read in reader.reads()]
+            offsets = numpy.zeros(len(expected) + 1, dtype=numpy.uint64)
+            numpy.cumsum([len(signal) for signal in expected], out=offsets[1:])
+            samples = numpy.concatenate(expected)
+
+            batch = reader.get_batch(0)
+            batch.set_cached_signal(
+                mock.Mock(contiguous_samples=samples, sample_offsets=offsets)
+            )
+            assert batch.cached_contiguous_samples[0] is samples
+            for read, signal in zip(batch.reads(), expected):
+                assert numpy.array_equal(read.signal, signal)
+                assert numpy.shares_memory(read.signal, samples)
+
+
+def _batch_read_ids(reader: p5.Reader, batch_index: int) -> List[str]:
+    """Return the read ids of a batch, run in a worker process"""
+    return p5.format_read_ids(reader.get_batch(batch_index).read_id_column)
+
+
+class TestPickle:
+    def test_round_trip(self, pod5_factory) -> None:
+        """Assert unpickled readers reopen the file lazily"""
+        path = pod5_factory(1100)
+        with p5.Reader(path, signal_cache_bytes=1024) as reader:
+            expected = {read.read_id: read.signal for read in reader.reads()}
+            restored = pickle.loads(pickle.dumps(reader))
+
+        assert restored._reopen_pending
+        assert restored.path == path
+        assert restored.file_identifier == reader.file_identifier
+        assert restored.file_version == reader.file_version
+        assert restored.signal_cache_info().max_bytes == 1024
+        assert restored._file_reader is None
+
+        with restored:
+            signals = {read.read_id: read.signal for read in restored.reads()}
+            assert not restored._reopen_pending
+            assert signals.keys() == expected.keys()
+            for read_id, signal in signals.items():
+                assert numpy.array_equal(signal, expected[read_id])
+
+        with pytest.raises(RuntimeError, match="closed Reader"):
+            pickle.dumps(restored)
+
+    def test_file_replaced(self, tmp_path: Path, pod5_factory) -> None:
+        """Assert reopening a file which was replaced raises"""
+        path = tmp_path / "replaced.pod5"
+        path.write_bytes(pod5_factory(10).read_bytes())
+        with p5.Reader(path) as reader:
+            state = pickle.dumps(reader)
+
+        path.write_bytes(pod5_factory(10, name="other.pod5").read_bytes())
+        restored = pickle.loads(state)
+        with pytest.raises(Pod5ApiException, match="File identifier"):
+            restored.read_ids
+
+    def test_spawn_pool(self, pod5_factory) -> None:
+        """Assert readers can be passed to spawned worker processes"""
+        path = pod5_factory(2500)
+        with p5.Reader(path) as reader:
+            expected = reader.read_ids
+            ctx = multiprocessing.get_context("spawn")
+            with ctx.Pool(2) as pool:
+                batches = pool.starmap(
+                    _batch_read_ids, [(reader, idx) for idx in range(3)]
+                )
+        assert [read_id for batch in batches for read_id in batch] == expected
+
+
+class TestReadahead:
+    def test_read_batches(self, pod5_factory) -> None:
+        """Assert batches iterated with readahead match and prefetching is counted"""
+        path = pod5_factory(2500)
+        with p5.Reader(path) as reader:
+            expected = [read.read_id for read in reader.reads()]
+            assert reader.readahead_info().batches == 0
+
+            with mock.patch.object(
+                ArrowTableHandle, "prefetch", autospec=True
+            ) as prefetch:
+                reads = [
+                    read.read_id
+                    for batch in reader.read_batches(readahead=2)
+                    for read in batch.reads()
+                ]
+            assert reads == expected
+
+            assert prefetch.call_count > 2
+            for call in prefetch.call_args_list:
+                _, offset, length = call.args
+                assert offset % mmap.PAGESIZE == 0
+                assert 0 < length <= path.stat().st_size
+
+            info = reader.readahead_info()
+            assert info.batches == reader.batch_count == 3
+            assert info.prefetched_batches == prefetch.call_count
+            assert info.prefetched_bytes > 0
+            assert info.fetch_seconds >= 0 and info.process_seconds >= 0
+
+    def test_selections(self, pod5_factory, monkeypatch) -> None:
+        """Assert readahead works for selections, including without madvise"""
+        path = pod5_factory(2500)
+        monkeypatch.delattr(mmap, "MADV_WILLNEED", raising=False)
+        with p5.Reader(path) as reader:
+            selection = reader.read_ids[::10]
+            reads = [str(read.read_id) for read in reader.reads(selection, readahead=1)]
+            assert reads == selection
+
+            batches = reader.read_batches(batch_selection=iter([2, 0]), readahead=4)
+            assert [batch.num_reads for batch in batches] == [500, 1000]
+            assert reader.readahead_info().batches == 5
+
+            assert len(list(reader.read_batches(readahead=0))) == 3
+            assert reader.readahead_info().batches == 5
+
+            with pytest.raises(ValueError, match="readahead"):
+                list(reader.read_batches(readahead=-1))
+
+
+class _NotifyingLoader:
+    """A signal loader completing batches on a thread, signalling a ready fd"""
+
+    def __init__(self, batch_count: int) -> None:
+        self._batches = list(range(batch_count))
+        self._completed = 0
+        self._fd = -1
+        self.cancelled = False
+
+    @property
+    def batch_ready(self) -> bool:
+        return self._completed > 0 or self.cancelled
+
+    def set_ready_fd(self, fd: int) -> None:
+        self._fd = fd
+
+    def complete_batch(self) -> None:
+        self._completed += 1
+        os.write(self._fd, b"\x01")
+
+    def release_next_batch(self) -> int:
+        assert self.batch_ready
+        self._completed -= 1
+        return self._batches.pop(0)
+
+    def cancel(self) -> None:
+        self.cancelled = True
+
+
+class _FinishedLoader(_NotifyingLoader):
+    """A signal loader which was cancelled, releasing no more batches"""
+
+    def __init__(self) -> None:
+        super().__init__(0)
+        self.cancelled = True
+
+    def release_next_batch(self) -> None:  # type: ignore [override]
+        return None
+
+
+class TestAsyncReader:
+    def test_aread_batches(self, pod5_factory) -> None:
+        """Assert async batch iteration matches synchronous iteration"""
+        path = pod5_factory(2500)
+
+        async def collect(reader: p5.Reader, **kwargs) -> List[List[str]]:
+            return [
+                [str(read.read_id) for read in batch.reads()]
+                async for batch in reader.aread_batches(**kwargs)
+            ]
+
+        with p5.Reader(path) as reader:
+            expected = [
+                [str(read.read_id) for read in batch.reads()]
+                for batch in reader.read_batches()
+            ]
+            assert asyncio.run(collect(reader)) == expected
+            assert asyncio.run(collect(reader, preload={"samples"})) == expected
+            assert asyncio.run(collect(reader, batch_selection=[2, 0])) == [
+                expected[2],
+                expected[0],
+            ]
+
+            selection = reader.read_ids[::7]
+            batches = asyncio.run(collect(reader, selection=selection))
+            assert [read_id for batch in batches for read_id in batch] == selection
+
+            with pytest.raises(ValueError, match="mutually exclusive"):
+                asyncio.run(collect(reader, selection=selection, batch_selection=[0]))
+
+    def test_areads(self, pod5_factory) -> None:
+        """Assert async reads carry their preloaded signal"""
+        path = pod5_factory(1500)
+
+        async def collect(reader: p5.Reader) -> List[p5.ReadRecord]:
+            return [read async for read in reader.areads(preload={"samples"})]
+
+        async def collect_selection(reader: p5.Reader, selection: List[str]) -> None:
+            async for _ in reader.areads(selection):
+                pass
+
+        with p5.Reader(path) as reader:
+            expected = {str(read.read_id): read.signal for read in reader.reads()}
+            reads = asyncio.run(collect(reader))
+            assert [str(read.read_id) for read in reads] == list(expected)
+            for read in reads[::100]:
+                assert read.has_cached_signal
+                assert numpy.array_equal(read.signal, expected[str(read.read_id)])
+
+            with pytest.raises(RuntimeError, match="Failed to find 1"):
+                asyncio.run(
+                    collect_selection(reader, [reader.read_ids[0], str(uuid4())])
+                )
+
+    def test_cancel(self, pod5_factory) -> None:
+        """Assert cancelling an async iteration finalises the generator"""
+        path = pod5_factory(2500)
+
+        async def cancel_after_first_batch(reader: p5.Reader) -> int:
+            seen = 0
+
+            async def consume() -> None:
+                nonlocal seen
+                async for _ in reader.aread_batches(preload={"samples"}):
+                    seen += 1
+                    await asyncio.sleep(10)
+
+            task = asyncio.ensure_future(consume())
+            while seen == 0:
+                await asyncio.sleep(0.01)
+            task.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await task
+            return seen
+
+        with p5.Reader(path) as reader:
+            assert asyncio.run(cancel_after_first_batch(reader)) == 1
+            assert len(list(reader.read_batches(preload={"samples"}))) == 3
+
+    def test_finished_loader(self, pod5_factory) -> None:
+        """Assert a loader releasing no more batches raises rather than hanging"""
+        plan = [(0, None)]
+        with pytest.raises(RuntimeError, match="cancelled or ran out of batches"):
+            _release_planned_signal(
+                _FinishedLoader(), _PlannedSignal(plan), 0  # type: ignore
+            )
+
+        async def collect(reader: p5.Reader) -> List[ReadRecordBatch]:
+            loader = _FinishedLoader()
+            batches = reader._aiterate_batch_plan(plan, loader)  # type: ignore
+            return [batch async for batch in batches]
+
+        with p5.Reader(pod5_factory(10)) as reader:
+            with pytest.raises(RuntimeError, match="cancelled or ran out of batches"):
+                asyncio.run(collect(reader))
+
+    def test_waiter(self) -> None:
+        """Assert batches are awaited through the ready fd, and close cancels"""
+        loader = _NotifyingLoader(3)
+
+        # The waiter is typed to release cache batches, which are ints here
+        async def release_all() -> List[p5b.Pod5SignalCacheBatch]:
+            waiter = _AsyncSignalLoaderWaiter(loader)  # type: ignore
+            try:
+                released = []
+                for _ in range(3):
+                    pending = asyncio.ensure_future(waiter.release_next_batch())
+                    await asyncio.sleep(0.01)
+                    assert not pending.done()
+
+                    # Batches complete on another thread, waking the event loop
+                    thread = threading.Thread(target=loader.complete_batch)
+                    thread.start()
+                    released.append(await asyncio.wait_for(pending, 5))
+                    thread.join()
+                return released
+            finally:
+                waiter.close()
+                assert loader._fd == -1
+                assert waiter._fds is None
+
+        assert asyncio.run(release_all()) == [0, 1, 2]
+        assert loader.cancelled
+
+    def test_waiter_without_pipes(self) -> None:
+        """Assert batches are awaited on a thread when the loop cannot watch pipes"""
+        loader = _NotifyingLoader(2)
+        loader._completed = 2
+
+        async def release_all() -> List[p5b.Pod5SignalCacheBatch]:
+            loop = asyncio.get_running_loop()
+            with mock.patch.object(loop, "add_reader", side_effect=NotImplementedError):
+                waiter = _AsyncSignalLoaderWaiter(loader)  # type: ignore
+            try:
+                assert waiter._fds is None
+                return [await waiter.release_next_batch() for _ in range(2)]
+            finally:
+                waiter.close()
+
+        assert asyncio.run(release_all()) == [0, 1]
+        assert loader._fd == -1
+        assert loader.cancelled
+
+
+class TestReadFilter:
+    def test_reads_where(self, pod5_factory) -> None:
+        """Assert filtered reads match filtering every read in python"""
+        path = pod5_factory(2500)
+        where = "channel <= 1500 and end_reason in ('signal_positive', 'unknown')"
+
+        def matches(read: p5.ReadRecord) -> bool:
+            return read.pore.channel <= 1500 and read.end_reason.name in (
+                "signal_positive",
+                "unknown",
+            )
+
+        with p5.Reader(path) as reader:
+            expected = [str(read.read_id) for read in reader.reads() if matches(read)]
+            assert 0 < len(expected) < reader.num_reads
+
+            assert [str(read.read_id) for read in reader.reads(where=where)] == expected
+            expression = (pc.field("channel") <= 1500) & pc.field("end_reason").isin(
+                ["signal_positive", "unknown"]
+            )
+            reads = list(reader.reads(where=expression, preload={"samples"}))
+            assert [str(read.read_id) for read in reads] == expected
+            for read in reads:
+                assert read.has_cached_signal
+            (last,) = reader.reads([expected[-1]])
+            assert numpy.array_equal(reads[-1].signal, last.signal)
+
+            selection = reader.read_ids[::3]
+            selected = [
+                str(read.read_id) for read in reader.reads(selection) if matches(read)
+            ]
+            filtered = reader.reads(selection, where=where, preload={"sample_count"})
+            assert [str(read.read_id) for read in filtered] == selected
+
+            nothing = list(reader.read_batches(where="channel > 100000"))
+            assert nothing == []
+
+    def test_signal_loaded_for_matches(self, pod5_factory) -> None:
+        """Assert signal is only preloaded for the rows matching the filter"""
+        path = pod5_factory(2500)
+        with p5.Reader(path) as reader:
+            batches = list(
+                reader.read_batches(
+                    batch_selection=[2, 0],
+                    where="num_samples > 50000",
+                    preload={"samples"},
+                )
+            )
+            assert [
+                batch._signal_cache and batch._signal_cache.batch_index
+                for batch in batches
+            ] == [0, 2]
+            for batch in batches:
+                assert batch._signal_cache is not None
+                assert batch._selected_batch_rows is not None
+                rows = list(batch._selected_batch_rows)
+                assert 0 < len(rows) < batch.num_reads
+                assert len(batch._signal_cache.samples) == len(rows)
+                for read in batch.reads():
+                    assert read.num_samples > 50000
+                    assert len(read.signal) == read.num_samples
+
+    def test_batch_selection_preload(self, pod5_factory) -> None:
+        """Assert preloaded signal is released for the selected batches"""
+        path = pod5_factory(2500)
+        with p5.Reader(path) as reader:
+            (batch,) = reader.read_batches(batch_selection=[1], preload={"samples"})
+            assert batch._signal_cache is not None
+            assert batch._signal_cache.batch_index == 1
+            read = next(batch.reads())
+            (expected,) = reader.reads([str(read.read_id)])
+            assert numpy.array_equal(read.signal, expected.signal)
+
+    @pytest.mark.parametrize("asynchronous", [False, True])
+    def test_batch_selection_preload_order(
+        self, pod5_factory, asynchronous: bool
+    ) -> None:
+        """Assert preloaded signal follows a batch selection in any order"""
+        path = pod5_factory(2500)
+        with p5.Reader(path) as reader:
+            last = reader.batch_count - 1
+            batch_selection = [last, 1, 0, 1]
+
+            async def collect() -> List[p5.ReadRecordBatch]:
+                return [
+                    batch
+                    async for batch in reader.aread_batches(
+                        batch_selection=batch_selection, preload={"samples"}
+                    )
+                ]
+
+            if asynchronous:
+                batches = asyncio.run(collect())
+            else:
+                batches = list(
+                    reader.read_batches(
+                        batch_selection=batch_selection, preload={"samples"}
+                    )
+                )
+
+            assert len(batches) == len(batch_selection)
+            for batch, batch_idx in zip(batches, batch_selection):
+                assert batch._signal_cache is not None
+                assert batch._signal_cache.batch_index == batch_idx
+                assert (
+                    batch.read_id_column == reader.get_batch(batch_idx).read_id_column
+                )
+                for read in batch.reads():
+                    (expected,) = reader.reads([str(read.read_id)])
+                    assert numpy.array_equal(read.signal, expected.signal)
+
+    def test_async_where(self, pod5_factory) -> None:
+        """Assert async iteration applies read filters"""
+        path = pod5_factory(1500)
+        where = "read_number % 2 == 0 or well == 1"
+
+        async def collect(reader: p5.Reader, where: str) -> List[str]:
+            return [
+                str(read.read_id)
+                async for read in reader.areads(where=where, preload={"samples"})
+            ]
+
+        with p5.Reader(path) as reader:
+            with pytest.raises(ValueError, match="column name"):
+                asyncio.run(collect(reader, where))
+
+            expected = [
+                str(read.read_id) for read in reader.reads() if read.pore.well == 1
+            ]
+            assert asyncio.run(collect(reader, "well == 1")) == expected
+
+
+class TestColumnarExport:
+    def test_to_table(self, pod5_factory) -> None:
+        n_reads = 1100
+        path = pod5_factory(n_reads)
+        with p5.Reader(path) as reader:
+            table = reader.to_table()
+
+            assert isinstance(table, pa.Table)
+            assert table.num_rows == n_reads
+            assert "signal" not in table.column_names
+            for name in ["pore_type", "end_reason", "run_info"]:
+                assert table.schema.field(name).type == pa.string()
+
+            for idx, read in enumerate(reader.reads()):
+                row = {
+                    name: table.column(name)[idx].as_py() for name in table.column_names
+                }
+                assert UUID(bytes=row["read_id"]) == read.read_id
+                assert row["read_number"] == read.read_number
+                assert row["start"] == read.start_sample
+                assert row["num_samples"] == read.num_samples
+                assert row["channel"] == read.pore.channel
+                assert row["well"] == read.pore.well
+                assert row["pore_type"] == read.pore.pore_type
+                assert row["end_reason"] == read.end_reason.name
+                assert row["end_reason_forced"] == read.end_reason.forced
+                assert row["run_info"] == read.run_info.acquisition_id
+
+    def test_to_table_selection(self, pod5_factory) -> None:
+        n_reads = 1100
+        path = pod5_factory(n_reads)
+        with p5.Reader(path) as reader:
+            table = reader.to_table(batch_selection=[1], columns=["read_id", "channel"])
+            assert table.column_names == ["read_id", "channel"]
+            assert table.num_rows == reader.get_batch(1).num_reads
+            assert format_read_ids(table.column("read_id").combine_chunks()) == (
+                format_read_ids(reader.get_batch(1).read_id_column)
+            )
+
+    def test_to_numpy(self, pod5_factory) -> None:
+        n_reads = 1100
+        path = pod5_factory(n_reads)
+        with p5.Reader(path) as reader:
+            arrays = reader.to_numpy()
+
+            assert arrays["read_id"].shape == (n_reads, 16)
+            assert arrays["read_id"].dtype == numpy.uint8
+            assert format_read_ids(arrays["read_id"]) == reader.read_ids
+            assert arrays["num_samples"].dtype == numpy.uint64
+            assert len(arrays["end_reason"]) == n_reads
+            assert all(isinstance(name, str) for name in arrays["end_reason"])
+
+
+class TestSignalCache:
+    def test_bounded_cache(self, pod5_factory) -> None:
+        """Assert the signal cache evicts batches to stay within its byte budget"""
+        path = pod5_factory(1100)
+        with p5.Reader(path, signal_cache_bytes=None) as unbounded:
+            expected = {read.read_id: read.signal for read in unbounded.reads()}
+            info = unbounded.signal_cache_info()
+            assert info.max_bytes is None
+            assert info.evictions == 0
+            assert info.entries == unbounded.signal_table.num_record_batches
+            batch_bytes = info.current_bytes // info.entries
+
+        max_bytes = int(batch_bytes * 2.5)
+        with p5.Reader(path, signal_cache_bytes=max_bytes) as reader:
+            numpy.random.seed(1)
+            reads = list(reader.reads())
+            for idx in numpy.random.choice(len(reads), 200):
+                read = reads[idx]
+                assert numpy.array_equal(read.signal, expected[read.read_id])
+                assert reader.signal_cache_info().current_bytes <= max_bytes
+
+            info = reader.signal_cache_info()
+            assert info.max_bytes == max_bytes
+            assert info.hits + info.misses >= 200
+            assert info.evictions > 0
+            assert info.entries > 0
+            assert info.misses - info.evictions == info.entries
+
+            reader.close()
+            assert reader.signal_cache_info().entries == 0
+
+    def test_lru_order(self, pod5_factory) -> None:
+        """Assert the least recently used batch is evicted first"""
+        path = pod5_factory(1100)
+        with p5.Reader(path, signal_cache_bytes=None) as reader:
+            for batch_id in range(3):
+                reader._get_signal_batch(batch_id)
+            # Any two of the first three batches fit but not all three
+            max_bytes = reader.signal_cache_info().current_bytes - 1
+
+        with p5.Reader(path, signal_cache_bytes=max_bytes) as reader:
+            first = reader._get_signal_batch(0)
+            reader._get_signal_batch(1)
+            assert reader._get_signal_batch(0) is first
+            reader._get_signal_batch(2)
+
+            # Batch 1 was least recently used so batch 0 is still cached
+            assert reader._get_signal_batch(0) is first
+            info = reader.signal_cache_info()
+            assert (info.hits, info.misses, info.evictions) == (2, 3, 1)
+
+    def test_disabled_cache(self, pod5_factory) -> None:
+        """Assert a zero byte budget retains no batches"""
+        path = pod5_factory(10)
+        with p5.Reader(path, signal_cache_bytes=0) as reader:
+            for read in reader.reads():
+                assert len(read.signal) == read.num_samples
+            info = reader.signal_cache_info()
+            assert info.entries == 0
+            assert info.current_bytes == 0
+            assert info.hits == 0
+
+        with pytest.raises(ValueError):
+            p5.Reader(path, signal_cache_bytes=-1)
+
+
+class TestMemoryUsage:
+    def test_memory_usage(self, pod5_factory) -> None:
+        """Assert memory usage reports the signal cache and memory maps"""
+        path = pod5_factory(1100)
+        with p5.Reader(path) as reader:
+            for read in reader.reads():
+                assert len(read.signal) == read.num_samples
+
+            usage = reader.memory_usage()
+            assert usage.signal_cache_bytes == reader.signal_cache_info().current_bytes
+            assert usage.signal_cache_bytes > 0
+            assert usage.loader_bytes == 0
+            if os.path.exists("/proc/self/smaps"):
+                assert usage.mapped_bytes is not None
+                assert usage.mapped_bytes > 0
+            else:
+                assert usage.mapped_bytes is None
+
+            assert usage.pool_backend in p5b.supported_memory_backends()
+            assert usage.pool_max_memory >= usage.pool_bytes_allocated >= 0
+
+    def test_loaders_tracked(self, pod5_factory) -> None:
+        """Assert live signal loaders are tracked until their iteration ends"""
+        path = pod5_factory(2500)
+        with p5.Reader(path) as reader:
+            reads = reader.reads(preload={"samples"})
+            next(reads)
+            assert len(reader._signal_loaders) == 1
+            assert reader.memory_usage().loader_bytes >= 0
+
+            reads.close()
+            del reads
+            assert len(reader._signal_loaders) == 0
+            assert reader.memory_usage().loader_bytes == 0
+
+    @pytest.mark.parametrize("memory_pool", ["system", pa.system_memory_pool()])
+    def test_memory_pool(self, pod5_factory, memory_pool) -> None:
+        """Assert readers open with a selected memory pool"""
+        path = pod5_factory(10)
+        with p5.Reader(path, memory_pool=memory_pool) as reader:
+            assert len(list(reader.reads())) == 10
+            assert reader.memory_usage().pool_backend == "system"
+            restored = pickle.loads(pickle.dumps(reader))
+            assert restored._memory_pool.backend_name == "system"
+
+    def test_invalid_memory_pool(self, pod5_factory) -> None:
+        """Assert unknown memory pools are rejected"""
+        path = pod5_factory(10)
+        with pytest.raises(ValueError, match="Unknown memory pool backend"):
+            p5.Reader(path, memory_pool="tcmalloc")
+        with pytest.raises(TypeError):
+            p5.Reader(path, memory_pool=1)  # type: ignore
+
+
+class TestRunInfos:
+    def test_run_infos(self, pod5_factory) -> None:
+        """Assert run_infos decodes every run info shared with read records"""
+        path = pod5_factory(100)
+        with p5.Reader(path) as reader:
+            run_infos = reader.run_infos()
+            assert len(run_infos) == reader.run_info_table.read_all().num_rows
+            assert all(isinstance(info, RunInfo) for info in run_infos.values())
+
+            for read in reader.reads():
+                assert read.run_info is run_infos[read.run_info.acquisition_id]
+
+    def test_lookup_run_info(self, pod5_factory) -> None:
+        """Assert lazily looked up run infos match the bulk decoded run infos"""
+        path = pod5_factory(100)
+        with p5.Reader(path) as reader:
+            expected = reader.run_infos()
+
+        with p5.Reader(path) as reader:
+            for read in reader.reads():
+                assert read.run_info == expected[read.run_info.acquisition_id]
+            assert len(reader._get_run_info_rows()) == len(expected)
+
+
+class TestFileStats:
+    def test_stats(self, pod5_factory) -> None:
+        """Assert the file statistics match the reads in the file"""
+        path = pod5_factory(1100)
+        with p5.Reader(path) as reader:
+            stats = reader.stats
+            assert isinstance(stats, p5.FileStats)
+            assert reader.stats is stats
+
+            reads = list(reader.reads())
+            assert stats.read_count == reader.num_reads == len(reads)
+            assert stats.sample_count == sum(read.num_samples for read in reads)
+            assert stats.min_start_sample == min(read.start_sample for read in reads)
+            assert stats.max_start_sample == max(read.start_sample for read in reads)
+            assert stats.signal_bytes == (
+                reader.inner_file_reader.get_file_signal_table_location().length
+            )
+
+            expected_counts: dict = {}
+            for read in reads:
+                acquisition_id = read.run_info.acquisition_id
+                expected_counts[acquisition_id] = (
+                    expected_counts.get(acquisition_id, 0) + 1
+                )
+            assert {
+                key: count for key, count in stats.run_info_read_counts.items() if count
+            } == expected_counts
+
+    def test_computed_stats_match_footer(self, pod5_factory) -> None:
+        """Assert computed statistics are identical to footer statistics"""
+        path = pod5_factory(100)
+        with p5.Reader(path) as reader:
+            footer_stats = reader._footer_stats()
+            assert footer_stats is not None
+            assert reader._compute_stats() == footer_stats
+
+    def test_stats_older_file(self) -> None:
+        """Assert statistics are computed for files without footer statistics"""
+        with p5.Reader(POD5_PATH) as reader:
+            assert reader._footer_stats() is None
+            stats = reader.stats
+            assert stats.read_count == 10
+            assert stats.sample_count == sum(read.num_samples for read in reader)
+            assert sum(stats.run_info_read_counts.values()) == 10
+
+
+class TestSignalRange:
+    @pytest.fixture(scope="function")
+    def chunked_pod5(self, tmp_path: Path) -> Path:
+        """Write reads with signal split over several compressed chunks"""
+        path = tmp_path / "chunked.pod5"
+        with p5.Writer(path) as writer:
+            for seed in range(1, 6):
+                read = _random_read_pre_compressed(seed)
+                signal = numpy.random.randint(-2000, 2000, 25_000, dtype=numpy.int16)
+                lengths = [10_000, 7_000, 8_000]
+                chunks = numpy.split(signal, numpy.cumsum(lengths)[:-1])
+                writer.add_read(
+                    replace(
+                        read,
+                        signal_chunks=[p5.vbz_compress_signal(c) for c in chunks],
+                        signal_chunk_lengths=lengths,
+                    )
+                )
+        return path
+
+    def test_signal_range(self, chunked_pod5: Path) -> None:
+        """Assert ranges across chunk boundaries match the full signal"""
+        with p5.Reader(chunked_pod5) as reader:
+            for read in reader.reads():
+                assert len(read.signal_rows) == 3
+                signal = read.signal
+                for start, end in [
+                    (0, 0),
+                    (0, 25_000),
+                    (100, 4196),
+                    (9_000, 11_000),
+                    (9_999, 17_001),
+                    (17_000, 25_000),
+                    (24_000, 30_000),
+                    (30_000, 40_000),
+                ]:
+                    expected = signal[start:end]
+                    actual = read.signal_range(start, end)
+                    assert actual.dtype == numpy.int16
+                    assert numpy.array_equal(actual, expected)
+
+                with mock.patch(
+                    "pod5.reader.vbz_decompress_signal", wraps=p5.vbz_decompress_signal
+                ) as decompress:
+                    read.signal_range(12_000, 16_000)
+                    assert decompress.call_count == 1
+
+                with pytest.raises(ValueError):
+                    read.signal_range(-1, 10)
+                with pytest.raises(ValueError):
+                    read.signal_range(10, 5)
+
+    def test_signal_range_cached(self, chunked_pod5: Path) -> None:
+        """Assert ranges are sliced from preloaded signal"""
+        with p5.Reader(chunked_pod5) as reader:
+            for read in reader.reads(preload={"samples"}):
+                assert read.has_cached_signal
+                assert numpy.array_equal(
+                    read.signal_range(9_000, 11_000), read.signal[9_000:11_000]
+                )
+
+    def test_signal_windows(self, chunked_pod5: Path) -> None:
+        """Assert batched windows match the full signal of each read"""
+        with p5.Reader(chunked_pod5) as reader:
+            batch = reader.get_batch(0)
+            starts = [0, 9_000, 16_500, 20_000, 21_000]
+            windows = batch.signal_windows(starts, 4_000)
+            assert windows.shape == (5, 4_000)
+            for read, start, window in zip(batch.reads(), starts, windows):
+                assert numpy.array_equal(window, read.signal[start : start + 4_000])
+
+            with pytest.raises(ValueError):
+                batch.signal_windows([0, 0], 10)
+            with pytest.raises(ValueError):
+                batch.signal_windows([0, 0, 0, 0, 24_000], 4_000)
+
+    def test_signal_pa_batch(self, chunked_pod5: Path) -> None:
+        """Assert batch calibration matches the calibrated signal of each read"""
+        with p5.Reader(chunked_pod5) as reader:
+            batch = reader.get_batch(0)
+            samples, offsets = batch.signal_pa_batch()
+            assert samples.dtype == numpy.float32
+            assert offsets.dtype == numpy.uint64
+            assert len(offsets) == batch.num_reads + 1
+            for read, start, end in zip(batch.reads(), offsets[:-1], offsets[1:]):
+                assert numpy.array_equal(samples[start:end], read.signal_pa)
+
+            out = numpy.empty(len(samples), dtype=numpy.float16)
+            half_samples, _ = batch.signal_pa_batch(out=out)
+            assert half_samples is out
+            assert numpy.array_equal(out, samples.astype(numpy.float16))
+            assert batch.signal_pa_batch(dtype=numpy.float16)[0].dtype == numpy.float16
+
+            with pytest.raises(ValueError):
+                batch.signal_pa_batch(out=numpy.empty(len(samples) - 1, numpy.float32))
+            with pytest.raises(ValueError):
+                batch.signal_pa_batch(out=numpy.empty(len(samples), numpy.int16))
+
+    def test_signal_pa_batch_selected(self, chunked_pod5: Path) -> None:
+        """
+        Assert batch calibration covers only the selected reads, whether their
+        samples, only their sample counts or nothing was preloaded
+        """
+        with p5.Reader(chunked_pod5) as reader:
+            read_ids = [str(read.read_id) for read in reader.reads()][1::2]
+            expected = {str(read.read_id): read.signal_pa for read in reader.reads()}
+
+            for preload in [None, {"samples"}, {"sample_count"}]:
+                (batch,) = reader.read_batches(read_ids, preload=preload)
+                samples, offsets = batch.signal_pa_batch()
+                assert len(offsets) == len(read_ids) + 1
+                for read, start, end in zip(batch.reads(), offsets[:-1], offsets[1:]):
+                    assert numpy.array_equal(
+                        samples[start:end], expected[str(read.read_id)]
+                    )
+
+    def test_signal_chunks(self, chunked_pod5: Path) -> None:
+        """Assert the described chunks of a batch decode to the signal of each read"""
+        with p5.Reader(chunked_pod5) as reader:
+            batch = reader.get_batch(0)
+            chunk_args, offsets = batch._signal_chunks(None)
+            buffers, compressed, chunk_buffers, begins, ends, counts = chunk_args[:6]
+            read_chunk_offsets, first_samples = chunk_args[6:]
+            for idx, read in enumerate(batch.reads()):
+                signal = numpy.empty((1, int(offsets[idx + 1] - offsets[idx])), "i2")
+                p5b.decode_signal_windows(
+                    buffers,
+                    compressed,
+                    chunk_buffers,
+                    begins,
+                    ends,
+                    counts,
+                    read_chunk_offsets[idx : idx + 2],
+                    first_samples[idx : idx + 1],
+                    signal.shape[1],
+                    signal,
+                )
+                assert numpy.array_equal(signal[0], read.signal)
+
+
+class TestUncompressedSignal:
+    @staticmethod
+    def _use_uncompressed_signal(reader: p5.Reader) -> None:
+        """Serve this readers signal table batches as uncompressed signal"""
+        get_vbz_signal_batch = reader._get_signal_batch
+
+        def get_uncompressed_signal_batch(batch_id: int) -> Signal:
+            batch = get_vbz_signal_batch(batch_id)
+            samples = [
+                p5.vbz_decompress_signal(
+                    memoryview(batch.signal[row].as_buffer()),
+                    batch.samples[row].as_py(),
+                )
+                for row in range(len(batch.signal))
+            ]
+            return Signal(pa.array(samples, pa.large_list(pa.int16())), batch.samples)
+
+        reader._get_signal_batch = get_uncompressed_signal_batch  # type: ignore
+        reader._is_vbz_compressed = False
+
+    def test_signal_views(self, pod5_factory) -> None:
+        """Assert uncompressed signal is returned as zero-copy views of each row"""
+        path = pod5_factory(100)
+        with p5.Reader(path) as reader:
+            expected = {read.read_id: read.signal for read in reader.reads()}
+
+        with p5.Reader(path) as reader:
+            self._use_uncompressed_signal(reader)
+            for read in reader.reads():
+                signal = read.signal
+                assert signal.dtype == numpy.int16
+                assert numpy.array_equal(signal, expected[read.read_id])
+                if len(read.signal_rows) == 1:
+                    assert not signal.flags.owndata
+                    assert not signal.flags.writeable
+
+                for index in range(len(read.signal_rows)):
+                    chunk = read.signal_for_chunk(index)
+                    assert chunk.dtype == numpy.int16
+                    assert not chunk.flags.owndata
+
+                middle = read.num_samples // 2
+                assert numpy.array_equal(
+                    read.signal_range(middle, middle + 100),
+                    expected[read.read_id][middle : middle + 100],
+                )
+
+    def test_to_read_signal_writeable(self, pod5_factory) -> None:
+        """Assert reads created from signal views own writeable signal"""
+        path = pod5_factory(100)
+        with p5.Reader(path) as reader:
+            self._use_uncompressed_signal(reader)
+            for record in reader.reads():
+                read = record.to_read()
+                assert read.signal.flags.writeable
+                read.signal += 1
+                assert numpy.array_equal(read.signal, record.signal + 1)
+
+    def test_signal_chunks(self, pod5_factory) -> None:
+        """Assert the described chunks of uncompressed signal decode each read"""
+        path = pod5_factory(100)
+        with p5.Reader(path) as reader:
+            self._use_uncompressed_signal(reader)
+            batch = reader.get_batch(0)
+            chunk_args, offsets = batch._signal_chunks(None)
+            buffers, compressed, chunk_buffers, begins, ends, counts = chunk_args[:6]
+            read_chunk_offsets, first_samples = chunk_args[6:]
+            assert not compressed.any()
+            for idx, read in enumerate(batch.reads()):
+                signal = numpy.empty((1, int(offsets[idx + 1] - offsets[idx])), "i2")
+                p5b.decode_signal_windows(
+                    buffers,
+                    compressed,
+                    chunk_buffers,
+                    begins,
+                    ends,
+                    counts,
+                    read_chunk_offsets[idx : idx + 2],
+                    first_samples[idx : idx + 1],
+                    signal.shape[1],
+                    signal,
+                )
+                assert numpy.array_equal(signal[0], read.signal)
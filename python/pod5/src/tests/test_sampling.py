@@ -0,0 +1,215 @@
+"""
+Testing the pod5 training window sampler
+"""
+import pickle
+from dataclasses import replace
+from pathlib import Path
+from typing import List
+
+import lib_pod5 as p5b
+import numpy
+import pyarrow as pa
+import pytest
+
+import pod5 as p5
+from pod5.sampling import _signal_batch_data
+from tests.conftest import _random_read_pre_compressed
+
+WINDOW = 3000
+
+
+@pytest.fixture(scope="function")
+def chunked_paths(tmp_path: Path) -> List[Path]:
+    """Write files of reads with signal split over several compressed chunks"""
+    paths = []
+    for file_idx in range(2):
+        path = tmp_path / f"chunked_{file_idx}.pod5"
+        with p5.Writer(path) as writer:
+            for seed in range(1, 21):
+                read = _random_read_pre_compressed(seed + 100 * file_idx)
+                # The last read of each file is too short to sample from
+                size = 25_000 if seed < 20 else WINDOW - 1
+                signal = numpy.random.randint(-2000, 2000, size, dtype=numpy.int16)
+                lengths = [size // 3, size // 3, size - 2 * (size // 3)]
+                chunks = numpy.split(signal, numpy.cumsum(lengths)[:-1])
+                writer.add_read(
+                    replace(
+                        read,
+                        signal_chunks=[p5.vbz_compress_signal(c) for c in chunks],
+                        signal_chunk_lengths=lengths,
+                    )
+                )
+        paths.append(path)
+    return paths
+
+
+def _expected_reads(paths: List[Path]) -> List[List[p5.ReadRecord]]:
+    """Load the reads of each file for comparison"""
+    return [list(p5.Reader(path).reads()) for path in paths]
+
+
+class TestWindowSampler:
+    def test_fill(self, chunked_paths: List[Path]) -> None:
+        """Assert filled windows match the signal of their reads"""
+        expected = _expected_reads(chunked_paths)
+        with p5.WindowSampler(chunked_paths, WINDOW, seed=1) as sampler:
+            assert sampler.num_reads == 38
+            assert sampler.window_length == WINDOW
+
+            windows = sampler.sample(100)
+            assert len(windows.files) == len(windows.reads) == len(windows.offsets)
+            signal = sampler.fill(windows)
+            assert signal.shape == (100, WINDOW) and signal.dtype == numpy.int16
+
+            pico_amps = numpy.empty((100, WINDOW), dtype=numpy.float32)
+            assert sampler.fill(windows, out=pico_amps, pico_amps=True) is pico_amps
+
+            for row, (file_idx, read_row, offset) in enumerate(zip(*windows)):
+                read = expected[file_idx][read_row]
+                assert read.num_samples >= WINDOW
+                full = read.signal[offset : offset + WINDOW]
+                assert numpy.array_equal(signal[row], full)
+                assert numpy.allclose(pico_amps[row], read.calibrate_signal_array(full))
+
+    def test_fill_raises(self, chunked_paths: List[Path]) -> None:
+        """Assert invalid outputs and windows are rejected"""
+        with p5.WindowSampler(chunked_paths, WINDOW, seed=1) as sampler:
+            windows = sampler.sample(4)
+            with pytest.raises(ValueError, match="out must be"):
+                sampler.fill(windows, out=numpy.empty((4, WINDOW), numpy.float32))
+            with pytest.raises(ValueError, match="out must be"):
+                sampler.fill(windows, out=numpy.empty((3, WINDOW), numpy.int16))
+
+            beyond = windows._replace(offsets=windows.offsets + 25_000)
+            with pytest.raises(ValueError, match="exceed"):
+                sampler.fill(beyond)
+
+        with pytest.raises(ValueError, match="window_length"):
+            p5.WindowSampler(chunked_paths, 0)
+
+        with p5.WindowSampler(chunked_paths, 100_000) as sampler:
+            assert sampler.num_reads == 0
+            with pytest.raises(ValueError, match="No reads"):
+                sampler.sample(1)
+
+    def test_seed_and_shards(self, chunked_paths: List[Path]) -> None:
+        """Assert sampling is reproducible and shards sample disjoint reads"""
+        sampler = p5.WindowSampler(chunked_paths, WINDOW, seed=7)
+        again = p5.WindowSampler(chunked_paths, WINDOW, seed=7)
+        first, second = sampler.sample(50), again.sample(50)
+        for left, right in zip(first, second):
+            assert numpy.array_equal(left, right)
+
+        shard_reads = []
+        for shard in range(3):
+            shard_sampler = sampler.shard(shard, 3)
+            windows = shard_sampler.sample(500)
+            shard_reads.append(set(zip(windows.files, windows.reads)))
+        assert sum(sampler.shard(idx, 3).num_reads for idx in range(3)) == 38
+        assert not shard_reads[0] & shard_reads[1]
+        assert not shard_reads[1] & shard_reads[2]
+
+        with pytest.raises(ValueError, match="shard"):
+            sampler.shard(3, 3)
+
+    def test_nested_shards(self, chunked_paths: List[Path]) -> None:
+        """Assert sharding a shard splits only the reads of that shard"""
+        sampler = p5.WindowSampler(chunked_paths, WINDOW, seed=7)
+        first, second = sampler.shard(0, 2), sampler.shard(1, 2)
+        nested = [first.shard(idx, 2) for idx in range(2)]
+
+        nested_reads = [set(shard._reads.tolist()) for shard in nested]
+        assert not nested_reads[0] & nested_reads[1]
+        assert nested_reads[0] | nested_reads[1] == set(first._reads.tolist())
+        assert not set(first._reads.tolist()) & set(second._reads.tolist())
+
+        windows = [shard.sample(20) for shard in (second, *nested)]
+        assert not any(
+            numpy.array_equal(left.reads, right.reads)
+            for idx, left in enumerate(windows)
+            for right in windows[idx + 1 :]
+        )
+
+    def test_pickle(self, chunked_paths: List[Path]) -> None:
+        """Assert samplers pickle without their open files and continue sampling"""
+        with p5.WindowSampler(chunked_paths, WINDOW, seed=3).shard(1, 2) as sampler:
+            sampler.fill(sampler.sample(2))
+            assert sampler._readers
+
+            restored = pickle.loads(pickle.dumps(sampler))
+            assert not restored._readers
+            assert restored.num_reads == sampler.num_reads
+
+            windows = sampler.sample(10)
+            restored_windows = restored.sample(10)
+            assert numpy.array_equal(windows.offsets, restored_windows.offsets)
+            assert numpy.array_equal(
+                sampler.fill(windows), restored.fill(restored_windows)
+            )
+            restored.close()
+
+    def test_max_open_readers(self, tmp_path: Path, chunked_paths: List[Path]) -> None:
+        """Assert only the most recently used files are kept open"""
+        paths = list(chunked_paths)
+        for file_idx in range(2):
+            path = tmp_path / f"copy_{file_idx}.pod5"
+            path.write_bytes(chunked_paths[file_idx].read_bytes())
+            paths.append(path)
+        expected = _expected_reads(paths)
+
+        with pytest.raises(ValueError, match="max_open_readers"):
+            p5.WindowSampler(paths, WINDOW, max_open_readers=0)
+
+        with p5.WindowSampler(paths, WINDOW, seed=5, max_open_readers=2) as sampler:
+            opened = set()
+            for _ in range(20):
+                windows = sampler.sample(1)
+                signal = sampler.fill(windows)
+                opened |= set(windows.files.tolist())
+                assert len(sampler._readers) <= 2
+                assert set(windows.files.tolist()) <= set(sampler._readers)
+
+                for row, (file_idx, read_row, offset) in enumerate(zip(*windows)):
+                    full = expected[file_idx][read_row].signal[offset:]
+                    assert numpy.array_equal(signal[row], full[:WINDOW])
+
+                for file_idx in set(range(len(paths))) - set(sampler._readers):
+                    start = int(sampler._index.file_buffer_starts[file_idx])
+                    end = int(sampler._index.file_buffer_starts[file_idx + 1])
+                    assert all(len(buf) == 0 for buf in sampler._buffers[start:end])
+            assert len(opened) > 2
+
+            assert sampler.shard(0, 2)._max_open_readers == 2
+
+    def test_batches(self, chunked_paths: List[Path]) -> None:
+        """Assert batches of the requested size are generated"""
+        with p5.WindowSampler(chunked_paths, WINDOW, seed=1) as sampler:
+            batches = list(sampler.batches(16, count=3, pico_amps=True))
+            assert len(batches) == 3
+            for signal, windows in batches:
+                assert signal.shape == (16, WINDOW)
+                assert signal.dtype == numpy.float32
+                assert len(windows.offsets) == 16
+
+    def test_uncompressed_chunks(self) -> None:
+        """Assert windows decode across uncompressed signal table rows"""
+        signal = numpy.arange(1000, dtype=numpy.int16)
+        rows = pa.array([signal[:400], signal[400:]], pa.large_list(pa.int16()))
+        data, offsets = _signal_batch_data(rows.slice(0))
+        assert offsets.tolist() == [0, 800, 2000]
+
+        windows = numpy.empty((2, 100), dtype=numpy.int16)
+        p5b.decode_signal_windows(
+            [data],
+            numpy.array([0], dtype=numpy.uint8),
+            numpy.array([0, 0, 0], dtype=numpy.uint32),
+            numpy.array([0, 800, 800], dtype=numpy.uint64),
+            numpy.array([800, 2000, 2000], dtype=numpy.uint64),
+            numpy.array([400, 600, 600], dtype=numpy.uint32),
+            numpy.array([0, 2, 3], dtype=numpy.uint64),
+            numpy.array([350, 10], dtype=numpy.uint64),
+            100,
+            windows,
+        )
+        assert numpy.array_equal(windows[0], signal[350:450])
+        assert numpy.array_equal(windows[1], signal[410:510])
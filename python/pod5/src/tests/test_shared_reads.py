@@ -0,0 +1,203 @@
+"""
+Testing passing reads through SharedReadBuffers
+"""
+import multiprocessing as mp
+from pathlib import Path
+from typing import List
+
+import numpy as np
+import pytest
+
+import pod5 as p5
+from pod5.shared_reads import SharedReadBatch
+from pod5.tools.pod5_convert_from_fast5 import QueueManager
+from tests.conftest import _random_read_pre_compressed
+from tests.test_writer import _record_fields
+
+
+def _compressed_reads(count: int) -> List[p5.CompressedRead]:
+    """Compressed reads of random data with their signal in several chunks"""
+    reads = []
+    for seed in range(1, count + 1):
+        read = _random_read_pre_compressed(seed)
+        signal = p5.vbz_decompress_signal(
+            read.signal_chunks[0], read.signal_chunk_lengths[0]
+        )
+        chunks = np.array_split(signal, seed % 3 + 1)
+        read.signal_chunks = [p5.vbz_compress_signal(chunk) for chunk in chunks]
+        read.signal_chunk_lengths = [len(chunk) for chunk in chunks]
+        reads.append(read)
+    return reads
+
+
+def _read_bytes(read: p5.CompressedRead) -> int:
+    """The bytes of the signal chunks of a read"""
+    return sum(len(chunk) for chunk in read.signal_chunks)
+
+
+def _assert_written(path: Path, reads: List[p5.CompressedRead]) -> None:
+    """
+    Assert the file at path holds exactly the given reads, in order, as written by
+    Writer.add_reads
+    """
+    expected_path = path.with_suffix(".expected.pod5")
+    with p5.Writer(expected_path) as writer:
+        writer.add_reads(reads)
+
+    with p5.Reader(path) as reader, p5.Reader(expected_path) as expected:
+        records = list(reader)
+        assert len(records) == expected.num_reads
+        for record, other in zip(records, expected):
+            assert record.read_id == other.read_id
+            # Compared by repr as unset values are NaN
+            assert repr(_record_fields(record)) == repr(_record_fields(other))
+            assert np.array_equal(record.signal, other.signal)
+
+
+def _produce(
+    buffers: p5.SharedReadBuffers, queue: mp.Queue, reads: List[p5.CompressedRead]
+) -> None:
+    """Pack reads in a producer process, sending their batch to the writer"""
+    queue.put(buffers.pack(reads))
+    buffers.close()
+
+
+class TestSharedReadBuffers:
+    """Test passing reads through shared memory slots"""
+
+    def test_round_trip(self, tmp_path: Path) -> None:
+        """Packed reads are written as they were given"""
+        reads = _compressed_reads(20)
+        with p5.SharedReadBuffers(slot_count=2) as buffers:
+            batch = buffers.pack(reads)
+            assert len(batch.slots) == 1
+            assert batch.read_count == len(batch) == 20
+            assert not batch.reads
+
+            path = tmp_path / "shared.pod5"
+            with p5.Writer(path) as writer:
+                assert buffers.write(batch, writer) == 20
+            assert not batch.slots
+        _assert_written(path, reads)
+
+    def test_several_slots(self, tmp_path: Path) -> None:
+        """Reads which do not fit in one slot fill further slots"""
+        reads = _compressed_reads(10)
+        slot_bytes = max(_read_bytes(read) for read in reads) * 3
+        with p5.SharedReadBuffers(slot_count=10, slot_bytes=slot_bytes) as buffers:
+            batch = buffers.pack(reads)
+            assert len(batch.slots) > 1
+            assert len({slot.slot for slot in batch.slots}) == len(batch.slots)
+            assert batch.read_count == len(batch) == 10
+            assert not batch.reads
+
+            path = tmp_path / "several.pod5"
+            with p5.Writer(path) as writer:
+                assert buffers.write(batch, writer) == 10
+            assert not batch.slots
+        _assert_written(path, reads)
+
+    def test_overflow(self, tmp_path: Path) -> None:
+        """
+        Reads larger than a slot, or beyond those every slot holds, are held by the
+        batch as they are
+        """
+        reads = _compressed_reads(10)
+        slot_bytes = max(_read_bytes(read) for read in reads) + 1024
+        with p5.SharedReadBuffers(slot_count=2, slot_bytes=slot_bytes) as buffers:
+            batch = buffers.pack(reads)
+            assert len(batch.slots) == 2
+            assert 0 < batch.read_count < 10
+            assert batch.reads == reads[batch.read_count :]
+            assert len(batch) == 10
+
+            path = tmp_path / "overflow.pod5"
+            with p5.Writer(path) as writer:
+                buffers.write(batch, writer)
+        _assert_written(path, reads)
+
+        large = _compressed_reads(1)[0]
+        large.signal_chunks = large.signal_chunks * 4
+        large.signal_chunk_lengths = large.signal_chunk_lengths * 4
+        mixed = [reads[0], large, reads[1]]
+        with p5.SharedReadBuffers(slot_count=2, slot_bytes=slot_bytes) as buffers:
+            batch = buffers.pack(mixed)
+            assert batch.read_count == 2
+            assert batch.reads == [large]
+
+            path = tmp_path / "large.pod5"
+            with p5.Writer(path) as writer:
+                buffers.write(batch, writer)
+        _assert_written(path, [reads[0], reads[1], large])
+
+        with p5.SharedReadBuffers(slot_count=1, slot_bytes=1024) as buffers:
+            batch = buffers.pack(reads)
+            assert not batch.slots
+            assert batch.reads == reads
+
+    def test_slots_exhausted(self) -> None:
+        """Packing waits for a free slot, which release or write frees"""
+        reads = _compressed_reads(2)
+        with p5.SharedReadBuffers(slot_count=1, timeout=0.05) as buffers:
+            batch = buffers.pack(reads)
+            with pytest.raises(TimeoutError, match="No free shared memory slot"):
+                buffers.pack(reads)
+            buffers.release(batch)
+            buffers.release(buffers.pack(reads))
+
+    def test_producer_processes(self, tmp_path: Path) -> None:
+        """Producer processes pack reads into the slots the writer created"""
+        ctx = mp.get_context("spawn")
+        queue = ctx.Queue()
+        reads = _compressed_reads(13)
+        with p5.SharedReadBuffers(slot_count=2, context=ctx) as buffers:
+            processes = [
+                ctx.Process(target=_produce, args=(buffers, queue, reads[rows]))
+                for rows in [slice(0, 5), slice(5, 13)]
+            ]
+            for process in processes:
+                process.start()
+
+            path = tmp_path / "producers.pod5"
+            with p5.Writer(path) as writer:
+                batches = [queue.get(timeout=60) for _ in processes]
+                assert sorted(len(batch) for batch in batches) == [5, 8]
+                for batch in sorted(batches, key=len):
+                    buffers.write(batch, writer)
+
+            for process in processes:
+                process.join()
+                assert process.exitcode == 0
+        _assert_written(path, reads)
+
+    def test_invalid(self) -> None:
+        """Invalid slot counts and sizes are rejected"""
+        with pytest.raises(ValueError, match="slot_count"):
+            p5.SharedReadBuffers(slot_count=0)
+        with pytest.raises(ValueError, match="slot_bytes"):
+            p5.SharedReadBuffers(slot_count=1, slot_bytes=16)
+
+    def test_queue_manager(self, tmp_path: Path) -> None:
+        """The QueueManager passes compressed reads through its read buffers"""
+        ctx = mp.get_context("spawn")
+        reads = _compressed_reads(4)
+        with p5.SharedReadBuffers(slot_count=2, context=ctx) as buffers:
+            queues = QueueManager(ctx, [], 2, 5, read_buffers=buffers)
+            for data in [reads, [], reads]:
+                queues.await_request()
+                queues.enqueue_data(tmp_path, data)
+
+            path = tmp_path / "queued.pod5"
+            _, data = queues.await_data()
+            assert isinstance(data, SharedReadBatch)
+            with p5.Writer(path) as writer:
+                assert queues.write_data(writer, data) == 4
+                assert queues.await_data() == (tmp_path, [])
+                assert queues.write_data(writer, []) == 0
+
+            _, data = queues.await_data()
+            assert isinstance(data, SharedReadBatch)
+            queues.discard_data(data)
+            assert not data.slots
+            queues.shutdown()
+        _assert_written(path, reads)
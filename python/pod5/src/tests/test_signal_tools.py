@@ -5,6 +5,7 @@ from io import TextIOWrapper
 from pathlib import Path
 import random
 
+import lib_pod5 as p5b
 import numpy as np
 import numpy.typing as npt
 from pod5.api_utils import safe_close
@@ -15,6 +16,8 @@ from pod5.signal_tools import (
     vbz_compress_signal_chunked,
     vbz_decompress_signal,
     vbz_decompress_signal_chunked,
+    vbz_decompress_signal_chunked_into,
+    vbz_decompress_signal_into,
 )
 
 TEST_SEEDS = range(10)
@@ -81,6 +84,64 @@ class TestPod5SignalTools:
 
         assert np.array_equal(uncompressed_signal, empty_signal)
 
+    @pytest.mark.parametrize("random_signal", TEST_SEEDS[:3], indirect=True)
+    def test_decompress_chunked_into(
+        self, random_signal: npt.NDArray[np.int16]
+    ) -> None:
+        """Test chunked decompression directly into a preallocated array"""
+        chunks, lengths = vbz_compress_signal_chunked(random_signal, 1000)
+
+        output = np.zeros(len(random_signal) + 2, dtype=np.int16)
+        result = vbz_decompress_signal_chunked_into(chunks, lengths, output[1:-1])
+
+        assert np.shares_memory(result, output)
+        assert np.array_equal(output[1:-1], random_signal)
+        assert output[0] == 0 and output[-1] == 0
+
+    def test_decompress_chunked_into_invalid(self) -> None:
+        """Test chunked decompression rejects inconsistent arguments"""
+        chunks, lengths = vbz_compress_signal_chunked(
+            np.arange(100, dtype=np.int16), 30
+        )
+
+        with pytest.raises(ValueError, match="Inconsistent number of chunks"):
+            vbz_decompress_signal_chunked_into(
+                chunks, lengths[1:], np.empty(100, dtype=np.int16)
+            )
+        with pytest.raises(ValueError, match="does not match"):
+            vbz_decompress_signal_chunked_into(
+                chunks, lengths, np.empty(99, dtype=np.int16)
+            )
+
+        read_only = np.empty(100, dtype=np.int16)
+        read_only.flags.writeable = False
+        for output in (
+            np.empty(100, dtype=np.int32),
+            np.empty(200, dtype=np.int16)[::2],
+            read_only,
+        ):
+            with pytest.raises(ValueError, match="writeable C-contiguous int16"):
+                vbz_decompress_signal_chunked_into(chunks, lengths, output)
+
+    def test_decompress_chunked_into_native(self, monkeypatch) -> None:
+        """Test all chunks are handed to the native library in a single call"""
+        calls = []
+
+        def decompress_signal_chunks(chunks, sample_counts, output):
+            calls.append(len(chunks))
+            offsets = np.cumsum(sample_counts) - sample_counts
+            for chunk, offset, count in zip(chunks, offsets, sample_counts):
+                vbz_decompress_signal_into(chunk, output[offset : offset + count])
+
+        monkeypatch.setattr(
+            p5b, "decompress_signal_chunks", decompress_signal_chunks, raising=False
+        )
+
+        signal = np.arange(1000, dtype=np.int16)
+        chunks, lengths = vbz_compress_signal_chunked(signal, 300)
+        assert np.array_equal(vbz_decompress_signal_chunked(chunks, lengths), signal)
+        assert calls == [4]
+
 
 class DemoObj:
     def __init__(self, path: Path) -> None:
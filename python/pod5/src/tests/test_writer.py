@@ -2,10 +2,17 @@
 Testing Pod5Writer
 """
 import lib_pod5 as p5b
+import dataclasses
+import uuid
+from typing import Any, Dict, List
+
 import numpy as np
+import pyarrow as pa
 import pytest
 
 import pod5 as p5
+from pod5.signal_tools import vbz_compress_signal_chunked
+from tests.conftest import _random_run_info
 
 
 class TestPod5Writer:
@@ -16,6 +23,82 @@ class TestPod5Writer:
         assert isinstance(writer, p5.Writer)
         assert isinstance(writer._writer, p5b.FileWriter)
 
+    @pytest.mark.parametrize("random_read", [1], indirect=True)
+    def test_writer_memory_pool(self, tmp_path, random_read: p5.Read) -> None:
+        """Write reads allocating from a selected memory pool"""
+        path = tmp_path / "memory_pool.pod5"
+        with p5.Writer(path, memory_pool="system") as writer:
+            writer.add_read(random_read)
+
+        with p5.Reader(path) as reader:
+            assert reader.read_ids == [str(random_read.read_id)]
+
+    @pytest.mark.parametrize(
+        "options",
+        [
+            p5.WriterOptions(),
+            p5.WriterOptions(
+                max_signal_chunk_size=300,
+                signal_table_batch_size=7,
+                read_table_batch_size=4,
+            ),
+            p5.WriterOptions(signal_type="uncompressed", writer_threads=2),
+        ],
+    )
+    def test_writer_options(self, tmp_path, options: p5.WriterOptions) -> None:
+        """Write reads with the signal chunks, batches and signal type of options"""
+        path = tmp_path / "options.pod5"
+        run_info = _random_run_info(1)
+        signals = [np.arange(1000 + idx, dtype=np.int16) for idx in range(10)]
+        with p5.Writer(path, options=options) as writer:
+            assert writer.options == options
+            writer.add(run_info)
+            writer.add_reads_columns(
+                {
+                    "read_id": [uuid.uuid4().bytes for _ in signals],
+                    "read_number": np.arange(len(signals)),
+                    "start": np.zeros(len(signals)),
+                    "channel": np.ones(len(signals)),
+                    "well": np.ones(len(signals)),
+                    "pore_type": ["pore"] * len(signals),
+                    "calibration_offset": np.zeros(len(signals)),
+                    "calibration_scale": np.ones(len(signals)),
+                    "median_before": np.zeros(len(signals)),
+                    "end_reason": ["unknown"] * len(signals),
+                    "run_info": [run_info.acquisition_id] * len(signals),
+                },
+                signal=pa.array(signals, type=pa.list_(pa.int16())),
+            )
+
+        with p5.Reader(path) as reader:
+            assert reader.is_vbz_compressed == (
+                options.signal_type == p5.SignalType.VBZ
+            )
+            assert reader.batch_count == -(
+                -len(signals) // options.read_table_batch_size
+            )
+            for record, signal in zip(reader.reads(), signals):
+                assert np.array_equal(record.signal, signal)
+                assert len(record.signal_rows) == -(
+                    -len(signal) // options.max_signal_chunk_size
+                )
+
+    @pytest.mark.parametrize(
+        "kwargs",
+        [
+            {"max_signal_chunk_size": 0},
+            {"max_signal_chunk_size": 2**32},
+            {"signal_table_batch_size": -1},
+            {"read_table_batch_size": 0},
+            {"writer_threads": 0},
+            {"signal_type": "zstd"},
+        ],
+    )
+    def test_writer_options_invalid(self, kwargs) -> None:
+        """Invalid writer options are rejected"""
+        with pytest.raises(ValueError):
+            p5.WriterOptions(**kwargs)
+
     @pytest.mark.parametrize("random_read", [1, 2, 3, 4], indirect=True)
     def test_writer_random_reads(self, writer: p5.Writer, random_read: p5.Read) -> None:
         """Write some random single reads to a writer"""
@@ -60,3 +143,451 @@ class TestPod5Writer:
             assert len(edited_record.signal) == 100
             assert min(edited_record.signal) == 0
             assert max(edited_record.signal) == 99
+
+
+def _record_fields(record: p5.ReadRecord) -> tuple:
+    """The fields of a read record other than its signal"""
+    return (
+        record.read_number,
+        record.start_sample,
+        record.pore,
+        record.calibration,
+        record.median_before,
+        record.end_reason,
+        record.run_info,
+        record.num_minknow_events,
+        record.tracked_scaling,
+        record.predicted_scaling,
+        record.num_reads_since_mux_change,
+        record.time_since_mux_change,
+    )
+
+
+def _assert_same_reads(expected: p5.Reader, written: p5.Reader) -> None:
+    """Assert every read of the written file matches the expected file"""
+    written_records = {record.read_id: record for record in written}
+    assert len(written_records) == expected.num_reads
+    for record in expected:
+        other = written_records[record.read_id]
+        # Compared by repr as unset values are NaN
+        assert repr(_record_fields(other)) == repr(_record_fields(record))
+        assert np.array_equal(other.signal, record.signal)
+
+
+class TestPod5WriterColumns:
+    """Test adding reads to a Pod5Writer as columns"""
+
+    @pytest.mark.parametrize(
+        "signal_form",
+        [
+            "flat",
+            "list",
+            "pre_compressed",
+            "pre_compressed_flat",
+            "pre_compressed_arrow",
+        ],
+    )
+    def test_read_table_round_trip(
+        self, reader: p5.Reader, writer: p5.Writer, signal_form: str
+    ) -> None:
+        """Write the read table batches of a file with the signal of their reads"""
+        for batch_index in range(reader.batch_count):
+            records = list(reader.get_batch(batch_index).reads())
+            for record in records:
+                writer.add(record.run_info)
+
+            signals = [record.signal for record in records]
+            columns = reader.read_table.get_batch(batch_index)
+            if signal_form == "flat":
+                offsets = np.zeros(len(signals) + 1, dtype=np.uint64)
+                np.cumsum([len(signal) for signal in signals], out=offsets[1:])
+                writer.add_reads_columns(
+                    columns, signal=np.concatenate(signals), signal_offsets=offsets
+                )
+            elif signal_form == "list":
+                writer.add_reads_columns(
+                    columns, signal=pa.array(signals, type=pa.list_(pa.int16()))
+                )
+            else:
+                compressed = [vbz_compress_signal_chunked(s, 1000) for s in signals]
+                chunks = [c for chunks, _ in compressed for c in chunks]
+                chunk_args: Dict[str, Any] = {
+                    "signal_chunks": chunks,
+                    "signal_chunk_lengths": np.concatenate(
+                        [ls for _, ls in compressed]
+                    ),
+                    "signal_chunk_counts": np.array(
+                        [len(ls) for _, ls in compressed], dtype=np.uint32
+                    ),
+                }
+                if signal_form == "pre_compressed_flat":
+                    offsets = np.zeros(len(chunks) + 1, dtype=np.uint64)
+                    np.cumsum([len(c) for c in chunks], out=offsets[1:])
+                    chunk_args["signal_chunks"] = np.concatenate(chunks)
+                    chunk_args["signal_chunk_offsets"] = offsets
+                elif signal_form == "pre_compressed_arrow":
+                    chunk_args["signal_chunks"] = pa.array(
+                        [c.tobytes() for c in chunks], type=pa.large_binary()
+                    )
+                writer.add_reads_columns(columns, **chunk_args)
+        writer.close()
+
+        with p5.Reader(writer.path) as written:
+            _assert_same_reads(reader, written)
+
+    def test_numpy_columns(self, writer: p5.Writer) -> None:
+        """Write reads from numpy columns naming their dictionary values"""
+        run_info = _random_run_info(1)
+        writer.add(run_info)
+        count = 5
+        read_ids = [uuid.uuid4() for _ in range(count)]
+        signal = np.arange(15, dtype=np.int16)
+        offsets = np.array([0, 1, 3, 6, 10, 15], dtype=np.uint64)
+        end_reasons = ["signal_positive", "mux_change"] * 2 + ["unknown"]
+
+        writer.add_reads_columns(
+            {
+                "read_id": np.array([r.bytes for r in read_ids], dtype="S16"),
+                "read_number": np.arange(count),
+                "start": np.arange(count) * 100,
+                "channel": np.full(count, 7),
+                "well": np.ones(count),
+                "pore_type": np.array(["a", "b", "a", "b", "a"]),
+                "calibration_offset": np.zeros(count),
+                "calibration_scale": np.ones(count),
+                "median_before": np.full(count, 50.0),
+                "end_reason": np.array(end_reasons),
+                "run_info": np.array([run_info.acquisition_id] * count),
+            },
+            signal=signal,
+            signal_offsets=offsets,
+        )
+        writer.close()
+
+        with p5.Reader(writer.path) as written:
+            records = {record.read_id: record for record in written}
+            for idx, read_id in enumerate(read_ids):
+                record = records[read_id]
+                assert record.read_number == idx
+                assert record.start_sample == idx * 100
+                assert record.pore == p5.Pore(7, 1, "ab"[idx % 2])
+                assert (
+                    record.end_reason
+                    == p5.EndReason.from_reason_with_default_forced(
+                        p5.EndReasonEnum[end_reasons[idx].upper()]
+                    )
+                )
+                assert record.run_info == run_info
+                assert record.num_minknow_events == 0
+                assert np.isnan(record.tracked_scaling.scale)
+                assert np.array_equal(
+                    record.signal, signal[offsets[idx] : offsets[idx + 1]]
+                )
+
+    def test_index_columns(self, writer: p5.Writer) -> None:
+        """Write reads from columns of indices returned by Writer.add"""
+        run_info = _random_run_info(2)
+        end_reason = p5.EndReason(p5.EndReasonEnum.UNBLOCK_MUX_CHANGE, forced=True)
+        columns = {
+            "read_id": np.frombuffer(uuid.uuid4().bytes, dtype=np.uint8)[None, :],
+            "read_number": [1],
+            "start": [2],
+            "channel": [3],
+            "well": [1],
+            "pore_type": [writer.add("pore")],
+            "calibration_offset": [0.5],
+            "calibration_scale": [2.0],
+            "median_before": [10.0],
+            "end_reason": [writer.add(end_reason)],
+            "run_info": [writer.add(run_info)],
+        }
+        writer.add_reads_columns(
+            columns,
+            signal=np.ones(10, dtype=np.int16),
+            signal_offsets=np.array([0, 10], dtype=np.uint64),
+        )
+        writer.close()
+
+        with p5.Reader(writer.path) as written:
+            record = next(written.reads())
+            assert record.pore.pore_type == "pore"
+            assert record.end_reason == end_reason
+            assert record.run_info == run_info
+            assert record.calibration == p5.Calibration(0.5, 2.0)
+            assert record.num_samples == 10
+
+    def test_invalid_columns(self, writer: p5.Writer) -> None:
+        """Invalid columns or signal are rejected before any read is written"""
+        columns = {
+            "read_id": np.zeros((2, 16), dtype=np.uint8),
+            "read_number": [1, 2],
+            "start": [0, 0],
+            "channel": [1, 1],
+            "well": [1, 1],
+            "pore_type": ["pore", "pore"],
+            "calibration_offset": [0.0, 0.0],
+            "calibration_scale": [1.0, 1.0],
+            "median_before": [0.0, 0.0],
+            "end_reason": ["unknown", "unknown"],
+            "run_info": ["missing", "missing"],
+        }
+        signal = np.zeros(4, dtype=np.int16)
+
+        with pytest.raises(KeyError):
+            writer.add_reads_columns(
+                columns,
+                signal=signal,
+                signal_offsets=np.array([0, 2, 4], dtype=np.uint64),
+            )
+
+        writer.add(_random_run_info(3))
+        columns["run_info"] = [0, 0]
+        with pytest.raises(ValueError, match="Unknown read columns"):
+            writer.add_reads_columns({**columns, "chanel": [1, 1]}, signal=signal)
+        with pytest.raises(ValueError, match="Missing read column: well"):
+            writer.add_reads_columns(
+                {k: v for k, v in columns.items() if k != "well"}, signal=signal
+            )
+        with pytest.raises(ValueError, match="has shape"):
+            writer.add_reads_columns(
+                {**columns, "channel": [1]},
+                signal=signal,
+                signal_offsets=np.array([0, 2, 4], dtype=np.uint64),
+            )
+        with pytest.raises(ValueError, match="Exactly one"):
+            writer.add_reads_columns(columns)
+        with pytest.raises(ValueError, match="signal offsets"):
+            writer.add_reads_columns(
+                columns, signal=signal, signal_offsets=np.array([0, 4], dtype=np.uint64)
+            )
+        with pytest.raises(ValueError, match="out of range"):
+            writer.add_reads_columns(
+                columns,
+                signal=signal,
+                signal_offsets=np.array([0, 3, 5], dtype=np.uint64),
+            )
+        with pytest.raises(TypeError, match="integer samples"):
+            writer.add_reads_columns(
+                columns,
+                signal=signal.astype(np.float32),
+                signal_offsets=np.array([0, 2, 4], dtype=np.uint64),
+            )
+        with pytest.raises(ValueError, match="signal chunks"):
+            writer.add_reads_columns(
+                columns,
+                signal_chunks=[],
+                signal_chunk_lengths=np.array([], dtype=np.uint32),
+                signal_chunk_counts=np.array([1, 1], dtype=np.uint32),
+            )
+        chunk_args: Dict[str, Any] = {
+            "signal_chunks": np.zeros(8, dtype=np.uint8),
+            "signal_chunk_lengths": np.array([2, 2], dtype=np.uint32),
+            "signal_chunk_counts": np.array([1, 1], dtype=np.uint32),
+        }
+        with pytest.raises(ValueError, match="signal_chunk_offsets must be given"):
+            writer.add_reads_columns(columns, **chunk_args)
+        with pytest.raises(ValueError, match="signal chunks"):
+            writer.add_reads_columns(
+                columns,
+                **chunk_args,
+                signal_chunk_offsets=np.array([0, 4], dtype=np.uint64),
+            )
+        with pytest.raises(ValueError, match="out of range"):
+            writer.add_reads_columns(
+                columns,
+                **chunk_args,
+                signal_chunk_offsets=np.array([0, 4, 9], dtype=np.uint64),
+            )
+        with pytest.raises(TypeError):
+            writer.add_reads_columns({**columns, "read_id": np.zeros(2)}, signal=signal)
+        for run_info_indices in ([0, 1], [-1, 0]):
+            with pytest.raises(ValueError, match="returned by Writer.add"):
+                writer.add_reads_columns(
+                    {**columns, "run_info": run_info_indices},
+                    signal=signal,
+                    signal_offsets=np.array([0, 2, 4], dtype=np.uint64),
+                )
+
+    def test_native_column_sizes(self, writer: p5.Writer) -> None:
+        """The native flat writers reject columns shorter than the read count"""
+        dtypes: List[Any] = [np.uint32, np.uint64, np.uint16, np.uint8, np.int16]
+        dtypes += [np.float32] * 3 + [np.int16, np.bool_, np.int16, np.uint64]
+        dtypes += [np.float32] * 4 + [np.uint32, np.float32]
+        columns = [np.zeros(2, dtype=dtype) for dtype in dtypes]
+        read_ids = np.zeros((2, 16), dtype=np.uint8)
+        signal = np.zeros(3, dtype=np.int16)
+        signal_offsets = np.array([0, 1, 2, 3], dtype=np.uint64)
+        chunk_args = (
+            np.zeros(3, dtype=np.uint8),
+            np.array([0, 1, 2, 3], dtype=np.uint64),
+            np.ones(3, dtype=np.uint32),
+            np.ones(3, dtype=np.uint32),
+        )
+
+        # Called with every column positionally, as Writer.add_reads_columns does
+        native: Any = writer._writer
+        with pytest.raises(RuntimeError, match="fewer read ids"):
+            native.add_reads_flat(3, read_ids, *columns, signal, signal_offsets)
+        with pytest.raises(RuntimeError, match="fewer read ids"):
+            native.add_reads_pre_compressed_flat(3, read_ids, *columns, *chunk_args)
+
+        read_ids = np.zeros((3, 16), dtype=np.uint8)
+        with pytest.raises(RuntimeError, match="every read"):
+            native.add_reads_flat(3, read_ids, *columns, signal, signal_offsets)
+        with pytest.raises(RuntimeError, match="every read"):
+            native.add_reads_pre_compressed_flat(3, read_ids, *columns, *chunk_args)
+
+
+def _read_columns(count: int, run_info: p5.RunInfo) -> dict:
+    """Columns of `count` reads naming their pore type, end reason and run info"""
+    return {
+        "read_id": [uuid.uuid4().bytes for _ in range(count)],
+        "read_number": np.arange(count),
+        "start": np.zeros(count),
+        "channel": np.ones(count),
+        "well": np.ones(count),
+        "pore_type": ["pore"] * count,
+        "calibration_offset": np.zeros(count),
+        "calibration_scale": np.ones(count),
+        "median_before": np.zeros(count),
+        "end_reason": ["signal_positive"] * count,
+        "run_info": [run_info.acquisition_id] * count,
+    }
+
+
+class TestRotatingWriter:
+    """Test writing reads to a series of files"""
+
+    def test_max_reads(self, tmp_path) -> None:
+        """Files are started every max_reads reads, across calls to add_reads"""
+        run_info = _random_run_info(1)
+        reads = [
+            p5.Read(
+                read_id=uuid.uuid4(),
+                pore=p5.Pore(1, 1, f"pore_{idx % 3}"),
+                calibration=p5.Calibration(0, 1),
+                read_number=idx,
+                start_sample=0,
+                median_before=0,
+                end_reason=p5.EndReason.from_reason_with_default_forced(
+                    p5.EndReasonEnum.SIGNAL_POSITIVE
+                ),
+                run_info=run_info,
+                signal=np.arange(idx + 1, dtype=np.int16),
+            )
+            for idx in range(25)
+        ]
+        with p5.RotatingWriter(tmp_path / "reads_{index}.pod5", max_reads=10) as writer:
+            writer.add_reads(reads[:7])
+            writer.add_reads(reads[7:])
+            writer.add_read(dataclasses.replace(reads[0], read_id=uuid.uuid4()))
+
+        assert writer.paths == [tmp_path / f"reads_{idx}.pod5" for idx in range(3)]
+        read_ids = []
+        for path, expected_count in zip(writer.paths, [10, 10, 6]):
+            with p5.Reader(path) as reader:
+                assert reader.num_reads == expected_count
+                for record in reader:
+                    assert record.run_info == run_info
+                    assert record.pore.pore_type == f"pore_{record.read_number % 3}"
+                    assert len(record.signal) == record.read_number + 1
+                    read_ids.append(record.read_id)
+        assert read_ids[:25] == [read.read_id for read in reads]
+
+    @pytest.mark.parametrize("max_open_files", [1, 3])
+    def test_max_bytes_columns(self, tmp_path, max_open_files: int) -> None:
+        """Files are started every max_bytes of signal, large reads on their own"""
+        run_info = _random_run_info(2)
+        lengths = [100] * 12 + [2000] + [100] * 3
+        offsets = np.zeros(len(lengths) + 1, dtype=np.uint64)
+        np.cumsum(lengths, out=offsets[1:])
+        signal = np.arange(offsets[-1], dtype=np.int16)
+        columns = _read_columns(len(lengths), run_info)
+
+        with p5.RotatingWriter(
+            str(tmp_path / "reads_{index:02d}.pod5"),
+            max_bytes=1000,
+            max_open_files=max_open_files,
+        ) as writer:
+            writer.add(run_info)
+            writer.add_reads_columns(columns, signal=signal, signal_offsets=offsets)
+
+        file_counts = []
+        for path in writer.paths:
+            with p5.Reader(path) as reader:
+                file_counts.append(reader.num_reads)
+                for record in reader:
+                    idx = record.read_number
+                    assert np.array_equal(
+                        record.signal, signal[offsets[idx] : offsets[idx + 1]]
+                    )
+        assert file_counts == [5, 5, 2, 1, 3]
+        assert writer.paths[0].name == "reads_00.pod5"
+
+    @pytest.mark.parametrize("contiguous", [False, True])
+    def test_indices_pre_compressed(self, tmp_path, contiguous: bool) -> None:
+        """Indices from RotatingWriter.add are added to each file which uses them"""
+        run_infos = [_random_run_info(3), _random_run_info(4)]
+        end_reason = p5.EndReason(p5.EndReasonEnum.MUX_CHANGE, forced=True)
+        signals = [np.arange(10 * (idx + 1), dtype=np.int16) for idx in range(6)]
+        compressed = [vbz_compress_signal_chunked(s, 7) for s in signals]
+
+        with p5.RotatingWriter(tmp_path / "reads_{index}.pod5", max_reads=4) as writer:
+            columns = _read_columns(len(signals), run_infos[0])
+            columns["run_info"] = [writer.add(run_infos[idx % 2]) for idx in range(6)]
+            columns["end_reason"] = [writer.add(end_reason)] * 6
+            columns["pore_type"] = [writer.add("other")] * 6
+            chunks = [c for chunks, _ in compressed for c in chunks]
+            chunk_args: Dict[str, Any] = {
+                "signal_chunks": chunks,
+                "signal_chunk_lengths": np.concatenate([ls for _, ls in compressed]),
+                "signal_chunk_counts": np.array(
+                    [len(ls) for _, ls in compressed], dtype=np.uint32
+                ),
+            }
+            if contiguous:
+                offsets = np.zeros(len(chunks) + 1, dtype=np.uint64)
+                np.cumsum([len(c) for c in chunks], out=offsets[1:])
+                chunk_args["signal_chunks"] = np.concatenate(chunks)
+                chunk_args["signal_chunk_offsets"] = offsets
+            writer.add_reads_columns(columns, **chunk_args)
+
+        assert len(writer.paths) == 2
+        for path in writer.paths:
+            with p5.Reader(path) as reader:
+                for record in reader:
+                    idx = record.read_number
+                    assert record.run_info == run_infos[idx % 2]
+                    assert record.end_reason == end_reason
+                    assert record.pore.pore_type == "other"
+                    assert np.array_equal(record.signal, signals[idx])
+
+    def test_invalid(self, tmp_path) -> None:
+        """Invalid templates, limits and indices are rejected"""
+        with pytest.raises(ValueError, match="index"):
+            p5.RotatingWriter(tmp_path / "reads.pod5")
+        with pytest.raises(ValueError, match="max_reads"):
+            p5.RotatingWriter(tmp_path / "reads_{index}.pod5", max_reads=0)
+
+        run_info = _random_run_info(5)
+        with p5.RotatingWriter(tmp_path / "reads_{index}.pod5") as writer:
+            writer.add(run_info)
+            columns = _read_columns(2, run_info)
+            columns["pore_type"] = [0, 1]
+            with pytest.raises(ValueError, match="RotatingWriter.add"):
+                writer.add_reads_columns(
+                    columns,
+                    signal=np.zeros(2, dtype=np.int16),
+                    signal_offsets=np.array([0, 1, 2], dtype=np.uint64),
+                )
+
+            columns = _read_columns(2, run_info)
+            chunks = [p5.vbz_compress_signal(np.zeros(2, dtype=np.int16))] * 3
+            for chunk_count, chunk_lengths in [(3, [2, 2]), (2, [2, 2, 2])]:
+                with pytest.raises(ValueError, match="signal chunks and lengths"):
+                    writer.add_reads_columns(
+                        columns,
+                        signal_chunks=chunks[:chunk_count],
+                        signal_chunk_lengths=np.array(chunk_lengths, dtype=np.uint32),
+                        signal_chunk_counts=np.array([1, 1], dtype=np.uint32),
+                    )